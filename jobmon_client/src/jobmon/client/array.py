@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-import copy
 from collections.abc import Iterable
 from http import HTTPStatus as StatusCodes
 from itertools import product
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 import structlog
 
+from jobmon.client.barrier import Barrier
 from jobmon.client.node import Node
 from jobmon.client.task import Task, validate_task_resource_scales
 from jobmon.client.task_template_version import TaskTemplateVersion
@@ -89,6 +99,12 @@ class Array:
         self.requester = requester
 
         self.tasks: Dict[int, Task] = {}
+        # node arg name -> node arg value -> positions in self.tasks of the tasks with
+        # that value; None once a task has a value that cannot be hashed
+        self._node_arg_index: Optional[Dict[str, Dict[Any, List[int]]]] = {}
+        self._task_order: List[Task] = []
+        # one barrier per group of upstream tasks, shared by create_tasks calls
+        self._barriers: Dict[FrozenSet[Task], Barrier] = {}
 
     @property
     def name(self) -> str:
@@ -214,6 +230,7 @@ class Array:
             )
 
         self.tasks[task_hash] = task
+        self._index_node_args(task)
 
         # populate backref
         task.array = self
@@ -224,6 +241,7 @@ class Array:
         task_attributes: Union[List, dict] = {},
         max_attempts: Optional[int] = None,
         resource_scales: Optional[Dict[str, Any]] = None,
+        barrier: bool = False,
         **node_kwargs: Any,
     ) -> List[Task]:
         """Create a task associated with the array.
@@ -236,6 +254,9 @@ class Array:
                 Default is wf default.
             resource_scales: determines the scaling factor for how aggressive resource
                 adjustments will be scaled up
+            barrier: wait for the upstream tasks through one all-to-all Barrier instead
+                of an edge from every upstream task to every new task. The new tasks'
+                upstream_tasks stay empty and they are listed in the barrier instead.
             **node_kwargs: values for each node argument specified in command_template
 
         Raises:
@@ -256,37 +277,39 @@ class Array:
                 f"Missing node_args for this array. Task Template requires node_args="
                 f"{self.task_template_version.node_args}, got {set(node_kwargs.keys())}"
             )
-        node_args_expanded = Array.expand_dict(**node_kwargs)
-
-        # build tasks over node_args
-        tasks = []
-        for node_args in node_args_expanded:
-            # build node
-            node = Node(self.task_template_version, node_args, self.requester)
-
-            task = Task(
-                node=node,
-                task_args=self.task_args,
-                op_args=self.op_args,
-                resource_scales=copy.deepcopy(resource_scales),
-                max_attempts=max_attempts,
-                upstream_tasks=upstream_tasks,
-                task_attributes=task_attributes,
-                requester=self.requester,
-            )
-            tasks.append(task)
 
-            logger.debug(f"Adding Task {task}")
-            if hash(task) in self.tasks.keys():
-                raise ValueError(
-                    f"A task with hash {hash(task)} already exists. "
-                    f"All tasks in a workflow must have unique "
-                    f"commands. Your command was: {task.command}"
-                )
+        upstream_barrier = None
+        if barrier and upstream_tasks:
+            upstream_barrier = self._get_barrier(upstream_tasks)
+            upstream_tasks = None
+
+        # build nodes and tasks over the expanded node_args in bulk
+        nodes = Node.create_product(
+            self.task_template_version, node_kwargs, self.requester
+        )
+        tasks = Task.create_many(
+            nodes,
+            task_args=self.task_args,
+            op_args=self.op_args,
+            resource_scales=resource_scales,
+            max_attempts=max_attempts,
+            upstream_tasks=upstream_tasks,
+            task_attributes=task_attributes,
+            requester=self.requester,
+            upstream_barrier=upstream_barrier,
+        )
+        for task in tasks:
             self.add_task(task)
+        logger.debug("Created tasks", array_name=self.name, num_tasks=len(tasks))
 
         return tasks
 
+    def _get_barrier(self, upstream_tasks: List[Task]) -> Barrier:
+        key = frozenset(upstream_tasks)
+        if key not in self._barriers:
+            self._barriers[key] = Barrier(upstream_tasks)
+        return self._barriers[key]
+
     @staticmethod
     def expand_dict(**kwargs: Any) -> Iterator[Dict]:
         """Expand a dictionary of iterables into combinations of values.
@@ -301,8 +324,68 @@ class Array:
         for element in product(*kwargs.values()):
             yield dict(zip(keys, element))
 
+    def _index_node_args(self, task: Task) -> None:
+        if self._node_arg_index is None:
+            return
+        position = len(self._task_order)
+        self._task_order.append(task)
+        try:
+            for key, val in task.node.node_args.items():
+                self._node_arg_index.setdefault(key, {}).setdefault(val, []).append(
+                    position
+                )
+        except TypeError:
+            # unhashable node arg values are matched by scanning every task
+            self._node_arg_index = None
+            self._task_order = []
+
     def get_tasks_by_node_args(self, **kwargs: Any) -> List["Task"]:
-        """Query tasks by node args. Used for setting dependencies."""
+        """Query tasks by node args. Used for setting dependencies.
+
+        Each keyword matches tasks whose node arg equals the value or, for a
+        non-string iterable value, is one of its items. Tasks matching every keyword
+        are returned in the order they were added.
+        """
+        # iterators can only be read once
+        kwargs = {
+            key: list(val) if isinstance(val, Iterator) else val
+            for key, val in kwargs.items()
+        }
+        if self._node_arg_index is None:
+            return self._scan_tasks_by_node_args(**kwargs)
+
+        lookups = []
+        for key, val in kwargs.items():
+            if self.tasks and key not in self._node_arg_index:
+                raise KeyError(key)
+            index = self._node_arg_index.get(key, {})
+            candidates = [val]
+            if isinstance(val, Iterable) and not isinstance(val, (str, bytes)):
+                candidates += list(val)
+            if not all(_is_hashable(candidate) for candidate in candidates[1:]):
+                return self._scan_tasks_by_node_args(**kwargs)
+            values = {c for c in candidates if _is_hashable(c)}
+            num_matches = sum(len(index.get(value, ())) for value in values)
+            if num_matches == 0:
+                return []
+            lookups.append((num_matches, key, values))
+        if not lookups:
+            return list(self.tasks.values())
+
+        # read the positions of the most selective key, then check the others on them
+        lookups.sort(key=lambda lookup: lookup[0])
+        _, key, values = lookups[0]
+        index = self._node_arg_index[key]
+        matched = [position for value in values for position in index.get(value, ())]
+        for _, key, values in lookups[1:]:
+            matched = [
+                position
+                for position in matched
+                if self._task_order[position].node.node_args[key] in values
+            ]
+        return [self._task_order[position] for position in sorted(matched)]
+
+    def _scan_tasks_by_node_args(self, **kwargs: Any) -> List["Task"]:
         tasks: List["Task"] = []
 
         for task in self.tasks.values():
@@ -310,6 +393,7 @@ class Array:
             for key, val in kwargs.items():
                 if (
                     isinstance(val, Iterable)
+                    and not isinstance(val, (str, bytes))
                     and task.node.node_args[key] in val
                     or task.node.node_args[key] == val
                 ):
@@ -348,3 +432,11 @@ class Array:
 
         array_id = resp["array_id"]
         self.array_id = array_id
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
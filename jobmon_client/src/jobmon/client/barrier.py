@@ -0,0 +1,70 @@
+"""An all-to-all dependency between groups of tasks."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+from jobmon.client.node import Node
+
+if TYPE_CHECKING:
+    from jobmon.client.task import Task
+
+
+class Barrier:
+    """Every downstream task of a barrier depends on every one of its upstream tasks.
+
+    A barrier stands in for the full set of edges between its upstream and downstream
+    tasks. It is kept as two lists in the client DAG, sent and stored as one row per
+    member, and counted down once per upstream completion by the swarm, so a
+    dependency between arrays of N and M tasks costs N + M instead of N * M.
+    """
+
+    def __init__(self, upstream_tasks: Iterable[Task]) -> None:
+        """Create a barrier on a group of upstream tasks.
+
+        Args:
+            upstream_tasks: tasks that must all finish before any downstream task runs.
+        """
+        self.upstream_tasks: Tuple[Task, ...] = tuple(dict.fromkeys(upstream_tasks))
+        self.downstream_tasks: List[Task] = []
+
+    @property
+    def upstream_nodes(self) -> List[Node]:
+        """The nodes of the upstream tasks."""
+        return [task.node for task in self.upstream_tasks]
+
+    @property
+    def downstream_nodes(self) -> List[Node]:
+        """The nodes of the downstream tasks."""
+        return [task.node for task in self.downstream_tasks]
+
+    def add_downstream(self, task: Task) -> None:
+        """Make a task wait for all of the upstream tasks.
+
+        Args:
+            task: the task to add.
+        """
+        self.downstream_tasks.append(task)
+        task.upstream_barriers.append(self)
+        task.node.upstream_barriers.append(self)
+        Node.dependency_version += 1
+
+    def digest(self) -> int:
+        """A hash of the sorted upstream node hashes and sorted downstream node hashes.
+
+        Barriers are mutable, so this is not ``__hash__``.
+        """
+        hash_value = hashlib.sha256()
+        for nodes in (self.upstream_nodes, self.downstream_nodes):
+            for node_hash in sorted(map(hash, nodes)):
+                hash_value.update(str(node_hash).encode("utf-8"))
+            hash_value.update(b"|")
+        return int(hash_value.hexdigest(), 16)
+
+    def __repr__(self) -> str:
+        """A representation string for a Barrier instance."""
+        return (
+            f"Barrier(num_upstream_tasks={len(self.upstream_tasks)}, "
+            f"num_downstream_tasks={len(self.downstream_tasks)})"
+        )
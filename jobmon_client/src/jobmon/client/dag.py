@@ -2,11 +2,13 @@
 
 import hashlib
 from http import HTTPStatus as StatusCodes
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import structlog
 
+from jobmon.client.barrier import Barrier
 from jobmon.client.node import Node
+from jobmon.client.pipelined_binder import PipelinedBinder
 from jobmon.core.exceptions import (
     CyclicGraphError,
     DuplicateNodeArgsError,
@@ -34,6 +36,10 @@ class Dag(object):
             requester (str): url to communicate with the flask services.
         """
         self.nodes: Set[Node] = set()
+        # the hash and a successful validation are kept until the graph changes
+        self._hash_version: Optional[Tuple[int, int]] = None
+        self._hash_val = 0
+        self._validated_version: Optional[Tuple[int, int]] = None
 
         if requester is None:
             requester = Requester.from_defaults()
@@ -46,6 +52,21 @@ class Dag(object):
             raise AttributeError("_dag_id cannot be accessed before dag is bound")
         return self._dag_id
 
+    @property
+    def barriers(self) -> List[Barrier]:
+        """The barriers the nodes of this dag wait on, in a stable order."""
+        barriers = {
+            id(barrier): barrier
+            for node in self.nodes
+            for barrier in node.upstream_barriers
+        }
+        return sorted(barriers.values(), key=lambda barrier: barrier.digest())
+
+    @property
+    def _version(self) -> Tuple[int, int]:
+        """Changes whenever a node is added or any node's dependencies change."""
+        return Node.dependency_version, len(self.nodes)
+
     def add_node(self, node: Node) -> None:
         """Add a node to this dag.
 
@@ -81,16 +102,30 @@ class Dag(object):
         )
         dag_id = response["dag_id"]
 
-        # no created date means bind edges
+        # no created date means bind edges. Barriers go first, since the last chunk of
+        # edges marks the dag created
         if response["created_date"] is None:
+            self._bulk_insert_barriers(dag_id)
             self._bulk_insert_edges(dag_id)
         self._dag_id = dag_id
         return dag_id
 
     def validate(self) -> None:
-        """Validate the nodes and their dependencies."""
+        """Validate the nodes and their dependencies.
+
+        A successful validation is skipped until the graph changes.
+        """
+        version = self._version
+        if version == self._validated_version:
+            return
+
         nodes_in_dag = self.nodes
         for node in nodes_in_dag:
+            if (
+                node.upstream_nodes <= nodes_in_dag
+                and node.downstream_nodes <= nodes_in_dag
+            ):
+                continue
             # Make sure no task contains up/down stream tasks that are not in the workflow
             for n in node.upstream_nodes:
                 if n not in nodes_in_dag:
@@ -107,14 +142,36 @@ class Dag(object):
                         "the workflow and is in the correct order."
                     )
 
-        dag_map = {node: node.downstream_nodes for node in nodes_in_dag}
+        # each barrier is one vertex between its upstream and downstream nodes
+        dag_map: Dict[Any, Iterable] = {
+            node: node.downstream_nodes for node in nodes_in_dag
+        }
+        for barrier in self.barriers:
+            for n in barrier.upstream_nodes:
+                if n not in nodes_in_dag:
+                    raise NodeDependencyNotExistError(
+                        f"Upstream node, {hash(n)}, of {barrier} does not exist in the "
+                        "dag. Check that every task has been added to the workflow and "
+                        "is in the correct order."
+                    )
+                dag_map[n] = [*dag_map[n], barrier]
+            for n in barrier.downstream_nodes:
+                if n not in nodes_in_dag:
+                    raise NodeDependencyNotExistError(
+                        f"Downstream node, {hash(n)}, of {barrier} does not exist in the "
+                        "dag. Check that every task has been added to the workflow and "
+                        "is in the correct order."
+                    )
+            dag_map[barrier] = barrier.downstream_nodes
+
         if self._is_cyclic(dag_map):
             raise CyclicGraphError(
                 "Cycle detected in the task graph. Please ensure that your task dependencies "
                 "flow in only one direction."
             )
+        self._validated_version = version
 
-    def _is_cyclic(self, dag_map: Dict[Node, Set[Node]]) -> bool:
+    def _is_cyclic(self, dag_map: Dict[Any, Iterable]) -> bool:
         """Return true if the nodes are cyclic.
 
         This method is effectively a depth-first search looking for already-seen nodes,
@@ -141,39 +198,32 @@ class Dag(object):
         return False
 
     def _bulk_bind_nodes(self, chunk_size: int) -> None:
-        def get_chunk(total_nodes: int, chunk_number: int) -> Optional[Tuple[int, int]]:
-            # This function is created for unit testing
-            if (chunk_number - 1) * chunk_size >= total_nodes:
-                return None
-            return (
-                (chunk_number - 1) * chunk_size,
-                min(total_nodes - 1, chunk_number * chunk_size - 1),
-            )
-
         nodes_in_dag = list(self.nodes)
-        nodes_received = {}
-        total_nodes = len(self.nodes)
-        chunk_number = 1
-        chunk_boarder = get_chunk(total_nodes, chunk_number)
-        while chunk_boarder is not None:
-            # do something to bind
-            nodes_to_send = []
-            for i in range(chunk_boarder[0], chunk_boarder[1] + 1):
-                node = nodes_in_dag[i]
-                n = {
-                    "task_template_version_id": node.task_template_version_id,
-                    "node_args_hash": str(node.node_args_hash),
-                    "node_args": node.mapped_node_args,
-                }
-                nodes_to_send.append(n)
-            rc, response = self.requester.send_request(
-                app_route="/nodes",
-                message={"nodes": nodes_to_send},
-                request_type="post",
-            )
+        nodes_received: Dict[str, int] = {}
+
+        def messages() -> Iterator[Dict]:
+            for start in range(0, len(nodes_in_dag), chunk_size):
+                nodes_to_send = [
+                    {
+                        "task_template_version_id": node.task_template_version_id,
+                        "node_args_hash": str(node.node_args_hash),
+                        "node_args": node.mapped_node_args,
+                    }
+                    for node in nodes_in_dag[start : start + chunk_size]
+                ]
+                yield {"nodes": nodes_to_send}
+
+        def on_response(response: Dict) -> None:
             nodes_received.update(response["nodes"])
-            chunk_number += 1
-            chunk_boarder = get_chunk(total_nodes, chunk_number)
+
+        PipelinedBinder(self.requester).run_phase(
+            "nodes",
+            "/nodes",
+            "post",
+            messages(),
+            num_items=len(nodes_in_dag),
+            on_response=on_response,
+        )
 
         for node in nodes_in_dag:
             k = f"{node.task_template_version_id}:{node.node_args_hash}"
@@ -181,9 +231,9 @@ class Dag(object):
                 node.node_id = int(nodes_received[k])
             else:
                 raise InvalidResponse(
-                    f"Fail to find node_id in HTTP response for node_args_hash "
+                    f"Fail to find node_id in HTTP responses for node_args_hash "
                     f"{node.node_args_hash} and task_template_version_id "
-                    f"{node.task_template_version_id} HTTP Response:\n {response}"
+                    f"{node.task_template_version_id}"
                 )
 
     def _get_dag_id(self) -> Optional[int]:
@@ -224,31 +274,84 @@ class Dag(object):
             )
         logger.debug(f"message included in edge post request: {all_edges}")
 
-        while all_edges:
-            # split off first chunk elements from queue.
-            edge_chunk, all_edges = all_edges[:chunk_size], all_edges[chunk_size:]
+        def messages() -> Iterator[Dict]:
+            for start in range(0, len(all_edges), chunk_size):
+                yield {
+                    "edges_to_add": all_edges[start : start + chunk_size],
+                    # only the last chunk marks the dag created
+                    "mark_created": start + chunk_size >= len(all_edges),
+                }
 
-            message: Dict[str, Union[List[Dict], bool]] = {"edges_to_add": edge_chunk}
-            # more edges to add. don't mark it created
-            if all_edges:
-                message["mark_created"] = False
-            else:
-                message["mark_created"] = True
+        PipelinedBinder(self.requester).run_phase(
+            "edges",
+            f"/dag/{dag_id}/edges",
+            "post",
+            messages(),
+            num_items=len(all_edges),
+            send_last_after_others=True,
+        )
 
-            app_route = f"/dag/{dag_id}/edges"
-            self.requester.send_request(
-                app_route=app_route, message=message, request_type="post"
-            )
+    def _bulk_insert_barriers(self, dag_id: int, chunk_size: int = 5000) -> None:
+        barriers = self.barriers
+        if not barriers:
+            return
+
+        def messages() -> Iterator[Dict]:
+            # barrier ids are positions in digest order, so a retry reuses them
+            for barrier_id, barrier in enumerate(barriers):
+                members = [
+                    ("upstream_node_ids", barrier.upstream_nodes),
+                    ("downstream_node_ids", barrier.downstream_nodes),
+                ]
+                for key, nodes in members:
+                    for start in range(0, len(nodes), chunk_size):
+                        yield {
+                            "barriers": [
+                                {
+                                    "barrier_id": barrier_id,
+                                    key: [
+                                        node.node_id
+                                        for node in nodes[start : start + chunk_size]
+                                    ],
+                                }
+                            ]
+                        }
+
+        PipelinedBinder(self.requester).run_phase(
+            "barriers",
+            f"/dag/{dag_id}/barriers",
+            "post",
+            messages(),
+            num_items=sum(
+                len(barrier.upstream_tasks) + len(barrier.downstream_tasks)
+                for barrier in barriers
+            ),
+        )
 
     def __hash__(self) -> int:
-        """Determined by hashing all sorted node hashes and their downstream."""
+        """Determined by hashing all sorted node hashes and their downstream.
+
+        Barriers are hashed by their members after the nodes, so the hash of a dag
+        without barriers doesn't change. The hash is stored with the dag and matched
+        on resume, so the digest is fed in one update per node instead of being made
+        order independent, and kept until the graph changes.
+        """
+        version = self._version
+        if version == self._hash_version:
+            return self._hash_val
+
         hash_value = hashlib.sha256()
         if len(self.nodes) > 0:  # if the dag is empty, we want to skip this
-            for node in sorted(self.nodes):
-                hash_value.update(str(hash(node)).encode("utf-8"))
-                for downstream_node in sorted(node.downstream_nodes):
-                    hash_value.update(str(hash(downstream_node)).encode("utf-8"))
-        return int(hash_value.hexdigest(), 16)
+            # sorting by hash matches Node.__lt__ without calling it per comparison
+            for node in sorted(self.nodes, key=hash):
+                downstream_hashes = sorted(map(hash, node.downstream_nodes))
+                node_digest = "".join(map(str, [hash(node), *downstream_hashes]))
+                hash_value.update(node_digest.encode("utf-8"))
+            for barrier in self.barriers:
+                hash_value.update(f"barrier{barrier.digest()}".encode("utf-8"))
+        self._hash_val = int(hash_value.hexdigest(), 16)
+        self._hash_version = version
+        return self._hash_val
 
     def __repr__(self) -> str:
         """A representation string for a Dag instance."""
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import hashlib
-from typing import Any, Dict, List, Optional, Set
+from itertools import product
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Type
 
 import structlog
 
@@ -11,12 +13,23 @@ from jobmon.client.task_template_version import TaskTemplateVersion
 from jobmon.core.constants import SpecialChars
 from jobmon.core.requester import Requester
 
+if TYPE_CHECKING:
+    from jobmon.client.barrier import Barrier
+
 logger = structlog.get_logger(__name__)
 
+_NAME_TRANSLATION = str.maketrans(
+    {char: "_" for char in SpecialChars.ILLEGAL_SPECIAL_CHARACTERS}
+)
+
 
 class Node:
     """A node represents an individual task within a Dag."""
 
+    # bumped on every dependency change of any node, so a Dag can tell whether its
+    # cached hash and validation still describe its nodes
+    dependency_version = 0
+
     def __init__(
         self,
         task_template_version: TaskTemplateVersion,
@@ -36,19 +49,103 @@ class Node:
             node_args: key-value pairs of arg_name and a value.
             requester: Requester object to communicate with the FastApi services.
         """
+        if requester is None:
+            requester = Requester.from_defaults()
+        self._set_attributes(
+            task_template_version,
+            node_args,
+            task_template_version.convert_arg_names_to_ids(**node_args),
+            requester,
+        )
+        self.node_args_hash = self._hash_node_args()
+
+    def _set_attributes(
+        self,
+        task_template_version: TaskTemplateVersion,
+        node_args: Dict[str, Any],
+        mapped_node_args: Dict[int, Any],
+        requester: Requester,
+    ) -> None:
+        """Set the attributes shared by __init__ and create_product, except the hash."""
         self._node_id: Optional[int] = None
+        self._default_name: Optional[str] = None
         self.task_template_version = task_template_version
         self.node_args = node_args
-        self.mapped_node_args = self.task_template_version.convert_arg_names_to_ids(
-            **self.node_args
-        )
-        self.node_args_hash = self._hash_node_args()
+        self.mapped_node_args = mapped_node_args
         self.upstream_nodes: Set[Node] = set()
         self.downstream_nodes: Set[Node] = set()
+        self.upstream_barriers: List[Barrier] = []
+        self.requester = requester
 
+    @classmethod
+    def create_product(
+        cls: Type[Node],
+        task_template_version: TaskTemplateVersion,
+        node_arg_values: Dict[str, Iterable[Any]],
+        requester: Optional[Requester] = None,
+    ) -> List[Node]:
+        """Create a node for each combination of node arg values, as ``Node(...)`` would.
+
+        Nodes come in the order of ``Array.expand_dict``. Each value is converted to a
+        string and a name fragment once, and the hash input and default name of every
+        node are joined from those, so nodes, hashes and names are the same as those of
+        nodes created one at a time.
+
+        Args:
+            task_template_version: The associated TaskTemplateVersion.
+            node_arg_values: node arg names and the values to expand.
+            requester: Requester object to communicate with the FastApi services.
+        """
+        if not node_arg_values:
+            return []
         if requester is None:
             requester = Requester.from_defaults()
-        self.requester = requester
+
+        names = list(node_arg_values.keys())
+        columns = [list(values) for values in node_arg_values.values()]
+        id_name_map = task_template_version.id_name_map
+        arg_ids = [id_name_map[name] for name in names]
+        str_columns = [[str(value) for value in column] for column in columns]
+        # the hash joins the sorted arg ids, then the values in the same order
+        hash_order = sorted(range(len(names)), key=lambda i: arg_ids[i])
+        hash_prefix = "_".join(str(arg_ids[i]) for i in hash_order) + "_"
+        hash_values_of = itemgetter(*hash_order) if len(names) > 1 else tuple
+        name_prefix = (
+            task_template_version.task_template.template_name + "_"
+        ).translate(_NAME_TRANSLATION)
+        name_columns = [
+            [f"{name}-{value}".translate(_NAME_TRANSLATION) for value in str_column]
+            for name, str_column in zip(names, str_columns)
+        ]
+        version_id = str(task_template_version.id).encode("utf-8")
+
+        nodes = []
+        for values, str_values, name_parts in zip(
+            product(*columns), product(*str_columns), product(*name_columns)
+        ):
+            node = cls.__new__(cls)
+            node._set_attributes(
+                task_template_version,
+                dict(zip(names, values)),
+                dict(zip(arg_ids, str_values)),
+                requester,
+            )
+            node.node_args_hash = int(
+                hashlib.sha256(
+                    (hash_prefix + "_".join(hash_values_of(str_values))).encode("utf-8")
+                ).hexdigest(),
+                16,
+            )
+
+            default_name = name_prefix + "_".join(name_parts)
+            node._default_name = (
+                default_name if len(default_name) < 250 else default_name[0:249]
+            )
+            hash_value = hashlib.sha256(str(node.node_args_hash).encode("utf-8"))
+            hash_value.update(version_id)
+            node._hash_val = int(hash_value.hexdigest(), 16)
+            nodes.append(node)
+        return nodes
 
     @property
     def node_id(self) -> int:
@@ -69,6 +166,8 @@ class Node:
     @property
     def default_name(self) -> str:
         """The default name of this node in the array."""
+        if self._default_name is not None:
+            return self._default_name
         name = (
             self.task_template_version.task_template.template_name
             + "_"
@@ -78,15 +177,11 @@ class Node:
         )
 
         # special char protection
-        name = "".join(
-            [
-                c if c not in SpecialChars.ILLEGAL_SPECIAL_CHARACTERS else "_"
-                for c in name
-            ]
-        )
+        name = name.translate(_NAME_TRANSLATION)
 
         # long name protection
         name = name if len(name) < 250 else name[0:249]
+        self._default_name = name
         return name
 
     def _hash_node_args(self) -> int:
@@ -117,6 +212,7 @@ class Node:
         self.upstream_nodes.add(upstream_node)
         # Add this node to the upstream nodes' downstream
         upstream_node.downstream_nodes.add(self)
+        Node.dependency_version += 1
 
     def add_upstream_nodes(self, upstream_nodes: List[Node]) -> None:
         """Add many nodes to this one's upstream Nodes.
@@ -136,6 +232,7 @@ class Node:
         self.downstream_nodes.add(downstream_node)
         # avoid endless recursion, set directly
         downstream_node.upstream_nodes.add(self)
+        Node.dependency_version += 1
 
     def add_downstream_nodes(self, downstream_nodes: List[Node]) -> None:
         """Add a list of nodes as this node's downstream nodes.
@@ -0,0 +1,152 @@
+"""Send the chunks of a bind phase to the server with several requests in flight."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import structlog
+
+from jobmon.core.configuration import JobmonConfig
+from jobmon.core.requester import Requester
+
+logger = structlog.get_logger(__name__)
+
+
+class PipelinedBinder:
+    """Binds workflow metadata chunk by chunk over the async requester.
+
+    Chunk messages are built lazily from an iterable while earlier chunks are in
+    flight, and at most ``max_in_flight`` requests are outstanding at once. Chunks of
+    a phase must be independent of each other; phases run one after another.
+    """
+
+    def __init__(
+        self, requester: Requester, max_in_flight: Optional[int] = None
+    ) -> None:
+        """Initialize the binder.
+
+        Args:
+            requester: requester whose async transport and retries are used.
+            max_in_flight: number of chunks sent at once. Defaults to the
+                http.bind_max_in_flight config value.
+        """
+        self.requester = requester
+        if max_in_flight is None:
+            max_in_flight = JobmonConfig.cached().get_int("http", "bind_max_in_flight")
+        self.max_in_flight = max(1, max_in_flight)
+
+    def run_phase(
+        self,
+        phase: str,
+        app_route: str,
+        request_type: str,
+        messages: Iterable[Dict],
+        num_items: int,
+        on_response: Optional[Callable[[Any], None]] = None,
+        send_last_after_others: bool = False,
+    ) -> float:
+        """Send every message of a bind phase and return its throughput.
+
+        Args:
+            phase: name of the phase, used in the throughput log.
+            app_route: route every message is sent to.
+            request_type: HTTP method of the route.
+            messages: one message per chunk.
+            num_items: number of nodes, edges or tasks in all the chunks.
+            on_response: called with each response as it arrives.
+            send_last_after_others: hold the last message back until every other
+                chunk has been bound. Routes that mark the bound object as complete
+                on the last chunk (mark_created) need this so that a failed chunk
+                never leaves it marked complete.
+
+        Returns:
+            Items bound per second.
+        """
+        start = time.time()
+        coro = self._run_phase(
+            app_route, request_type, messages, on_response, send_last_after_others
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coro)
+        else:
+            # Called from within a running event loop (e.g. a notebook)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+                pool.submit(asyncio.run, coro).result()
+
+        elapsed = time.time() - start
+        throughput = num_items / elapsed if elapsed > 0 else float(num_items)
+        logger.info(
+            f"Bound {num_items} {phase} in {elapsed:.2f}s ({throughput:.0f}/s)",
+            phase=phase,
+            num_items=num_items,
+            elapsed=elapsed,
+            throughput=throughput,
+        )
+        return throughput
+
+    async def _run_phase(
+        self,
+        app_route: str,
+        request_type: str,
+        messages: Iterable[Dict],
+        on_response: Optional[Callable[[Any], None]],
+        send_last_after_others: bool,
+    ) -> None:
+        import aiohttp
+
+        async with aiohttp.ClientSession() as session:
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            # chunks being sent, plus any that failed
+            in_flight: Set[asyncio.Task] = set()
+
+            async def send(message: Dict) -> None:
+                try:
+                    _, response = await self.requester.send_request_async(
+                        session=session,
+                        app_route=app_route,
+                        message=message,
+                        request_type=request_type,
+                    )
+                finally:
+                    semaphore.release()
+                if on_response is not None:
+                    on_response(response)
+
+            def forget_if_sent(task: asyncio.Task) -> None:
+                if not task.cancelled() and task.exception() is None:
+                    in_flight.discard(task)
+
+            def raise_if_failed() -> None:
+                for task in in_flight:
+                    if task.done() and not task.cancelled():
+                        error = task.exception()
+                        if error is not None:
+                            raise error
+
+            try:
+                held_back: Optional[Dict] = None
+                for message in messages:
+                    if send_last_after_others:
+                        # send the previous message and hold this one back
+                        previous, held_back = held_back, message
+                        if previous is None:
+                            continue
+                        message = previous
+                    await semaphore.acquire()
+                    # stop building chunks once one has failed
+                    raise_if_failed()
+                    task = asyncio.create_task(send(message))
+                    task.add_done_callback(forget_if_sent)
+                    in_flight.add(task)
+                await asyncio.gather(*in_flight)
+                if held_back is not None:
+                    await semaphore.acquire()
+                    await send(held_back)
+            finally:
+                for task in in_flight:
+                    task.cancel()
@@ -9,12 +9,12 @@ of workflow run state, including:
 
 from __future__ import annotations
 
-import ast
 import numbers
 import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+import requests
 import structlog
 
 from jobmon.client.swarm.array import SwarmArray
@@ -254,9 +254,9 @@ class SwarmBuilder:
 
             # Assign upstream and downstream counts
             swarm_task.num_upstreams = len(task.upstream_tasks)
-            swarm_task.downstream_swarm_tasks = {
+            swarm_task.set_downstreams(
                 temp_tasks[t.task_id] for t in task.downstream_tasks
-            }
+            )
 
             # Create array association
             state.arrays[swarm_task.array_id].add_task(swarm_task)
@@ -264,8 +264,21 @@ class SwarmBuilder:
             # Add task to SwarmState (handles status bucket)
             state.add_task(swarm_task)
 
+        # Each barrier counts as one upstream of each of its downstream tasks
+        barriers = {
+            id(barrier): barrier
+            for task in workflow.tasks.values()
+            for barrier in task.upstream_barriers
+        }
+        for barrier in barriers.values():
+            state.add_barrier(
+                [temp_tasks[t.task_id] for t in barrier.upstream_tasks],
+                [temp_tasks[t.task_id] for t in barrier.downstream_tasks],
+            )
+
         # Compute initial upstream done counts for downstream propagation
         state.compute_initial_upstream_done_counts()
+        state.compact_dependencies()
 
     # ──────────────────────────────────────────────────────────────────────────
     # Build from Workflow ID (Resume Scenarios)
@@ -292,8 +305,8 @@ class SwarmBuilder:
         # Fetch workflow metadata
         self._set_workflow_metadata(workflow_id)
 
-        # Fetch tasks in chunks with periodic heartbeats
-        self._set_tasks_from_db(chunk_size=edge_chunk_size)
+        # Stream tasks in pages with periodic heartbeats
+        self._set_tasks_from_db()
 
         # Fetch dependencies in chunks with periodic heartbeats
         self._set_downstreams_from_db(chunk_size=edge_chunk_size)
@@ -325,71 +338,71 @@ class SwarmBuilder:
 
         logger.info(f"Fetched workflow metadata: workflow_id={wf_id}, dag_id={dag_id}")
 
-    def _set_tasks_from_db(self, chunk_size: int = 500) -> None:
-        """Fetch tasks that need to run from database in chunks.
+    def _set_tasks_from_db(
+        self, page_size: int = 100_000, max_stream_retries: int = 5
+    ) -> None:
+        """Stream tasks that need to run from the database in pages.
 
-        Logs heartbeats periodically during long fetches.
+        Each page is consumed row by row as it arrives; the next page starts after
+        the last task received. If a stream breaks part way through a page it is
+        reopened after the last task received, up to max_stream_retries times in a
+        row. Logs heartbeats periodically during long fetches.
         """
         cluster_registry: dict[str, Cluster] = {}
-        all_tasks_returned = False
-        max_task_id = 0
+        after_task_id = 0
+        state = self._ensure_state()
+        stream_retries = 0
 
         logger.info("Fetching tasks from the database")
 
-        while not all_tasks_returned:
-            # Log heartbeat if needed
+        while True:
             self._maybe_heartbeat()
-            state = self._ensure_state()
-            if len(state.tasks) > 0 and len(state.tasks) % 1000 == 0:
-                logger.info(
-                    f"Still fetching tasks, {len(state.tasks)} collected so far..."
+            num_rows = 0
+            try:
+                for task in self.requester.stream_request(
+                    app_route=f"/workflow/{self._workflow_id}/resume_tasks",
+                    message={"after_task_id": after_task_id, "page_size": page_size},
+                ):
+                    self._process_task_from_db(task, cluster_registry)
+                    after_task_id = task["task_id"]
+                    num_rows += 1
+                    stream_retries = 0
+                    if num_rows % 10_000 == 0:
+                        self._maybe_heartbeat()
+                        logger.info(
+                            f"Still fetching tasks, {len(state.tasks)} collected "
+                            "so far..."
+                        )
+            except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ConnectionError,
+            ) as e:
+                stream_retries += 1
+                if stream_retries > max_stream_retries:
+                    raise
+                logger.warning(
+                    f"Task stream broke after task {after_task_id}, reopening "
+                    f"(attempt {stream_retries} of {max_stream_retries}): {e}"
                 )
+                continue
+            if num_rows < page_size:
+                break
 
-            # Fetch next chunk
-            _, resp = self.requester.send_request(
-                app_route=f"/workflow/get_tasks/{self._workflow_id}",
-                message={"max_task_id": max_task_id, "chunk_size": chunk_size},
-                request_type="get",
-            )
-            task_dict = resp["tasks"]
-
-            # Check if done
-            if not task_dict:
-                return
-            if len(task_dict) < chunk_size:
-                all_tasks_returned = True
-
-            max_task_id = max(task_dict)
-
-            # Process tasks
-            for task_id_str, metadata in task_dict.items():
-                self._process_task_from_db(int(task_id_str), metadata, cluster_registry)
-
-        logger.info(f"All tasks fetched: {len(self._ensure_state().tasks)} total")
+        logger.info(f"All tasks fetched: {len(state.tasks)} total")
 
     def _process_task_from_db(
         self,
-        task_id: int,
-        metadata: tuple,
+        task: dict,
         cluster_registry: dict[str, Cluster],
     ) -> None:
         """Process a single task from database response."""
         state = self._ensure_state()
 
-        (
-            array_id,
-            status,
-            max_attempts,
-            resource_scales,
-            fallback_queues,
-            requested_resources,
-            cluster_name,
-            queue_name,
-            array_concurrency,
-        ) = metadata
+        array_id = task["array_id"]
+        cluster_name = task["cluster_name"]
 
         # Parse resource_scales
-        resource_scales = ast.literal_eval(resource_scales)
+        resource_scales = task["resource_scales"]
         for resource, scaler in resource_scales.items():
             if not isinstance(scaler, numbers.Number):
                 if isinstance(scaler, list):
@@ -401,10 +414,6 @@ class SwarmBuilder:
                         "scales retrieved from the Jobmon DB."
                     )
 
-        # Parse other fields
-        fallback_queues_parsed = ast.literal_eval(fallback_queues)
-        requested_resources = ast.literal_eval(requested_resources)
-
         # Get or create cluster
         if cluster_name not in cluster_registry:
             cluster = Cluster(cluster_name=cluster_name, requester=self.requester)
@@ -413,22 +422,22 @@ class SwarmBuilder:
         cluster = cluster_registry[cluster_name]
 
         # Create queue and fallback queues
-        queue = cluster.get_queue(queue_name)
-        fallback_queue_objs = [cluster.get_queue(q) for q in fallback_queues_parsed]
+        queue = cluster.get_queue(task["queue_name"])
+        fallback_queue_objs = [cluster.get_queue(q) for q in task["fallback_queues"]]
 
         # Create TaskResources
         task_resources = TaskResources(
-            requested_resources=requested_resources,
+            requested_resources=task["requested_resources"],
             queue=queue,
             requester=self.requester,
         )
 
         # Create SwarmTask
         swarm_task = SwarmTask(
-            task_id=task_id,
+            task_id=task["task_id"],
             array_id=array_id,
-            status=status,
-            max_attempts=max_attempts,
+            status=task["status"],
+            max_attempts=task["max_attempts"],
             task_resources=task_resources,
             cluster=cluster,
             resource_scales=resource_scales,
@@ -439,7 +448,7 @@ class SwarmBuilder:
         if array_id not in state.arrays:
             array = SwarmArray(
                 array_id=array_id,
-                max_concurrently_running=array_concurrency,
+                max_concurrently_running=task["array_concurrency"],
             )
             state.add_array(array)
         state.arrays[array_id].add_task(swarm_task)
@@ -495,16 +504,49 @@ class SwarmBuilder:
 
         for task_id, swarm_task in state.tasks.items():
             downstream_node_ids = task_edge_map.get(task_id, set())
+            downstream_swarm_tasks: list[SwarmTask] = []
             for downstream_node_id in downstream_node_ids:
                 downstream_task_id = task_node_id_map.get(downstream_node_id)
                 if downstream_task_id is not None:
                     downstream_swarm_task = state.tasks.get(downstream_task_id)
                     if downstream_swarm_task is not None:
-                        swarm_task.downstream_swarm_tasks.add(downstream_swarm_task)
+                        downstream_swarm_tasks.append(downstream_swarm_task)
                         downstream_swarm_task.num_upstreams += 1
+            if downstream_swarm_tasks:
+                swarm_task.set_downstreams(downstream_swarm_tasks)
+
+        if state.tasks:
+            self._set_barriers_from_db(task_node_id_map)
+
+        state.compact_dependencies()
 
         logger.info("Task DAG fully constructed, swarm is ready to run")
 
+    def _set_barriers_from_db(self, task_node_id_map: dict[int, int]) -> None:
+        """Fetch barrier members and add the barriers to the state.
+
+        Members that aren't being run again are left out, like upstreams on edges.
+        """
+        state = self._ensure_state()
+        _, barrier_resp = self.requester.send_request(
+            app_route=f"/dag/{self._dag_id}/barriers",
+            message={},
+            request_type="get",
+        )
+
+        def swarm_tasks_of(node_ids: list[int]) -> list[SwarmTask]:
+            task_ids = (task_node_id_map.get(node_id) for node_id in node_ids)
+            return [
+                state.tasks[task_id]
+                for task_id in task_ids
+                if task_id is not None and task_id in state.tasks
+            ]
+
+        for upstream_node_ids, downstream_node_ids in barrier_resp["barriers"].values():
+            state.add_barrier(
+                swarm_tasks_of(upstream_node_ids), swarm_tasks_of(downstream_node_ids)
+            )
+
     # ──────────────────────────────────────────────────────────────────────────
     # Properties for backward compatibility
     # ──────────────────────────────────────────────────────────────────────────
@@ -55,6 +55,14 @@ class TaskStatusUpdatesResponse:
     tasks_by_status: dict[str, list[int]]
 
 
+@dataclass(frozen=True)
+class ConcurrencyLimitsResponse:
+    """Workflow and per-array concurrency limits."""
+
+    max_concurrently_running: int
+    array_limits: dict[int, int]
+
+
 @dataclass(frozen=True)
 class WorkflowMetadata:
     """Workflow metadata from the server."""
@@ -284,6 +292,26 @@ class ServerGateway:
         )
         return response["max_concurrently_running"]
 
+    async def get_concurrency_limits(self) -> ConcurrencyLimitsResponse:
+        """Get the workflow limit and the limits of all arrays in one request.
+
+        Returns:
+            ConcurrencyLimitsResponse with the workflow limit and limits by array ID.
+        """
+        _, response = await self._request(
+            app_route=f"/workflow/{self.workflow_id}/concurrency_limits",
+            message={},
+            request_type="get",
+        )
+        return ConcurrencyLimitsResponse(
+            max_concurrently_running=response["max_concurrently_running"],
+            # JSON object keys arrive as strings
+            array_limits={
+                int(array_id): limit
+                for array_id, limit in response["array_limits"].items()
+            },
+        )
+
     async def get_array_concurrency(self, array_id: int) -> int:
         """Get the array-level max_concurrently_running limit.
 
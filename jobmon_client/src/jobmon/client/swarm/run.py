@@ -252,7 +252,7 @@ async def _run_workflow_async(
     # Resolve defaults
     config = config or WorkflowRunConfig()
     requester = requester or Requester.from_defaults()
-    jobmon_config = JobmonConfig()
+    jobmon_config = JobmonConfig.cached()
 
     # Resolve heartbeat settings from config or JobmonConfig
     heartbeat_interval = config.heartbeat_interval
@@ -300,7 +300,7 @@ async def _resume_workflow_run_async(
     # Resolve defaults
     config = config or WorkflowRunConfig()
     requester = requester or Requester.from_defaults()
-    jobmon_config = JobmonConfig()
+    jobmon_config = JobmonConfig.cached()
 
     # Resolve heartbeat settings from config or JobmonConfig
     heartbeat_interval = config.heartbeat_interval
@@ -6,9 +6,11 @@ with compatible resources and queueing them to the server.
 
 from __future__ import annotations
 
+import heapq
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, Any, Generator
 
 import structlog
 
@@ -118,56 +120,67 @@ class Scheduler:
         - Belong to the same array
         - Have the same task resources (for efficient queueing)
         - Respect workflow and array concurrency limits
+
+        The ready queue is indexed once per tick by ``(array_id, task_resources)``
+        so building every batch is O(N) overall. Each batch is started from the
+        group holding the oldest remaining task, which keeps the FIFO order of
+        the previous full-queue scan. Tasks that are not scheduled are returned
+        to the front of the queue in their original order.
         """
         # Use SwarmState to compute capacities
         workflow_capacity = self._state.get_available_capacity()
-        array_capacities: dict[int, int] = {
-            aid: self._state.get_array_capacity(aid) for aid in self._state.arrays
-        }
-
-        unscheduled: list["SwarmTask"] = []
+        if workflow_capacity <= 0 or not self._state.ready_to_run:
+            return
+        array_capacities = self._state.get_array_capacities()
+
+        # Drain the ready queue into per-(array, resources) FIFO groups
+        pending: list["SwarmTask"] = []
+        group_index: dict[tuple[int, Any], int] = {}
+        groups: list[deque[int]] = []
+        group_arrays: list[int] = []
+        while self._state.ready_to_run:
+            task = self._state.dequeue_task()
+            if task is None:
+                break
+            key = (task.array_id, task.current_task_resources)
+            gid = group_index.get(key)
+            if gid is None:
+                gid = len(groups)
+                group_index[key] = gid
+                groups.append(deque())
+                group_arrays.append(task.array_id)
+            groups[gid].append(len(pending))
+            pending.append(task)
+
+        # Heap of (position of the oldest waiting task, group) for FIFO fairness
+        heads = [(group[0], gid) for gid, group in enumerate(groups)]
+        heapq.heapify(heads)
+        scheduled = [False] * len(pending)
 
         try:
-            while self._state.ready_to_run and workflow_capacity > 0:
-                next_task = self._state.dequeue_task()
-                if next_task is None:
-                    break
-
-                array_id = next_task.array_id
-                task_resources = next_task.current_task_resources
-
-                if array_capacities.get(array_id, 0) <= 0:
-                    # No room in this array
-                    unscheduled.append(next_task)
+            while heads and workflow_capacity > 0:
+                _, gid = heapq.heappop(heads)
+                group = groups[gid]
+                array_id = group_arrays[gid]
+
+                array_capacity = array_capacities.get(array_id, 0)
+                if array_capacity <= 0:
+                    # No room in this array; its tasks stay in the queue
                     continue
 
-                # Start a batch with this task
-                current_batch: list["SwarmTask"] = [next_task]
-                workflow_capacity -= 1
-                array_capacities[array_id] -= 1
-
-                # Try to add compatible tasks to batch
-                for _ in range(self._state.get_ready_to_run_count()):
-                    candidate = self._state.dequeue_task()
-                    if candidate is None:
-                        break
-
-                    # Check if this candidate can be added to the current batch
-                    can_add = (
-                        workflow_capacity > 0
-                        and array_capacities.get(candidate.array_id, 0) > 0
-                        and candidate.array_id == array_id
-                        and candidate.current_task_resources == task_resources
-                        and len(current_batch) < self.MAX_BATCH_SIZE
-                    )
-
-                    if can_add:
-                        current_batch.append(candidate)
-                        workflow_capacity -= 1
-                        array_capacities[candidate.array_id] -= 1
-                    else:
-                        # Put it back in the queue
-                        self._state.enqueue_task(candidate)
+                batch_size = min(
+                    len(group), array_capacity, workflow_capacity, self.MAX_BATCH_SIZE
+                )
+                current_batch: list["SwarmTask"] = []
+                for _ in range(batch_size):
+                    position = group.popleft()
+                    scheduled[position] = True
+                    current_batch.append(pending[position])
+                workflow_capacity -= batch_size
+                array_capacities[array_id] = array_capacity - batch_size
+
+                if group:
+                    heapq.heappush(heads, (group[0], gid))
 
                 array = self._state.arrays.get(array_id)
                 array_name = array.array_name if array else None
@@ -181,9 +194,10 @@ class Scheduler:
                 yield current_batch
 
         finally:
-            # Put unscheduled tasks back at the front of the queue
-            for task in reversed(unscheduled):
-                self._state.enqueue_task(task, front=True)
+            # Put unscheduled tasks back at the front of the queue, in order
+            for position in range(len(pending) - 1, -1, -1):
+                if not scheduled[position]:
+                    self._state.enqueue_task(pending[position], front=True)
 
     async def _queue_batch(self, tasks: list["SwarmTask"]) -> BatchResult:
         """Queue a batch of tasks to the server.
@@ -27,8 +27,7 @@ class Synchronizer:
 
     - Requesting server to triage overdue task instances
     - Fetching task status updates (full or incremental)
-    - Synchronizing workflow-level concurrency limits
-    - Synchronizing per-array concurrency limits
+    - Synchronizing workflow-level and per-array concurrency limits
 
     All operations are performed in parallel for better throughput.
 
@@ -102,8 +101,7 @@ class Synchronizer:
         Runs all sync operations in parallel:
         1. Request triage for overdue task instances
         2. Fetch task status updates
-        3. Fetch workflow concurrency limit
-        4. Fetch array concurrency limits
+        3. Fetch workflow and array concurrency limits in one request
 
         Args:
             full_sync: If True, fetch all task statuses regardless of last_sync.
@@ -121,20 +119,14 @@ class Synchronizer:
         tasks = [
             self._request_triage(),
             self._get_task_updates(full_sync=full_sync, last_sync=last_sync),
-            self._get_workflow_concurrency(),
+            self._get_concurrency_limits(),
         ]
 
-        # Only fetch array limits if we have arrays
-        if self._array_ids:
-            tasks.append(self._get_array_concurrency_limits())
-
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results and combine into a single StateUpdate
         combined = StateUpdate.empty()
-        op_names = ["triage", "task_status_updates", "workflow_concurrency"]
-        if self._array_ids:
-            op_names.append("array_concurrency")
+        op_names = ["triage", "task_status_updates", "concurrency_limits"]
 
         for i, result in enumerate(results):
             if isinstance(result, BaseException):
@@ -196,47 +188,26 @@ class Synchronizer:
             sync_time=response.time,
         )
 
-    async def _get_workflow_concurrency(self) -> StateUpdate:
-        """Fetch workflow-level concurrency limit from server.
-
-        Returns:
-            StateUpdate with max_concurrently_running.
-        """
-        limit = await self._gateway.get_workflow_concurrency()
-        return StateUpdate(max_concurrently_running=limit)
+    async def _get_concurrency_limits(self) -> StateUpdate:
+        """Fetch workflow-level and per-array concurrency limits from server.
 
-    async def _get_array_concurrency_limits(self) -> StateUpdate:
-        """Fetch per-array concurrency limits from server.
+        All limits come back in one request; array limits are filtered to the
+        arrays this synchronizer knows about.
 
         Returns:
-            StateUpdate with array_limits.
+            StateUpdate with max_concurrently_running and array_limits.
         """
-        if not self._array_ids:
-            return StateUpdate.empty()
-
-        async def fetch_one(aid: int) -> tuple[int, int]:
-            limit = await self._gateway.get_array_concurrency(aid)
-            return aid, limit
-
-        results = await asyncio.gather(
-            *[fetch_one(aid) for aid in self._array_ids],
-            return_exceptions=True,
+        response = await self._gateway.get_concurrency_limits()
+        array_limits = {
+            aid: limit
+            for aid, limit in response.array_limits.items()
+            if aid in self._array_ids
+        }
+        return StateUpdate(
+            max_concurrently_running=response.max_concurrently_running,
+            array_limits=array_limits,
         )
 
-        array_limits: dict[int, int] = {}
-        for result in results:
-            if isinstance(result, BaseException):
-                logger.warning(
-                    "Failed to fetch array concurrency limit",
-                    error=str(result),
-                    exc_info=result,
-                )
-            else:
-                aid, limit = result
-                array_limits[aid] = limit
-
-        return StateUpdate(array_limits=array_limits)
-
     async def request_triage_only(self) -> None:
         """Convenience method to only request triage without full sync.
 
@@ -267,15 +238,10 @@ class Synchronizer:
         Returns:
             StateUpdate with workflow and array concurrency limits.
         """
-        tasks = [self._get_workflow_concurrency()]
-        if self._array_ids:
-            tasks.append(self._get_array_concurrency_limits())
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        combined = StateUpdate.empty()
-        for result in results:
-            if isinstance(result, StateUpdate):
-                combined = combined.merge(result)
-
-        return combined
+        try:
+            return await self._get_concurrency_limits()
+        except Exception as e:
+            logger.warning(
+                "Failed to fetch concurrency limits", error=str(e), exc_info=e
+            )
+            return StateUpdate.empty()
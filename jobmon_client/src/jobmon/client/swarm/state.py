@@ -9,10 +9,11 @@ from __future__ import annotations
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 import structlog
 
+from jobmon.client.swarm.task import DownstreamGraph, SwarmBarrier
 from jobmon.core.constants import TaskStatus, WorkflowRunStatus
 
 if TYPE_CHECKING:
@@ -34,6 +35,7 @@ ACTIVE_TASK_STATUSES: tuple[str, ...] = (
     TaskStatus.LAUNCHED,
     TaskStatus.RUNNING,
 )
+_ACTIVE_TASK_STATUS_SET: frozenset[str] = frozenset(ACTIVE_TASK_STATUSES)
 
 # Workflow-run statuses indicating the server has already decided the run must stop.
 SERVER_STOP_STATUSES: frozenset[str] = frozenset(
@@ -216,6 +218,10 @@ class SwarmState:
             TaskStatus.ERROR_FATAL: set(),
         }
 
+        # Incremental in-flight counters: array_id -> count of active tasks
+        self._active_by_array: dict[int, int] = {}
+        self._active_total: int = 0
+
         # Scheduling queue
         self.ready_to_run: deque["SwarmTask"] = deque()
 
@@ -226,6 +232,12 @@ class SwarmState:
         # Sync tracking
         self.last_sync: Optional[datetime] = None
 
+        # Compact downstream adjacency, set by compact_dependencies()
+        self._graph: Optional[DownstreamGraph] = None
+
+        # All-to-all dependencies, counted down instead of propagated per edge
+        self.barriers: list[SwarmBarrier] = []
+
         # Cached TaskResources by hash to avoid duplicate binds
         self.task_resources_cache: dict[int, "TaskResources"] = {}
 
@@ -244,6 +256,8 @@ class SwarmState:
         """
         self.tasks[task.task_id] = task
         self._task_status_map[task.status].add(task)
+        if task.status in _ACTIVE_TASK_STATUS_SET:
+            self._adjust_active(task.array_id, 1)
 
     def add_array(self, array: "SwarmArray") -> None:
         """Register an array with the state.
@@ -253,6 +267,29 @@ class SwarmState:
         """
         self.arrays[array.array_id] = array
 
+    def add_barrier(
+        self, upstreams: Iterable["SwarmTask"], downstreams: Iterable["SwarmTask"]
+    ) -> Optional[SwarmBarrier]:
+        """Make every downstream task wait for all of the upstream tasks.
+
+        A barrier without upstream tasks (e.g. all of them finished in a previous
+        run) or without downstream tasks constrains nothing and is not added.
+
+        Args:
+            upstreams: The tasks that must all finish.
+            downstreams: The tasks waiting on them.
+
+        Returns:
+            The barrier, or None if it was not added.
+        """
+        upstreams = list(upstreams)
+        downstreams = list(downstreams)
+        if not upstreams or not downstreams:
+            return None
+        barrier = SwarmBarrier(upstreams, downstreams)
+        self.barriers.append(barrier)
+        return barrier
+
     def get_task(self, task_id: int) -> Optional["SwarmTask"]:
         """Get a task by ID.
 
@@ -277,6 +314,11 @@ class SwarmState:
         """Count of tasks currently in-flight."""
         return sum(len(self._task_status_map[s]) for s in ACTIVE_TASK_STATUSES)
 
+    def get_status_count(self, status: str) -> int:
+        """Count of tasks currently in ``status``."""
+        bucket = self._task_status_map.get(status)
+        return len(bucket) if bucket is not None else 0
+
     def get_ready_to_run_count(self) -> int:
         """Count of tasks ready to be scheduled."""
         return len(self.ready_to_run)
@@ -333,17 +375,59 @@ class SwarmState:
             return 0
 
         array = self.arrays[array_id]
-        active_in_array = sum(
-            1 for task in self._get_active_tasks() if task.array_id == array_id
-        )
+        active_in_array = self._get_active_counts().get(array_id, 0)
         return max(0, array.max_concurrently_running - active_in_array)
 
-    def _get_active_tasks(self) -> set["SwarmTask"]:
-        """Get all tasks currently in active statuses."""
-        result: set["SwarmTask"] = set()
+    def get_array_capacities(self) -> dict[int, int]:
+        """Available capacity for every registered array, keyed by array_id."""
+        active_counts = self._get_active_counts()
+        return {
+            array_id: max(
+                0, array.max_concurrently_running - active_counts.get(array_id, 0)
+            )
+            for array_id, array in self.arrays.items()
+        }
+
+    def get_array_active_count(self, array_id: int) -> int:
+        """Count of in-flight tasks in this array."""
+        return self._get_active_counts().get(array_id, 0)
+
+    def _get_active_counts(self) -> dict[int, int]:
+        """Per-array in-flight counts, maintained as task statuses change.
+
+        The status buckets are the source of truth. If they were changed without
+        going through this class the totals disagree and the counters are
+        rebuilt, which costs one pass over the active tasks.
+        """
+        if self.get_active_task_count() != self._active_total:
+            self._rebuild_active_counters()
+        return self._active_by_array
+
+    def _rebuild_active_counters(self) -> None:
+        counts: dict[int, int] = {}
+        total = 0
         for status in ACTIVE_TASK_STATUSES:
-            result |= self._task_status_map[status]
-        return result
+            for task in self._task_status_map[status]:
+                counts[task.array_id] = counts.get(task.array_id, 0) + 1
+                total += 1
+        self._active_by_array = counts
+        self._active_total = total
+
+    def _adjust_active(self, array_id: int, delta: int) -> None:
+        self._active_by_array[array_id] = self._active_by_array.get(array_id, 0) + delta
+        self._active_total += delta
+
+    def _move_task(self, task: "SwarmTask", new_status: str) -> None:
+        """Move a task between status buckets and update the active counters."""
+        old_status = task.status
+        self._task_status_map[old_status].discard(task)
+        task.status = new_status
+        self._task_status_map[new_status].add(task)
+
+        was_active = old_status in _ACTIVE_TASK_STATUS_SET
+        is_active = new_status in _ACTIVE_TASK_STATUS_SET
+        if was_active != is_active:
+            self._adjust_active(task.array_id, 1 if is_active else -1)
 
     def get_percent_done(self) -> float:
         """Calculate completion percentage."""
@@ -373,14 +457,7 @@ class SwarmState:
         for task_id, new_status in update.task_statuses.items():
             task = self.tasks.get(task_id)
             if task is not None and task.status != new_status:
-                # Remove from old status bucket
-                old_status = task.status
-                self._task_status_map[old_status].discard(task)
-
-                # Update task and add to new bucket
-                task.status = new_status
-                self._task_status_map[new_status].add(task)
-
+                self._move_task(task, new_status)
                 changed_tasks.add(task)
 
         # Update workflow concurrency limit
@@ -419,13 +496,7 @@ class SwarmState:
         if task.status == new_status:
             return False
 
-        # Remove from old bucket
-        self._task_status_map[task.status].discard(task)
-
-        # Update and add to new bucket
-        task.status = new_status
-        self._task_status_map[new_status].add(task)
-
+        self._move_task(task, new_status)
         return True
 
     def propagate_completions(
@@ -442,7 +513,7 @@ class SwarmState:
         newly_ready: list["SwarmTask"] = []
 
         for task in completed_tasks:
-            for downstream in task.downstream_swarm_tasks:
+            for downstream in task.iter_downstreams():
                 downstream.num_upstreams_done += 1
                 # Only return tasks that are in REGISTERING status and have all
                 # upstreams done. Tasks in other states (e.g., already DONE from
@@ -453,6 +524,13 @@ class SwarmState:
                     and downstream.all_upstreams_done
                 ):
                     newly_ready.append(downstream)
+            for barrier in task._barriers:
+                for downstream in barrier.upstream_done():
+                    if (
+                        downstream.status == TaskStatus.REGISTERING
+                        and downstream.all_upstreams_done
+                    ):
+                        newly_ready.append(downstream)
 
         return newly_ready
 
@@ -519,5 +597,24 @@ class SwarmState:
         Call this after all tasks and their relationships are registered.
         """
         for task in self._task_status_map[TaskStatus.DONE]:
-            for downstream in task.downstream_swarm_tasks:
+            for downstream in task.iter_downstreams():
                 downstream.num_upstreams_done += 1
+            for barrier in task._barriers:
+                barrier.upstream_done()
+
+    def compact_dependencies(self) -> None:
+        """Move every task's downstream edges into one shared CSR graph.
+
+        Call this after all tasks and their relationships are registered. Edges
+        then cost a few bytes each instead of a Python set per task; the
+        ``downstream_swarm_tasks`` view on each task is unchanged.
+        """
+        graph = DownstreamGraph(list(self.tasks.values()))
+        graph.attach()
+        self._graph = graph
+        logger.debug(
+            "Compacted swarm dependency graph",
+            num_tasks=len(graph.tasks),
+            num_edges=len(graph.targets),
+            num_barriers=len(self.barriers),
+        )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Set
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import structlog
 
@@ -13,8 +14,137 @@ from jobmon.core.cluster_protocol import ClusterQueue
 logger = structlog.get_logger(__name__)
 
 
+class DownstreamGraph:
+    """Compressed sparse row (CSR) adjacency of downstream task edges.
+
+    Tasks are numbered by their position in ``tasks``. The downstreams of the
+    task at position ``i`` are ``tasks[targets[j]]`` for ``j`` in
+    ``offsets[i]:offsets[i + 1]``. Storing edges as two flat integer arrays
+    costs 4 bytes per edge instead of a Python ``set`` per task.
+    """
+
+    __slots__ = ("tasks", "offsets", "targets")
+
+    def __init__(self, tasks: Sequence[SwarmTask]) -> None:
+        """Build the adjacency from each task's pending downstream tuple.
+
+        Args:
+            tasks: the tasks to index. Every downstream must be in this sequence.
+        """
+        self.tasks: Tuple[SwarmTask, ...] = tuple(tasks)
+        positions = {id(task): i for i, task in enumerate(self.tasks)}
+
+        offsets = array("i", [0])
+        targets = array("i")
+        for task in self.tasks:
+            for downstream in task._pending_downstreams():
+                position = positions.get(id(downstream))
+                if position is None:
+                    raise ValueError(
+                        f"Downstream task {downstream.task_id} of task {task.task_id} "
+                        "is not part of the graph."
+                    )
+                targets.append(position)
+            offsets.append(len(targets))
+        self.offsets = offsets
+        self.targets = targets
+
+    def downstreams(self, index: int) -> Iterable[SwarmTask]:
+        """Yield the downstream tasks of the task at ``index``."""
+        tasks = self.tasks
+        targets = self.targets
+        for j in range(self.offsets[index], self.offsets[index + 1]):
+            yield tasks[targets[j]]
+
+    def num_downstreams(self, index: int) -> int:
+        """Count the downstream tasks of the task at ``index``."""
+        return self.offsets[index + 1] - self.offsets[index]
+
+    def attach(self) -> None:
+        """Point every indexed task at this graph and drop its pending edges."""
+        for index, task in enumerate(self.tasks):
+            task._graph = self
+            task._index = index
+            task._downstream = ()
+
+
+class SwarmBarrier:
+    """An all-to-all dependency between groups of swarm tasks, evaluated by counting.
+
+    Each downstream task counts the barrier as a single upstream. The barrier counts
+    its finished upstream tasks and releases every downstream task once they are all
+    done, so completions cost one increment instead of one per downstream task.
+    """
+
+    __slots__ = ("upstreams", "downstreams", "num_upstreams_done")
+
+    def __init__(
+        self, upstreams: Sequence[SwarmTask], downstreams: Sequence[SwarmTask]
+    ) -> None:
+        """Create the barrier and count it as an upstream of each downstream task.
+
+        Args:
+            upstreams: the tasks that must all finish.
+            downstreams: the tasks waiting on them.
+        """
+        self.upstreams: Tuple[SwarmTask, ...] = tuple(dict.fromkeys(upstreams))
+        self.downstreams: Tuple[SwarmTask, ...] = tuple(dict.fromkeys(downstreams))
+        self.num_upstreams_done = 0
+        for task in self.upstreams:
+            task._barriers = task._barriers + (self,)
+        for task in self.downstreams:
+            task.num_upstreams += 1
+
+    @property
+    def num_upstreams(self) -> int:
+        """Number of tasks that must finish."""
+        return len(self.upstreams)
+
+    def upstream_done(self) -> Tuple[SwarmTask, ...]:
+        """Count one finished upstream; return the downstreams it released, if any."""
+        self.num_upstreams_done += 1
+        if self.num_upstreams_done == len(self.upstreams):
+            for task in self.downstreams:
+                task.num_upstreams_done += 1
+            return self.downstreams
+        return ()
+
+    def __repr__(self) -> str:
+        """A representation string for a SwarmBarrier instance."""
+        return (
+            f"SwarmBarrier(num_upstreams={len(self.upstreams)}, "
+            f"num_upstreams_done={self.num_upstreams_done}, "
+            f"num_downstreams={len(self.downstreams)})"
+        )
+
+
 class SwarmTask(object):
-    """Swarm side task object."""
+    """Swarm side task object.
+
+    Instances use ``__slots__`` so that million-task workflows don't pay for a
+    per-task ``__dict__``. Downstream edges are held as a tuple while the swarm
+    is being built and moved into a shared :class:`DownstreamGraph` once
+    :meth:`SwarmState.compact_dependencies` runs. Barriers the task is an
+    upstream of are held as a tuple of :class:`SwarmBarrier`.
+    """
+
+    __slots__ = (
+        "task_id",
+        "array_id",
+        "status",
+        "current_task_resources",
+        "compute_resources_callable",
+        "fallback_queues",
+        "resource_scales",
+        "cluster",
+        "max_attempts",
+        "num_upstreams",
+        "num_upstreams_done",
+        "_downstream",
+        "_graph",
+        "_index",
+        "_barriers",
+    )
 
     def __init__(
         self,
@@ -48,7 +178,10 @@ class SwarmTask(object):
         self.array_id = array_id
         self.status = status
 
-        self.downstream_swarm_tasks: Set[SwarmTask] = set()
+        self._downstream: Tuple[SwarmTask, ...] = ()
+        self._graph: Optional[DownstreamGraph] = None
+        self._index: int = -1
+        self._barriers: Tuple[SwarmBarrier, ...] = ()
 
         self.current_task_resources = task_resources
         self.compute_resources_callable = compute_resources_callable
@@ -72,10 +205,37 @@ class SwarmTask(object):
         else:
             return False
 
+    def iter_downstreams(self) -> Iterable[SwarmTask]:
+        """Iterate over downstream tasks without building a container."""
+        if self._graph is not None:
+            return self._graph.downstreams(self._index)
+        return iter(self._downstream)
+
+    def _pending_downstreams(self) -> Tuple[SwarmTask, ...]:
+        if self._graph is not None:
+            return tuple(self._graph.downstreams(self._index))
+        return self._downstream
+
+    @property
+    def downstream_swarm_tasks(self) -> frozenset[SwarmTask]:
+        """Return the set of downstream tasks."""
+        return frozenset(self.iter_downstreams())
+
+    @downstream_swarm_tasks.setter
+    def downstream_swarm_tasks(self, tasks: Iterable[SwarmTask]) -> None:
+        """Replace the downstream tasks, detaching from any compacted graph."""
+        self.set_downstreams(tasks)
+
+    def set_downstreams(self, tasks: Iterable[SwarmTask]) -> None:
+        """Replace the downstream tasks, detaching from any compacted graph."""
+        self._downstream = tuple(dict.fromkeys(tasks))
+        self._graph = None
+        self._index = -1
+
     @property
     def downstream_tasks(self) -> List[SwarmTask]:
         """Return list of downstream tasks."""
-        return list(self.downstream_swarm_tasks)
+        return list(self.iter_downstreams())
 
     def __hash__(self) -> int:
         """Returns the ID of the task."""
@@ -5,6 +5,7 @@ TaskInstances will be created from it for every execution.
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import numbers
 from http import HTTPStatus as StatusCodes
@@ -13,10 +14,12 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Set,
+    Type,
     Union,
 )
 
@@ -34,6 +37,7 @@ from jobmon.core.serializers import (
 
 if TYPE_CHECKING:
     from jobmon.client.array import Array
+    from jobmon.client.barrier import Barrier
     from jobmon.client.workflow import Workflow
 
 logger = structlog.get_logger(__name__)
@@ -144,73 +148,197 @@ class Task:
         """
         if requester is None:
             requester = Requester.from_defaults()
-        self.requester = requester
 
         # pre bind hash defining attributes
-        self.node = node
-        self.task_args = task_args
-        self.mapped_task_args = (
-            self.node.task_template_version.convert_arg_names_to_ids(**self.task_args)
+        mapped_task_args = node.task_template_version.convert_arg_names_to_ids(
+            **task_args
+        )
+        command = node.task_template_version.command_template.format(
+            **node.node_args, **task_args, **op_args
         )
-        self.task_args_hash = self._hash_task_args()
-        self.op_args = op_args
 
-        # pre bind mutable attributes
-        self.command = self.node.task_template_version.command_template.format(
-            **self.node.node_args, **self.task_args, **self.op_args
+        # Names of jobs can't start with a numeric.
+        if not name:
+            name = node.default_name
+        self.is_valid_job_name(name)
+
+        self._set_attributes(
+            node=node,
+            task_args=task_args,
+            mapped_task_args=mapped_task_args,
+            task_args_hash=self._hash_mapped_args(mapped_task_args),
+            op_args=op_args,
+            command=command,
+            name=name,
+            upstream_tasks=upstream_tasks if upstream_tasks else [],
+            task_attributes=self._format_task_attributes(task_attributes),
+            max_attempts=max_attempts,
+            cluster_name=cluster_name,
+            compute_resources=(
+                compute_resources if compute_resources is not None else {}
+            ),
+            compute_resources_callable=compute_resources_callable,
+            resource_scales=resource_scales if resource_scales is not None else {},
+            fallback_queues=fallback_queues if fallback_queues is not None else [],
+            requester=requester,
         )
 
         # Not all tasks bound to an array initially
         if array is not None:
             self.array = array
 
-        # Names of jobs can't start with a numeric.
-        if not name:
-            name = self.node.default_name
-        self.is_valid_job_name(name)
+    def _set_attributes(
+        self,
+        node: Node,
+        task_args: Dict[str, Any],
+        mapped_task_args: Dict[int, Any],
+        task_args_hash: int,
+        op_args: Dict[str, Any],
+        command: str,
+        name: str,
+        upstream_tasks: Iterable[Task],
+        task_attributes: Dict[str, Optional[str]],
+        max_attempts: Optional[int],
+        cluster_name: str,
+        compute_resources: Dict[str, Any],
+        compute_resources_callable: Optional[Callable],
+        resource_scales: Dict[str, Any],
+        fallback_queues: List[str],
+        requester: Requester,
+    ) -> None:
+        """Set the attributes of a task from arguments already validated and derived.
+
+        Shared by __init__ and create_many so that both build the same task.
+        """
+        self.requester = requester
+
+        # pre bind hash defining attributes
+        self.node = node
+        self.task_args = task_args
+        self.mapped_task_args = mapped_task_args
+        self.task_args_hash = task_args_hash
+        self.op_args = op_args
+
+        # pre bind mutable attributes
+        self.command = command
         self.name = name
 
         # upstream and downstream task relationships
-        self.upstream_tasks: Set[Task] = (
-            set(upstream_tasks) if upstream_tasks else set()
-        )
+        self.upstream_tasks: Set[Task] = set(upstream_tasks)
         self.downstream_tasks: Set[Task] = set()
         for task in self.upstream_tasks:
             self.add_upstream(task)
+        self.upstream_barriers: List[Barrier] = []
 
-        self.task_attributes: dict = {}
-        if isinstance(task_attributes, List):
-            for attr in task_attributes:
-                self.task_attributes[attr] = None
-        elif isinstance(task_attributes, dict):
-            for attr in task_attributes:
-                self.task_attributes[str(attr)] = str(task_attributes[attr])
-        else:
-            raise ValueError(
-                "task_attributes must be provided as a list of attributes or a "
-                "dictionary of attributes and their values"
-            )
+        self.task_attributes: dict = task_attributes
 
         # mutable operational/cluster behaviour
         self._instance_max_attempts = max_attempts
         self._instance_cluster_name = cluster_name
-        self._instance_compute_resources = (
-            compute_resources if compute_resources is not None else {}
-        )
+        self._instance_compute_resources = compute_resources
         self._instance_compute_resources_callable = compute_resources_callable
-        self._instance_resource_scales = (
-            resource_scales if resource_scales is not None else {}
-        )
+        self._instance_resource_scales = resource_scales
 
-        self.fallback_queues: List[str] = (
-            fallback_queues if fallback_queues is not None else []
-        )
+        self.fallback_queues: List[str] = fallback_queues
 
         # error api
         self._errors: Union[
             None, Dict[str, Union[int, List[Dict[str, Union[str, int]]]]]
         ] = None
 
+    @staticmethod
+    def _format_task_attributes(
+        task_attributes: Union[List, dict, None],
+    ) -> Dict[str, Optional[str]]:
+        """Map attribute names to their string values, or None if given as a list."""
+        if isinstance(task_attributes, List):
+            return dict.fromkeys(task_attributes)
+        elif isinstance(task_attributes, dict):
+            return {str(attr): str(value) for attr, value in task_attributes.items()}
+        else:
+            raise ValueError(
+                "task_attributes must be provided as a list of attributes or a "
+                "dictionary of attributes and their values"
+            )
+
+    @classmethod
+    def create_many(
+        cls: Type[Task],
+        nodes: List[Node],
+        task_args: Dict[str, Any],
+        op_args: Dict[str, Any],
+        resource_scales: Optional[Dict[str, Any]] = None,
+        max_attempts: Optional[int] = None,
+        upstream_tasks: Optional[List[Task]] = None,
+        task_attributes: Union[List, dict, None] = None,
+        requester: Optional[Requester] = None,
+        upstream_barrier: Optional[Barrier] = None,
+    ) -> List[Task]:
+        """Create a task for each node sharing the same args, as ``Task(...)`` would.
+
+        Everything that does not depend on the node (the task args hash, the formatted
+        task attributes, resource scales without iterators) is computed once and
+        shared, and each task's hash is computed up front. Commands, names and hashes
+        are the same as those of tasks created one at a time. Tasks created with an
+        ``upstream_barrier`` wait for all of its upstream tasks without an edge to each.
+        """
+        if requester is None:
+            requester = Requester.from_defaults()
+        if not nodes:
+            return []
+
+        task_template_version = nodes[0].task_template_version
+        mapped_task_args = task_template_version.convert_arg_names_to_ids(**task_args)
+        task_args_hash = cls._hash_mapped_args(mapped_task_args)
+        task_args_hash_bytes = str(task_args_hash).encode("utf-8")
+        command_template = task_template_version.command_template
+        fixed_args = dict(task_args, **op_args)
+
+        if task_attributes is None:
+            task_attributes = {}
+        attributes = cls._format_task_attributes(task_attributes)
+
+        # iterators are stateful, so each task needs its own
+        shared_scales = copy.deepcopy(resource_scales) if resource_scales else {}
+        own_scales = any(isinstance(v, Iterator) for v in shared_scales.values())
+        upstreams = set(upstream_tasks) if upstream_tasks else set()
+
+        # default names start with the template name and have illegal characters
+        # replaced, so checking one checks them all
+        cls.is_valid_job_name(nodes[0].default_name)
+
+        tasks = []
+        for node in nodes:
+            task = cls.__new__(cls)
+            hash_value = hashlib.sha256(str(hash(node)).encode("utf-8"))
+            hash_value.update(task_args_hash_bytes)
+            task._hash_val = int(hash_value.hexdigest(), 16)
+            task._set_attributes(
+                node=node,
+                task_args=task_args,
+                mapped_task_args=mapped_task_args,
+                task_args_hash=task_args_hash,
+                op_args=op_args,
+                command=command_template.format(**node.node_args, **fixed_args),
+                name=node.default_name,
+                upstream_tasks=upstreams,
+                task_attributes=dict(attributes),
+                max_attempts=max_attempts,
+                cluster_name="",
+                compute_resources={},
+                compute_resources_callable=None,
+                resource_scales=(
+                    copy.deepcopy(shared_scales) if own_scales else shared_scales
+                ),
+                fallback_queues=[],
+                requester=requester,
+            )
+            if upstream_barrier is not None:
+                upstream_barrier.add_downstream(task)
+
+            tasks.append(task)
+        return tasks
+
     @property
     def compute_resources(self) -> Dict[str, Any]:
         try:
@@ -468,10 +596,14 @@ class Task:
 
     def _hash_task_args(self) -> int:
         """A hash of the encoded result of the args and values concatenated together."""
-        arg_ids = list(self.mapped_task_args.keys())
+        return self._hash_mapped_args(self.mapped_task_args)
+
+    @staticmethod
+    def _hash_mapped_args(mapped_task_args: Dict[int, Any]) -> int:
+        arg_ids = list(mapped_task_args.keys())
         arg_ids.sort()
 
-        arg_values = [str(self.mapped_task_args[key]) for key in arg_ids]
+        arg_values = [str(mapped_task_args[key]) for key in arg_ids]
         str_arg_ids = [str(arg) for arg in arg_ids]
 
         hash_value = int(
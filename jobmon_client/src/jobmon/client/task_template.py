@@ -26,6 +26,7 @@ from jobmon.client.task import Task, validate_task_resource_scales
 from jobmon.client.task_template_version import TaskTemplateVersion
 from jobmon.core.constants import ExecludeTTVs, MaxConcurrentlyRunning
 from jobmon.core.exceptions import InvalidResponse
+from jobmon.core.metadata_cache import get_metadata_cache
 from jobmon.core.requester import Requester
 from jobmon.core.serializers import (
     SerializeClientTaskTemplate,
@@ -122,7 +123,8 @@ class TaskTemplate:
             return
 
         app_route = "/task_template"
-        return_code, response = self.requester.send_request(
+        return_code, response = get_metadata_cache().send_request(
+            self.requester,
             app_route=app_route,
             message={
                 "tool_version_id": tool_version.id,
@@ -437,6 +439,7 @@ class TaskTemplate:
     def load_task_template_versions(self) -> None:
         """Load task template versions associated with this task template from the database."""
         app_route = f"/task_template/{self.id}/versions"
+        # not cached: a version created by another process must be seen at once
         return_code, response = self.requester.send_request(
             app_route=app_route, message={}, request_type="get"
         )
@@ -637,6 +640,7 @@ class TaskTemplate:
         resource_scales: Optional[Dict[str, Any]] = None,
         cluster_name: str = "",
         name: Optional[str] = None,
+        barrier: bool = False,
         **kwargs: Any,
     ) -> List[Task]:
         """Creates a set of tasks equal to the cross product of all node args.
@@ -655,6 +659,8 @@ class TaskTemplate:
             **kwargs: task, node, and op_args as defined in the command template. If you
                 provide node_args as an iterable, they will be expanded.
             name: the name of the array.
+            barrier: wait for upstream_tasks through one all-to-all Barrier instead of
+                an edge from every upstream task to every task in this array.
         """
         if upstream_tasks is None:
             upstream_tasks = []
@@ -704,6 +710,7 @@ class TaskTemplate:
             upstream_tasks=upstream_tasks,
             max_attempts=max_attempts,
             resource_scales=resource_scales,
+            barrier=barrier,
             **node_args,
         )
         return tasks
@@ -17,6 +17,7 @@ from jobmon.client.tool_version import ToolVersion
 from jobmon.client.workflow import Workflow
 from jobmon.core.constants import MaxConcurrentlyRunning
 from jobmon.core.exceptions import InvalidResponse
+from jobmon.core.metadata_cache import get_metadata_cache
 from jobmon.core.requester import Requester
 from jobmon.core.serializers import SerializeClientTool
 
@@ -566,6 +567,7 @@ class Tool:
 
     def _load_tool_versions(self) -> List[ToolVersion]:
         app_route = f"/tool/{self.id}/tool_versions"
+        # not cached: a version created by another process must be seen at once
         return_code, response = self.requester.send_request(
             app_route=app_route, message={}, request_type="get"
         )
@@ -585,7 +587,8 @@ class Tool:
     def _bind(self) -> None:
         """Call route to create tool."""
         app_route = "/tool"
-        return_code, response = self.requester.send_request(
+        return_code, response = get_metadata_cache().send_request(
+            self.requester,
             app_route=app_route,
             message={"name": self.name},
             request_type="post",
@@ -19,6 +19,7 @@ import structlog
 
 from jobmon.client.array import Array
 from jobmon.client.dag import Dag
+from jobmon.client.pipelined_binder import PipelinedBinder
 from jobmon.client.swarm import WorkflowRunConfig, run_workflow
 from jobmon.client.task import Task
 from jobmon.client.task_resources import TaskResources
@@ -244,6 +245,8 @@ class Workflow(object):
         self._dag = Dag(requester)
         # hash to task object mapping. ensure only 1
         self.tasks: Dict[int, Task] = {}
+        self._task_hash_count: Optional[int] = None
+        self._task_hash = 0
         self.arrays: Dict[str, Array] = {}
         self._chunk_size: int = chunk_size
 
@@ -319,13 +322,21 @@ class Workflow(object):
 
     @property
     def task_hash(self) -> int:
-        """Hash of all of the tasks."""
-        hash_value = hashlib.sha256()
-        tasks = sorted(self.tasks.values())
-        if len(tasks) > 0:  # if there are no tasks, we want to skip this
-            for task in tasks:
-                hash_value.update(str(hash(task)).encode("utf-8"))
-        return int(hash_value.hexdigest(), 16)
+        """Hash of all of the tasks.
+
+        Tasks are only ever added and are keyed by their hash, so the hash is kept
+        until the number of tasks changes.
+        """
+        if self._task_hash_count != len(self.tasks):
+            # sha256 of the concatenation equals one update per task, sorted by hash
+            self._task_hash = int(
+                hashlib.sha256(
+                    "".join(map(str, sorted(self.tasks))).encode("utf-8")
+                ).hexdigest(),
+                16,
+            )
+            self._task_hash_count = len(self.tasks)
+        return self._task_hash
 
     @property
     def task_errors(self) -> Dict:
@@ -565,7 +576,7 @@ class Workflow(object):
         logger.info("Adding Workflow metadata to database")
         self.bind()
 
-        jobmon_config = JobmonConfig()
+        jobmon_config = JobmonConfig.cached()
         try:
             gui_url = jobmon_config.get("http", "gui_url")
         except ConfigError:
@@ -783,75 +794,29 @@ class Workflow(object):
         reset_if_running: bool = True,
         chunk_size: int = 500,
     ) -> None:
-        app_route = "/task/bind_tasks_no_args"
-        remaining_task_hashes = list(self.tasks.keys())
-
-        while remaining_task_hashes:
-            # split off first chunk elements from queue.
-            task_hashes_chunk = remaining_task_hashes[:chunk_size]
-            remaining_task_hashes = remaining_task_hashes[chunk_size:]
-
-            # If this is the last chunk, mark the created_date field in the
-            # database.
-            mark_created = len(remaining_task_hashes) == 0
-
-            # send to server in a format of:
-            # {<hash>:[workflow_id(0), node_id(1), task_args_hash(2), array_id(3),
-            # name(4), command(5), max_attempts(6)], reset_if_running(7), task_args(8),
-            # task_attributes(9), resource_scales(10), fallback_queues(11)}
-            # flat the data structure so that the server won't depend on the client
-            task_metadata: Dict[int, List] = {}
-            for task_hash in task_hashes_chunk:
-                task = self.tasks[task_hash]
-
-                # get array id
-                array = task.array
-                if not array.is_bound:
-                    array.bind()
-
-                # get task resources id
-                self._set_original_task_resources(task)
-
-                serializable_resource_scales = copy.copy(task.resource_scales)
-                for resource, scaler in task.resource_scales.items():
-                    # We can't serialize a callable, so use the function name instead.
-                    if callable(scaler):
-                        serializable_resource_scales[resource] = getattr(  # type: ignore
-                            scaler, "__name__", "Unknown Callable"  # type: ignore
-                        )
-                    # We can't serialize an iterator, so take the relevant elements as a
-                    # list.
-                    elif isinstance(scaler, Iterator):
-                        serializable_resource_scales[resource] = list(  # type: ignore
-                            itertools.islice(
-                                copy.deepcopy(scaler), task.max_attempts - 1
-                            )
-                        )
-
-                task_metadata[task_hash] = [
-                    task.node.node_id,
-                    str(task.task_args_hash),
-                    task.array.array_id,
-                    task.original_task_resources.id,
-                    task.name,
-                    task.command,
-                    task.max_attempts,
-                    reset_if_running,
-                    serializable_resource_scales,
-                    task.fallback_queues,
-                ]
-
-            parameters = {
-                "workflow_id": self.workflow_id,
-                "tasks": task_metadata,
-                "mark_created": mark_created,
-            }
-            return_code, response = self.requester.send_request(
-                app_route=app_route,
-                message=parameters,
-                request_type="put",
-            )
+        task_hashes = list(self.tasks.keys())
 
+        # arrays and task resources bind with blocking requests, so bind them here
+        # rather than while chunks are built inside the binder's event loop
+        for task in self.tasks.values():
+            if not task.array.is_bound:
+                task.array.bind()
+            self._set_original_task_resources(task)
+
+        def messages() -> Iterator[Dict]:
+            for start in range(0, len(task_hashes), chunk_size):
+                task_hashes_chunk = task_hashes[start : start + chunk_size]
+                yield {
+                    "workflow_id": self.workflow_id,
+                    "tasks": self._get_task_metadata(
+                        task_hashes_chunk, reset_if_running
+                    ),
+                    # If this is the last chunk, mark the created_date field in the
+                    # database.
+                    "mark_created": start + chunk_size >= len(task_hashes),
+                }
+
+        def on_response(response: Dict) -> None:
             # populate returned values onto task dict
             return_tasks = response["tasks"]
             for k in return_tasks.keys():
@@ -859,57 +824,103 @@ class Workflow(object):
                 task.task_id = return_tasks[k][0]
                 task.initial_status = return_tasks[k][1]
 
+        PipelinedBinder(self.requester).run_phase(
+            "tasks",
+            "/task/bind_tasks_no_args",
+            "put",
+            messages(),
+            num_items=len(task_hashes),
+            on_response=on_response,
+            send_last_after_others=True,
+        )
+
         # Bind task arguments and attributes as well
         self._bind_task_args(chunk_size)
         self._bind_task_attributes(chunk_size)
 
+    def _get_task_metadata(
+        self, task_hashes_chunk: List[int], reset_if_running: bool
+    ) -> Dict[int, List]:
+        # send to server in a format of:
+        # {<hash>:[workflow_id(0), node_id(1), task_args_hash(2), array_id(3),
+        # name(4), command(5), max_attempts(6)], reset_if_running(7), task_args(8),
+        # task_attributes(9), resource_scales(10), fallback_queues(11)}
+        # flat the data structure so that the server won't depend on the client
+        task_metadata: Dict[int, List] = {}
+        for task_hash in task_hashes_chunk:
+            task = self.tasks[task_hash]
+
+            serializable_resource_scales = copy.copy(task.resource_scales)
+            for resource, scaler in task.resource_scales.items():
+                # We can't serialize a callable, so use the function name instead.
+                if callable(scaler):
+                    serializable_resource_scales[resource] = getattr(  # type: ignore
+                        scaler, "__name__", "Unknown Callable"  # type: ignore
+                    )
+                # We can't serialize an iterator, so take the relevant elements as a
+                # list.
+                elif isinstance(scaler, Iterator):
+                    serializable_resource_scales[resource] = list(  # type: ignore
+                        itertools.islice(copy.deepcopy(scaler), task.max_attempts - 1)
+                    )
+
+            task_metadata[task_hash] = [
+                task.node.node_id,
+                str(task.task_args_hash),
+                task.array.array_id,
+                task.original_task_resources.id,
+                task.name,
+                task.command,
+                task.max_attempts,
+                reset_if_running,
+                serializable_resource_scales,
+                task.fallback_queues,
+            ]
+        return task_metadata
+
     def _bind_task_args(self, chunk_size: int = 500) -> None:
         """Bind all task args to the database.
 
-        Loop through our bound task dict in chunks in order to bind new args and arg types
+        Send our bound task dict in chunks in order to bind new args and arg types
         to the database.
         """
-        remaining_task_hashes = list(self.tasks.keys())
-
-        while remaining_task_hashes:
-            # split off first chunk elements from queue.
-            task_hashes_chunk = remaining_task_hashes[:chunk_size]
-            remaining_task_hashes = remaining_task_hashes[chunk_size:]
+        tasks = list(self.tasks.values())
 
-            task_arg_list = []
-            for task_hash in task_hashes_chunk:
-                task = self.tasks[task_hash]
-                task_args = [
+        def messages() -> Iterator[Dict]:
+            for start in range(0, len(tasks), chunk_size):
+                task_arg_list = [
                     (task.task_id, arg_id, value)
+                    for task in tasks[start : start + chunk_size]
                     for arg_id, value in task.mapped_task_args.items()
                 ]
-                task_arg_list.extend(task_args)
-
-            self.requester.send_request(
-                app_route="/task/bind_task_args",
-                message={"task_args": task_arg_list},
-                request_type="put",
-            )
+                yield {"task_args": task_arg_list}
+
+        PipelinedBinder(self.requester).run_phase(
+            "task args",
+            "/task/bind_task_args",
+            "put",
+            messages(),
+            num_items=len(tasks),
+        )
 
     def _bind_task_attributes(self, chunk_size: int = 500) -> None:
-        remaining_task_hashes = list(self.tasks.keys())
-
-        while remaining_task_hashes:
-            # split off first chunk elements from queue.
-            task_hashes_chunk = remaining_task_hashes[:chunk_size]
-            remaining_task_hashes = remaining_task_hashes[chunk_size:]
-
-            attribute_dict = {}
-            for task_hash in task_hashes_chunk:
-                task = self.tasks[task_hash]
-                attribute_dict[task.task_id] = task.task_attributes
-
-            # Send the request
-            self.requester.send_request(
-                app_route="/task/bind_task_attributes",
-                message={"task_attributes": attribute_dict},
-                request_type="put",
-            )
+        tasks = list(self.tasks.values())
+
+        def messages() -> Iterator[Dict]:
+            for start in range(0, len(tasks), chunk_size):
+                attribute_dict = {
+                    task.task_id: task.task_attributes
+                    for task in tasks[start : start + chunk_size]
+                }
+                yield {"task_attributes": attribute_dict}
+
+        PipelinedBinder(self.requester).run_phase(
+            "task attributes",
+            "/task/bind_task_attributes",
+            "put",
+            messages(),
+            num_items=len(tasks),
+        )
 
     def get_errors(
         self, limit: int = 1000
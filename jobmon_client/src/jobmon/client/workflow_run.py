@@ -225,7 +225,7 @@ class WorkflowRun(object):
         self.requester = requester
 
         # set values from config
-        config = JobmonConfig()
+        config = JobmonConfig.cached()
         if workflow_run_heartbeat_interval is None:
             heartbeat_interval = config.get_int("heartbeat", "workflow_run_interval")
         else:
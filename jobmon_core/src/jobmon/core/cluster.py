@@ -11,6 +11,7 @@ from jobmon.core.cluster_protocol import (
     ClusterWorkerNode,
 )
 from jobmon.core.cluster_type import ClusterType
+from jobmon.core.metadata_cache import get_metadata_cache
 from jobmon.core.requester import Requester
 from jobmon.core.serializers import SerializeCluster, SerializeQueue
 
@@ -49,8 +50,12 @@ class Cluster:
     def bind(self) -> None:
         """Bind Cluster to the database, getting an id back."""
         app_route = f"/cluster/{self.cluster_name}"
-        _, response = self.requester.send_request(
-            app_route=app_route, message={}, request_type="get"
+        _, response = get_metadata_cache().send_request(
+            self.requester,
+            app_route=app_route,
+            message={},
+            request_type="get",
+            keep=lambda response: response["cluster"] is not None,
         )
         cluster_kwargs = SerializeCluster.kwargs_from_wire(response["cluster"])
 
@@ -102,8 +107,12 @@ class Cluster:
         except KeyError:
             queue_class = self._cluster_type.cluster_queue_class
             app_route = f"/cluster/{self.id}/queue/{queue_name}"
-            _, response = self.requester.send_request(
-                app_route=app_route, message={}, request_type="get"
+            _, response = get_metadata_cache().send_request(
+                self.requester,
+                app_route=app_route,
+                message={},
+                request_type="get",
+                keep=lambda response: response["queue"] is not None,
             )
             queue_kwargs = SerializeQueue.kwargs_from_wire(response["queue"])
             queue = queue_class(**queue_kwargs)
@@ -79,6 +79,17 @@ class ClusterDistributor(Protocol):
         """Return the name of the cluster type."""
         raise NotImplementedError
 
+    @property
+    def concurrent_submission(self) -> bool:
+        """Whether this distributor's methods may be called from several threads at once.
+
+        The distributor service runs independent commands (e.g. launching different
+        array batches) in a thread pool. Calls into plugins that return False here are
+        serialized; plugins with thread-safe submission can return True to let them
+        overlap.
+        """
+        return False
+
     @abstractmethod
     def start(self) -> None:
         """Start the distributor."""
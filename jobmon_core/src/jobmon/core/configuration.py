@@ -4,9 +4,10 @@ import argparse
 import ast
 import json
 import os
+import threading
 from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 import yaml
 from dotenv import load_dotenv
@@ -25,6 +26,27 @@ DEFAULTS_FILE_NAME = "defaults.yaml"
 DEFAULTS_FILE = Path(__file__).parent / "config" / DEFAULTS_FILE_NAME
 ENV_VAR_PREFIX = "JOBMON__"
 
+# Process-wide snapshot used by JobmonConfig.cached(), keyed by (path, mtime)
+_cache_lock = threading.Lock()
+_cached_config: Optional[Tuple[Tuple[str, Optional[int]], "JobmonConfig"]] = None
+_config_load_count = 0
+
+
+def _resolve_config_filepath(filepath: str = "") -> str:
+    """Return the config file that JobmonConfig would load for ``filepath``."""
+    if filepath:
+        return filepath
+    # Allow the user to specify a different config file using an environment variable
+    filepath = os.getenv("JOBMON__CONFIG_FILE", "")
+    if filepath == "":
+        # if the installer plugin exists, use the config file form the plugin
+        filepath = CONFIG_FILE_FROM_INSTALLER_PLUGIN
+    if not filepath:
+        # when no config file in env and not installer plug-in,
+        # use the default yaml in core
+        filepath = str(DEFAULTS_FILE)
+    return filepath
+
 
 class JobmonConfig:
     """Default config setup using YAML."""
@@ -43,28 +65,56 @@ class JobmonConfig:
         3. config file from installer
         4. default config file in core
         """
-        if filepath:
-            self._filepath = filepath
-        else:
-            # Allow the user to specify a different config file using an environment variable
-            self._filepath = os.getenv("JOBMON__CONFIG_FILE", "")
-            # if the env not set, check if the installer plugin exists
-            if self._filepath == "":
-                # if the installer plugin exists, use the config file form the plugin
-                self._filepath = CONFIG_FILE_FROM_INSTALLER_PLUGIN
-
-        if self._filepath:
-            with open(self._filepath, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f)
-        else:
-            # when no config file in env and not installer plug-in,
-            # use the default yaml in core
-            self._filepath = DEFAULTS_FILE  # type: ignore
-            with open(DEFAULTS_FILE, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f)
+        global _config_load_count
+
+        resolved = _resolve_config_filepath(filepath)
+        self._filepath = Path(resolved)
+        with open(resolved, "r", encoding="utf-8") as f:
+            self._config = yaml.safe_load(f)
+        _config_load_count += 1
 
         self._dict_config = dict_config
 
+    @classmethod
+    def cached(cls: Type["JobmonConfig"]) -> "JobmonConfig":
+        """Return the process-wide snapshot of the default config.
+
+        The file is parsed once and reused until it changes on disk, a different
+        ``JOBMON__CONFIG_FILE`` is set, or :meth:`reload_cached` is called.
+        Environment variable overrides are still read on every ``get``. The
+        snapshot is shared, so callers must not ``set`` values on it.
+        """
+        global _cached_config
+
+        filepath = _resolve_config_filepath()
+        try:
+            mtime: Optional[int] = os.stat(filepath).st_mtime_ns
+        except OSError:
+            mtime = None
+        key = (filepath, mtime)
+
+        cached = _cached_config
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with _cache_lock:
+            if _cached_config is None or _cached_config[0] != key:
+                _cached_config = (key, cls())
+            return _cached_config[1]
+
+    @classmethod
+    def reload_cached(cls: Type["JobmonConfig"]) -> "JobmonConfig":
+        """Discard the process-wide snapshot and parse the config file again."""
+        global _cached_config
+
+        with _cache_lock:
+            _cached_config = None
+        return cls.cached()
+
+    @staticmethod
+    def load_count() -> int:
+        """Number of times a config file has been parsed in this process."""
+        return _config_load_count
+
     def _merge_dicts(self, base: Dict, override: Dict) -> Dict:
         """Utility function to merge two dictionaries."""
         for key, value in override.items():
@@ -0,0 +1,205 @@
+"""Pooled, keep-alive HTTP sessions shared by synchronous Requesters.
+
+Every ``Requester`` in a process that uses the same pool settings shares one
+``requests.Session`` so repeated calls to the Jobmon server reuse TCP (and TLS)
+connections instead of paying a fresh handshake per request. Sessions are
+recreated after ``fork`` so that child processes never share sockets with
+their parent.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Type
+
+import requests
+import structlog
+from requests.adapters import HTTPAdapter
+
+from jobmon.core.configuration import JobmonConfig
+from jobmon.core.exceptions import ConfigError
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection pool settings for the shared HTTP session.
+
+    Attributes:
+        pool_connections: number of per-host connection pools to cache.
+        pool_maxsize: maximum number of connections kept alive per host.
+        pool_block: block when a host has no free connection instead of
+            opening a throwaway one.
+        keep_alive: keep connections open between requests.
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    keep_alive: bool = True
+
+    @classmethod
+    def from_config(
+        cls: Type[PoolSettings], config: Optional[JobmonConfig] = None
+    ) -> PoolSettings:
+        """Read pool settings from the ``http`` section, falling back to defaults."""
+        config = config if config is not None else JobmonConfig()
+        defaults = cls()
+
+        def _int(key: str, default: int) -> int:
+            try:
+                return config.get_int("http", key)
+            except ConfigError:
+                return default
+
+        def _bool(key: str, default: bool) -> bool:
+            try:
+                return config.get_boolean("http", key)
+            except ConfigError:
+                return default
+
+        return cls(
+            pool_connections=_int("pool_connections", defaults.pool_connections),
+            pool_maxsize=_int("pool_maxsize", defaults.pool_maxsize),
+            pool_block=_bool("pool_block", defaults.pool_block),
+            keep_alive=_bool("keep_alive", defaults.keep_alive),
+        )
+
+
+class PooledSession:
+    """A ``requests.Session`` bound to the process that created it."""
+
+    def __init__(self, settings: PoolSettings) -> None:
+        """Create the underlying session for the current process.
+
+        Args:
+            settings: the pool settings to mount on the session.
+        """
+        self.settings = settings
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._new_connections = 0
+        self._reused_connections = 0
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.settings.pool_connections,
+            pool_maxsize=self.settings.pool_maxsize,
+            pool_block=self.settings.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.settings.keep_alive:
+            session.headers["Connection"] = "close"
+        session.hooks["response"].append(self._count_connection)
+        return session
+
+    def _count_connection(
+        self, response: requests.Response, *args: Any, **kwargs: Any
+    ) -> None:
+        """Record whether the response was served over a reused connection.
+
+        The hook runs before the body is read, so the urllib3 connection is still
+        attached to the raw response. A connection is new if its socket differs
+        from the one we saw on its previous use.
+        """
+        connection = getattr(response.raw, "connection", None)
+        sock = getattr(connection, "sock", None)
+        if connection is None or sock is None:
+            return
+        reused = getattr(connection, "_jobmon_last_sock", None) is sock
+        connection._jobmon_last_sock = sock
+        with self._lock:
+            if reused:
+                self._reused_connections += 1
+            else:
+                self._new_connections += 1
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the session, recreating it if the process has forked."""
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    # The inherited sockets belong to the parent, so we drop them
+                    # without closing to avoid shutting down the parent's streams.
+                    self._pid = os.getpid()
+                    self._new_connections = 0
+                    self._reused_connections = 0
+                    self._session = self._create_session()
+        return self._session
+
+    def stats(self) -> Dict[str, int]:
+        """Return connection reuse counters for this session.
+
+        ``new_connections`` counts requests that had to open a TCP connection,
+        ``reused_connections`` counts requests served over a kept-alive one and
+        ``requests`` is their sum.
+        """
+        with self._lock:
+            return {
+                "new_connections": self._new_connections,
+                "requests": self._new_connections + self._reused_connections,
+                "reused_connections": self._reused_connections,
+            }
+
+    def close(self) -> None:
+        """Close all pooled connections owned by this process."""
+        if self._pid == os.getpid():
+            self._session.close()
+
+
+_sessions: Dict[PoolSettings, PooledSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_pooled_session(settings: Optional[PoolSettings] = None) -> PooledSession:
+    """Return the process-wide pooled session for the given settings."""
+    settings = settings if settings is not None else PoolSettings()
+    pooled = _sessions.get(settings)
+    if pooled is None:
+        with _sessions_lock:
+            pooled = _sessions.get(settings)
+            if pooled is None:
+                pooled = PooledSession(settings)
+                _sessions[settings] = pooled
+                logger.debug(
+                    "Created pooled HTTP session",
+                    pool_connections=settings.pool_connections,
+                    pool_maxsize=settings.pool_maxsize,
+                    keep_alive=settings.keep_alive,
+                )
+    return pooled
+
+
+def get_connection_stats() -> Dict[str, int]:
+    """Aggregate connection reuse counters across every pooled session."""
+    totals = {"new_connections": 0, "requests": 0, "reused_connections": 0}
+    for pooled in list(_sessions.values()):
+        for key, value in pooled.stats().items():
+            totals[key] += value
+    return totals
+
+
+def close_pooled_sessions() -> None:
+    """Close and forget every pooled session in this process."""
+    with _sessions_lock:
+        for pooled in _sessions.values():
+            pooled.close()
+        _sessions.clear()
+
+
+def _forget_sessions_after_fork() -> None:
+    # A fresh lock and registry in the child; the parent's sockets are left alone.
+    global _sessions_lock
+    _sessions_lock = threading.Lock()
+    _sessions.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_sessions_after_fork)
@@ -0,0 +1,133 @@
+"""Process-wide cache of cluster, queue, tool and task template lookups.
+
+Scripts that build many workflows in a loop look up the same clusters, queues, tools
+and task templates for every workflow. These lookups return rows that are created
+once and then almost never change, so their responses are kept per server URL for
+``http.metadata_cache_ttl`` seconds and shared by every object in the process.
+Lists that grow as rows are added, such as tool and task template versions, are
+not cached, so rows created by another process are seen at once. Lookups that find
+nothing are not kept and :meth:`MetadataCache.refresh` drops everything.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import threading
+import time
+from http import HTTPStatus as StatusCodes
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import structlog
+
+from jobmon.core.configuration import JobmonConfig
+from jobmon.core.exceptions import ConfigError
+from jobmon.core.requester import Requester
+
+logger = structlog.get_logger(__name__)
+
+_Key = Tuple[str, str, str, str]
+
+
+class MetadataCache:
+    """Responses of metadata lookups keyed by server URL, route and message."""
+
+    def __init__(self, ttl: float = 300) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: seconds a response is reused before the server is asked again; 0
+                disables the cache.
+        """
+        self.ttl = ttl
+        self._responses: Dict[_Key, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.requests_avoided = 0
+
+    @staticmethod
+    def _key(
+        requester: Requester, app_route: str, message: dict, request_type: str
+    ) -> _Key:
+        return (
+            requester.service_url,
+            request_type,
+            app_route,
+            json.dumps(message, sort_keys=True),
+        )
+
+    def send_request(
+        self,
+        requester: Requester,
+        app_route: str,
+        message: dict,
+        request_type: str,
+        keep: Optional[Callable[[Any], bool]] = None,
+    ) -> Tuple[int, Any]:
+        """Return a cached response, or send the request and cache its response.
+
+        Args:
+            requester: the requester to send the request through.
+            app_route: the route to request.
+            message: the request message.
+            request_type: the http method.
+            keep: called with a successful response; the response is cached only
+                if it returns True. Defaults to caching every successful response.
+        """
+        key = self._key(requester, app_route, message, request_type)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.requests_avoided += 1
+                requests_avoided = self.requests_avoided
+                response = copy.deepcopy(cached[1])
+            else:
+                response = None
+        if response is not None:
+            logger.debug(
+                "Served metadata lookup from cache",
+                app_route=app_route,
+                requests_avoided=requests_avoided,
+            )
+            return StatusCodes.OK, response
+
+        return_code, response = requester.send_request(
+            app_route=app_route, message=message, request_type=request_type
+        )
+        if (
+            self.ttl > 0
+            and return_code == StatusCodes.OK
+            and (keep is None or keep(response))
+        ):
+            with self._lock:
+                self._responses[key] = (
+                    time.monotonic() + self.ttl,
+                    copy.deepcopy(response),
+                )
+        return return_code, response
+
+    def refresh(self, service_url: Optional[str] = None) -> None:
+        """Drop every cached response, or only those of one server."""
+        with self._lock:
+            if service_url is None:
+                self._responses.clear()
+            else:
+                for key in [k for k in self._responses if k[0] == service_url]:
+                    del self._responses[key]
+
+
+_metadata_cache: Optional[MetadataCache] = None
+_metadata_cache_lock = threading.Lock()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get or create the process metadata cache from the ``http`` config section."""
+    global _metadata_cache
+    if _metadata_cache is None:
+        with _metadata_cache_lock:
+            if _metadata_cache is None:
+                try:
+                    ttl = JobmonConfig.cached().get_float("http", "metadata_cache_ttl")
+                except ConfigError:
+                    ttl = MetadataCache().ttl
+                _metadata_cache = MetadataCache(ttl)
+    return _metadata_cache
@@ -5,9 +5,19 @@ from __future__ import annotations
 import contextlib
 import functools
 import json
-from typing import Any, Callable, Dict, Tuple, Type
+import sys
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+)
 
-import aiohttp
 import requests
 import structlog
 import tenacity
@@ -16,6 +26,11 @@ import urllib3
 from jobmon.core import __version__
 from jobmon.core.configuration import JobmonConfig
 from jobmon.core.exceptions import InvalidRequest, InvalidResponse
+from jobmon.core.http_session import PoolSettings, get_pooled_session
+
+if TYPE_CHECKING:
+    # aiohttp is only needed by the async methods; worker nodes never load it.
+    import aiohttp
 
 logger = structlog.get_logger(__name__)
 
@@ -31,6 +46,10 @@ class Requester:
     # Class-level attribute to store the OtlpManager instance
     _otlp_manager = None
 
+    # Process-wide requesters handed out by from_defaults, keyed by settings
+    _shared: Dict[Tuple, Requester] = {}
+    _shared_lock = threading.Lock()
+
     def __init__(
         self,
         service_url: str,
@@ -38,6 +57,7 @@ class Requester:
         retries_attempts: int = 10,
         request_timeout: int = 20,
         use_otlp: bool = False,
+        pool_settings: Optional[PoolSettings] = None,
     ) -> None:
         """Initialize requester with optional OTLP support.
 
@@ -47,11 +67,13 @@ class Requester:
             retries_attempts: Number of retry attempts
             request_timeout: Individual request timeout in seconds
             use_otlp: Whether to enable OTLP instrumentation
+            pool_settings: Connection pool settings for the shared HTTP session
         """
         self.service_url = service_url
         self.retries_timeout = retries_timeout
         self.retries_attempts = retries_attempts
         self.request_timeout = request_timeout
+        self.pool_settings = pool_settings or PoolSettings()
 
         if use_otlp and Requester._otlp_manager is None:
             self._init_otlp()
@@ -86,8 +108,14 @@ class Requester:
 
     @classmethod
     def from_defaults(cls: Type[Requester]) -> Requester:
-        """Instantiate a requester from default config values."""
-        config = JobmonConfig()
+        """Return the shared requester for the default config values.
+
+        Requesters are cached per process and keyed by their settings, so callers
+        that resolve to the same service URL, retry and pool settings share one
+        instance. Use :meth:`reload` to pick up config file changes, or construct
+        a ``Requester`` directly when private state is needed.
+        """
+        config = JobmonConfig.cached()
 
         service_url = config.get("http", "service_url")
         route_prefix = config.get("http", "route_prefix")
@@ -105,19 +133,55 @@ class Requester:
         except Exception:
             use_otlp = False
 
-        return cls(
-            service_url=service_url,
-            retries_timeout=retries_timeout,
-            retries_attempts=retries_attempts,
-            request_timeout=request_timeout,
-            use_otlp=use_otlp,
+        pool_settings = PoolSettings.from_config(config)
+        key = (
+            cls,
+            service_url,
+            retries_timeout,
+            retries_attempts,
+            request_timeout,
+            use_otlp,
+            pool_settings,
         )
+        requester = cls._shared.get(key)
+        if requester is None:
+            with cls._shared_lock:
+                requester = cls._shared.get(key)
+                if requester is None:
+                    requester = cls(
+                        service_url=service_url,
+                        retries_timeout=retries_timeout,
+                        retries_attempts=retries_attempts,
+                        request_timeout=request_timeout,
+                        use_otlp=use_otlp,
+                        pool_settings=pool_settings,
+                    )
+                    cls._shared[key] = requester
+                    logger.debug(
+                        "Created shared requester",
+                        service_url=service_url,
+                        shared_requesters=len(cls._shared),
+                        config_loads=JobmonConfig.load_count(),
+                    )
+        return requester
+
+    @classmethod
+    def reload(cls: Type[Requester]) -> Requester:
+        """Drop the shared requesters, re-read the config and return a fresh one."""
+        with cls._shared_lock:
+            Requester._shared.clear()
+        JobmonConfig.reload_cached()
+        return cls.from_defaults()
 
     @property
     def url(self) -> str:
         """Legacy property for backward compatibility."""
         return self.service_url
 
+    def connection_stats(self) -> Dict[str, int]:
+        """Connection reuse counters for this requester's pooled HTTP session."""
+        return get_pooled_session(self.pool_settings).stats()
+
     def add_server_structlog_context(self, **kwargs: Any) -> None:
         """Add the structlogging context if it has been provided."""
         for key, value in kwargs.items():
@@ -184,7 +248,7 @@ class Requester:
             return False
 
         # Retry for specific exceptions (sync and async compatible).
-        return isinstance(
+        if isinstance(
             exception,
             (
                 InvalidResponse,
@@ -194,10 +258,13 @@ class Requester:
                 requests.exceptions.ReadTimeout,
                 urllib3.exceptions.NewConnectionError,
                 urllib3.exceptions.MaxRetryError,
-                aiohttp.ClientError,
-                aiohttp.ServerTimeoutError,
-                aiohttp.ClientConnectorError,
             ),
+        ):
+            return True
+        # An aiohttp error can only be raised once something has imported aiohttp.
+        aiohttp_module = sys.modules.get("aiohttp")
+        return aiohttp_module is not None and isinstance(
+            exception, aiohttp_module.ClientError
         )
 
     def _maybe_retry(self, func: Callable, tenacious: bool) -> Any:
@@ -226,6 +293,15 @@ class Requester:
 
         return retrying
 
+    def _request_headers(self) -> Dict[str, str]:
+        # Include the current structlog context for server correlation
+        return {
+            "Content-Type": "application/json",
+            "X-Server-Structlog-Context": json.dumps(
+                self._get_current_structlog_context()
+            ),
+        }
+
     def _send_request(
         self,
         app_route: str,
@@ -241,17 +317,12 @@ class Requester:
         if request_type == "get":
             params.update(message)
 
-        # Set headers, including current structlog context for server correlation
-        headers = {
-            "Content-Type": "application/json",
-            "X-Server-Structlog-Context": json.dumps(
-                self._get_current_structlog_context()
-            ),
-        }
+        headers = self._request_headers()
 
-        # Send the appropriate request
+        # Send the appropriate request over the process-wide pooled session
+        session = get_pooled_session(self.pool_settings).session
         if request_type == "post":
-            response = requests.post(
+            response = session.post(
                 route,
                 params=params,
                 json=message,
@@ -259,14 +330,14 @@ class Requester:
                 timeout=self.request_timeout,
             )
         elif request_type == "get":
-            response = requests.get(
+            response = session.get(
                 route,
                 params=params,
                 headers=headers,
                 timeout=self.request_timeout,
             )
         elif request_type == "put":
-            response = requests.put(
+            response = session.put(
                 route,
                 params=params,
                 json=message,
@@ -316,6 +387,57 @@ class Requester:
 
         return res
 
+    def _open_stream(self, app_route: str, message: dict) -> Any:
+        route = self.service_url + app_route
+        logger.debug("Making streaming HTTP request", route=route)
+
+        params = {"client_jobmon_version": __version__}
+        params.update(message)
+        session = get_pooled_session(self.pool_settings).session
+        response = session.get(
+            route,
+            params=params,
+            headers=self._request_headers(),
+            timeout=self.request_timeout,
+            stream=True,
+        )
+
+        # Read the body of an error response to report it, as _send_request does
+        status_code = response.status_code
+        if 400 <= status_code < 600:
+            with contextlib.closing(response):
+                _, content = get_content(response)
+            if 499 < status_code or status_code == 423:
+                raise InvalidResponse(
+                    f"Request failed due to status code {status_code} from GET "
+                    f"request through route {app_route}. Response content: {content}"
+                )
+            raise InvalidRequest(
+                f"Client error with status code {status_code} from GET "
+                f"request through route {app_route}. Response content: {content}"
+            )
+        return response
+
+    def stream_request(
+        self, app_route: str, message: dict, tenacious: bool = True
+    ) -> Iterator[Any]:
+        """Send a GET request and yield each object of its newline delimited JSON body.
+
+        Opening the stream is retried like send_request. Objects already yielded are
+        not fetched again, so a caller paging with a cursor can resume from the last
+        object it received if the stream breaks.
+        """
+
+        def open_fn(app_route: str, message: dict, request_type: str) -> Any:
+            return self._open_stream(app_route, message)
+
+        open_method = self._maybe_trace(self._maybe_retry(open_fn, tenacious))
+        response = open_method(app_route=app_route, message=message, request_type="get")
+        with contextlib.closing(response):
+            for line in response.iter_lines():
+                if line:
+                    yield json.loads(line)
+
     async def _send_request_async(
         self,
         session: aiohttp.ClientSession,
@@ -324,6 +446,8 @@ class Requester:
         request_type: str,
     ) -> Tuple[int, Any]:
         """Async version of _send_request using aiohttp."""
+        import aiohttp
+
         # Construct URL
         route = self.service_url + app_route
         logger.debug("Making HTTP request", route=route, request_type=request_type)
@@ -402,6 +526,8 @@ class Requester:
         Returns:
             Tuple of (status_code, content) where content is parsed JSON or raw text/bytes.
         """
+        import aiohttp
+
         content_type = response.headers.get("Content-Type", "")
         if "application/json" in content_type:
             try:
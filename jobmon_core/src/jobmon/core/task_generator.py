@@ -1,16 +1,22 @@
+"""Turn python functions into Jobmon tasks that run through ``worker_node_entry_point``.
+
+The worker node imports this module for every task generator task it runs, so the
+client API, ``docstring_parser`` and the Sphinx directives in
+:mod:`jobmon.core.task_generator_docs` are imported only where they are used.
+"""
+
+from __future__ import annotations
+
 import ast
-import importlib
 import inspect
 import logging
 import shutil
-import traceback
-from types import ModuleType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Collection,
     Dict,
-    Iterable,
     List,
     Optional,
     Type,
@@ -18,16 +24,12 @@ from typing import (
     get_args,
 )
 
-import docstring_parser
-from docutils import nodes  # type: ignore
-from docutils import statemachine
-from docutils.parsers.rst import Directive  # type: ignore
-from sphinx import application  # type: ignore
-from sphinx.util import nodes as sphinx_nodes  # type: ignore
+if TYPE_CHECKING:
+    import docstring_parser
 
-from jobmon.client.api import Tool
-from jobmon.client.task import Task
-from jobmon.client.workflow import Workflow
+    from jobmon.client.api import Tool
+    from jobmon.client.task import Task
+    from jobmon.client.workflow import Workflow
 
 SIMPLE_TYPES = {str, int, float, bool}
 BUILT_IN_COLLECTIONS = {list, tuple, set}
@@ -322,7 +324,8 @@ class TaskGenerator:
         """
         self.task_function = task_function
         self.serializers = serializers
-        self.tool = Tool(tool_name)
+        self.tool_name = tool_name
+        self._tool: Optional[Tool] = None
         self.max_attempts = max_attempts
         self.mod_name = f"{task_function.__module__}"
         self.name = task_function.__name__
@@ -357,6 +360,19 @@ class TaskGenerator:
         # otherwise, use FHS default
         self.name_func = name_func
 
+    @property
+    def tool(self) -> Tool:
+        """The Tool that owns the task template, bound on first use.
+
+        Running a task on the worker node never needs the tool, so binding it there
+        would only cost startup time and server round trips.
+        """
+        if self._tool is None:
+            from jobmon.client.api import Tool
+
+            self._tool = Tool(self.tool_name)
+        return self._tool
+
     def _validate_task_function(self) -> None:
         """Check that a task can be generated from the task_function.
 
@@ -814,6 +830,8 @@ class TaskGenerator:
 
     def help(self) -> str:
         """Return help text for the task_function."""
+        import docstring_parser
+
         # Parse the task function's docstring - Note that there may be nothing!
         task_function_docstring = docstring_parser.parse(  # type: ignore
             self.task_function.__doc__  # type: ignore
@@ -957,274 +975,13 @@ def get_tasks_by_node_args(
     return result
 
 
-class TaskGeneratorDocumenter(Directive):
-    """Directive for generating documentation for a single task generator."""
-
-    required_arguments = 1
-    optional_arguments = 1
-    final_argument_whitespace = True
-    option_spec = {"optional": lambda x: x}  # Defines the 'optional' option
-
-    def run(self) -> list[nodes.Node]:
-        """The function sphinx/docutils use to generate documentation for the directive."""
-        module_name = self.arguments[0]
-        # if there are more than one arg, the second will be module path
-        module_path = self.options.get("optional", None)
-        task_generator = self._load_task_generator(module_name, module_path)
-
-        return _generate_nodes(task_generator, self.state)
-
-    def _load_task_generator(
-        self, task_generator_path: str, module_path: Optional[str] = None
-    ) -> TaskGenerator:
-        """Load the task generator from the given path."""
-        try:
-            module_name, attr_name = task_generator_path.split(":", 1)
-        except ValueError:
-            raise self.error(
-                f'"{task_generator_path}" is not of format "module:parser"'
-            )
-
-        try:
-            if module_path:
-                spec = importlib.util.spec_from_file_location(
-                    module_name, module_path
-                )  # type: ignore
-                mod = importlib.util.module_from_spec(spec)  # type: ignore
-                spec.loader.exec_module(mod)  # type: ignore
-            else:
-                mod = __import__(module_name, globals(), locals(), [attr_name])
-        except (Exception, SystemExit) as exc:
-            err_msg = f'Failed to import "{attr_name}" from "{module_name}". '
-            if isinstance(exc, SystemExit):
-                err_msg += "The module appeared to call sys.exit()"
-            else:
-                err_msg += (
-                    f"The following exception was raised:\n{traceback.format_exc()}"
-                )
-            raise self.error(err_msg)
-
-        if not hasattr(mod, attr_name):
-            raise self.error(f'Module "{module_name}" has no attribute "{attr_name}"')
-
-        task_generator = getattr(mod, attr_name)
-
-        if not isinstance(task_generator, TaskGenerator):
-            raise self.error(
-                f'Attribute "{attr_name}" of module "{module_name}" is not a TaskGenerator'
-            )
-
-        return task_generator
-
-
-class TaskGeneratorModuleDocumenter(Directive):
-    """Directive for generating documentation for all the task generators in a module."""
+_DOCS_ATTRIBUTES = {"TaskGeneratorDocumenter", "TaskGeneratorModuleDocumenter", "setup"}
 
-    required_arguments = 1
-    optional_arguments = 1
-    final_argument_whitespace = True
-    option_spec = {"optional": lambda x: x}  # Defines the 'optional' option
-
-    def run(self) -> list[nodes.Node]:
-        """The function sphinx/docutils use to generate documentation for the directive."""
-        module_name = self.arguments[0]
-        # if there are more than one arg, the second will be module path
-        module_path = self.options.get("optional", None)
-        module, task_generators = self._load_module_task_generators(
-            module_name, module_path
-        )
 
-        section = self._generate_module_section(module_name, module, task_generators)
+def __getattr__(name: str) -> Any:
+    # The Sphinx directives used to live here; import them from their module on demand.
+    if name in _DOCS_ATTRIBUTES:
+        from jobmon.core import task_generator_docs
 
-        for task_generator in task_generators:
-            section.extend(_generate_nodes(task_generator, self.state))
-
-        return [section]
-
-    def _load_module_task_generators(
-        self, module_name: str, module_path: Optional[str] = None
-    ) -> tuple[ModuleType, list[TaskGenerator]]:
-        """Load all the task generators in a given module."""
-        task_generators = []
-
-        try:
-            if module_path:
-                spec = importlib.util.spec_from_file_location(
-                    module_name, module_path
-                )  # type: ignore
-                mod = importlib.util.module_from_spec(spec)  # type: ignore
-                spec.loader.exec_module(mod)  # type: ignore
-            else:
-                mod = importlib.import_module(module_name)
-        except (Exception, SystemExit) as exc:
-            err_msg = f'Failed to import "{module_name}". '
-            if isinstance(exc, SystemExit):
-                err_msg += "The module appeared to call sys.exit()"
-            else:
-                err_msg += (
-                    f"The following exception was raised:\n{traceback.format_exc()}"
-                )
-            raise self.error(err_msg)
-
-        for attr_name in dir(mod):
-            if attr_name.startswith("_"):
-                continue
-
-            attr = getattr(mod, attr_name)
-
-            if isinstance(attr, TaskGenerator):
-                task_generators.append(attr)
-
-        return mod, task_generators
-
-    def _generate_module_section(
-        self,
-        module_name: str,
-        module: ModuleType,
-        task_generators: Iterable[TaskGenerator],
-    ) -> nodes.Node:
-        """Makes the docutils node for the module section.
-
-        Includes the docstring for the module, and a list of task generator names. Doesn't
-        include any task generator detailed documentation.
-        """
-        # Set up base node
-        section = nodes.section(
-            "",
-            nodes.title(text=module_name),
-            ids=[nodes.make_id(module_name)],
-            names=[nodes.fully_normalize_name(module_name)],
-        )
-
-        # Use sphinx and docutils tooling to format the docstring into rST and then parse it
-        # into a docutils node.
-        result = statemachine.ViewList()
-        if module.__doc__:
-            for line in statemachine.string2lines(
-                module.__doc__, tab_width=4, convert_whitespace=True
-            ):
-                result.append(line, module_name)
-
-        task_generator_path_lines = [""]
-        for task_generator in task_generators:
-            task_generator_path_lines.append(".. code-block:: shell")
-            task_generator_path_lines.append("")
-            task_generator_path_lines.append(
-                f"    {TASK_RUNNER_NAME} {task_generator.full_path}"
-            )
-            task_generator_path_lines.append("")
-
-        for line in task_generator_path_lines:
-            result.append(line, module_name)
-
-        sphinx_nodes.nested_parse_with_titles(self.state, result, section)
-
-        return section
-
-
-def _generate_nodes(task_generator: TaskGenerator, state: Any) -> nodes.Node:
-    """Makes a docutils node with the documentation for a task generator.
-
-    Includes the docstring description for the task generator and all the arguments.
-    """
-    # Set up base node
-    section = nodes.section(
-        "",
-        nodes.title(text=task_generator.name),
-        ids=[nodes.make_id(task_generator.full_path)],
-        names=[nodes.fully_normalize_name(task_generator.full_path)],
-    )
-
-    # Get rST lines for the description and options
-    parsed_docstring = docstring_parser.parse(str(task_generator.task_function.__doc__))
-    lines = []
-    lines.extend(
-        _format_description(
-            task_generator=task_generator, parsed_docstring=parsed_docstring
-        )
-    )
-    lines.extend(
-        _format_options(
-            task_generator=task_generator, parsed_docstring=parsed_docstring
-        )
-    )
-
-    # Convert the rST lines into a docutils node
-    result = statemachine.ViewList()
-    for line in lines:
-        result.append(line, task_generator.name)
-    sphinx_nodes.nested_parse_with_titles(state, result, section)
-
-    return [section]
-
-
-def _format_description(
-    task_generator: TaskGenerator, parsed_docstring: docstring_parser.Docstring
-) -> list[str]:
-    """Format the description of the task generator into proper rST."""
-    lines = []
-
-    # Description from the docstring
-    if parsed_docstring.short_description:
-        lines.append(parsed_docstring.short_description)
-        lines.append("")
-
-    if parsed_docstring.long_description:
-        for line in statemachine.string2lines(
-            parsed_docstring.long_description, tab_width=4, convert_whitespace=True
-        ):
-            lines.append(line)
-        lines.append("")
-
-    # How to run on the cli
-    lines.append(".. code-block:: shell")
-    lines.append("")
-    lines.append(f"    {TASK_RUNNER_NAME} {task_generator.full_path} [OPTIONS]")
-    lines.append("")
-
-    return lines
-
-
-def _format_options(
-    task_generator: TaskGenerator, parsed_docstring: docstring_parser.Docstring
-) -> list[str]:
-    """Format the options of the task generator into proper rST."""
-    param_docs = {param.arg_name: param for param in parsed_docstring.params}
-    lines = []
-
-    # we use rubric to provide some separation without exploding the table
-    # of contents
-    lines.append(".. rubric:: Options")
-    lines.append("")
-    for param, annotation in task_generator.params.items():
-        if is_optional_type(annotation):
-            underlying_optional_type = get_optional_type_parameter(annotation)
-            annotation_name = f"OPTIONAL[{underlying_optional_type.__name__.upper()}]"
-        elif isinstance(annotation, type):
-            annotation_name = annotation.__name__.upper()
-        else:
-            # it can be typing._GenericAlias for list type annotation
-            annotation_name = str(annotation).upper()
-
-        lines.append(f".. option:: {param}='<{annotation_name}>'")
-        lines.append("")
-        if param in param_docs and param_docs[param].description:
-            for line in statemachine.string2lines(
-                param_docs[param].description, tab_width=4, convert_whitespace=True
-            ):
-                lines.append(line)
-            lines.append("")
-
-    return lines
-
-
-def setup(app: application.Sphinx) -> dict:
-    """The function that registers the extension with sphinx."""
-    app.add_directive("task_generator", TaskGeneratorDocumenter)
-    app.add_directive("task_generator_module", TaskGeneratorModuleDocumenter)
-
-    return {
-        "version": "0.1",
-        "parallel_read_safe": True,
-        "parallel_write_safe": True,
-    }
+        return getattr(task_generator_docs, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
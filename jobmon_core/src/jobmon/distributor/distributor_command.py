@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, List, Optional
 
 import structlog
 
@@ -8,11 +8,12 @@ logger = structlog.get_logger(__name__)
 
 
 class DistributorCommand:
-    def __init__(self, func: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
         """A command to be run by the distributor service.
 
         Args:
             func: a callable which does work and optionally modifies task instance state.
+                It may return a list of follow-up commands that must run after it.
             *args: positional args to be passed into func.
             **kwargs: kwargs to be passed into func.
         """
@@ -21,11 +22,14 @@ class DistributorCommand:
         self._kwargs = kwargs
         self.error_raised = False
 
-    def __call__(self, raise_on_error: bool = False) -> None:
+    def __call__(
+        self, raise_on_error: bool = False
+    ) -> Optional[List[DistributorCommand]]:
         try:
-            self._func(*self._args, **self._kwargs)
+            return self._func(*self._args, **self._kwargs)
         except Exception as e:
             if raise_on_error:
                 raise
             else:
                 logger.exception("Distributor command failed", error=str(e))
+                return None
@@ -4,9 +4,11 @@ import asyncio
 import itertools as it
 import signal
 import sys
+import threading
 import time
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
@@ -18,6 +20,7 @@ from typing import (
     Set,
     Tuple,
     Union,
+    cast,
 )
 
 import aiohttp
@@ -48,12 +51,14 @@ class DistributorService:
         task_instance_heartbeat_interval: Optional[int] = None,
         heartbeat_report_by_buffer: Optional[float] = None,
         distributor_poll_interval: Optional[int] = None,
+        full_sync_interval: Optional[int] = None,
+        max_concurrent_commands: Optional[int] = None,
         raise_on_error: bool = False,
     ) -> None:
         """Initialization of DistributorService."""
         # Bind distributor instance context
         # operational args
-        config = JobmonConfig()
+        config = JobmonConfig.cached()
         if workflow_run_heartbeat_interval is None:
             self._workflow_run_heartbeat_interval = config.get_int(
                 "heartbeat", "workflow_run_interval"
@@ -78,6 +83,19 @@ class DistributorService:
             )
         else:
             self._distributor_poll_interval = distributor_poll_interval
+        if full_sync_interval is None:
+            self._full_sync_interval = config.get_int(
+                "distributor", "full_sync_interval"
+            )
+        else:
+            self._full_sync_interval = full_sync_interval
+        if max_concurrent_commands is None:
+            self._max_concurrent_commands = config.get_int(
+                "distributor", "max_concurrent_commands"
+            )
+        else:
+            self._max_concurrent_commands = max_concurrent_commands
+        self._max_concurrent_commands = max(1, self._max_concurrent_commands)
         self.raise_on_error = raise_on_error
 
         # indexing of task instance by associated id
@@ -109,9 +127,20 @@ class DistributorService:
 
         # syncronization timings
         self._last_heartbeat_time = time.time()
+        self._last_full_sync_time = 0.0
+        # server time of the last status sync. None until the first full sync
+        self._status_watermark: Optional[str] = None
 
-        # cluster API
+        # cluster API. calls into plugins that aren't thread safe are serialized
         self.cluster_interface = cluster_interface
+        self._cluster_lock: Optional[threading.RLock] = (
+            None
+            if getattr(cluster_interface, "concurrent_submission", False)
+            else threading.RLock()
+        )
+
+        # guards the batch index while commands run in worker threads
+        self._batch_lock = threading.Lock()
 
         # web service API
         if requester is None:
@@ -146,22 +175,58 @@ class DistributorService:
             sys.stderr.write("ALIVE")
             sys.stderr.flush()
 
-            done: List[str] = []
-            todo = [
-                TaskInstanceStatus.QUEUED,
-                TaskInstanceStatus.INSTANTIATED,
-                TaskInstanceStatus.LAUNCHED,
-                TaskInstanceStatus.RUNNING,
-                TaskInstanceStatus.TRIAGING,
-                TaskInstanceStatus.KILL_SELF,
-                TaskInstanceStatus.NO_HEARTBEAT,
-            ]
+            asyncio.run(self._run_loop())
+
+        except DistributorInterruptedError as e:
+            logger.info(f"Distributor interrupted: {e}")
+        except Exception as e:
+            logger.exception("Distributor error", error=str(e))
+            raise
+        finally:
+            logger.info("Distributor stopping")
+            # stop distributor
+            self.cluster_interface.stop()
+
+            # Send simple shutdown signal
+            sys.stderr.write("SHUTDOWN")
+            sys.stderr.flush()
+
+    async def _run_loop(self) -> None:
+        """Sync, process and heartbeat until interrupted.
+
+        Blocking work (HTTP calls through the synchronous requester and cluster plugin
+        calls) runs in a pool of ``max_concurrent_commands`` threads so that independent
+        commands, such as launching different array batches, overlap.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=self._max_concurrent_commands,
+            thread_name_prefix="jobmon-distributor",
+        )
+        loop.set_default_executor(executor)
+
+        done: List[str] = []
+        todo = [
+            TaskInstanceStatus.QUEUED,
+            TaskInstanceStatus.INSTANTIATED,
+            TaskInstanceStatus.LAUNCHED,
+            TaskInstanceStatus.RUNNING,
+            TaskInstanceStatus.TRIAGING,
+            TaskInstanceStatus.KILL_SELF,
+            TaskInstanceStatus.NO_HEARTBEAT,
+        ]
+        async with aiohttp.ClientSession() as session:
             while True:
                 # loop through all statuses and do as much work as we can till the heartbeat
                 time_till_next_heartbeat = self._workflow_run_heartbeat_interval - (
                     time.time() - self._last_heartbeat_time
                 )
 
+                # refresh internal state from db for every status at once
+                sync_start = time.time()
+                await self.sync_status_from_db_async()
+                time_till_next_heartbeat -= time.time() - sync_start
+
                 while todo and time_till_next_heartbeat > 0:
                     # log when this status started
                     start_time = time.time()
@@ -169,22 +234,17 @@ class DistributorService:
                     # remove status from todo and add to done
                     status = todo.pop(0)
 
-                    # refresh internal state from db
-                    self.refresh_status_from_db(status)
-
-                    # how long the heartbeat took
-                    refresh_time = time.time()
-                    time_till_next_heartbeat -= refresh_time - start_time
-
                     if status in self._command_generator_map.keys():
                         # process any work
-                        self.process_status(status, time_till_next_heartbeat)
+                        await self.process_status_async(
+                            status, time_till_next_heartbeat
+                        )
                         # how long the full status took
                         end_time = time.time()
-                        time_till_next_heartbeat -= end_time - refresh_time
+                        time_till_next_heartbeat -= end_time - start_time
 
                     else:
-                        end_time = refresh_time
+                        end_time = start_time
 
                     done.append(status)
                     duration = int(end_time - start_time)
@@ -203,23 +263,9 @@ class DistributorService:
                     f"Distributor service time_till_next_heartbeat: {time_till_next_heartbeat}"
                 )
                 if time_till_next_heartbeat > 0:
-                    time.sleep(time_till_next_heartbeat)
+                    await asyncio.sleep(time_till_next_heartbeat)
 
-                self.log_task_instance_report_by_date()
-
-        except DistributorInterruptedError as e:
-            logger.info(f"Distributor interrupted: {e}")
-        except Exception as e:
-            logger.exception("Distributor error", error=str(e))
-            raise
-        finally:
-            logger.info("Distributor stopping")
-            # stop distributor
-            self.cluster_interface.stop()
-
-            # Send simple shutdown signal
-            sys.stderr.write("SHUTDOWN")
-            sys.stderr.flush()
+                await self.log_task_instance_report_by_date_async(session)
 
     def process_status(self, status: str, timeout: Union[int, float] = -1) -> None:
         """Processes commands until all work is done or timeout is reached.
@@ -242,7 +288,11 @@ class DistributorService:
             try:
                 # get next command
                 distributor_command = next(self._distributor_commands)
-                distributor_command(self.raise_on_error)
+                follow_ups = distributor_command(self.raise_on_error)
+                if follow_ups:
+                    self._distributor_commands = it.chain(
+                        follow_ups, self._distributor_commands
+                    )
 
                 # if we need a status sync close the main generator. we will process remaining
                 # transactions, but nothing new from the generator
@@ -253,12 +303,78 @@ class DistributorService:
                 # stop processing commands if we are out of commands
                 keep_iterating = False
 
-        # update the state map
+        self._rebuild_status_map(status)
+
+    async def process_status_async(
+        self, status: str, timeout: Union[int, float] = -1
+    ) -> None:
+        """Process the commands for a status concurrently in worker threads.
+
+        At most ``max_concurrent_commands`` commands are in flight at once. The
+        follow-up commands of a command (e.g. logging the distributor ids of a launched
+        batch) run in the same thread right after it, so they keep their order.
+
+        Args:
+            status: which status to process work for.
+            timeout: time until we stop generating new commands. -1 means process till no
+                more work.
+        """
+        start = time.time()
+        command_generator = self._command_generator_map[status]()
+        pending: Set[asyncio.Future] = set()
+        errors: List[BaseException] = []
+
+        def collect(futures: Set[asyncio.Future]) -> None:
+            for future in futures:
+                if future.exception() is not None:
+                    errors.append(cast(BaseException, future.exception()))
+
+        try:
+            for distributor_command in command_generator:
+                if len(pending) >= self._max_concurrent_commands:
+                    finished, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    collect(finished)
+                    if errors:
+                        break
+                pending.add(
+                    asyncio.ensure_future(
+                        asyncio.to_thread(self._run_command, distributor_command)
+                    )
+                )
+                if timeout != -1 and time.time() - start >= timeout:
+                    break
+        finally:
+            command_generator.close()
+            if pending:
+                finished, _ = await asyncio.wait(pending)
+                collect(finished)
+            self._rebuild_status_map(status)
+
+        if errors:
+            raise errors[0]
+
+    def _run_command(self, distributor_command: DistributorCommand) -> None:
+        """Run a command and then, depth first, the follow-up commands it returns."""
+        follow_ups = distributor_command(self.raise_on_error)
+        for follow_up in follow_ups or []:
+            self._run_command(follow_up)
+
+    def _rebuild_status_map(self, status: str) -> None:
+        """Move task instances that left ``status`` into the set for their new one."""
         task_instances = self._task_instance_status_map.pop(status)
         self._task_instance_status_map[status] = set()
         for task_instance in task_instances:
             self._task_instance_status_map[task_instance.status].add(task_instance)
 
+    def _cluster_call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call into the cluster plugin, serialized unless it supports concurrency."""
+        if self._cluster_lock is None:
+            return func(*args, **kwargs)
+        with self._cluster_lock:
+            return func(*args, **kwargs)
+
     def instantiate_task_instances(
         self, task_instances: List[DistributorTaskInstance]
     ) -> None:
@@ -304,26 +420,29 @@ class DistributorService:
                 array_batch_num=batch_number,
                 batch_size=len(task_instance_batch_kwargs["task_instance_ids"]),
             )
-            try:
-                task_instance_batch = self._task_instance_batches[
-                    (array_id, batch_number)
-                ]
-            except KeyError:
-                task_instance_batch = TaskInstanceBatch(
-                    array_id=array_id,
-                    array_name=task_instance_batch_kwargs["array_name"],
-                    array_batch_num=batch_number,
-                    task_resources_id=task_instance_batch_kwargs["task_resources_id"],
-                    requester=self.requester,
-                )
-                self._task_instance_batches[(array_id, batch_number)] = (
-                    task_instance_batch
-                )
+            with self._batch_lock:
+                try:
+                    task_instance_batch = self._task_instance_batches[
+                        (array_id, batch_number)
+                    ]
+                except KeyError:
+                    task_instance_batch = TaskInstanceBatch(
+                        array_id=array_id,
+                        array_name=task_instance_batch_kwargs["array_name"],
+                        array_batch_num=batch_number,
+                        task_resources_id=task_instance_batch_kwargs[
+                            "task_resources_id"
+                        ],
+                        requester=self.requester,
+                    )
+                    self._task_instance_batches[(array_id, batch_number)] = (
+                        task_instance_batch
+                    )
 
-            for task_instance_id in task_instance_batch_kwargs["task_instance_ids"]:
-                task_instance = self._task_instances[task_instance_id]
-                task_instance.status = TaskInstanceStatus.INSTANTIATED
-                task_instance_batch.add_task_instance(task_instance)
+                for task_instance_id in task_instance_batch_kwargs["task_instance_ids"]:
+                    task_instance = self._task_instances[task_instance_id]
+                    task_instance.status = TaskInstanceStatus.INSTANTIATED
+                    task_instance_batch.add_task_instance(task_instance)
 
     @bind_context(
         array_id="task_instance_batch.array_id",
@@ -331,10 +450,17 @@ class DistributorService:
     )
     def launch_task_instance_batch(
         self, task_instance_batch: TaskInstanceBatch
-    ) -> None:
-        self._task_instance_batches.pop(
-            (task_instance_batch.array_id, task_instance_batch.batch_number)
-        )
+    ) -> List[DistributorCommand]:
+        """Submit a batch to the cluster.
+
+        Returns:
+            The commands that record the outcome of the submission. They must run after
+            this one.
+        """
+        with self._batch_lock:
+            self._task_instance_batches.pop(
+                (task_instance_batch.array_id, task_instance_batch.batch_number)
+            )
 
         batch_size = len(task_instance_batch.task_instances)
         logger.debug(
@@ -355,7 +481,8 @@ class DistributorService:
         task_instance_batch.prepare_task_instance_batch_for_launch()
 
         # build worker node command
-        command = self.cluster_interface.build_worker_node_command(
+        command = self._cluster_call(
+            self.cluster_interface.build_worker_node_command,
             task_instance_id=None,
             array_id=task_instance_batch.array_id,
             batch_number=task_instance_batch.batch_number,
@@ -371,13 +498,12 @@ class DistributorService:
                 batch_size=batch_size,
                 submission_name=task_instance_batch.submission_name,
             )
-            distributor_id_map = (
-                self.cluster_interface.submit_array_to_batch_distributor(
-                    command=command,
-                    name=task_instance_batch.submission_name,
-                    requested_resources=task_instance_batch.requested_resources,
-                    array_length=batch_size,
-                )
+            distributor_id_map = self._cluster_call(
+                self.cluster_interface.submit_array_to_batch_distributor,
+                command=command,
+                name=task_instance_batch.submission_name,
+                requested_resources=task_instance_batch.requested_resources,
+                array_length=batch_size,
             )
             task_instance_batch.set_distributor_ids(distributor_id_map)
             logger.info(
@@ -416,22 +542,13 @@ class DistributorService:
                 distributor_commands.append(distributor_command)
 
         else:
-            # if successful log a transition to launched
+            # if successful record the distributor ids and the transition to launched
             launch_command = DistributorCommand(
-                task_instance_batch.transition_to_launched, self._next_report_increment
-            )
-            # Log the distributor IDs
-            log_distributor_ids_command = DistributorCommand(
-                task_instance_batch.log_distributor_ids
+                task_instance_batch.launch, self._next_report_increment
             )
-
             distributor_commands.append(launch_command)
-            distributor_commands.append(log_distributor_ids_command)
 
-        finally:
-            self._distributor_commands = it.chain(
-                distributor_commands, self._distributor_commands
-            )
+        return distributor_commands
 
     @bind_context(task_instance_id="task_instance.task_instance_id")
     def launch_task_instance(self, task_instance: DistributorTaskInstance) -> None:
@@ -447,13 +564,15 @@ class DistributorService:
             requested_resources = task_instance.batch.requested_resources
 
         # Fetch the worker node command
-        command = self.cluster_interface.build_worker_node_command(
-            task_instance_id=task_instance.task_instance_id
+        command = self._cluster_call(
+            self.cluster_interface.build_worker_node_command,
+            task_instance_id=task_instance.task_instance_id,
         )
 
         # Submit to batch distributor
         try:
-            distributor_id = self.cluster_interface.submit_to_batch_distributor(
+            distributor_id = self._cluster_call(
+                self.cluster_interface.submit_to_batch_distributor,
                 command=command,
                 name=task_instance.submission_name,
                 requested_resources=requested_resources,
@@ -481,8 +600,8 @@ class DistributorService:
             distributor_id=task_instance.distributor_id,
         )
 
-        r_value, r_msg = self.cluster_interface.get_remote_exit_info(
-            task_instance.distributor_id
+        r_value, r_msg = self._cluster_call(
+            self.cluster_interface.get_remote_exit_info, task_instance.distributor_id
         )
         logger.info(
             "Retrieved exit info from cluster",
@@ -530,7 +649,9 @@ class DistributorService:
                 num_tasks=len(distributor_ids),
                 distributor_ids=distributor_ids[:10],  # Log first 10
             )
-            self.cluster_interface.terminate_task_instances(distributor_ids)
+            self._cluster_call(
+                self.cluster_interface.terminate_task_instances, distributor_ids
+            )
             logger.info(
                 "Cluster termination completed",
                 num_tasks=len(distributor_ids),
@@ -570,11 +691,30 @@ class DistributorService:
 
     def log_task_instance_report_by_date(self) -> None:
         """Log the heartbeat to show that the task instance is still alive."""
-        task_instances_launched = self._task_instance_status_map[
-            TaskInstanceStatus.LAUNCHED
-        ]
-        submitted_or_running = self.cluster_interface.get_submitted_or_running(
-            [x.distributor_id for x in task_instances_launched]
+        task_instance_batches = self._get_heartbeat_batches()
+        if task_instance_batches:
+            asyncio.run(self._log_heartbeats(task_instance_batches))
+
+        self._last_heartbeat_time = time.time()
+
+    async def log_task_instance_report_by_date_async(
+        self, session: aiohttp.ClientSession
+    ) -> None:
+        """Log the heartbeat on the running event loop, reusing its HTTP session."""
+        task_instance_batches = await asyncio.to_thread(self._get_heartbeat_batches)
+        if task_instance_batches:
+            await self._log_heartbeat_batches(session, task_instance_batches)
+
+        self._last_heartbeat_time = time.time()
+
+    def _get_heartbeat_batches(self) -> List[List[int]]:
+        """Chunk the launched task instances the cluster still knows about."""
+        task_instances_launched = list(
+            self._task_instance_status_map[TaskInstanceStatus.LAUNCHED]
+        )
+        submitted_or_running = self._cluster_call(
+            self.cluster_interface.get_submitted_or_running,
+            [x.distributor_id for x in task_instances_launched],
         )
 
         task_instance_ids_to_heartbeat: List[int] = []
@@ -584,32 +724,38 @@ class DistributorService:
                     task_instance_launched.task_instance_id
                 )
 
-        if any(task_instance_ids_to_heartbeat):
-            # Create batches of task instance IDs
-            chunk_size = 500
-            task_instance_batches = [
-                task_instance_ids_to_heartbeat[i : i + chunk_size]
-                for i in range(0, len(task_instance_ids_to_heartbeat), chunk_size)
-            ]
-
-            # Send heartbeat for each batch
-            logger.info(
-                f"Sending heartbeats for {len(task_instance_ids_to_heartbeat)} task instances",
-                num_tasks=len(task_instance_ids_to_heartbeat),
-                num_batches=len(task_instance_batches),
-            )
-            asyncio.run(self._log_heartbeats(task_instance_batches))
+        if not task_instance_ids_to_heartbeat:
+            return []
 
-        self._last_heartbeat_time = time.time()
+        # Create batches of task instance IDs
+        chunk_size = 500
+        task_instance_batches = [
+            task_instance_ids_to_heartbeat[i : i + chunk_size]
+            for i in range(0, len(task_instance_ids_to_heartbeat), chunk_size)
+        ]
+        logger.info(
+            f"Sending heartbeats for {len(task_instance_ids_to_heartbeat)} task instances",
+            num_tasks=len(task_instance_ids_to_heartbeat),
+            num_batches=len(task_instance_batches),
+        )
+        return task_instance_batches
 
     async def _log_heartbeats(self, task_instance_batches: List[List[int]]) -> None:
         """Create a task for each batch of task instances to send heartbeat."""
         async with aiohttp.ClientSession() as session:
-            heartbeat_tasks = [
-                asyncio.create_task(self._log_heartbeat_by_batch(session, batch))
-                for batch in task_instance_batches
-            ]
-            await asyncio.gather(*heartbeat_tasks)
+            await self._log_heartbeat_batches(session, task_instance_batches)
+
+    async def _log_heartbeat_batches(
+        self, session: aiohttp.ClientSession, task_instance_batches: List[List[int]]
+    ) -> None:
+        """Send the heartbeat batches with at most max_concurrent_commands in flight."""
+        semaphore = asyncio.Semaphore(self._max_concurrent_commands)
+
+        async def bounded(batch: List[int]) -> None:
+            async with semaphore:
+                await self._log_heartbeat_by_batch(session, batch)
+
+        await asyncio.gather(*(bounded(batch) for batch in task_instance_batches))
 
     async def _log_heartbeat_by_batch(
         self, session: aiohttp.ClientSession, task_instance_ids_to_heartbeat: List[int]
@@ -644,12 +790,93 @@ class DistributorService:
         signal.signal(signal.SIGHUP, handle_sighup)
         signal.signal(signal.SIGINT, handle_sigint)
 
-    def refresh_status_from_db(self, status: str) -> None:
-        """Got to DB to check the list tis status."""
+    def sync_status_from_db(self) -> None:
+        """Bring every tracked status up to date with the db.
+
+        Normally only the task instances whose status changed since the last sync
+        are fetched, in one request. On the first call, and then every
+        ``full_sync_interval`` seconds, each status is reconciled against the full
+        list of ids we hold instead, which catches any change a delta missed (e.g.
+        one committed by a long transaction after the watermark was taken).
+        """
+        now = time.time()
+        if (
+            self._status_watermark is None
+            or now - self._last_full_sync_time >= self._full_sync_interval
+        ):
+            watermark: Optional[str] = None
+            for status in list(self._task_instance_status_map.keys()):
+                server_time = self.refresh_status_from_db(status)
+                # the earliest server time is the only one safe to resume from
+                if watermark is None:
+                    watermark = server_time
+            self._status_watermark = watermark
+            self._last_full_sync_time = now
+            logger.debug("Full status sync completed", watermark=watermark)
+        else:
+            self.refresh_status_updates_from_db()
+
+    async def sync_status_from_db_async(self) -> None:
+        """Async variant of sync_status_from_db.
+
+        The per-status requests of a full sync are sent concurrently; their results are
+        applied on the event loop thread.
+        """
+        now = time.time()
+        if (
+            self._status_watermark is None
+            or now - self._last_full_sync_time >= self._full_sync_interval
+        ):
+            statuses = list(self._task_instance_status_map.keys())
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._fetch_status_from_db, status)
+                    for status in statuses
+                )
+            )
+            server_times = []
+            for result in results:
+                self._apply_status_updates(result["status_updates"])
+                if result.get("time") is not None:
+                    server_times.append(result["time"])
+            # the earliest server time is the only one safe to resume from
+            watermark = min(server_times) if server_times else None
+            self._status_watermark = watermark
+            self._last_full_sync_time = now
+            logger.debug("Full status sync completed", watermark=watermark)
+        else:
+            await asyncio.to_thread(self.refresh_status_updates_from_db)
+
+    def refresh_status_updates_from_db(self) -> None:
+        """Fetch the task instances whose status changed since the last watermark."""
+        message = {"last_sync": self._status_watermark}
+        app_route = (
+            f"/workflow_run/{self.workflow_run.workflow_run_id}"
+            "/task_instance_status_updates"
+        )
+        _, result = self.requester.send_request(
+            app_route=app_route, message=message, request_type="post"
+        )
+        self._apply_status_updates(result["status_updates"])
+        if result["time"] is not None:
+            self._status_watermark = result["time"]
+
+    def refresh_status_from_db(self, status: str) -> Optional[str]:
+        """Got to DB to check the list tis status.
+
+        Returns:
+            The db time the check was made at.
+        """
+        result = self._fetch_status_from_db(status)
+        self._apply_status_updates(result["status_updates"])
+        return result.get("time")
+
+    def _fetch_status_from_db(self, status: str) -> Dict[str, Any]:
+        """Ask the db which task instances moved into or out of ``status``."""
         message = {
             "task_instance_ids": [
                 task_instance.task_instance_id
-                for task_instance in self._task_instance_status_map[status]
+                for task_instance in list(self._task_instance_status_map[status])
             ],
             "status": status,
         }
@@ -657,14 +884,19 @@ class DistributorService:
         _, result = self.requester.send_request(
             app_route=app_route, message=message, request_type="post"
         )
-        # mutate the statuses and update the status map
-        status_updates: Dict[str, List[int]] = result["status_updates"]
+        return result
+
+    def _apply_status_updates(self, status_updates: Dict[str, List[int]]) -> None:
+        """Mutate the statuses and update the status map."""
         for new_status, task_instance_ids in status_updates.items():
             for task_instance_id in task_instance_ids:
                 try:
                     task_instance = self._task_instances[task_instance_id]
 
                 except KeyError:
+                    if new_status not in self._task_instance_status_map:
+                        # a terminal task instance we never tracked
+                        continue
                     task_instance = DistributorTaskInstance(
                         task_instance_id,
                         self.workflow_run.workflow_run_id,
@@ -677,8 +909,11 @@ class DistributorService:
                     self._task_instances[task_instance.task_instance_id] = task_instance
 
                 else:
-                    # remove from old status set
                     previous_status = task_instance.status
+                    if previous_status == new_status:
+                        continue
+
+                    # remove from old status set
                     self._task_instance_status_map[previous_status].remove(
                         task_instance
                     )
@@ -86,7 +86,53 @@ class TaskInstanceBatch:
             array_batch_num=self.batch_number,
             batch_size=len(self.task_instances),
         )
+        self._validate_instantiated()
 
+        app_route = f"/array/{self.array_id}/transition_to_launched"
+        data = {
+            "batch_number": self.batch_number,
+            "next_report_increment": next_report_by,
+        }
+
+        self.requester.send_request(
+            app_route=app_route, message=data, request_type="post"
+        )
+        self._set_launched()
+
+    def launch(self, next_report_by: float) -> None:
+        """Record distributor ids and transition to LAUNCHED in one request.
+
+        Equivalent to log_distributor_ids followed by transition_to_launched, but the
+        server applies both in a single transaction.
+        """
+        logger.info(
+            "Launching batch",
+            array_id=self.array_id,
+            array_batch_num=self.batch_number,
+            batch_size=len(self.task_instances),
+        )
+        try:
+            self._validate_instantiated()
+        except ValueError:
+            # keep the ids recorded so the instances can still be found and killed
+            self.log_distributor_ids()
+            raise
+
+        app_route = f"/array/{self.array_id}/launch_batch"
+        data = {
+            "batch_number": self.batch_number,
+            "next_report_increment": next_report_by,
+            "distributor_ids": {
+                ti.task_instance_id: ti.distributor_id for ti in self.task_instances
+            },
+        }
+
+        self.requester.send_request(
+            app_route=app_route, message=data, request_type="post"
+        )
+        self._set_launched()
+
+    def _validate_instantiated(self) -> None:
         # Assertion that all bound task instances are indeed instantiated
         for ti in self.task_instances:
             if ti.status != TaskInstanceStatus.INSTANTIATED:
@@ -103,16 +149,7 @@ class TaskInstanceBatch:
                     f"{ti} is not in INSTANTIATED state, prior to launching."
                 )
 
-        app_route = f"/array/{self.array_id}/transition_to_launched"
-        data = {
-            "batch_number": self.batch_number,
-            "next_report_increment": next_report_by,
-        }
-
-        self.requester.send_request(
-            app_route=app_route, message=data, request_type="post"
-        )
-
+    def _set_launched(self) -> None:
         # Update local status and log each task instance (info level - state transition)
         for ti in self.task_instances:
             ti.status = TaskInstanceStatus.LAUNCHED
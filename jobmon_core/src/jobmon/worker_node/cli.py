@@ -12,7 +12,6 @@ import structlog
 
 from jobmon.core.cli import CLI
 from jobmon.core.logging import set_jobmon_context
-from jobmon.core.task_generator import TaskGenerator
 
 logger = structlog.get_logger(__name__)
 
@@ -125,6 +124,7 @@ class WorkerNodeCLI(CLI):
 
     def run_task_generator(self, args: argparse.Namespace) -> int:
         from jobmon.core.exceptions import ReturnCodes
+        from jobmon.core.task_generator import TaskGenerator
 
         # Import the module and get the task generator we've been pointed to, raise an error
         # if it's not a TaskGenerator
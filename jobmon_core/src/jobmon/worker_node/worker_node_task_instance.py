@@ -1,11 +1,13 @@
 """The Task Instance Object once it has been submitted to run on a worker node."""
 
 import asyncio
+import codecs
 import os
 import signal
 import socket
+from collections import deque
 from time import time
-from typing import Dict, Optional, TextIO
+from typing import BinaryIO, Deque, Dict, Optional
 
 import structlog
 
@@ -60,7 +62,7 @@ class WorkerNodeTaskInstance:
         self._distributor_id = self.cluster_interface.distributor_id
 
         # config
-        config = JobmonConfig()
+        config = JobmonConfig.cached()
         if task_instance_heartbeat_interval is None:
             self._task_instance_heartbeat_interval = config.get_int(
                 "heartbeat", "task_instance_interval"
@@ -436,9 +438,21 @@ class WorkerNodeTaskInstance:
 
     @staticmethod
     async def _communicate(
-        async_stream: asyncio.StreamReader, output_stream: TextIO, chunk_size: int = 64
+        async_stream: asyncio.StreamReader,
+        output_stream: BinaryIO,
+        chunk_size: int = 2**16,
+        tail_size: int = 10000,
+        flush_interval: float = 1.0,
     ) -> str:
-        mem_buffer = ""
+        """Copy a subprocess stream to a file and return the tail of its text.
+
+        Raw bytes go to ``output_stream`` unchanged, flushed at most every
+        ``flush_interval`` seconds. Only the last ``tail_size`` characters are kept in
+        memory. They are decoded incrementally, so multi-byte characters split across
+        reads survive, and invalid bytes become U+FFFD.
+        """
+        tail = _OutputTail(tail_size)
+        last_flush = time()
         try:
             while True:
                 # Read a chunk of data. If no data is returned, we've reached EOF.
@@ -446,25 +460,22 @@ class WorkerNodeTaskInstance:
                 if not data_chunk:
                     break  # EOF reached
 
-                # Attempt to decode and write the data chunk.
-                try:
-                    data_chunk_str = data_chunk.decode()
-                    output_stream.write(data_chunk_str)
+                output_stream.write(data_chunk)
+                tail.append(data_chunk)
+                if time() - last_flush >= flush_interval:
                     output_stream.flush()
-                    mem_buffer += data_chunk_str
-                    # Keep only the last 10k characters in memory.
-                    mem_buffer = mem_buffer[-10000:]
-                except UnicodeDecodeError:
-                    pass  # Ignore decoding errors and continue reading the stream.
+                    last_flush = time()
+            output_stream.flush()
+        except asyncio.CancelledError:
+            # The command failed elsewhere and the caller has already closed the
+            # file; return what was captured for the error log.
+            pass
         except Exception as e:
             # Log unexpected errors. This could be any exception raised by
-            # the reading or writing operations. Consider appending an error message
-            # to `mem_buffer` to indicate that an error occurred.
+            # the reading or writing operations.
             logger.exception("Stream reading error", error=str(e))
-            mem_buffer += "\n[Error reading stream: {}]".format(e)
-        finally:
-            # Ensure that the method always returns the buffer, even if an error occurred.
-            return mem_buffer
+            return tail.getvalue() + "\n[Error reading stream: {}]".format(e)
+        return tail.getvalue()
 
     async def _process_poller(self, process: asyncio.subprocess.Process) -> int:
         keep_polling = True
@@ -510,8 +521,8 @@ class WorkerNodeTaskInstance:
 
         try:
             # Context manager to ensure file streams are properly closed after writing.
-            with open(self.stdout, "w") as stdout_stream, open(
-                self.stderr, "w"
+            with open(self.stdout, "wb") as stdout_stream, open(
+                self.stderr, "wb"
             ) as stderr_stream:
                 # Create asyncio tasks for reading subprocess stdout and stderr.
                 stdout_task = asyncio.create_task(
@@ -577,3 +588,38 @@ class WorkerNodeTaskInstance:
                 stdout=stdout_result,
                 stderr=stderr_result,
             )
+
+
+class _OutputTail:
+    """The last ``size`` characters of an incrementally decoded byte stream.
+
+    Decoded pieces are kept in a deque and whole pieces are dropped from the front
+    once the rest still covers ``size`` characters, so each byte is copied a
+    constant number of times however much output the command produces.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pieces: Deque[str] = deque()
+        self._length = 0
+
+    def append(self, data: bytes) -> None:
+        # Decoding a chunk far larger than the tail is wasted work; only its end
+        # can survive. Four bytes of slack keep a split character intact.
+        if len(data) > 4 * self._size + 4:
+            self._decoder.reset()
+            self._pieces.clear()
+            self._length = 0
+            data = data[-(4 * self._size + 4) :]
+        piece = self._decoder.decode(data)
+        if not piece:
+            return
+        self._pieces.append(piece)
+        self._length += len(piece)
+        while self._length - len(self._pieces[0]) >= self._size:
+            self._length -= len(self._pieces.popleft())
+
+    def getvalue(self) -> str:
+        text = "".join(self._pieces) + self._decoder.decode(b"", final=True)
+        return text[-self._size :]
@@ -5,9 +5,10 @@ This module provides the database session dependency for route handlers.
 Sessions are created from the sessionmaker stored in app.state by the
 db_lifespan context manager.
 """
+
 from __future__ import annotations
 
-from typing import Generator
+from typing import Any, Callable, Generator
 
 from fastapi import Depends, Request
 from sqlalchemy.orm import Session
@@ -17,7 +18,8 @@ def get_db(request: Request) -> Generator[Session, None, None]:
     """Yield a SQLAlchemy Session for FastAPI dependency injection.
 
     The session is automatically committed on success, rolled back on
-    exception, and closed when the request completes.
+    exception, and closed when the request completes. Routes should depend on
+    it through ``DB`` so that the commit happens before the response is sent.
 
     Args:
         request: The FastAPI request object (provides access to app.state)
@@ -49,6 +51,24 @@ def get_dialect(request: Request) -> str:
     return request.app.state.db_dialect
 
 
+def _depends_before_response(dependency: Callable[..., Any]) -> Any:
+    """Declare a yield dependency that finishes before the response is sent.
+
+    Since FastAPI 0.118 the code after ``yield`` runs once the response has been
+    sent, unless the dependency is function scoped. For ``get_db`` that would let a
+    client see a 200 and issue its next request before the commit lands, or see a
+    200 for a commit that then fails. Older versions, without ``scope``, already
+    finish yield dependencies before responding.
+
+    Args:
+        dependency: the yield dependency to declare.
+    """
+    try:
+        return Depends(dependency, scope="function")
+    except TypeError:
+        return Depends(dependency)
+
+
 # Dependency aliases for cleaner route handler signatures
-DB = Depends(get_db)
+DB = _depends_before_response(get_db)
 Dialect = Depends(get_dialect)
@@ -1,41 +1,171 @@
-import nltk
+"""Group task instance error logs that share an error template."""
+
+import hashlib
+import re
+import time
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+import numpy as np
 import sklearn.feature_extraction.text as ext
-from pandas import DataFrame
+import structlog
+from pandas import DataFrame, Series
 
-nltk.download("punkt", quiet=True)
+logger = structlog.get_logger(__name__)
 
+CLUSTER_COLUMNS = [
+    "error_score",
+    "group_instance_count",
+    "task_instance_ids",
+    "task_ids",
+    "sample_error",
+    "first_error_time",
+    "workflow_run_id",
+    "workflow_id",
+]
 
-def cluster_error_logs(df: DataFrame) -> DataFrame:
-    """Cluster error logs using unsupervised learning."""
-    count_vectorizer = ext.CountVectorizer()
-    df["processed_log"] = df["task_instance_stderr_log"].where(
-        df["task_instance_stderr_log"].notna() & (df["task_instance_stderr_log"] != ""),
-        df["error"],
-    )
-    doc_matrix = count_vectorizer.fit_transform(df["processed_log"])
-
-    # TF-IDF transformation
-    tf_idf_transformer = ext.TfidfTransformer()
-    log_scores = tf_idf_transformer.fit_transform(doc_matrix).toarray()
-
-    per_log_score = log_scores.sum(axis=1) / (log_scores != 0).sum(axis=1)
-
-    df["error_score"] = per_log_score
-
-    df_grouped = (
-        df.groupby("error_score")
-        .agg(
-            group_instance_count=("error_score", "count"),
-            task_instance_ids=("task_instance_id", lambda x: list(set(x))),
-            task_ids=("task_id", lambda x: list(set(x))),
-            sample_error=("processed_log", "first"),
-            first_error_time=("error_time", "first"),
-            workflow_run_id=("workflow_run_id", "first"),
-            workflow_id=("workflow_id", "first"),
+# Run in order: timestamps, uuids and hex ids contain digits that the number
+# pattern would otherwise split, and paths may contain numbers as well.
+_TEMPLATE_PATTERNS: List[Tuple[Pattern, str]] = [
+    (
+        re.compile(
+            r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}"
+            r"-[0-9a-fA-F]{12}\b"
+        ),
+        "<UUID>",
+    ),
+    (
+        re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\b"),
+        "<TIME>",
+    ),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|\b(?=[a-f]*\d)[0-9a-f]{12,}\b"), "<HEX>"),
+    (re.compile(r"(?<![\w.])(?:~|\.{1,2})?(?:/[\w.\-+@%=,]+)+/?"), "<PATH>"),
+    (re.compile(r"\b\d+(?:\.\d+)*\b"), "<NUM>"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize_error_logs(logs: Series) -> Series:
+    """Reduce each error log to its template.
+
+    Numbers, timestamps, paths, hex ids and uuids are replaced with placeholders
+    and runs of whitespace are collapsed, so that logs of the same error raised by
+    different tasks share a template.
+    """
+    templates = logs.fillna("")
+    for pattern, placeholder in _TEMPLATE_PATTERNS:
+        templates = templates.str.replace(pattern, placeholder, regex=True)
+    return templates.str.strip()
+
+
+def _template_scores(templates: List[str]) -> np.ndarray:
+    """Mean TF-IDF weight of the words of each template, kept sparse throughout."""
+    try:
+        doc_matrix = ext.CountVectorizer().fit_transform(templates)
+    except ValueError:
+        # none of the templates has a word in it, e.g. every log was empty
+        return np.zeros(len(templates))
+    log_scores = ext.TfidfTransformer().fit_transform(doc_matrix).tocsr()
+    num_words = np.diff(log_scores.indptr)
+    totals = np.asarray(log_scores.sum(axis=1)).ravel()
+    return np.divide(totals, num_words, out=np.zeros_like(totals), where=num_words > 0)
+
+
+def cluster_error_logs(
+    df: DataFrame,
+    batch_size: int = 10_000,
+    max_rows: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+) -> DataFrame:
+    """Cluster error logs by the template of their text.
+
+    Logs are read in batches of ``batch_size`` rows and only one entry per distinct
+    template is kept, so memory grows with the number of clusters rather than the
+    number of logs.
+
+    Args:
+        df: one row per error log.
+        batch_size: number of logs normalized at once.
+        max_rows: stop after this many logs have been clustered.
+        max_seconds: stop once a batch ends this long after the start. At
+            least one batch is always clustered.
+
+    Returns:
+        One row per cluster, largest cluster first.
+    """
+    start = time.time()
+    clusters: Dict[bytes, Dict[str, Any]] = {}
+    num_rows = len(df)
+    if max_rows is not None and max_rows < num_rows:
+        logger.warning(
+            f"Clustering the first {max_rows} of {num_rows} error logs: "
+            f"over the {max_rows} row limit"
         )
-        .reset_index()
-    )
+        num_rows = max_rows
 
-    df_grouped.sort_values(by="group_instance_count", ascending=False, inplace=True)
+    for batch_start in range(0, num_rows, batch_size):
+        if (
+            max_seconds is not None
+            and batch_start > 0
+            and time.time() - start > max_seconds
+        ):
+            logger.warning(
+                f"Stopped clustering error logs after {batch_start} of "
+                f"{num_rows} logs: over the {max_seconds}s limit"
+            )
+            break
+        batch = df.iloc[batch_start : min(batch_start + batch_size, num_rows)]
+        stderr_log = batch["task_instance_stderr_log"]
+        processed_log = stderr_log.where(
+            stderr_log.notna() & (stderr_log != ""), batch["error"]
+        )
+        templates = normalize_error_logs(processed_log)
 
-    return df_grouped
+        for (
+            template,
+            log,
+            task_instance_id,
+            task_id,
+            error_time,
+            workflow_run_id,
+            workflow_id,
+        ) in zip(
+            templates,
+            processed_log,
+            batch["task_instance_id"],
+            batch["task_id"],
+            batch["error_time"],
+            batch["workflow_run_id"],
+            batch["workflow_id"],
+        ):
+            key = hashlib.blake2b(template.encode(), digest_size=16).digest()
+            cluster = clusters.get(key)
+            if cluster is None:
+                cluster = clusters[key] = {
+                    "template": template,
+                    "group_instance_count": 0,
+                    "task_instance_ids": set(),
+                    "task_ids": set(),
+                    "sample_error": log,
+                    "first_error_time": error_time,
+                    "workflow_run_id": workflow_run_id,
+                    "workflow_id": workflow_id,
+                }
+            cluster["group_instance_count"] += 1
+            cluster["task_instance_ids"].add(task_instance_id)
+            cluster["task_ids"].add(task_id)
+
+    if not clusters:
+        return DataFrame(columns=CLUSTER_COLUMNS)
+
+    rows = list(clusters.values())
+    scores = _template_scores([cluster.pop("template") for cluster in rows])
+    for cluster, score in zip(rows, scores):
+        cluster["error_score"] = float(score)
+        cluster["task_instance_ids"] = list(cluster["task_instance_ids"])
+        cluster["task_ids"] = list(cluster["task_ids"])
+
+    df_grouped = DataFrame(rows, columns=CLUSTER_COLUMNS)
+    df_grouped.sort_values(
+        by="group_instance_count", ascending=False, kind="stable", inplace=True
+    )
+    return df_grouped.reset_index(drop=True)
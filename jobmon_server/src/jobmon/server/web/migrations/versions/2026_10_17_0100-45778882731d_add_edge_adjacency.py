@@ -0,0 +1,110 @@
+"""add edge adjacency.
+
+Revision ID: 45778882731d
+Revises: 4762c850f79c
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+
+import ast
+import json
+from typing import Any, List, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "45778882731d"
+down_revision: Union[str, None] = "4762c850f79c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# edge rows read per backfill query
+BACKFILL_BATCH_SIZE = 10000
+
+edge = sa.table(
+    "edge",
+    sa.column("dag_id", sa.Integer),
+    sa.column("node_id", sa.Integer),
+    sa.column("downstream_node_ids", sa.JSON),
+)
+edge_adjacency = sa.table(
+    "edge_adjacency",
+    sa.column("dag_id", sa.Integer),
+    sa.column("upstream_node_id", sa.Integer),
+    sa.column("downstream_node_id", sa.Integer),
+)
+
+
+def _node_ids(value: Any) -> List[int]:
+    """Read a downstream_node_ids value in any format clients have stored.
+
+    Values are lists, JSON strings of lists, JSON strings of such strings, or
+    Python list literals. Copied here so replaying the migration doesn't depend on
+    application code.
+    """
+    while isinstance(value, str):
+        if not value.strip():
+            return []
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            value = ast.literal_eval(value)
+    return list(value or [])
+
+
+def backfill(connection: sa.engine.Connection) -> None:
+    """Copy the downstream lists of the edge table into edge_adjacency.
+
+    Args:
+        connection: connection to the database being migrated.
+    """
+    last_key = (-1, -1)
+    while True:
+        rows = connection.execute(
+            sa.select(edge.c.dag_id, edge.c.node_id, edge.c.downstream_node_ids)
+            .where(
+                sa.tuple_(edge.c.dag_id, edge.c.node_id)
+                > sa.tuple_(*(sa.literal(value) for value in last_key))
+            )
+            .order_by(edge.c.dag_id, edge.c.node_id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        adjacency = [
+            {
+                "dag_id": dag_id,
+                "upstream_node_id": node_id,
+                "downstream_node_id": downstream_node_id,
+            }
+            for dag_id, node_id, downstream_node_ids in rows
+            for downstream_node_id in set(_node_ids(downstream_node_ids))
+        ]
+        if adjacency:
+            connection.execute(sa.insert(edge_adjacency), adjacency)
+        last_key = (rows[-1].dag_id, rows[-1].node_id)
+
+
+def upgrade() -> None:
+    """Add the normalized edge table and fill it from the JSON edge lists."""
+    op.create_table(
+        "edge_adjacency",
+        sa.Column("dag_id", sa.Integer(), nullable=False),
+        sa.Column("upstream_node_id", sa.Integer(), nullable=False),
+        sa.Column("downstream_node_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("dag_id", "upstream_node_id", "downstream_node_id"),
+    )
+    op.create_index(
+        "ix_edge_adjacency_downstream",
+        "edge_adjacency",
+        ["dag_id", "downstream_node_id", "upstream_node_id"],
+        unique=False,
+    )
+    backfill(op.get_bind())
+
+
+def downgrade() -> None:
+    """Drop the normalized edge table."""
+    op.drop_index("ix_edge_adjacency_downstream", table_name="edge_adjacency")
+    op.drop_table("edge_adjacency")
@@ -0,0 +1,59 @@
+"""add resource usage summary.
+
+Revision ID: 8c1f0e5a9b27
+Revises: 45778882731d
+Create Date: 2026-10-17 03:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1f0e5a9b27"
+down_revision: Union[str, None] = "45778882731d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the per task template version resource usage summary.
+
+    Summaries are filled in as resource usage is requested, so there is no backfill.
+    Task instances a summary passed before they settled are kept one per row.
+    """
+    op.create_table(
+        "resource_usage_summary",
+        sa.Column("task_template_version_id", sa.Integer(), nullable=False),
+        sa.Column("last_task_instance_id", sa.Integer(), nullable=False),
+        sa.Column("num_task_instances", sa.Integer(), nullable=False),
+        sa.Column("num_mem_reported", sa.Integer(), nullable=False),
+        sa.Column("mem_count", sa.Integer(), nullable=False),
+        sa.Column("mem_sum", sa.Float(), nullable=False),
+        sa.Column("mem_m2", sa.Float(), nullable=False),
+        sa.Column("mem_min", sa.Float(), nullable=True),
+        sa.Column("mem_max", sa.Float(), nullable=True),
+        sa.Column("mem_sketch", sa.Text(), nullable=True),
+        sa.Column("runtime_count", sa.Integer(), nullable=False),
+        sa.Column("runtime_sum", sa.Float(), nullable=False),
+        sa.Column("runtime_m2", sa.Float(), nullable=False),
+        sa.Column("runtime_min", sa.Float(), nullable=True),
+        sa.Column("runtime_max", sa.Float(), nullable=True),
+        sa.Column("runtime_sketch", sa.Text(), nullable=True),
+        sa.Column("updated_date", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("task_template_version_id"),
+    )
+    op.create_table(
+        "unsettled_task_instance",
+        sa.Column("task_template_version_id", sa.Integer(), nullable=False),
+        sa.Column("task_instance_id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("task_template_version_id", "task_instance_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the resource usage summary."""
+    op.drop_table("unsettled_task_instance")
+    op.drop_table("resource_usage_summary")
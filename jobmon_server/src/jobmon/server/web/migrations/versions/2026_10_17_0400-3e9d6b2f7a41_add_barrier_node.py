@@ -0,0 +1,45 @@
+"""add barrier node.
+
+Revision ID: 3e9d6b2f7a41
+Revises: 8c1f0e5a9b27
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e9d6b2f7a41"
+down_revision: Union[str, None] = "8c1f0e5a9b27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the members of all-to-all barrier dependencies.
+
+    Existing DAGs only have edges, so there is no backfill.
+    """
+    op.create_table(
+        "barrier_node",
+        sa.Column("dag_id", sa.Integer(), nullable=False),
+        sa.Column("barrier_id", sa.Integer(), nullable=False),
+        sa.Column("node_id", sa.Integer(), nullable=False),
+        sa.Column("is_upstream", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("dag_id", "barrier_id", "node_id"),
+    )
+    op.create_index(
+        "ix_barrier_node_node",
+        "barrier_node",
+        ["dag_id", "node_id", "is_upstream", "barrier_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Drop the barrier members."""
+    op.drop_index("ix_barrier_node_node", table_name="barrier_node")
+    op.drop_table("barrier_node")
@@ -0,0 +1,32 @@
+"""Barrier node Database table."""
+
+from sqlalchemy import Boolean, Column, Index, Integer
+
+from jobmon.server.web.models import Base
+
+
+class BarrierNode(Base):
+    """Database Table to record the members of a DAG's barrier dependencies.
+
+    A barrier makes every one of its downstream nodes depend on every one of its
+    upstream nodes. Keeping one row per member instead of one per edge stores a
+    dependency between arrays of N and M tasks in N + M rows. The primary key serves
+    member lookups by barrier and the secondary index serves barrier lookups by node.
+    """
+
+    __tablename__ = "barrier_node"
+
+    dag_id = Column(Integer, primary_key=True)
+    barrier_id = Column(Integer, primary_key=True)
+    node_id = Column(Integer, primary_key=True)
+    is_upstream = Column(Boolean, nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_barrier_node_node",
+            "dag_id",
+            "node_id",
+            "is_upstream",
+            "barrier_id",
+        ),
+    )
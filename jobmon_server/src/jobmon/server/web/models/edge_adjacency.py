@@ -0,0 +1,30 @@
+"""Edge adjacency Database table."""
+
+from sqlalchemy import Column, Index, Integer
+
+from jobmon.server.web.models import Base
+
+
+class EdgeAdjacency(Base):
+    """Database Table to record one row per edge of a DAG.
+
+    The edge table keeps each node's upstream and downstream lists as JSON. This
+    table holds the same edges normalized so that they can be filtered and joined in
+    SQL. The primary key serves downstream lookups and the secondary index serves
+    upstream lookups.
+    """
+
+    __tablename__ = "edge_adjacency"
+
+    dag_id = Column(Integer, primary_key=True)
+    upstream_node_id = Column(Integer, primary_key=True)
+    downstream_node_id = Column(Integer, primary_key=True)
+
+    __table_args__ = (
+        Index(
+            "ix_edge_adjacency_downstream",
+            "dag_id",
+            "downstream_node_id",
+            "upstream_node_id",
+        ),
+    )
@@ -0,0 +1,53 @@
+"""Resource usage summary Database table."""
+
+from typing import Optional
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from jobmon.server.web.models import Base
+
+
+class ResourceUsageSummary(Base):
+    """Database Table of running resource usage statistics per task template version.
+
+    Settled task instances of the version with ids up to last_task_instance_id are
+    folded in. Task instances up to that id that had not settled yet are listed in
+    the unsettled_task_instance table and folded in once they do, so none is counted
+    twice or missed and one long-running instance doesn't hold the watermark back.
+    The watermark only passes task instances that haven't changed for a few
+    minutes, so ids inserted earlier but committed later are not skipped.
+    For memory and runtime the table keeps the count, sum, sum of squared deviations
+    from the mean (m2), extremes, and a serialized quantile sketch, all of which can
+    be merged with newer task instances without reading the folded ones again.
+    """
+
+    __tablename__ = "resource_usage_summary"
+
+    task_template_version_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("task_template_version.id"), primary_key=True
+    )
+    last_task_instance_id: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+    num_task_instances: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # task instances that reported maxrss, of which mem_count were above zero
+    num_mem_reported: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mem_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    mem_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    mem_m2: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    mem_min: Mapped[Optional[float]] = mapped_column(Float)
+    mem_max: Mapped[Optional[float]] = mapped_column(Float)
+    mem_sketch: Mapped[Optional[str]] = mapped_column(Text)
+
+    # task instances with a non-zero wallclock
+    runtime_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    runtime_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    runtime_m2: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    runtime_min: Mapped[Optional[float]] = mapped_column(Float)
+    runtime_max: Mapped[Optional[float]] = mapped_column(Float)
+    runtime_sketch: Mapped[Optional[str]] = mapped_column(Text)
+
+    updated_date = mapped_column(DateTime, default=func.now(), onupdate=func.now())
@@ -0,0 +1,25 @@
+"""Unsettled task instance Database table."""
+
+from sqlalchemy import ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from jobmon.server.web.models import Base
+
+
+class UnsettledTaskInstance(Base):
+    """Database Table of task instances a resource usage summary is waiting on.
+
+    The summary of a task template version has passed these task instances before
+    they settled. They are read again by id until they do, then removed. Task
+    instances that never settle stay listed, so they are kept one per row rather
+    than in a single column.
+    """
+
+    __tablename__ = "unsettled_task_instance"
+
+    task_template_version_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("resource_usage_summary.task_template_version_id"),
+        primary_key=True,
+    )
+    task_instance_id: Mapped[int] = mapped_column(Integer, primary_key=True)
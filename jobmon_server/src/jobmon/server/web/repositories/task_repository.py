@@ -2,17 +2,18 @@
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 import structlog
-from sqlalchemy import and_, select, update
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.orm import Session
 
 from jobmon.core import constants
 from jobmon.core.constants import Direction
 from jobmon.core.serializers import SerializeTaskResourceUsage
-from jobmon.server.web.models.edge import Edge
+from jobmon.server.web.models.barrier_node import BarrierNode
+from jobmon.server.web.models.edge_adjacency import EdgeAdjacency
 from jobmon.server.web.models.node import Node
 from jobmon.server.web.models.queue import Queue
 from jobmon.server.web.models.task import Task
@@ -60,6 +61,11 @@ _reversed_task_instance_label_mapping = {
     "DONE": ["D"],
 }
 
+# Maximum number of IDs bound into a single IN clause.
+_IN_CLAUSE_BATCH_SIZE = 1000
+# DAG levels walked with one edge query each before loading the whole DAG's edges.
+_MAX_FRONTIER_LEVELS = 32
+
 
 class TaskRepository:
     def __init__(self, session: Session) -> None:
@@ -137,11 +143,15 @@ class TaskRepository:
 
     def _update_task_statuses_in_db(self, task_ids: List[int], new_status: str) -> None:
         """Update task statuses in the database."""
-        update_stmt = update(Task).where(
-            and_(Task.id.in_(task_ids), Task.status != new_status)
-        )
         vals = {"status": new_status}
-        self.session.execute(update_stmt.values(**vals))
+        for i in range(0, len(task_ids), _IN_CLAUSE_BATCH_SIZE):
+            update_stmt = update(Task).where(
+                and_(
+                    Task.id.in_(task_ids[i : i + _IN_CLAUSE_BATCH_SIZE]),
+                    Task.status != new_status,
+                )
+            )
+            self.session.execute(update_stmt.values(**vals))
         self.session.flush()
 
     def _get_workflow_run(self, workflow_id: str) -> WorkflowRun | None:
@@ -187,7 +197,10 @@ class TaskRepository:
             task_instance_update_stmt = update(TaskInstance).where(
                 TaskInstance.id.in_(self.session.query(subquery.c.id))
             )
-            vals = {"status": constants.TaskInstanceStatus.KILL_SELF}
+            vals = {
+                "status": constants.TaskInstanceStatus.KILL_SELF,
+                "status_date": func.now(),
+            }
             self.session.execute(task_instance_update_stmt.values(**vals))
             self.session.flush()
 
@@ -277,32 +290,7 @@ class TaskRepository:
         rows = self.session.query(Task.node_id).filter(Task.id.in_(task_ids)).all()
         node_ids = [int(row[0]) for row in rows]
 
-        # This set will accumulate all discovered node IDs.
-        nodes_recursive: Set[int] = set()
-        # Use a stack (list) for iterative traversal.
-        stack = list(node_ids)
-
-        while stack:
-            current_node = stack.pop()
-            # Skip if we've already processed this task.
-            if current_node in nodes_recursive:
-                continue
-
-            # Mark the current node as visited.
-            nodes_recursive.add(current_node)
-            # Get the node dependencies for the current node based on the specified direction.
-            node_deps = self._get_node_dependencies(
-                {current_node},
-                dag_id,
-                (
-                    Direction.DOWN
-                    if direction == constants.Direction.DOWN
-                    else Direction.UP
-                ),
-            )
-            if node_deps:
-                # Add the node dependencies to the stack for further processing.
-                stack.extend(list(node_deps))
+        nodes_recursive = self._traverse_nodes(set(node_ids), dag_id, direction)
 
         # get task_ids from node_ids
         tasks_recursive = self._get_tasks_from_nodes(
@@ -310,6 +298,83 @@ class TaskRepository:
         )
         return set(tasks_recursive.keys())
 
+    def _traverse_nodes(
+        self, node_ids: Set[int], dag_id: int, direction: Direction
+    ) -> Set[int]:
+        """Get the given nodes and everything reachable from them in one direction.
+
+        The DAG is walked one level at a time, with one batched edge query per level.
+        Deep DAGs would still cost a query per level, so after
+        ``_MAX_FRONTIER_LEVELS`` levels the rest of the DAG's edges are loaded in a
+        single query and the walk finishes in memory.
+
+        Args:
+            node_ids (Set[int]): nodes to start from.
+            dag_id (int): ID of DAG
+            direction (Direction): either up or down
+
+        Returns:
+            Set[int]: the starting nodes and all of their ancestors or descendants.
+        """
+        visited = set(node_ids)
+        frontier = set(node_ids)
+        levels = 0
+        while frontier:
+            if levels == _MAX_FRONTIER_LEVELS:
+                adjacency = self._get_dag_adjacency(dag_id, direction)
+                stack = list(frontier)
+                while stack:
+                    for node_id in adjacency.get(stack.pop(), ()):
+                        if node_id not in visited:
+                            visited.add(node_id)
+                            stack.append(node_id)
+                # drop the barrier keys the walk passed through
+                visited = {node_id for node_id in visited if isinstance(node_id, int)}
+                break
+            frontier = self._get_node_dependencies(frontier, dag_id, direction)
+            frontier -= visited
+            visited |= frontier
+            levels += 1
+        return visited
+
+    @staticmethod
+    def _adjacency_columns(direction: Direction) -> Tuple[Any, Any]:
+        """Return the (from, to) edge_adjacency columns for a traversal direction."""
+        if direction == Direction.UP:
+            return EdgeAdjacency.downstream_node_id, EdgeAdjacency.upstream_node_id
+        elif direction == Direction.DOWN:
+            return EdgeAdjacency.upstream_node_id, EdgeAdjacency.downstream_node_id
+        raise ValueError(f"Invalid direction type. Expected one of: {Direction}")
+
+    def _get_dag_adjacency(self, dag_id: int, direction: Direction) -> Dict[Any, List]:
+        """Get the upstream or downstream node IDs of every node in a DAG.
+
+        Each barrier is a ``("barrier", barrier_id)`` key between its members, so that
+        its edges are not expanded.
+
+        Args:
+            dag_id (int): ID of DAG
+            direction (Direction): either up or down
+        """
+        from_column, to_column = self._adjacency_columns(direction)
+        select_stmt = select(from_column, to_column).where(
+            EdgeAdjacency.dag_id == int(dag_id)
+        )
+        adjacency: Dict[Any, List] = defaultdict(list)
+        for from_node_id, to_node_id in self.session.execute(select_stmt):
+            adjacency[from_node_id].append(to_node_id)
+
+        from_upstream = direction == Direction.DOWN
+        select_stmt = select(
+            BarrierNode.barrier_id, BarrierNode.node_id, BarrierNode.is_upstream
+        ).where(BarrierNode.dag_id == int(dag_id))
+        for barrier_id, node_id, is_upstream in self.session.execute(select_stmt):
+            if is_upstream == from_upstream:
+                adjacency[node_id].append(("barrier", barrier_id))
+            else:
+                adjacency[("barrier", barrier_id)].append(node_id)
+        return adjacency
+
     def _get_node_dependencies(
         self, nodes: set, dag_id: int, direction: Direction
     ) -> Set[int]:
@@ -320,26 +385,54 @@ class TaskRepository:
             dag_id (int): ID of DAG
             direction (Direction): either up or down
         """
-        select_stmt = select(Edge).where(
-            Edge.dag_id == int(dag_id), Edge.node_id.in_(list(nodes))
-        )
+        from_column, to_column = self._adjacency_columns(direction)
+        node_list = list(nodes)
         node_ids: Set[int] = set()
-        for row in self.session.execute(select_stmt).all():
-            edges = row[0]
-            if direction == Direction.UP:
-                upstreams = edges.upstream_node_ids
-                if upstreams:
-                    node_ids.update(upstreams)
-            elif direction == Direction.DOWN:
-                downstreams = edges.downstream_node_ids
-                if downstreams:
-                    node_ids.update(downstreams)
-            else:
-                raise ValueError(
-                    f"Invalid direction type. Expected one of: {Direction}"
-                )
+        for i in range(0, len(node_list), _IN_CLAUSE_BATCH_SIZE):
+            select_stmt = select(to_column).where(
+                EdgeAdjacency.dag_id == int(dag_id),
+                from_column.in_(node_list[i : i + _IN_CLAUSE_BATCH_SIZE]),
+            )
+            node_ids.update(self.session.execute(select_stmt).scalars())
+        node_ids.update(self._get_barrier_dependencies(node_list, dag_id, direction))
         return node_ids
 
+    def _get_barrier_dependencies(
+        self, node_list: List[int], dag_id: int, direction: Direction
+    ) -> Set[int]:
+        """Get the nodes on the other side of the barriers the given nodes are in.
+
+        The barriers are looked up first and their members second, so a barrier costs
+        its number of members rather than its number of edges.
+
+        Args:
+            node_list (list): list of node IDs
+            dag_id (int): ID of DAG
+            direction (Direction): either up or down
+        """
+        from_upstream = direction == Direction.DOWN
+        barrier_ids: Set[int] = set()
+        for i in range(0, len(node_list), _IN_CLAUSE_BATCH_SIZE):
+            select_stmt = (
+                select(BarrierNode.barrier_id)
+                .distinct()
+                .where(
+                    BarrierNode.dag_id == int(dag_id),
+                    BarrierNode.node_id.in_(node_list[i : i + _IN_CLAUSE_BATCH_SIZE]),
+                    BarrierNode.is_upstream == from_upstream,
+                )
+            )
+            barrier_ids.update(self.session.execute(select_stmt).scalars())
+        if not barrier_ids:
+            return set()
+
+        select_stmt = select(BarrierNode.node_id).where(
+            BarrierNode.dag_id == int(dag_id),
+            BarrierNode.barrier_id.in_(barrier_ids),
+            BarrierNode.is_upstream == (not from_upstream),
+        )
+        return set(self.session.execute(select_stmt).scalars())
+
     def _get_tasks_from_nodes(
         self, workflow_id: int, nodes: List, task_status: List
     ) -> dict:
@@ -353,11 +446,13 @@ class TaskRepository:
         if not nodes:
             return {}
 
-        select_stmt = select(Task.id, Task.status, Task.name).where(
-            Task.workflow_id == workflow_id, Task.node_id.in_(list(nodes))
-        )
-
-        result = self.session.execute(select_stmt).all()
+        result: List[Any] = []
+        for i in range(0, len(nodes), _IN_CLAUSE_BATCH_SIZE):
+            select_stmt = select(Task.id, Task.status, Task.name).where(
+                Task.workflow_id == workflow_id,
+                Task.node_id.in_(nodes[i : i + _IN_CLAUSE_BATCH_SIZE]),
+            )
+            result.extend(self.session.execute(select_stmt).all())
         task_dict = {}
         for r in result:
             # When task_status not specified, return the full subdag
@@ -509,14 +604,7 @@ class TaskRepository:
             node_ids (list): list of node IDs
             dag_id (int): ID of DAG
         """
-        node_set = set(node_ids)
-        node_descendants = node_set
-        while len(node_descendants) > 0:
-            node_descendants = self._get_node_dependencies(
-                node_descendants, dag_id, Direction.DOWN
-            )
-            node_set = node_set.union(node_descendants)
-        return list(node_set)
+        return list(self._traverse_nodes(set(node_ids), dag_id, Direction.DOWN))
 
     def get_task_dependencies(self, task_id: int) -> TaskDependenciesResponse:
         """Get task's downstream and upstream tasks and their status."""
@@ -617,20 +705,32 @@ class TaskRepository:
         from jobmon.server.web.utils.json_compat import normalize_node_ids_for_client
 
         tasks_and_edges = self.session.execute(
-            select(Task.id, Task.node_id, Edge.downstream_node_ids).where(
-                Task.id.in_(task_ids),
-                Task.node_id == Edge.node_id,
-                Edge.dag_id == dag_id,
+            select(Task.id, Task.node_id, EdgeAdjacency.downstream_node_id)
+            .outerjoin(
+                EdgeAdjacency,
+                and_(
+                    EdgeAdjacency.dag_id == dag_id,
+                    EdgeAdjacency.upstream_node_id == Task.node_id,
+                ),
             )
+            .where(Task.id.in_(task_ids))
         ).all()
 
-        result = {}
+        downstream_node_ids: Dict[int, List[int]] = {}
+        node_ids: Dict[int, int] = {}
         for row in tasks_and_edges:
+            node_ids[row.id] = row.node_id
+            downstreams = downstream_node_ids.setdefault(row.id, [])
+            if row.downstream_node_id is not None:
+                downstreams.append(row.downstream_node_id)
+
+        result = {}
+        for task_id, node_id in node_ids.items():
             # Format downstream_node_ids based on client version
             formatted_downstream_ids = normalize_node_ids_for_client(
-                row.downstream_node_ids, client_version
+                downstream_node_ids[task_id] or None, client_version
             )
-            result[row.id] = [row.node_id, formatted_downstream_ids]
+            result[task_id] = [node_id, formatted_downstream_ids]
 
         return DownstreamTasksResponse(downstream_tasks=result)
 
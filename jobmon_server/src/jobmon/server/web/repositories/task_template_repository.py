@@ -1,22 +1,27 @@
 import json
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+from datetime import timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import numpy as np
 import pandas as pd  # type: ignore
 import scipy.stats as st  # type: ignore
 import structlog
-from sqlalchemy import String, and_, case, desc, func, select
+from sqlalchemy import String, and_, case, delete, desc, func, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.elements import ColumnElement, Label
 
+from jobmon.core.configuration import JobmonConfig
 from jobmon.server.web.error_log_clustering import cluster_error_logs
 from jobmon.server.web.models.arg import Arg
 from jobmon.server.web.models.array import Array
 from jobmon.server.web.models.node import Node
 from jobmon.server.web.models.node_arg import NodeArg
 from jobmon.server.web.models.queue import Queue
+from jobmon.server.web.models.resource_usage_summary import ResourceUsageSummary
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.task_instance import TaskInstance
 from jobmon.server.web.models.task_instance_error_log import TaskInstanceErrorLog
@@ -24,6 +29,7 @@ from jobmon.server.web.models.task_instance_status import TaskInstanceStatus
 from jobmon.server.web.models.task_resources import TaskResources
 from jobmon.server.web.models.task_template import TaskTemplate
 from jobmon.server.web.models.task_template_version import TaskTemplateVersion
+from jobmon.server.web.models.unsettled_task_instance import UnsettledTaskInstance
 from jobmon.server.web.models.workflow_run import WorkflowRun
 from jobmon.server.web.schemas.task_template import (
     CoreInfoItem,
@@ -40,6 +46,7 @@ from jobmon.server.web.schemas.task_template import (
     TaskTemplateVersionResponse,
     WorkflowTaskTemplateStatusItem,
 )
+from jobmon.server.web.utils.quantile_sketch import QuantileSketch
 
 logger = structlog.get_logger(__name__)
 
@@ -62,6 +69,215 @@ class ResourceUsageStatistics:
     viz_data: Optional[List[TaskResourceVizItem]] = None
 
 
+# task instances whose resource usage is reported in task template statistics
+_FINISHED_TASK_INSTANCE_STATUSES = [
+    TaskInstanceStatus.DONE,
+    TaskInstanceStatus.RESOURCE_ERROR,
+    TaskInstanceStatus.NO_HEARTBEAT,
+    TaskInstanceStatus.UNKNOWN_ERROR,
+    TaskInstanceStatus.ERROR_FATAL,
+    TaskInstanceStatus.ERROR,
+]
+
+# task instances that will not change status again. NO_HEARTBEAT may still move to
+# error with usage reported by the worker; NO_DISTRIBUTOR_ID never ran, so it settles
+# without usage.
+_SETTLED_TASK_INSTANCE_STATUSES = [
+    status
+    for status in _FINISHED_TASK_INSTANCE_STATUSES
+    if status != TaskInstanceStatus.NO_HEARTBEAT
+] + [TaskInstanceStatus.NO_DISTRIBUTOR_ID]
+
+# ids are assigned when a task instance is inserted, not when it is committed, so a
+# lower id can appear after a higher one was read. The summary watermark only moves
+# past task instances that haven't changed for this long, by which time every
+# lower id has been committed.
+_UNCOMMITTED_TASK_INSTANCE_GRACE = timedelta(minutes=5)
+
+# Maximum number of IDs bound into a single IN clause.
+_IN_CLAUSE_BATCH_SIZE = 1000
+
+
+def _t_interval(
+    confidence: float, count: int, mean: float, m2: float
+) -> List[Union[float, None]]:
+    """Student's t confidence interval of a mean from its running moments."""
+    std = math.sqrt(m2 / (count - 1))
+    interval = st.t.interval(
+        confidence, count - 1, loc=mean, scale=std / math.sqrt(count)
+    )
+    return [round(float(interval[0]), 2), round(float(interval[1]), 2)]
+
+
+@dataclass
+class _UsageMoments:
+    """Mergeable count, mean, spread, extremes and quantiles of one resource."""
+
+    count: int = 0
+    total: float = 0.0
+    # sum of squared deviations from the mean, updated with Welford's method
+    m2: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: float) -> None:
+        previous_mean = self.mean
+        self.count += 1
+        self.total += value
+        self.m2 += (value - previous_mean) * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.sketch.add(value)
+
+    def merge(self, other: "_UsageMoments") -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @classmethod
+    def from_summary(
+        cls: Type["_UsageMoments"], summary: ResourceUsageSummary, prefix: str
+    ) -> "_UsageMoments":
+        return cls(
+            count=getattr(summary, f"{prefix}_count"),
+            total=getattr(summary, f"{prefix}_sum"),
+            m2=getattr(summary, f"{prefix}_m2"),
+            min=getattr(summary, f"{prefix}_min"),
+            max=getattr(summary, f"{prefix}_max"),
+            sketch=QuantileSketch.from_json(getattr(summary, f"{prefix}_sketch")),
+        )
+
+    def to_summary(self, summary: ResourceUsageSummary, prefix: str) -> None:
+        setattr(summary, f"{prefix}_count", self.count)
+        setattr(summary, f"{prefix}_sum", self.total)
+        setattr(summary, f"{prefix}_m2", self.m2)
+        setattr(summary, f"{prefix}_min", self.min)
+        setattr(summary, f"{prefix}_max", self.max)
+        setattr(summary, f"{prefix}_sketch", self.sketch.to_json())
+
+
+@dataclass
+class _ResourceUsageTotals:
+    """Running resource usage of finished task instances, as stored in the summary.
+
+    Folding a task instance in matches calculate_resource_statistics: memory is
+    clamped at zero and only positive values enter the statistics, and only
+    non-zero runtimes do.
+    """
+
+    num_task_instances: int = 0
+    num_mem_reported: int = 0
+    mem: _UsageMoments = field(default_factory=_UsageMoments)
+    runtime: _UsageMoments = field(default_factory=_UsageMoments)
+
+    def add(self, wallclock: Optional[str], maxrss: Optional[str]) -> None:
+        try:
+            runtime = float(wallclock) if wallclock is not None else None
+            memory = int(maxrss) if maxrss is not None else None
+        except ValueError:
+            # such rows are dropped from the exact computation as well
+            return
+        self.num_task_instances += 1
+        if memory is not None:
+            self.num_mem_reported += 1
+            if memory > 0:
+                self.mem.add(float(memory))
+        if runtime is not None and runtime != 0:
+            self.runtime.add(runtime)
+
+    def merge(self, other: "_ResourceUsageTotals") -> None:
+        self.num_task_instances += other.num_task_instances
+        self.num_mem_reported += other.num_mem_reported
+        self.mem.merge(other.mem)
+        self.runtime.merge(other.runtime)
+
+    @classmethod
+    def from_summary(
+        cls: Type["_ResourceUsageTotals"], summary: ResourceUsageSummary
+    ) -> "_ResourceUsageTotals":
+        return cls(
+            num_task_instances=summary.num_task_instances,
+            num_mem_reported=summary.num_mem_reported,
+            mem=_UsageMoments.from_summary(summary, "mem"),
+            runtime=_UsageMoments.from_summary(summary, "runtime"),
+        )
+
+    def to_summary(self, summary: ResourceUsageSummary) -> None:
+        summary.num_task_instances = self.num_task_instances
+        summary.num_mem_reported = self.num_mem_reported
+        self.mem.to_summary(summary, "mem")
+        self.runtime.to_summary(summary, "runtime")
+
+    def statistics(
+        self, confidence_interval: Optional[str] = None
+    ) -> ResourceUsageStatistics:
+        stats = ResourceUsageStatistics(num_tasks=self.num_task_instances)
+        if self.num_mem_reported:
+            if self.mem.count:
+                stats.min_mem = int(self.mem.min)  # type: ignore[arg-type]
+                stats.max_mem = int(self.mem.max)  # type: ignore[arg-type]
+                stats.mean_mem = self.mem.mean
+                stats.median_mem = self.mem.sketch.quantile(0.5)
+            else:
+                stats.min_mem = 0
+                stats.max_mem = 0
+                stats.mean_mem = 0.0
+                stats.median_mem = 0.0
+        if self.runtime.count:
+            stats.min_runtime = int(self.runtime.min)  # type: ignore[arg-type]
+            stats.max_runtime = int(self.runtime.max)  # type: ignore[arg-type]
+            stats.mean_runtime = self.runtime.mean
+            stats.median_runtime = self.runtime.sketch.quantile(0.5)
+        else:
+            stats.min_runtime = 0
+            stats.max_runtime = 0
+            stats.mean_runtime = 0.0
+            stats.median_runtime = 0.0
+
+        if confidence_interval:
+            ci_value = float(confidence_interval)
+            if self.mem.count > 1:
+                stats.ci_mem = _t_interval(
+                    ci_value, self.mem.count, self.mem.mean, self.mem.m2
+                )
+            if self.runtime.count > 1:
+                stats.ci_runtime = _t_interval(
+                    ci_value, self.runtime.count, self.runtime.mean, self.runtime.m2
+                )
+        return stats
+
+
+@dataclass
+class _SummaryFold:
+    """Task instances of a version read on top of its stored summary."""
+
+    # the stored summary with newly settled task instances folded in
+    stored: _ResourceUsageTotals
+    # finished task instances that may still change, counted in this response only
+    pending: _ResourceUsageTotals
+    last_task_instance_id: int
+    # task instances the watermark passed before they settled
+    newly_unsettled_ids: List[int]
+    # task instances listed as unsettled that have settled since
+    newly_settled_ids: List[int]
+    # whether the stored summary is out of date
+    changed: bool
+
+
 class TaskTemplateRepository:
     def __init__(self, session: Session) -> None:
         """Initialize the TaskTemplateRepository with a database session."""
@@ -107,16 +323,7 @@ class TaskTemplateRepository:
         """Fetch and filter task resource details with optimized single-query approach."""
         base_filters = [
             TaskTemplateVersion.id == task_template_version_id,
-            TaskInstance.status.in_(
-                [
-                    TaskInstanceStatus.DONE,
-                    TaskInstanceStatus.RESOURCE_ERROR,
-                    TaskInstanceStatus.NO_HEARTBEAT,
-                    TaskInstanceStatus.UNKNOWN_ERROR,
-                    TaskInstanceStatus.ERROR_FATAL,
-                    TaskInstanceStatus.ERROR,
-                ]
-            ),
+            TaskInstance.status.in_(_FINISHED_TASK_INSTANCE_STATUSES),
         ]
 
         if workflows:
@@ -416,6 +623,185 @@ class TaskTemplateRepository:
 
         return stats
 
+    def _get_resource_usage_summary_for_update(
+        self, task_template_version_id: int
+    ) -> ResourceUsageSummary:
+        """Return the locked summary of a task template version, creating it."""
+        query = (
+            select(ResourceUsageSummary)
+            .where(
+                ResourceUsageSummary.task_template_version_id
+                == task_template_version_id
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        summary = self.session.execute(query).scalar_one_or_none()
+        if summary is None:
+            try:
+                with self.session.begin_nested():
+                    self.session.add(
+                        ResourceUsageSummary(
+                            task_template_version_id=task_template_version_id
+                        )
+                    )
+            except IntegrityError:
+                # created by a concurrent request
+                pass
+            summary = self.session.execute(query).scalar_one()
+        return summary
+
+    def _fold_task_instances(
+        self,
+        task_template_version_id: int,
+        summary: Optional[ResourceUsageSummary],
+    ) -> _SummaryFold:
+        """Read the task instances a summary hasn't folded in and fold the settled.
+
+        The watermark moves to the newest task instance last changed before the
+        grace period. Newer ones count toward this response only until then.
+        """
+        if summary is None:
+            stored = _ResourceUsageTotals()
+            last_task_instance_id = 0
+        else:
+            stored = _ResourceUsageTotals.from_summary(summary)
+            last_task_instance_id = summary.last_task_instance_id
+
+        rows = self.session.execute(
+            select(
+                TaskInstance.id,
+                TaskInstance.status,
+                TaskInstance.wallclock,
+                TaskInstance.maxrss,
+                TaskInstance.status_date,
+                UnsettledTaskInstance.task_instance_id.is_not(None).label(
+                    "was_unsettled"
+                ),
+            )
+            .join(Task, TaskInstance.task_id == Task.id)
+            .join(Node, Task.node_id == Node.id)
+            .outerjoin(
+                UnsettledTaskInstance,
+                and_(
+                    UnsettledTaskInstance.task_template_version_id
+                    == task_template_version_id,
+                    UnsettledTaskInstance.task_instance_id == TaskInstance.id,
+                ),
+            )
+            .where(
+                Node.task_template_version_id == task_template_version_id,
+                (TaskInstance.id > last_task_instance_id)
+                | UnsettledTaskInstance.task_instance_id.is_not(None),
+            )
+        ).all()
+
+        db_time = self.session.execute(select(func.now())).scalar()
+        committed_before = db_time - _UNCOMMITTED_TASK_INSTANCE_GRACE
+        watermark = max(
+            [last_task_instance_id]
+            + [
+                row.id
+                for row in rows
+                if row.status_date is not None and row.status_date <= committed_before
+            ]
+        )
+        fold = _SummaryFold(
+            stored=stored,
+            pending=_ResourceUsageTotals(),
+            last_task_instance_id=watermark,
+            newly_unsettled_ids=[],
+            newly_settled_ids=[],
+            changed=watermark > last_task_instance_id,
+        )
+        for row in rows:
+            if row.id > watermark:
+                if row.status in _FINISHED_TASK_INSTANCE_STATUSES:
+                    fold.pending.add(row.wallclock, row.maxrss)
+                continue
+            if row.status in _SETTLED_TASK_INSTANCE_STATUSES:
+                fold.changed = True
+                if row.status in _FINISHED_TASK_INSTANCE_STATUSES:
+                    fold.stored.add(row.wallclock, row.maxrss)
+                if row.was_unsettled:
+                    fold.newly_settled_ids.append(row.id)
+                continue
+            if not row.was_unsettled:
+                fold.newly_unsettled_ids.append(row.id)
+            if row.status in _FINISHED_TASK_INSTANCE_STATUSES:
+                fold.pending.add(row.wallclock, row.maxrss)
+        return fold
+
+    def _update_unsettled_task_instances(
+        self, task_template_version_id: int, fold: _SummaryFold
+    ) -> None:
+        """Store the task instances the summary is waiting on after a fold."""
+        settled_ids = fold.newly_settled_ids
+        for i in range(0, len(settled_ids), _IN_CLAUSE_BATCH_SIZE):
+            self.session.execute(
+                delete(UnsettledTaskInstance).where(
+                    UnsettledTaskInstance.task_template_version_id
+                    == task_template_version_id,
+                    UnsettledTaskInstance.task_instance_id.in_(
+                        settled_ids[i : i + _IN_CLAUSE_BATCH_SIZE]
+                    ),
+                )
+            )
+        if fold.newly_unsettled_ids:
+            self.session.execute(
+                insert(UnsettledTaskInstance),
+                [
+                    {
+                        "task_template_version_id": task_template_version_id,
+                        "task_instance_id": task_instance_id,
+                    }
+                    for task_instance_id in fold.newly_unsettled_ids
+                ],
+            )
+
+    def get_summarized_resource_statistics(
+        self,
+        task_template_version_id: int,
+        confidence_interval: Optional[str] = None,
+    ) -> ResourceUsageStatistics:
+        """Resource statistics of all finished task instances of a version.
+
+        Only task instances newer than the stored summary, and the ones it has
+        passed before they settled, are read. Settled ones are folded into the
+        summary; finished ones that may still change, or that changed within the
+        last few minutes, count toward this response only. The summary is locked
+        and written only when it is out of date. Usage rewritten on task instances
+        that were already folded in is not seen; ``exact`` requests read every row.
+        Medians come from a quantile sketch, so they are exact for up to 1000 values
+        and within 1% for larger samples.
+        """
+        summary = self.session.execute(
+            select(ResourceUsageSummary).where(
+                ResourceUsageSummary.task_template_version_id
+                == task_template_version_id
+            )
+        ).scalar_one_or_none()
+        fold = self._fold_task_instances(task_template_version_id, summary)
+        if fold.changed:
+            # read again under the lock, a concurrent request may have folded first
+            summary = self._get_resource_usage_summary_for_update(
+                task_template_version_id
+            )
+            fold = self._fold_task_instances(task_template_version_id, summary)
+            fold.stored.to_summary(summary)
+            summary.last_task_instance_id = fold.last_task_instance_id
+            self._update_unsettled_task_instances(task_template_version_id, fold)
+
+        stored = fold.stored
+        stored.merge(fold.pending)
+        if stored.num_task_instances == 0:
+            return self.calculate_resource_statistics(
+                task_details=[],
+                confidence_interval=confidence_interval,
+                task_template_version_id=task_template_version_id,
+            )
+        return stored.statistics(confidence_interval)
+
     def get_task_template_resource_usage(
         self, req: TaskTemplateResourceUsageRequest
     ) -> Optional[List[TaskResourceVizItem]]:
@@ -841,6 +1227,13 @@ class TaskTemplateRepository:
 
         return result_dict
 
+    def _error_log_clustering_limits(self) -> Tuple[Optional[int], Optional[float]]:
+        """Return the configured caps on error log clustering, None if uncapped."""
+        config = JobmonConfig.cached()
+        max_rows = config.get_int("error_log_clustering", "max_rows")
+        max_seconds = config.get_float("error_log_clustering", "max_seconds")
+        return max_rows or None, max_seconds or None
+
     def get_tt_error_log_viz(
         self,
         workflow_id: int,
@@ -1092,7 +1485,10 @@ class TaskTemplateRepository:
                     ]
                 )
 
-                clustered = cluster_error_logs(df)
+                max_rows, max_seconds = self._error_log_clustering_limits()
+                clustered = cluster_error_logs(
+                    df, max_rows=max_rows, max_seconds=max_seconds
+                )
                 total_clusters = len(clustered)
                 paged_clusters = clustered.iloc[offset : offset + page_size]
 
@@ -1209,6 +1605,11 @@ class TaskTemplateRepository:
                 )
                 .order_by(TaskInstanceErrorLog.id)
             )
+            if cluster_errors:
+                # only the logs that will be clustered are loaded
+                max_rows, _ = self._error_log_clustering_limits()
+                if max_rows is not None:
+                    query = query.limit(max_rows)
 
             rows = self.session.execute(query).all()
 
@@ -1231,7 +1632,10 @@ class TaskTemplateRepository:
                     ]
                 )
 
-                clustered = cluster_error_logs(df)
+                max_rows, max_seconds = self._error_log_clustering_limits()
+                clustered = cluster_error_logs(
+                    df, max_rows=max_rows, max_seconds=max_seconds
+                )
                 total_clusters = len(clustered)
                 if total_clusters == 0:
                     return ErrorLogResponse(
@@ -1,9 +1,10 @@
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import structlog
-from sqlalchemy import Select, func, select, text, update
+from sqlalchemy import Select, case, func, select, text, update
 from sqlalchemy.orm import Session
 
 from jobmon.core.constants import WorkflowStatus as Statuses
@@ -54,6 +55,13 @@ _reversed_cli_label_mapping = {
 _cli_order = ["PENDING", "SCHEDULED", "RUNNING", "DONE", "FATAL"]
 
 
+def _epoch_milliseconds(value: Optional[datetime]) -> Optional[int]:
+    """Milliseconds since the epoch of a naive UTC datetime, as pandas writes them."""
+    if value is None:
+        return None
+    return int(value.replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
 class WorkflowRepository:
     def __init__(self, session: Session) -> None:
         """Initialize the workflow repository."""
@@ -237,125 +245,63 @@ class WorkflowRepository:
                 workflow_request = [int(row[0]) for row in rows]
         # performance improvement one: only query the limited number of workflows
         workflow_request = workflow_request[:limit]
-        # performance improvement two: split query
-        query_filter = [
-            Workflow.id.in_(workflow_request),  # type: ignore
-            WorkflowStatus.id == Workflow.status,  # type: ignore
+        # count tasks and retries per workflow and cli status in one grouped query
+        status_counts = [
+            func.sum(
+                case((Task.status.in_(_reversed_cli_label_mapping[col]), 1), else_=0)
+            )
+            for col in _cli_order
         ]
-        sql1: Select[
-            Tuple[Optional[int], Optional[str], Optional[str], Optional[datetime]]
-        ] = (
+        retries = func.sum(
+            case((Task.num_attempts > 1, Task.num_attempts - 1), else_=0)
+        )
+        sql = (
             select(
                 Workflow.id,
                 Workflow.name,
                 WorkflowStatus.label,
                 Workflow.created_date,
+                func.count(Task.id),
+                *status_counts,
+                retries,
             )
-        ).where(
-            *query_filter
+            .join(WorkflowStatus, WorkflowStatus.id == Workflow.status)
+            .join(Task, Task.workflow_id == Workflow.id)
+            .where(Workflow.id.in_(workflow_request))  # type: ignore
+            .group_by(
+                Workflow.id, Workflow.name, WorkflowStatus.label, Workflow.created_date
+            )
+            .order_by(Workflow.id)
         )
-        rows1 = self.session.execute(sql1).all()
-
-        row_map = dict()
-        for r in rows1:
-            row_map[r[0]] = r
-
-        query_filter = [
-            Task.workflow_id.in_(workflow_request),
-        ]
-        sql2: Select[Tuple[int, int, str]] = (
-            select(
-                Task.workflow_id,
-                func.count(Task.status),
-                Task.status,
-            ).where(*query_filter)
-        ).group_by(Task.workflow_id, Task.status)
-        rows2 = self.session.execute(sql2).all()
-
-        res = []
-        for r in rows2:  # type: ignore
-            d = dict()
-            d["WF_ID"] = r[0]
-            d["WF_NAME"] = row_map[r[0]][1]
-            d["WF_STATUS"] = row_map[r[0]][2]
-            d["TASKS"] = r[1]
-            d["STATUS"] = r[2]
-            d["CREATED_DATE"] = row_map[r[0]][3]
-            q_filter = [Task.workflow_id == d["WF_ID"], Task.status == d["STATUS"]]
-            q = select(Task.num_attempts).where(*q_filter)
-            query_result = self.session.execute(q).all()
-            retries = 0
-            for rr in query_result:
-                retries += 0 if int(rr[0]) <= 1 else int(rr[0]) - 1
-            d["RETRIES"] = retries
-            res.append(d)
-
-        if res is not None and len(res) > 0:
-            # assign to dataframe for aggregation
-            df = pd.DataFrame(res, columns=res[0].keys())
-
-            # remap to jobmon_cli statuses
-            df.STATUS.replace(to_replace=_cli_label_mapping, inplace=True)
+        rows = self.session.execute(sql).all()
 
-            # aggregate totals by workflow and status
-            df = df.groupby(
-                ["WF_ID", "WF_NAME", "WF_STATUS", "STATUS", "CREATED_DATE"]
-            ).agg({"TASKS": "sum", "RETRIES": "sum"})
-
-            # pivot wide by task status
-            tasks = df.pivot_table(
-                values="TASKS",
-                index=["WF_ID", "WF_NAME", "WF_STATUS", "CREATED_DATE"],
-                columns="STATUS",
-                fill_value=0,
+        if not rows:
+            empty_columns = ["WF_ID", "WF_NAME", "WF_STATUS", "CREATED_DATE", "TASKS"]
+            empty_columns += ["PENDING", "RUNNING", "DONE", "FATAL", "RETRIES"]
+            return WorkflowStatusResponse(
+                workflows=json.dumps({col: {} for col in empty_columns})
             )
-            for col in _cli_order:
-                if col not in tasks.columns:
-                    tasks[col] = 0
-            tasks = tasks[_cli_order]
-
-            # aggregate again without status to get the totals by workflow
-            retries = df.groupby(["WF_ID", "WF_NAME", "WF_STATUS", "CREATED_DATE"]).agg(
-                {"TASKS": "sum", "RETRIES": "sum"}
-            )
-
-            # combine datasets
-            df = pd.concat([tasks, retries], axis=1)
-
-            # compute pcts and format
-            for col in _cli_order:
-                df[col + "_pct"] = (
-                    df[col].astype(float) / df["TASKS"].astype(float)
-                ) * 100
-                df[col + "_pct"] = df[[col + "_pct"]].round(1)
-                df[col] = (
-                    df[col].astype(int).astype(str)
-                    + " ("
-                    + df[col + "_pct"].astype(str)
-                    + "%)"
-                )
 
-            # final order
-            df = df[["TASKS"] + _cli_order + ["RETRIES"]]
-            df = df.reset_index()
-            df_json = df.to_json()
-        else:
-            df = pd.DataFrame(
-                {},
-                columns=[
-                    "WF_ID",
-                    "WF_NAME",
-                    "WF_STATUS",
-                    "CREATED_DATE",
-                    "TASKS",
-                    "PENDING",
-                    "RUNNING",
-                    "DONE",
-                    "FATAL",
-                    "RETRIES",
-                ],
-            ).to_json()
-            df_json = df
+        # column oriented json in the layout of DataFrame.to_json, which the cli reads
+        columns: Dict[str, Dict[str, Any]] = {
+            col: {}
+            for col in ["WF_ID", "WF_NAME", "WF_STATUS", "CREATED_DATE", "TASKS"]
+            + _cli_order
+            + ["RETRIES"]
+        }
+        for i, row in enumerate(rows):
+            index = str(i)
+            wf_id, name, label, created_date, num_tasks = row[:5]
+            columns["WF_ID"][index] = wf_id
+            columns["WF_NAME"][index] = name
+            columns["WF_STATUS"][index] = label
+            columns["CREATED_DATE"][index] = _epoch_milliseconds(created_date)
+            columns["TASKS"][index] = int(num_tasks)
+            for col, count in zip(_cli_order, row[5:-1]):
+                pct = round(int(count) / int(num_tasks) * 100, 1)
+                columns[col][index] = f"{int(count)} ({pct}%)"
+            columns["RETRIES"][index] = int(row[-1])
+        df_json = json.dumps(columns)
 
         return WorkflowStatusResponse(workflows=df_json)
 
@@ -0,0 +1,156 @@
+"""Per-worker read-through cache for lookup routes whose results rarely change.
+
+Clusters, queues, task template versions and workflow statuses are read by every
+client session and distributor but written almost never, and rows are not changed
+once written. Each server worker keeps the rendered responses of these lookups in
+a bounded LRU for a short TTL; entries only expire, as there are no writes to
+invalidate them on. Lookups that find nothing are not cached, so rows
+added later are seen at once. Lists that grow over time, such as the versions of a
+tool, are not cached because a new member must be seen at once by every worker.
+Responses carry an ETag and a ``Cache-Control`` max-age so clients can
+revalidate with ``If-None-Match`` and get an empty 304 back.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus as StatusCodes
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
+
+import structlog
+from fastapi import Request, Response
+from starlette.responses import JSONResponse
+
+from jobmon.core.configuration import JobmonConfig
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A rendered JSON response body and its ETag."""
+
+    body: bytes
+    etag: str
+    expires: float
+
+    @classmethod
+    def render(cls: Type[CachedResponse], content: Any, ttl: float) -> CachedResponse:
+        """Render content the way JSONResponse does and tag it with its hash."""
+        body = bytes(JSONResponse(content=content).body)
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        return cls(body=body, etag=etag, expires=time.monotonic() + ttl)
+
+
+class RouteCache:
+    """A thread safe TTL/LRU cache of rendered route responses.
+
+    Keys are tuples whose first element names the route; hits and misses are
+    counted per route name.
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 300) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: number of responses kept before the least recently used
+                one is evicted.
+            ttl: seconds a response is served before it is read again.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Tuple[Hashable, ...], CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are kept at all."""
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[CachedResponse]:
+        """Return the live response for key, or None and count a miss."""
+        route = str(key[0])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses[route] = self._misses.get(route, 0) + 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits[route] = self._hits.get(route, 0) + 1
+            return entry
+
+    def put(self, key: Tuple[Hashable, ...], content: Any) -> CachedResponse:
+        """Render content, keep it under key while the cache is enabled, return it."""
+        entry = CachedResponse.render(content, self.ttl)
+        if not self.enabled:
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop every response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits.clear()
+            self._misses.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of entries and the hits and misses of each route."""
+        with self._lock:
+            routes = sorted(set(self._hits) | set(self._misses))
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "routes": {
+                    route: {
+                        "hits": self._hits.get(route, 0),
+                        "misses": self._misses.get(route, 0),
+                    }
+                    for route in routes
+                },
+            }
+
+    def response(self, request: Request, entry: CachedResponse) -> Response:
+        """Build the response for entry, an empty 304 if the client already has it."""
+        headers = {
+            "ETag": entry.etag,
+            "Cache-Control": f"private, max-age={int(self.ttl)}",
+        }
+        if_none_match = request.headers.get("if-none-match", "")
+        if entry.etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=StatusCodes.NOT_MODIFIED, headers=headers)
+        return Response(
+            content=entry.body,
+            status_code=StatusCodes.OK,
+            media_type="application/json",
+            headers=headers,
+        )
+
+
+_route_cache: Optional[RouteCache] = None
+
+
+def get_route_cache() -> RouteCache:
+    """Get or create this worker's route cache from the route_cache config."""
+    global _route_cache
+    if _route_cache is None:
+        config = JobmonConfig.cached()
+        _route_cache = RouteCache(
+            max_entries=config.get_int("route_cache", "max_entries"),
+            ttl=config.get_float("route_cache", "ttl"),
+        )
+    return _route_cache
@@ -7,6 +7,7 @@ from typing_extensions import TypedDict
 
 from jobmon.core.configuration import JobmonConfig
 from jobmon.core.exceptions import ConfigError
+from jobmon.server.web.server_side_exception import InvalidUsage
 
 _CONFIG = JobmonConfig()
 
@@ -131,3 +132,19 @@ def get_user_or_anonymous(request: Request) -> User:
         return create_anonymous_user()
 
     return get_user(request)
+
+
+async def get_request_json(request: Request) -> Any:
+    """Parse the JSON request body as a FastAPI dependency.
+
+    Routes that use the database are plain ``def`` functions so that FastAPI runs them
+    in its threadpool and their blocking SQLAlchemy calls (and retry sleeps) never stall
+    the event loop. They can't ``await request.json()`` themselves, so the body is read
+    here, on the event loop, before the route runs.
+    """
+    try:
+        return await request.json()
+    except ValueError as e:
+        raise InvalidUsage(
+            f"{str(e)} in request to {request.url.path}", status_code=400
+        ) from e
@@ -1,12 +1,13 @@
 from importlib import import_module
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 from starlette.status import HTTP_200_OK
 
 from jobmon.server.web import routes
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
+from jobmon.server.web.route_cache import get_route_cache
 
 version = "v3"
 # Create a router for version 3 of the API
@@ -30,19 +31,19 @@ def is_alive() -> JSONResponse:
 
 
 @api_v3_router.get("/time")
-def get_pst_now(db: Session = Depends(get_db)) -> JSONResponse:
+def get_pst_now(db: Session = DB) -> JSONResponse:
     """Get the current time in the Pacific."""
     return routes.get_pst_now(db)
 
 
 @api_v3_health_router.get("/health")
-def health(db: Session = Depends(get_db)) -> JSONResponse:
+def health(db: Session = DB) -> JSONResponse:
     """Test connectivity to the app. Always unauthenticated for health checks."""
     return routes.health(db)
 
 
 @api_v3_router.get("/test_bad")
-def test_route(db: Session = Depends(get_db)) -> None:
+def test_route(db: Session = DB) -> None:
     """Test route."""
     return routes.test_route(db)
 
@@ -52,3 +53,9 @@ def test_route(db: Session = Depends(get_db)) -> None:
 def api_version() -> JSONResponse:
     """Test connectivity to the database."""
     return JSONResponse(content={"status": version})
+
+
+@api_v3_router.get("/route_cache/stats")
+def route_cache_stats() -> JSONResponse:
+    """Return this worker's lookup cache size and hits and misses per route."""
+    return JSONResponse(content=get_route_cache().stats())
@@ -1,9 +1,9 @@
 from typing import Any, Optional
 
-from fastapi import Depends, Query
+from fastapi import Query
 from sqlalchemy.orm import Session
 
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.repositories.array_repository import ArrayRepository
 from jobmon.server.web.routes.v3.cli import cli_router as api_v3_router
 
@@ -14,7 +14,7 @@ def get_array_task_instances(
     array_name: str,
     job_name: Optional[str] = Query(None),
     limit: Optional[int] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Return error/output filepaths for task instances filtered by array name.
 
@@ -1,7 +1,7 @@
 """Routes for Tasks."""
 
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Union
 
 import structlog
 from fastapi import Depends, Query, Request
@@ -10,11 +10,12 @@ from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from jobmon.core import constants
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.workflow import Workflow
 from jobmon.server.web.models.workflow_status import WorkflowStatus
 from jobmon.server.web.repositories.task_repository import TaskRepository
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.cli import cli_router as api_v3_router
 from jobmon.server.web.routes.v3.cli.workflow import _check_downstream_tasks_status
 from jobmon.server.web.schemas.task import (
@@ -37,7 +38,7 @@ logger = structlog.get_logger(__name__)
 def get_task_status(
     task_ids: Optional[Union[int, list[int]]] = Query(...),
     status: Optional[Union[str, list[str]]] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> TaskStatusResponse:
     """Get the status of a task."""
     logger.info(f"task_ids: {task_ids}, status_request: {status}")
@@ -49,14 +50,13 @@ def get_task_status(
 
 
 @api_v3_router.post("/task/subdag")
-async def get_task_subdag(
-    request: Request, db: Session = Depends(get_db)
+def get_task_subdag(
+    data: Dict = Depends(get_request_json), db: Session = DB
 ) -> TaskSubdagResponse:
     """Used to get the sub dag of a given task.
 
     It returns a list of sub tasks as well as a list of sub nodes.
     """
-    data = cast(Dict, await request.json())
     task_ids = data.get("task_ids", [])
     task_status = data.get("task_status", [])
 
@@ -188,7 +188,9 @@ def create_response(new_status: str) -> JSONResponse:
 
 
 @api_v3_router.put("/task/update_statuses")
-async def update_task_statuses(request: Request, db: Session = Depends(get_db)) -> Any:
+def update_task_statuses(
+    data: Dict = Depends(get_request_json), db: Session = DB
+) -> Any:
     """Update the status of the tasks.
 
     Description:
@@ -209,7 +211,6 @@ async def update_task_statuses(request: Request, db: Session = Depends(get_db))
         return response
 
     try:
-        data = cast(Dict, await request.json())
         workflow_id, recursive, task_ids, new_status = parse_request_data(data)
 
         if isinstance(task_ids, str):
@@ -241,9 +242,7 @@ async def update_task_statuses(request: Request, db: Session = Depends(get_db))
 
 
 @api_v3_router.get("/task_dependencies/{task_id}")
-def get_task_dependencies(
-    task_id: int, db: Session = Depends(get_db)
-) -> TaskDependenciesResponse:
+def get_task_dependencies(task_id: int, db: Session = DB) -> TaskDependenciesResponse:
     """Get task's downstream and upstream tasks and their status."""
     task_repo = TaskRepository(db)
     result = task_repo.get_task_dependencies(task_id)
@@ -252,8 +251,8 @@ def get_task_dependencies(
 
 
 @api_v3_router.put("/tasks_recursive/{direction}")
-async def get_tasks_recursive(
-    direction: str, request: Request, db: Session = Depends(get_db)
+def get_tasks_recursive(
+    direction: str, data: Any = Depends(get_request_json), db: Session = DB
 ) -> TasksRecursiveResponse:
     """Get all input task_ids'.
 
@@ -261,7 +260,6 @@ async def get_tasks_recursive(
     return all recursive(including input set) task_ids in the defined direction.
     """
     direct = constants.Direction.UP if direction == "up" else constants.Direction.DOWN
-    data = await request.json()
     # define task_ids as set in order to eliminate dups
     task_ids = set(data.get("task_ids", []))
 
@@ -276,7 +274,7 @@ async def get_tasks_recursive(
 
 @api_v3_router.get("/task_resource_usage")
 def get_task_resource_usage(
-    task_id: int, db: Session = Depends(get_db)
+    task_id: int, db: Session = DB
 ) -> TaskResourceUsageResponse:
     """Return the resource usage for a given Task ID."""
     task_repo = TaskRepository(db)
@@ -286,13 +284,14 @@ def get_task_resource_usage(
 
 
 @api_v3_router.post("/task/get_downstream_tasks")
-async def get_downstream_tasks(
-    request: Request, db: Session = Depends(get_db)
+def get_downstream_tasks(
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> DownstreamTasksResponse:
     """Get only the direct downstreams of a task."""
     # Get client version from query parameters
     client_version = request.query_params.get("client_jobmon_version")
-    data = cast(Dict, await request.json())
 
     task_ids = data["task_ids"]
     dag_id = data["dag_id"]
@@ -304,9 +303,7 @@ async def get_downstream_tasks(
 
 
 @api_v3_router.get("/task/get_ti_details_viz/{task_id}")
-def get_task_details(
-    task_id: int, db: Session = Depends(get_db)
-) -> TaskInstanceDetailsResponse:
+def get_task_details(task_id: int, db: Session = DB) -> TaskInstanceDetailsResponse:
     """Get information about TaskInstances associated with specific Task ID."""
     task_repo = TaskRepository(db)
     result = task_repo.get_task_instance_details(task_id)
@@ -315,9 +312,7 @@ def get_task_details(
 
 
 @api_v3_router.get("/task/get_task_details_viz/{task_id}")
-def get_task_details_viz(
-    task_id: int, db: Session = Depends(get_db)
-) -> TaskDetailsResponse:
+def get_task_details_viz(task_id: int, db: Session = DB) -> TaskDetailsResponse:
     """Get status of Task from Task ID."""
     task_repo = TaskRepository(db)
     result = task_repo.get_task_details_viz(task_id)
@@ -1,19 +1,20 @@
 """Routes for TaskTemplate."""
 
 from http import HTTPStatus as StatusCodes
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import structlog
 from fastapi import Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
-from jobmon.server.web.db import get_db, get_dialect
+from jobmon.server.web.db import DB, get_dialect
 from jobmon.server.web.repositories.task_template_repository import (
     TaskTemplateRepository,
 )
 from jobmon.server.web.routes.v3.cli import cli_router as api_v3_router
 from jobmon.server.web.schemas.task_template import (
+    TaskResourceDetailItem,
     TaskResourceVizItem,
     TaskTemplateResourceUsageRequest,
     TaskTemplateResourceUsageResponse,
@@ -27,7 +28,7 @@ logger = structlog.get_logger(__name__)
 def get_task_template_details_for_workflow(
     workflow_id: int = Query(..., ge=1),
     task_template_id: int = Query(..., ge=1),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Fetch Task Template details (ID, Name, and Version) for a given Workflow."""
     tt_repo = TaskTemplateRepository(db)
@@ -46,7 +47,7 @@ def get_task_template_details_for_workflow(
 def get_task_template_version_for_tasks(
     task_id: Optional[int] = None,
     workflow_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Get the task_template_version_ids using repository pattern."""
     tt_repo = TaskTemplateRepository(db)
@@ -64,7 +65,7 @@ def get_task_template_version_for_tasks(
 
 @api_v3_router.get("/get_requested_cores")
 def get_requested_cores(
-    task_template_version_ids: Optional[str] = None, db: Session = Depends(get_db)
+    task_template_version_ids: Optional[str] = None, db: Session = DB
 ) -> Any:
     """Get the min, max, and avg of requested cores."""
     if task_template_version_ids is None:
@@ -83,7 +84,7 @@ def get_requested_cores(
 
 @api_v3_router.get("/get_most_popular_queue")
 def get_most_popular_queue(
-    task_template_version_ids: Optional[str] = Query(...), db: Session = Depends(get_db)
+    task_template_version_ids: Optional[str] = Query(...), db: Session = DB
 ) -> Any:
     """Get the most popular queue of the task template."""
     if task_template_version_ids is None:
@@ -103,30 +104,45 @@ def get_most_popular_queue(
 @api_v3_router.post(
     "/task_template_resource_usage", response_model=TaskTemplateResourceUsageResponse
 )
-async def get_task_template_resource_usage(
-    request_data: TaskTemplateResourceUsageRequest, db: Session = Depends(get_db)
+def get_task_template_resource_usage(
+    request_data: TaskTemplateResourceUsageRequest, db: Session = DB
 ) -> TaskTemplateResourceUsageResponse:
     """Unified endpoint for task template resource usage.
 
     Returns modern Pydantic models suitable for both GUI frontend
-    and Python client consumption with full type safety.
+    and Python client consumption with full type safety. Statistics over all task
+    instances of the version are read from its resource usage summary unless
+    ``exact`` is set; filtered or visualized requests are always computed exactly.
     """
     repo = TaskTemplateRepository(db)
 
     try:
-        # Get task details using the repository
-        task_details = repo.get_task_resource_details(
-            task_template_version_id=request_data.task_template_version_id,
-            workflows=request_data.workflows,
-            node_args=request_data.node_args,
-        )
-
-        # Calculate statistics using repository method
-        stats = repo.calculate_resource_statistics(
-            task_details=task_details,
-            confidence_interval=request_data.ci,
-            task_template_version_id=request_data.task_template_version_id,
-        )
+        if not (
+            request_data.exact
+            or request_data.viz
+            or request_data.workflows
+            or request_data.node_args
+        ):
+            # Unfiltered statistics are served from the stored summary
+            task_details: List[TaskResourceDetailItem] = []
+            stats = repo.get_summarized_resource_statistics(
+                task_template_version_id=request_data.task_template_version_id,
+                confidence_interval=request_data.ci,
+            )
+        else:
+            # Get task details using the repository
+            task_details = repo.get_task_resource_details(
+                task_template_version_id=request_data.task_template_version_id,
+                workflows=request_data.workflows,
+                node_args=request_data.node_args,
+            )
+
+            # Calculate statistics using repository method
+            stats = repo.calculate_resource_statistics(
+                task_details=task_details,
+                confidence_interval=request_data.ci,
+                task_template_version_id=request_data.task_template_version_id,
+            )
 
         # Prepare viz data if requested
         viz_data = None
@@ -177,7 +193,7 @@ async def get_task_template_resource_usage(
 @api_v3_router.get("/workflow_tt_status_viz/{workflow_id}")
 def get_workflow_tt_status_viz(
     workflow_id: int,
-    db: Session = Depends(get_db),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Get the status of the workflows for GUI."""
@@ -204,7 +220,7 @@ def get_tt_error_log_viz(
     page_size: int = 10,
     just_recent_errors: str = "false",
     cluster_errors: str = "false",
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Get the error logs for a task template id for GUI."""
     recent_errors = just_recent_errors.lower() == "true"
@@ -4,15 +4,17 @@ from http import HTTPStatus as StatusCodes
 from typing import Any, List, Optional, Union
 
 import structlog
-from fastapi import Depends, Query, Request
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from fastapi import Depends, Query
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session, aliased
 from starlette.responses import JSONResponse
 
-from jobmon.server.web.db.deps import get_db
-from jobmon.server.web.models.edge import Edge
+from jobmon.server.web.db.deps import DB
+from jobmon.server.web.models.barrier_node import BarrierNode
+from jobmon.server.web.models.edge_adjacency import EdgeAdjacency
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.repositories.workflow_repository import WorkflowRepository
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.cli import cli_router as api_v3_router
 from jobmon.server.web.schemas.workflow import (
     TaskTableResponse,
@@ -30,11 +32,10 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/workflow_validation")
-async def get_workflow_validation_status(
-    request: Request, db: Session = Depends(get_db)
+def get_workflow_validation_status(
+    data: Any = Depends(get_request_json), db: Session = DB
 ) -> WorkflowValidationResponse:
     """Check if workflow is valid."""
-    data = await request.json()
     task_ids = data["task_ids"]
 
     workflow_repo = WorkflowRepository(db)
@@ -58,38 +59,54 @@ def _check_downstream_tasks_status(
     # Valid downstream task states
     valid_states = {"G", "I", "Q"}
 
-    # Get downstream node_ids for each task using the same pattern as get_downstream_tasks
-    tasks_and_edges = session.execute(
-        select(Task.id, Task.node_id, Edge.downstream_node_ids).where(
-            Task.id.in_(task_ids),
-            Task.node_id == Edge.node_id,
-            Edge.dag_id == dag_id,
+    # Look for a single direct downstream task outside the valid states
+    upstream_node_ids = select(Task.node_id).where(Task.id.in_(task_ids))
+    invalid_downstream = session.execute(
+        select(Task.id)
+        .join(
+            EdgeAdjacency,
+            and_(
+                EdgeAdjacency.dag_id == dag_id,
+                EdgeAdjacency.downstream_node_id == Task.node_id,
+            ),
         )
-    ).all()
-
-    # Collect all downstream node_ids
-    downstream_node_ids = set()
-    for row in tasks_and_edges:
-        if row.downstream_node_ids is not None:
-            downstreams = row.downstream_node_ids
-            if downstreams:
-                downstream_node_ids.update(downstreams)
-
-    if not downstream_node_ids:
-        return True  # No downstream tasks, consider valid
-
-    # Get task statuses for downstream nodes
-    downstream_status_rows = session.execute(
-        select(Task.status).where(
-            Task.workflow_id == workflow_id, Task.node_id.in_(list(downstream_node_ids))
+        .where(
+            EdgeAdjacency.upstream_node_id.in_(upstream_node_ids),
+            Task.workflow_id == workflow_id,
+            Task.status.not_in(valid_states),
         )
-    ).all()
-
-    for status_row in downstream_status_rows:
-        if status_row[0] not in valid_states:
-            return False  # Found a downstream task not in valid state
+        .limit(1)
+    ).first()
+    if invalid_downstream is not None:
+        return False
+
+    # and one downstream of a barrier the tasks are upstream of
+    upstream_member = aliased(BarrierNode)
+    downstream_member = aliased(BarrierNode)
+    barrier_ids = select(upstream_member.barrier_id).where(
+        upstream_member.dag_id == dag_id,
+        upstream_member.node_id.in_(upstream_node_ids),
+        upstream_member.is_upstream.is_(True),
+    )
+    invalid_downstream = session.execute(
+        select(Task.id)
+        .join(
+            downstream_member,
+            and_(
+                downstream_member.dag_id == dag_id,
+                downstream_member.node_id == Task.node_id,
+            ),
+        )
+        .where(
+            downstream_member.barrier_id.in_(barrier_ids),
+            downstream_member.is_upstream.is_(False),
+            Task.workflow_id == workflow_id,
+            Task.status.not_in(valid_states),
+        )
+        .limit(1)
+    ).first()
 
-    return True
+    return invalid_downstream is None
 
 
 @api_v3_router.get("/workflow/{workflow_id}/workflow_tasks")
@@ -97,7 +114,7 @@ def get_workflow_tasks(
     workflow_id: int,
     limit: int,
     status: Optional[List[str]] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> WorkflowTasksResponse:
     """Get the tasks for a given workflow."""
     workflow_repo = WorkflowRepository(db)
@@ -106,7 +123,7 @@ def get_workflow_tasks(
 
 @api_v3_router.get("/workflow/{workflow_id}/validate_username/{username}")
 def get_workflow_user_validation(
-    workflow_id: int, username: str, db: Session = Depends(get_db)
+    workflow_id: int, username: str, db: Session = DB
 ) -> WorkflowUserValidationResponse:
     """Return all usernames associated with a given workflow_id's workflow runs.
 
@@ -118,7 +135,7 @@ def get_workflow_user_validation(
 
 @api_v3_router.get("/workflow/{workflow_id}/validate_for_workflow_reset/{username}")
 def get_workflow_run_for_workflow_reset(
-    workflow_id: int, username: str, db: Session = Depends(get_db)
+    workflow_id: int, username: str, db: Session = DB
 ) -> WorkflowRunForResetResponse:
     """Last workflow_run_id associated with a given workflow_id started by the username.
 
@@ -132,11 +149,12 @@ def get_workflow_run_for_workflow_reset(
 
 
 @api_v3_router.put("/workflow/{workflow_id}/reset")
-async def reset_workflow(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def reset_workflow(
+    workflow_id: int,
+    data: Any = Depends(get_request_json),
+    db: Session = DB,
 ) -> JSONResponse:
     """Update the workflow's status, all its tasks' statuses to 'G'."""
-    data = await request.json()
     partial_reset = data.get("partial_reset", False)
 
     workflow_repo = WorkflowRepository(db)
@@ -150,7 +168,7 @@ def get_workflow_status(
     workflow_id: Optional[Union[int, str, List[Union[int, str]]]] = Query(None),
     limit: Optional[int] = Query(None),
     user: Optional[List[str]] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> WorkflowStatusResponse:
     """Get the status of the workflow."""
     workflow_repo = WorkflowRepository(db)
@@ -159,7 +177,7 @@ def get_workflow_status(
 
 @api_v3_router.get("/workflow_status_viz")
 def get_workflow_status_viz(
-    workflow_ids: List[int] = Query(None), db: Session = Depends(get_db)
+    workflow_ids: List[int] = Query(None), db: Session = DB
 ) -> Any:
     """Get the status of the workflows for GUI."""
     workflow_repo = WorkflowRepository(db)
@@ -187,7 +205,7 @@ def workflows_by_user_form(
     user_exclude: Optional[List[str]] = Query(None, alias="user!"),
     tool_exclude: Optional[List[str]] = Query(None, alias="tool!"),
     status_exclude: Optional[List[str]] = Query(None, alias="status!"),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> WorkflowOverviewResponse:
     """Fetch associated workflows and workflow runs by username."""
     workflow_repo = WorkflowRepository(db)
@@ -210,7 +228,7 @@ def workflows_by_user_form(
 
 @api_v3_router.get("/task_table_viz/{workflow_id}")
 def task_details_by_wf_id(
-    workflow_id: int, tt_name: str, db: Session = Depends(get_db)
+    workflow_id: int, tt_name: str, db: Session = DB
 ) -> TaskTableResponse:
     """Fetch Task details associated with Workflow ID and TaskTemplate name."""
     workflow_repo = WorkflowRepository(db)
@@ -219,7 +237,7 @@ def task_details_by_wf_id(
 
 @api_v3_router.get("/workflow_details_viz/{workflow_id}")
 def wf_details_by_wf_id(
-    workflow_id: int, db: Session = Depends(get_db)
+    workflow_id: int, db: Session = DB
 ) -> List[WorkflowDetailsItem]:
     """Fetch name, args, dates, tool for a Workflow provided WF ID."""
     workflow_repo = WorkflowRepository(db)
@@ -3,7 +3,7 @@
 from collections import defaultdict
 from http import HTTPStatus as StatusCodes
 from time import sleep
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional
 
 import structlog
 from fastapi import Depends, HTTPException, Request
@@ -16,23 +16,23 @@ from jobmon.core.constants import TaskInstanceStatus
 from jobmon.core.constants import TaskStatus as TaskStatusConstants
 from jobmon.core.logging import set_jobmon_context
 from jobmon.server.web._compat import add_time
-from jobmon.server.web.db.deps import get_db, get_dialect
+from jobmon.server.web.db.deps import DB, get_dialect
 from jobmon.server.web.models.array import Array
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.task_instance import TaskInstance
 from jobmon.server.web.models.task_status import TaskStatus
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 
 logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/array")
-async def add_array(request: Request, db: Session = Depends(get_db)) -> Any:
+def add_array(data: Dict = Depends(get_request_json), db: Session = DB) -> Any:
     """Return an array ID by workflow and task template version ID.
 
     If not found, bind the array.
     """
-    data = cast(Dict, await request.json())
     workflow_id = int(data["workflow_id"])
     task_template_version_id = int(data["task_template_version_id"])
 
@@ -83,11 +83,12 @@ async def add_array(request: Request, db: Session = Depends(get_db)) -> Any:
 
 
 @api_v3_router.post("/array/{array_id}/queue_task_batch")
-async def record_array_batch_num(
-    array_id: int, request: Request, db: Session = Depends(get_db)
+def record_array_batch_num(
+    array_id: int,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Record a batch number to associate sets of task instances with an array submission."""
-    data = cast(Dict, await request.json())
     array_id = int(array_id)
     task_ids = [int(task_id) for task_id in data["task_ids"]]
     task_resources_id = int(data["task_resources_id"])
@@ -246,13 +247,14 @@ async def record_array_batch_num(
 
 
 @api_v3_router.post("/array/{array_id}/transition_to_launched")
-async def transition_array_to_launched(
-    array_id: int, request: Request, db: Session = Depends(get_db)
+def transition_array_to_launched(
+    array_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Transition TIs associated with an array_id and batch_num to launched."""
     set_jobmon_context(array_id=array_id)
-
-    data = cast(Dict, await request.json())
     batch_num = data["batch_number"]
     next_report = data["next_report_increment"]
 
@@ -261,7 +263,54 @@ async def transition_array_to_launched(
         array_id=array_id,
         array_batch_num=batch_num,
     )
+    return _launch_array_batch(
+        db, get_dialect(request), array_id, batch_num, next_report
+    )
+
+
+@api_v3_router.post("/array/{array_id}/launch_batch")
+def launch_array_batch(
+    array_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
+    """Record distributor ids and transition a batch to launched in one transaction.
+
+    Combines ``transition_to_launched`` and ``log_distributor_id`` so the distributor
+    needs a single round trip per submitted batch.
+    """
+    set_jobmon_context(array_id=array_id)
+    batch_num = data["batch_number"]
+    next_report = data["next_report_increment"]
+    distributor_ids = {
+        int(task_instance_id): str(distributor_id)
+        for task_instance_id, distributor_id in data["distributor_ids"].items()
+    }
 
+    logger.info(
+        "Server received batch launch request",
+        array_id=array_id,
+        array_batch_num=batch_num,
+        num_distributor_ids=len(distributor_ids),
+    )
+    return _launch_array_batch(
+        db, get_dialect(request), array_id, batch_num, next_report, distributor_ids
+    )
+
+
+def _launch_array_batch(
+    db: Session,
+    dialect: str,
+    array_id: int,
+    batch_num: int,
+    next_report: float,
+    distributor_ids: Optional[Dict[int, str]] = None,
+) -> JSONResponse:
+    """Atomically move a batch's Tasks and TaskInstances to LAUNCHED.
+
+    If distributor_ids are given they are recorded in the same transaction.
+    """
     # Atomic update of both Task and TaskInstance with retry logic
     max_retries = 5
 
@@ -295,8 +344,31 @@ async def transition_array_to_launched(
             )
             db.execute(update_task_stmt)
 
-            # 2) Transition TaskInstances to LAUNCHED in the same transaction
-            dialect = get_dialect(request)
+            # 2) Record distributor ids whatever the TaskInstance status, like
+            # log_distributor_id does, so that a killed instance can still be found
+            if distributor_ids:
+                update_ids_stmt = (
+                    update(TaskInstance)
+                    .where(
+                        TaskInstance.id.in_(list(distributor_ids.keys())),
+                        TaskInstance.array_id == array_id,
+                    )
+                    .values(
+                        distributor_id=case(
+                            *[
+                                (TaskInstance.id == task_instance_id, distributor_id)
+                                for task_instance_id, distributor_id in (
+                                    distributor_ids.items()
+                                )
+                            ],
+                            else_=TaskInstance.distributor_id,
+                        )
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                db.execute(update_ids_stmt)
+
+            # 3) Transition TaskInstances to LAUNCHED in the same transaction
             update_ti_stmt = (
                 update(TaskInstance)
                 .where(
@@ -315,7 +387,7 @@ async def transition_array_to_launched(
             )
             db.execute(update_ti_stmt)
 
-            # 3) Atomic commit - both updates succeed or both fail
+            # 4) Atomic commit - all updates succeed or all fail
             db.commit()
 
             # Log each task instance (info level - state transition)
@@ -370,8 +442,10 @@ async def transition_array_to_launched(
 
 
 @api_v3_router.post("/array/{array_id}/transition_to_killed")
-async def transition_to_killed(
-    array_id: int, request: Request, db: Session = Depends(get_db)
+def transition_to_killed(
+    array_id: int,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Transition TIs from KILL_SELF to ERROR_FATAL.
 
@@ -380,8 +454,6 @@ async def transition_to_killed(
     TIs are cleaned up (no race condition with new workflow runs).
     """
     set_jobmon_context(array_id=array_id)
-
-    data = cast(Dict, await request.json())
     batch_num = data["batch_number"]
 
     logger.info(
@@ -509,12 +581,10 @@ async def transition_to_killed(
 
 
 @api_v3_router.post("/array/{array_id}/log_distributor_id")
-async def log_array_distributor_id(
-    array_id: int, request: Request, db: Session = Depends(get_db)
+def log_array_distributor_id(
+    array_id: int, data: Any = Depends(get_request_json), db: Session = DB
 ) -> Any:
     """Add distributor_id, stderr/stdout paths to the DB for all TIs in an array."""
-    data = await request.json()
-
     filtered_data = {
         task_instance_id: distributor_id
         for task_instance_id, distributor_id in data.items()
@@ -568,11 +638,11 @@ async def log_array_distributor_id(
 @api_v3_router.get(
     "/workflow/{workflow_id}/get_array_max_concurrently_running/{task_template_version_id}"
 )
-async def get_array_max_concurrently_running(
+def get_array_max_concurrently_running(
     array_id: int | None = None,
     workflow_id: int | None = None,
     task_template_version_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Return the maximum concurrency of this array."""
     set_jobmon_context(array_id=array_id)
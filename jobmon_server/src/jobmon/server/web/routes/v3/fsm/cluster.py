@@ -3,20 +3,27 @@
 from http import HTTPStatus as StatusCodes
 from typing import Any
 
-from fastapi import Depends
+from fastapi import Request
 from sqlalchemy import select
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.cluster import Cluster
 from jobmon.server.web.models.cluster_type import ClusterType
+from jobmon.server.web.route_cache import get_route_cache
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 
 
 @api_v3_router.get("/cluster/{cluster_name}")
-def get_cluster_by_name(cluster_name: str, db: Session = Depends(get_db)) -> Any:
+def get_cluster_by_name(cluster_name: str, request: Request, db: Session = DB) -> Any:
     """Get the id, cluster_type_name and connection_parameters of a Cluster."""
+    route_cache = get_route_cache()
+    cache_key = ("cluster", cluster_name)
+    cached = route_cache.get(cache_key)
+    if cached is not None:
+        return route_cache.response(request, cached)
+
     select_stmt = (
         select(Cluster, ClusterType.name)
         .join(ClusterType, Cluster.cluster_type_id == ClusterType.id)
@@ -26,7 +33,9 @@ def get_cluster_by_name(cluster_name: str, db: Session = Depends(get_db)) -> Any
 
     # send back json
     if result is None:
-        resp = JSONResponse(content={"cluster": None}, status_code=StatusCodes.OK)
+        resp: Response = JSONResponse(
+            content={"cluster": None}, status_code=StatusCodes.OK
+        )
     else:
         cluster, cluster_type_name = result
         cluster_list = [
@@ -35,7 +44,6 @@ def get_cluster_by_name(cluster_name: str, db: Session = Depends(get_db)) -> Any
             cluster_type_name,  # Access the cluster type name here
             cluster.connection_parameters,
         ]
-        resp = JSONResponse(
-            content={"cluster": cluster_list}, status_code=StatusCodes.OK
-        )
+        cached = route_cache.put(cache_key, {"cluster": cluster_list})
+        resp = route_cache.response(request, cached)
     return resp
@@ -1,7 +1,7 @@
 """Routes for DAGs."""
 
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, cast
+from typing import Any, Dict, List
 
 import sqlalchemy
 import structlog
@@ -12,25 +12,34 @@ from sqlalchemy.sql import func
 from starlette.responses import JSONResponse
 
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db import get_db, get_dialect
+from jobmon.server.web.db import DB, get_dialect
+from jobmon.server.web.models.barrier_node import BarrierNode
 from jobmon.server.web.models.dag import Dag
 from jobmon.server.web.models.edge import Edge
+from jobmon.server.web.models.edge_adjacency import EdgeAdjacency
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage, ServerError
+from jobmon.server.web.utils.json_compat import normalize_node_ids
 
 logger = structlog.get_logger(__name__)
 
+# Rows per multi-row insert into edge_adjacency and barrier_node, bounded by SQLite's
+# variable limit.
+_ADJACENCY_INSERT_BATCH_SIZE = 5000
+
 
 @api_v3_router.post("/dag")
-async def add_dag(request: Request, db: Session = Depends(get_db)) -> Any:
+def add_dag(
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
     """Add a new dag to the database.
 
     Args:
-        request: The request object.
+        data: The JSON request body.
         db: The database session.
     """
-    data = cast(Dict, await request.json())
-
     # add dag
     dag_hash = data.pop("dag_hash")
     set_jobmon_context(dag_hash=str(dag_hash))
@@ -59,18 +68,29 @@ async def add_dag(request: Request, db: Session = Depends(get_db)) -> Any:
     return resp
 
 
+def _insert_ignore(model: Any, rows: List[Dict], dialect: str) -> Any:
+    """Build a multi-row insert that skips rows whose keys already exist."""
+    insert_stmt = insert(model).values(rows)
+    if dialect == "mysql":
+        return insert_stmt.prefix_with("IGNORE")
+    elif dialect == "sqlite":
+        return insert_stmt.prefix_with("OR IGNORE")
+    else:
+        raise ServerError(f"Unsupported SQL dialect '{dialect}'")
+
+
 @api_v3_router.post("/dag/{dag_id}/edges")
-async def add_edges(
+def add_edges(
     dag_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Add edges to the edge table."""
     set_jobmon_context(dag_id=dag_id)
     logger.info(f"Add edges for dag {dag_id}")
     try:
-        data = cast(Dict, await request.json())
         edges_to_add = data.pop("edges_to_add")
         mark_created = bool(data.pop("mark_created"))
     except KeyError as e:
@@ -84,16 +104,30 @@ async def add_edges(
         edge["upstream_node_ids"] = edge["upstream_node_ids"] or None
         edge["downstream_node_ids"] = edge["downstream_node_ids"] or None
 
+    # one row per edge, normalized from the downstream lists
+    adjacency = [
+        {
+            "dag_id": dag_id,
+            "upstream_node_id": edge["node_id"],
+            "downstream_node_id": downstream_node_id,
+        }
+        for edge in edges_to_add
+        for downstream_node_id in set(
+            normalize_node_ids(edge["downstream_node_ids"]) or []
+        )
+    ]
+
     # Bulk insert the nodes and node args with raw SQL, for performance. Ignore duplicate
     # keys
-    insert_stmt = insert(Edge).values(edges_to_add)
-    if dialect == "mysql":
-        insert_stmt = insert_stmt.prefix_with("IGNORE")
-    elif dialect == "sqlite":
-        insert_stmt = insert_stmt.prefix_with("OR IGNORE")
-    else:
-        raise ServerError(f"Unsupported SQL dialect '{dialect}'")
-    db.execute(insert_stmt)
+    db.execute(_insert_ignore(Edge, edges_to_add, dialect))
+    for i in range(0, len(adjacency), _ADJACENCY_INSERT_BATCH_SIZE):
+        db.execute(
+            _insert_ignore(
+                EdgeAdjacency,
+                adjacency[i : i + _ADJACENCY_INSERT_BATCH_SIZE],
+                dialect,
+            )
+        )
 
     if mark_created:
         update_stmt = (
@@ -107,3 +141,74 @@ async def add_edges(
     # return result
     resp = JSONResponse(content={}, status_code=StatusCodes.OK)
     return resp
+
+
+@api_v3_router.post("/dag/{dag_id}/barriers")
+def add_barriers(
+    dag_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+    dialect: str = Depends(get_dialect),
+) -> Any:
+    """Add members to the barrier dependencies of a dag.
+
+    Each barrier makes all of its downstream nodes depend on all of its upstream
+    nodes. Members of one barrier may be split across requests.
+    """
+    set_jobmon_context(dag_id=dag_id)
+    logger.info(f"Add barriers for dag {dag_id}")
+    try:
+        barriers = data.pop("barriers")
+    except KeyError as e:
+        raise InvalidUsage(
+            f"{str(e)} in request to {request.url.path}", status_code=400
+        ) from e
+
+    members = [
+        {
+            "dag_id": dag_id,
+            "barrier_id": barrier["barrier_id"],
+            "node_id": node_id,
+            "is_upstream": is_upstream,
+        }
+        for barrier in barriers
+        for key, is_upstream in (
+            ("upstream_node_ids", True),
+            ("downstream_node_ids", False),
+        )
+        for node_id in barrier.get(key) or []
+    ]
+    for i in range(0, len(members), _ADJACENCY_INSERT_BATCH_SIZE):
+        db.execute(
+            _insert_ignore(
+                BarrierNode, members[i : i + _ADJACENCY_INSERT_BATCH_SIZE], dialect
+            )
+        )
+    db.commit()
+
+    resp = JSONResponse(content={}, status_code=StatusCodes.OK)
+    return resp
+
+
+@api_v3_router.get("/dag/{dag_id}/barriers")
+def get_barriers(dag_id: int, db: Session = DB) -> Any:
+    """Get the upstream and downstream node ids of every barrier of a dag."""
+    set_jobmon_context(dag_id=dag_id)
+    barriers: Dict[int, List[List[int]]] = {}
+    rows = db.execute(
+        select(BarrierNode.barrier_id, BarrierNode.node_id, BarrierNode.is_upstream)
+        .where(BarrierNode.dag_id == dag_id)
+        .order_by(BarrierNode.barrier_id, BarrierNode.node_id)
+    )
+    for barrier_id, node_id, is_upstream in rows:
+        upstream_node_ids, downstream_node_ids = barriers.setdefault(
+            barrier_id, [[], []]
+        )
+        if is_upstream:
+            upstream_node_ids.append(node_id)
+        else:
+            downstream_node_ids.append(node_id)
+
+    resp = JSONResponse(content={"barriers": barriers}, status_code=StatusCodes.OK)
+    return resp
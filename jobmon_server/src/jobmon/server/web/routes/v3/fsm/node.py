@@ -2,18 +2,19 @@
 
 from http import HTTPStatus as StatusCodes
 from time import sleep
-from typing import Any, Dict, cast
+from typing import Any, Dict
 
 import structlog
-from fastapi import Depends, Request
+from fastapi import Depends
 from sqlalchemy import insert, select
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
-from jobmon.server.web.db import get_db, get_dialect
+from jobmon.server.web.db import DB, get_dialect
 from jobmon.server.web.models.node import Node
 from jobmon.server.web.models.node_arg import NodeArg
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import ServerError
 
@@ -21,19 +22,18 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/nodes")
-async def add_nodes(
-    request: Request,
-    db: Session = Depends(get_db),
+def add_nodes(
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Add a chunk of nodes to the database.
 
     Args:
-        request: The request object.
+        data: The JSON request body.
         db: The database session.
         dialect: The database dialect (mysql, sqlite, etc.)
     """
-    data = cast(Dict, await request.json())
     # Extract node and node_args
 
     # Bulk insert the nodes and node args with raw SQL, for performance. Ignore duplicate
@@ -3,24 +3,31 @@
 from http import HTTPStatus as StatusCodes
 from typing import Any
 
-from fastapi import Depends
+from fastapi import Request
 from sqlalchemy import select
 from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.queue import Queue
+from jobmon.server.web.route_cache import get_route_cache
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 
 
 @api_v3_router.get("/cluster/{cluster_id}/queue/{queue_name}")
 def get_queue_by_cluster_queue_names(
-    cluster_id: int, queue_name: str, db: Session = Depends(get_db)
+    cluster_id: int, queue_name: str, request: Request, db: Session = DB
 ) -> Any:
     """Get the id, name, cluster_name and parameters of a Queue.
 
     Based on cluster_name and queue_name.
     """
+    route_cache = get_route_cache()
+    cache_key = ("queue", cluster_id, queue_name)
+    cached = route_cache.get(cache_key)
+    if cached is not None:
+        return route_cache.response(request, cached)
+
     select_stmt = select(Queue).where(
         Queue.cluster_id == cluster_id, Queue.name == queue_name
     )
@@ -28,11 +35,12 @@ def get_queue_by_cluster_queue_names(
 
     # send back json
     if queue is None:
-        resp = JSONResponse(content={"queue": None}, status_code=StatusCodes.OK)
+        resp: Response = JSONResponse(
+            content={"queue": None}, status_code=StatusCodes.OK
+        )
     else:
-        resp = JSONResponse(
-            content={"queue": queue.to_wire_as_requested_by_client()},
-            status_code=StatusCodes.OK,
+        cached = route_cache.put(
+            cache_key, {"queue": queue.to_wire_as_requested_by_client()}
         )
-    resp.status_code = StatusCodes.OK
+        resp = route_cache.response(request, cached)
     return resp
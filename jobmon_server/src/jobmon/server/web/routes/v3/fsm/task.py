@@ -2,10 +2,10 @@
 
 import json
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, List, Set, Union, cast
+from typing import Any, Dict, List, Set, Union
 
 import structlog
-from fastapi import Depends, Request
+from fastapi import Depends
 from sqlalchemy import desc, insert, select, tuple_, update
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.mysql.dml import Insert as MySQLInsert
@@ -18,7 +18,7 @@ from starlette.responses import JSONResponse
 
 from jobmon.core import constants
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db import get_db, get_dialect
+from jobmon.server.web.db import DB, get_dialect
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.task_arg import TaskArg
 from jobmon.server.web.models.task_attribute import TaskAttribute
@@ -28,6 +28,7 @@ from jobmon.server.web.models.task_instance_error_log import TaskInstanceErrorLo
 from jobmon.server.web.models.task_resources import TaskResources
 from jobmon.server.web.models.task_status import TaskStatus
 from jobmon.server.web.models.workflow import Workflow
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage, ServerError
 
@@ -35,9 +36,10 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.put("/task/bind_tasks_no_args")
-async def bind_tasks_no_args(request: Request, db: Session = Depends(get_db)) -> Any:
+def bind_tasks_no_args(
+    all_data: Dict = Depends(get_request_json), db: Session = DB
+) -> Any:
     """Bind the task objects to the database."""
-    all_data = cast(Dict, await request.json())
     tasks = all_data["tasks"]
     workflow_id = int(all_data["workflow_id"])
     mark_created = bool(all_data["mark_created"])
@@ -161,13 +163,12 @@ async def bind_tasks_no_args(request: Request, db: Session = Depends(get_db)) ->
 
 
 @api_v3_router.put("/task/bind_task_args")
-async def bind_task_args(
-    request: Request,
-    db: Session = Depends(get_db),
+def bind_task_args(
+    all_data: Dict = Depends(get_request_json),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Add task args and associated task ids to the database."""
-    all_data = cast(Dict, await request.json())
     task_args = all_data["task_args"]
     if any(task_args):
         # Insert task args using INSERT IGNORE to handle conflicts
@@ -204,13 +205,12 @@ async def bind_task_args(
 
 
 @api_v3_router.put("/task/bind_task_attributes")
-async def bind_task_attributes(
-    request: Request,
-    db: Session = Depends(get_db),
+def bind_task_attributes(
+    all_data: Dict = Depends(get_request_json),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Add task attributes and associated attribute types to the database."""
-    all_data = cast(Dict, await request.json())
     attributes = all_data["task_attributes"]
 
     # Map attribute names to attribute_type_ids, insert if necessary
@@ -219,7 +219,9 @@ async def bind_task_attributes(
         all_attribute_names |= set(attribute.keys())
 
     if any(all_attribute_names):
-        attribute_type_ids = _add_or_get_attribute_types(all_attribute_names, db)
+        attribute_type_ids = _add_or_get_attribute_types(
+            all_attribute_names, db, dialect
+        )
         # Build our insert values. On conflicts, update the existing value
         insert_values = []
         for task_id, attribute_dict in attributes.items():
@@ -276,7 +278,7 @@ async def bind_task_attributes(
 
 
 def _add_or_get_attribute_types(
-    names: Union[List[str], Set[str]], db: Session
+    names: Union[List[str], Set[str]], db: Session, dialect: str
 ) -> Dict[str, int]:
     # Query for existing attribute types, to avoid integrity conflicts
     query = select(TaskAttributeType).where(TaskAttributeType.name.in_(names))
@@ -286,29 +288,60 @@ def _add_or_get_attribute_types(
     # Identify new attribute types to insert
     new_names = set(names) - set(existing_attr_map.keys())  # type: ignore
     if new_names:
+        too_long = sorted(name for name in new_names if len(name) > 255)
+        if too_long:
+            raise InvalidUsage(
+                "Attribute type names are constrained to 255 characters, you may have "
+                f"values that are too long. Could not add: {too_long}",
+                status_code=400,
+            )
         insert_values = [{"name": name} for name in new_names]
+        # Concurrent chunks of the same workflow may insert some of the same names,
+        # so skip the names that already exist rather than failing on them
+        if dialect == "mysql":
+            insert_stmt = (
+                insert(TaskAttributeType).values(insert_values).prefix_with("IGNORE")
+            )
+        elif dialect == "sqlite":
+            insert_stmt = (
+                sqlite_insert(TaskAttributeType)
+                .values(insert_values)
+                .on_conflict_do_nothing()
+            )
+        else:
+            raise ServerError(
+                f"invalid sql dialect. Only (mysql, sqlite) are supported. Got {dialect}"
+            )
         try:
-            insert_stmt = insert(TaskAttributeType).values(insert_values)
             db.execute(insert_stmt)
-        except (DataError, IntegrityError) as e:
+        except DataError as e:
             raise InvalidUsage(
                 "Attribute type names are constrained to 255 characters, you may have "
                 f"values that are too long. Message: {str(e)}",
                 status_code=400,
             ) from e
         # Fetch the newly inserted attribute types to get their IDs
-        query = select(TaskAttributeType).where(TaskAttributeType.name.in_(names))
+        query = (
+            select(TaskAttributeType)
+            .where(TaskAttributeType.name.in_(names))
+            .with_for_update(read=True)
+        )
         existing_attr_types = db.execute(query).scalars().all()
+        missing_names = set(names).difference(at.name for at in existing_attr_types)
+        if missing_names:
+            raise ServerError(
+                f"Attribute types were not added: {sorted(missing_names)}"
+            )
 
     # Map type names to IDs for return
     return {type_obj.name: type_obj.id for type_obj in existing_attr_types}  # type: ignore
 
 
 @api_v3_router.post("/task/bind_resources")
-async def bind_task_resources(request: Request, db: Session = Depends(get_db)) -> Any:
+def bind_task_resources(
+    data: Dict = Depends(get_request_json), db: Session = DB
+) -> Any:
     """Add the task resources for a given task."""
-    data = cast(Dict, await request.json())
-
     tr_id = data.get("task_resources_type_id", None)
     req_resc = json.dumps(data.get("requested_resources", None))
     new_resources = TaskResources(
@@ -323,7 +356,7 @@ async def bind_task_resources(request: Request, db: Session = Depends(get_db)) -
 
 
 @api_v3_router.get("/task/{task_id}/most_recent_ti_error")
-def get_most_recent_ti_error(task_id: int, db: Session = Depends(get_db)) -> Any:
+def get_most_recent_ti_error(task_id: int, db: Session = DB) -> Any:
     """Route to determine the cause of the most recent task_instance's error.
 
     Args:
@@ -364,14 +397,15 @@ def get_most_recent_ti_error(task_id: int, db: Session = Depends(get_db)) -> Any
 
 
 @api_v3_router.post("/task/{workflow_id}/set_resume_state")
-async def set_task_resume_state(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def set_task_resume_state(
+    workflow_id: int,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """An endpoint to set all tasks to a resumable state for a workflow.
 
     Conditioned on the workflow already being in an appropriate resume state.
     """
-    data = cast(Dict, await request.json())
     reset_if_running = bool(data["reset_if_running"])
 
     # Ensure that the workflow is resumable
@@ -3,7 +3,7 @@
 from collections import defaultdict
 from http import HTTPStatus as StatusCodes
 from time import sleep
-from typing import Any, DefaultDict, Dict, Optional, cast
+from typing import Any, DefaultDict, Dict, Optional
 
 import structlog
 from fastapi import Depends, HTTPException, Request
@@ -17,13 +17,14 @@ from jobmon.core import constants
 from jobmon.core.logging import set_jobmon_context
 from jobmon.core.serializers import SerializeTaskInstanceBatch
 from jobmon.server.web._compat import add_time
-from jobmon.server.web.db.deps import get_db, get_dialect
+from jobmon.server.web.db.deps import DB, get_dialect
 from jobmon.server.web.models.array import Array
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.task_instance import TaskInstance
 from jobmon.server.web.models.task_instance_error_log import TaskInstanceErrorLog
 from jobmon.server.web.models.task_instance_status import TaskInstanceStatus
 from jobmon.server.web.models.task_status import TaskStatus
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import ServerError
 
@@ -269,12 +270,14 @@ def transit_ti_and_t(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_running")
-async def log_running(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_running(
+    task_instance_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance as running."""
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
 
     logger.info(
         "Server received log_running request",
@@ -403,8 +406,11 @@ async def log_running(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_report_by")
-async def log_ti_report_by(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_ti_report_by(
+    task_instance_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance as being responsive with a new report_by_date.
 
@@ -416,10 +422,10 @@ async def log_ti_report_by(
     Args:
         task_instance_id: id of the task_instance to log
         request: fastapi request object
+        data: The JSON request body.
         db: The database session.
     """
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
 
     logger.debug(
         "Server received heartbeat",
@@ -496,8 +502,10 @@ async def log_ti_report_by(
 
 
 @api_v3_router.post("/task_instance/log_report_by/batch")
-async def log_ti_report_by_batch(
-    request: Request, db: Session = Depends(get_db)
+def log_ti_report_by_batch(
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log task_instances as being responsive with a new report_by_date.
 
@@ -509,9 +517,9 @@ async def log_ti_report_by_batch(
     Args:
         task_instance_id: id of the task_instance to log
         request: fastapi request object
+        data: The JSON request body.
         db: The database session.
     """
-    data = cast(Dict, await request.json())
     tis = data.get("task_instance_ids", None)
 
     next_report_increment = float(data["next_report_increment"])
@@ -571,12 +579,13 @@ async def log_ti_report_by_batch(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_done")
-async def log_done(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_done(
+    task_instance_id: int,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance as done."""
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
 
     logger.info(
         "Server received log_done request",
@@ -637,12 +646,13 @@ async def log_done(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_error_worker_node")
-async def log_error_worker_node(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_error_worker_node(
+    task_instance_id: int,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log an error for a task instance."""
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
 
     try:
         # do not lock TaskInstance
@@ -713,9 +723,7 @@ async def log_error_worker_node(
 
 
 @api_v3_router.get("/task_instance/{task_instance_id}/task_instance_error_log")
-async def get_task_instance_error_log(
-    task_instance_id: int, db: Session = Depends(get_db)
-) -> Any:
+def get_task_instance_error_log(task_instance_id: int, db: Session = DB) -> Any:
     """Route to return all task_instance_error_log entries of the task_instance_id.
 
     Args:
@@ -743,7 +751,7 @@ async def get_task_instance_error_log(
 
 @api_v3_router.get("/get_array_task_instance_id/{array_id}/{batch_num}/{step_id}")
 def get_array_task_instance_id(
-    array_id: int, batch_num: int, step_id: int, db: Session = Depends(get_db)
+    array_id: int, batch_num: int, step_id: int, db: Session = DB
 ) -> Any:
     """Given an array ID and an index, select a single task instance ID.
 
@@ -766,15 +774,17 @@ def get_array_task_instance_id(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_no_distributor_id")
-async def log_no_distributor_id(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_no_distributor_id(
+    task_instance_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance_id that did not get an distributor_id upon submission."""
     set_jobmon_context(task_instance_id=task_instance_id)
     logger.info(
         f"Logging ti {task_instance_id} did not get distributor id upon submission"
     )
-    data = cast(Dict, await request.json())
     logger.debug(f"Log NO DISTRIBUTOR ID. Data {data['no_id_err_msg']}")
     err_msg = data["no_id_err_msg"]
 
@@ -828,12 +838,14 @@ async def log_no_distributor_id(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_distributor_id")
-async def log_distributor_id(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_distributor_id(
+    task_instance_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance's distributor id."""
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
 
     select_stmt = select(TaskInstance).where(TaskInstance.id == task_instance_id)
     task_instance = db.execute(select_stmt).scalars().one()
@@ -926,18 +938,21 @@ async def log_distributor_id(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_known_error")
-async def log_known_error(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_known_error(
+    task_instance_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance as errored.
 
     Args:
         task_instance_id (int): id for task instance.
         request (Request): fastapi request object.
+        data (Dict): the JSON request body.
         db: The database session.
     """
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
     error_state = data["error_state"]
     error_message = data["error_message"]
     distributor_id = data.get("distributor_id", None)
@@ -987,18 +1002,21 @@ async def log_known_error(
 
 
 @api_v3_router.post("/task_instance/{task_instance_id}/log_unknown_error")
-async def log_unknown_error(
-    task_instance_id: int, request: Request, db: Session = Depends(get_db)
+def log_unknown_error(
+    task_instance_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a task_instance as errored.
 
     Args:
         task_instance_id (int): id for task instance
         request (Request): fastapi request object
+        data (Dict): the JSON request body.
         db: The database session.
     """
     set_jobmon_context(task_instance_id=task_instance_id)
-    data = cast(Dict, await request.json())
     error_state = data["error_state"]
     error_message = data["error_message"]
     distributor_id = data.get("distributor_id", None)
@@ -1057,11 +1075,11 @@ async def log_unknown_error(
 
 
 @api_v3_router.post("/task_instance/instantiate_task_instances")
-async def instantiate_task_instances(
-    request: Request, db: Session = Depends(get_db)
+def instantiate_task_instances(
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Sync status of given task intance IDs."""
-    data = cast(Dict, await request.json())
     task_instance_ids_list = tuple([int(tid) for tid in data["task_instance_ids"]])
 
     logger.info(
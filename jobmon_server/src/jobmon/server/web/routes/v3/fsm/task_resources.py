@@ -5,13 +5,12 @@ from http import HTTPStatus as StatusCodes
 from typing import Any
 
 import structlog
-from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.queue import Queue
 from jobmon.server.web.models.task_resources import TaskResources
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
@@ -20,7 +19,7 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/task_resources/{task_resources_id}")
-def get_task_resources(task_resources_id: int, db: Session = Depends(get_db)) -> Any:
+def get_task_resources(task_resources_id: int, db: Session = DB) -> Any:
     """Return an task_resources."""
     set_jobmon_context(task_resources_id=task_resources_id)
 
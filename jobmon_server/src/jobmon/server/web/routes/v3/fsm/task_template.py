@@ -1,7 +1,7 @@
 """Routes for TaskTemplates."""
 
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, cast
+from typing import Any, Dict
 
 import structlog
 from fastapi import Depends, Request
@@ -12,11 +12,13 @@ from starlette.responses import JSONResponse
 
 from jobmon.core import constants
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.arg import Arg
 from jobmon.server.web.models.task_template import TaskTemplate
 from jobmon.server.web.models.task_template_version import TaskTemplateVersion
 from jobmon.server.web.models.template_arg_map import TemplateArgMap
+from jobmon.server.web.route_cache import get_route_cache
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage
 
@@ -24,10 +26,13 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/task_template")
-async def get_task_template(request: Request, db: Session = Depends(get_db)) -> Any:
+def get_task_template(
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
     """Add a task template for a given tool to the database."""
     # check input variable
-    data = cast(Dict, await request.json())
     try:
         tool_version_id = int(data["tool_version_id"])
         name = data["task_template_name"]
@@ -61,9 +66,7 @@ async def get_task_template(request: Request, db: Session = Depends(get_db)) ->
 
 
 @api_v3_router.get("/task_template/{task_template_id}/versions")
-def get_task_template_versions(
-    task_template_id: int, db: Session = Depends(get_db)
-) -> Any:
+def get_task_template_versions(task_template_id: int, db: Session = DB) -> Any:
     """Get the task_template_version."""
     # get task template version object
     set_jobmon_context(task_template_id=task_template_id)
@@ -82,10 +85,11 @@ def get_task_template_versions(
 
 
 @api_v3_router.post("/task_template/{task_template_id}/add_version")
-async def add_task_template_version(
+def add_task_template_version(
     task_template_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Add a task_template_version safely using injected DB session."""
     set_jobmon_context(task_template_id=task_template_id)
@@ -114,7 +118,6 @@ async def add_task_template_version(
 
     # Parse and validate request
     try:
-        data = cast(Dict, await request.json())
         node_args = data["node_args"]
         task_args = data["task_args"]
         op_args = data["op_args"]
@@ -193,18 +196,23 @@ async def add_task_template_version(
 @api_v3_router.get("/task_template/id/{task_template_version_id}")
 def get_task_template_id_for_task_template_version(
     task_template_version_id: int,
-    db: Session = Depends(get_db),
-) -> int:
+    request: Request,
+    db: Session = DB,
+) -> Any:
     """Get the task_template_id for a given task_template_version_id."""
     set_jobmon_context(task_template_version_id=task_template_version_id)
     logger.info(
         f"Getting task template id for task template version: {task_template_version_id}"
     )
 
-    select_stmt = select(TaskTemplateVersion).where(
-        TaskTemplateVersion.id == task_template_version_id
-    )
-    ttv = db.execute(select_stmt).scalars().one()
-    ttid = ttv.task_template_id
-
-    return int(ttid)  # type: ignore
+    # a task template version never moves to another task template
+    route_cache = get_route_cache()
+    cache_key = ("task_template_id", task_template_version_id)
+    cached = route_cache.get(cache_key)
+    if cached is None:
+        select_stmt = select(TaskTemplateVersion).where(
+            TaskTemplateVersion.id == task_template_version_id
+        )
+        ttv = db.execute(select_stmt).scalars().one()
+        cached = route_cache.put(cache_key, int(ttv.task_template_id))
+    return route_cache.response(request, cached)
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Optional
 
 import sqlalchemy
 import structlog
@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.node_arg import NodeArg
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.task_instance import TaskInstance
@@ -20,6 +20,7 @@ from jobmon.server.web.models.task_resources import TaskResources
 from jobmon.server.web.models.tool import Tool
 from jobmon.server.web.models.tool_version import ToolVersion
 from jobmon.server.web.models.workflow import Workflow
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage
 
@@ -27,9 +28,12 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/tool")
-async def add_tool(request: Request, db: Session = Depends(get_db)) -> Any:
+def add_tool(
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
     """Add a tool to the database."""
-    data = cast(Dict, await request.json())
     try:
         tool_name = data["name"]
     except Exception as e:
@@ -56,9 +60,7 @@ async def add_tool(request: Request, db: Session = Depends(get_db)) -> Any:
 
 
 @api_v3_router.get("/tool/{tool_id}/tool_versions")
-def get_tool_versions(
-    tool_id: int, request: Request, db: Session = Depends(get_db)
-) -> Any:
+def get_tool_versions(tool_id: int, request: Request, db: Session = DB) -> Any:
     """Get the Tool Version."""
     # check input variable
     set_jobmon_context(tool_id=tool_id)
@@ -88,7 +90,7 @@ def get_tool_resource_usage(
     tool_name: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Gets resource usage and node args for all TaskInstances associated with a given tool.
 
@@ -1,7 +1,7 @@
 """Routes for Tool Versions."""
 
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, cast
+from typing import Any, Dict
 
 import sqlalchemy
 import structlog
@@ -11,9 +11,10 @@ from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
 
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.task_template import TaskTemplate
 from jobmon.server.web.models.tool_version import ToolVersion
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage
 
@@ -21,10 +22,13 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/tool_version")
-async def add_tool_version(request: Request, db: Session = Depends(get_db)) -> Any:
+def add_tool_version(
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
     """Add a new version for a Tool."""
     # check input variable
-    data = cast(Dict, await request.json())
 
     try:
         tool_id = int(data["tool_id"])
@@ -52,7 +56,7 @@ async def add_tool_version(request: Request, db: Session = Depends(get_db)) -> A
 
 
 @api_v3_router.get("/tool_version/{tool_version_id}/task_templates")
-def get_task_templates(tool_version_id: int, db: Session = Depends(get_db)) -> Any:
+def get_task_templates(tool_version_id: int, db: Session = DB) -> Any:
     """Get the Tool Version."""
     # check input variable
     set_jobmon_context(tool_version_id=tool_version_id)
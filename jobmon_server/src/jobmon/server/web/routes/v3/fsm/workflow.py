@@ -5,24 +5,27 @@ import json
 from collections import defaultdict
 from http import HTTPStatus as StatusCodes
 from math import ceil
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import sqlalchemy
 import structlog
-from fastapi import Depends, HTTPException, Request
+from fastapi import Depends, HTTPException, Query, Request
 from sqlalchemy import func, insert, select, update
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError, NoResultFound
-from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
+from sqlalchemy.orm import Session, aliased
+from starlette.responses import JSONResponse, StreamingResponse
 
 from jobmon.core.configuration import JobmonConfig
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db import get_db, get_dialect
+from jobmon.server.web.db import DB, get_dialect
 from jobmon.server.web.models.array import Array
+from jobmon.server.web.models.barrier_node import BarrierNode
+from jobmon.server.web.models.cluster import Cluster
 from jobmon.server.web.models.dag import Dag
 from jobmon.server.web.models.edge import Edge
+from jobmon.server.web.models.edge_adjacency import EdgeAdjacency
 from jobmon.server.web.models.node import Node
 from jobmon.server.web.models.queue import Queue
 from jobmon.server.web.models.task import Task
@@ -38,10 +41,10 @@ from jobmon.server.web.models.workflow_attribute_type import WorkflowAttributeTy
 from jobmon.server.web.models.workflow_run import WorkflowRun
 from jobmon.server.web.models.workflow_run_status import WorkflowRunStatus
 from jobmon.server.web.models.workflow_status import WorkflowStatus
-from jobmon.server.web.routes.utils import get_request_username
+from jobmon.server.web.route_cache import get_route_cache
+from jobmon.server.web.routes.utils import get_request_json, get_request_username
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage, ServerError
-from jobmon.server.web.utils.json_compat import normalize_node_ids
 
 logger = structlog.get_logger(__name__)
 
@@ -67,14 +70,14 @@ def _add_workflow_attributes(
 
 
 @api_v3_router.post("/workflow")
-async def bind_workflow(
+def bind_workflow(
     request: Request,
-    db: Session = Depends(get_db),
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Bind a workflow to the database."""
     try:
-        data = cast(Dict, await request.json())
         tv_id = int(data["tool_version_id"])
         dag_id = int(data["dag_id"])
         whash = str(data["workflow_args_hash"])
@@ -152,8 +155,8 @@ async def bind_workflow(
 
 
 @api_v3_router.get("/workflow/{workflow_args_hash}")
-async def get_matching_workflows_by_workflow_args(
-    workflow_args_hash: str, request: Request, db: Session = Depends(get_db)
+def get_matching_workflows_by_workflow_args(
+    workflow_args_hash: str, request: Request, db: Session = DB
 ) -> Any:
     """Return any dag hashes that are assigned to workflows with identical workflow args."""
     try:
@@ -243,10 +246,11 @@ def _upsert_wf_attribute(
 
 
 @api_v3_router.put("/workflow/{workflow_id}/workflow_attributes")
-async def update_workflow_attribute(
+def update_workflow_attribute(
     workflow_id: int,
     request: Request,
-    db: Session = Depends(get_db),
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
     dialect: str = Depends(get_dialect),
 ) -> Any:
     """Update the attributes for a given workflow."""
@@ -258,7 +262,6 @@ async def update_workflow_attribute(
             f"{str(e)} in request to {request.url.path}", status_code=400
         ) from e
     """ Add/update attributes for a workflow """
-    data = cast(Dict, await request.json())
 
     logger.debug("Update attributes")
     attributes = data["workflow_attributes"]
@@ -270,13 +273,15 @@ async def update_workflow_attribute(
 
 
 @api_v3_router.post("/workflow/{workflow_id}/set_resume")
-async def set_resume(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def set_resume(
+    workflow_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Set resume on a workflow."""
     set_jobmon_context(workflow_id=workflow_id)
     try:
-        data = cast(Dict, await request.json())
 
         # Check if auth is enabled via config
         config = JobmonConfig()
@@ -317,7 +322,7 @@ async def set_resume(
 
 
 @api_v3_router.get("/workflow/{workflow_id}/is_resumable")
-def workflow_is_resumable(workflow_id: int, db: Session = Depends(get_db)) -> Any:
+def workflow_is_resumable(workflow_id: int, db: Session = DB) -> Any:
     """Check if a workflow is in a resumable state.
 
     Returns:
@@ -365,7 +370,7 @@ def workflow_is_resumable(workflow_id: int, db: Session = Depends(get_db)) -> An
 
 
 @api_v3_router.post("/workflow/{workflow_id}/force_cleanup_kill_self")
-def force_cleanup_kill_self(workflow_id: int, db: Session = Depends(get_db)) -> Any:
+def force_cleanup_kill_self(workflow_id: int, db: Session = DB) -> Any:
     """Force cleanup of stuck KILL_SELF task instances and finalize workflow run.
 
     Use this when jobs have been externally terminated (e.g., scancel, node failure)
@@ -472,8 +477,8 @@ def force_cleanup_kill_self(workflow_id: int, db: Session = Depends(get_db)) ->
 
 
 @api_v3_router.get("/workflow/{workflow_id}/get_max_concurrently_running")
-async def get_max_concurrently_running(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def get_max_concurrently_running(
+    workflow_id: int, request: Request, db: Session = DB
 ) -> Any:
     """Return the maximum concurrency of this workflow."""
     set_jobmon_context(workflow_id=workflow_id)
@@ -493,12 +498,51 @@ async def get_max_concurrently_running(
     return resp
 
 
+@api_v3_router.get("/workflow/{workflow_id}/concurrency_limits")
+def get_concurrency_limits(workflow_id: int, db: Session = DB) -> Any:
+    """Return the maximum concurrency of this workflow and of each of its arrays.
+
+    Lets the swarm refresh every limit with one request per sync instead of one per
+    array.
+    """
+    set_jobmon_context(workflow_id=workflow_id)
+    select_stmt = (
+        select(
+            Workflow.max_concurrently_running,
+            Array.id,
+            Array.max_concurrently_running,
+        )
+        .outerjoin(Array, Array.workflow_id == Workflow.id)
+        .where(Workflow.id == workflow_id)
+    )
+    rows = db.execute(select_stmt).all()
+
+    if not rows:
+        return JSONResponse(
+            content={"error": f"Workflow with ID {workflow_id} not found in database."},
+            status_code=StatusCodes.NOT_FOUND,
+        )
+
+    resp = JSONResponse(
+        content={
+            "max_concurrently_running": rows[0][0],
+            "array_limits": {
+                array_id: limit for _, array_id, limit in rows if array_id is not None
+            },
+        },
+        status_code=StatusCodes.OK,
+    )
+    return resp
+
+
 @api_v3_router.put("/workflow/{workflow_id}/update_max_concurrently_running")
-async def update_max_running(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def update_max_running(
+    workflow_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Update the number of tasks that can be running concurrently for a given workflow."""
-    data = cast(Dict, await request.json())
     set_jobmon_context(workflow_id=workflow_id)
     logger.debug("Update workflow max concurrently running")
 
@@ -554,18 +598,19 @@ async def update_max_running(
 
 
 @api_v3_router.post("/workflow/{workflow_id}/task_status_updates")
-async def task_status_updates(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def task_status_updates(
+    workflow_id: int,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Returns all tasks in the database that have the specified status.
 
     Args:
         workflow_id (int): the ID of the workflow.
-        request (Request): the request object.
+        data (Dict): the JSON request body.
         db (Session): the database session.
     """
     set_jobmon_context(workflow_id=workflow_id)
-    data = cast(Dict, await request.json())
     logger.info(f"Get tasks by status for workflow {workflow_id}")
 
     try:
@@ -596,7 +641,7 @@ async def task_status_updates(
 
 
 @api_v3_router.get("/workflow/{workflow_id}/fetch_workflow_metadata")
-def fetch_workflow_metadata(workflow_id: int, db: Session = Depends(get_db)) -> Any:
+def fetch_workflow_metadata(workflow_id: int, db: Session = DB) -> Any:
     """Get metadata associated with specified Workflow ID."""
     # Query for a workflow object
     wf = db.execute(select(Workflow).where(Workflow.id == workflow_id)).scalar()
@@ -613,7 +658,7 @@ def fetch_workflow_metadata(workflow_id: int, db: Session = Depends(get_db)) ->
 
 @api_v3_router.get("/workflow/get_tasks/{workflow_id}")
 def get_tasks_from_workflow(
-    workflow_id: int, max_task_id: int, chunk_size: int, db: Session = Depends(get_db)
+    workflow_id: int, max_task_id: int, chunk_size: int, db: Session = DB
 ) -> Any:
     """Return tasks associated with specified Workflow ID."""
     if max_task_id == 0:
@@ -689,20 +734,116 @@ def get_tasks_from_workflow(
     return resp
 
 
+def _parse_stored_literal(value: Optional[str], cache: Dict[str, Any]) -> Any:
+    """Parse a value stored as JSON or as a Python literal string.
+
+    Tasks of a workflow mostly share their scales, fallback queues and resources, so
+    each distinct string is parsed once per page.
+    """
+    if value is None:
+        return None
+    if value not in cache:
+        try:
+            cache[value] = json.loads(value)
+        except ValueError:
+            cache[value] = ast.literal_eval(value)
+    return cache[value]
+
+
+@api_v3_router.get("/workflow/{workflow_id}/resume_tasks")
+def get_resume_tasks(
+    workflow_id: int,
+    after_task_id: int = 0,
+    # each page is loaded into memory before it is streamed, so keep it bounded
+    page_size: int = Query(100_000, ge=1, le=100_000),
+    db: Session = DB,
+) -> Any:
+    """Stream the unfinished tasks of a workflow as newline delimited JSON.
+
+    Tasks are ordered by id and at most page_size are returned after after_task_id,
+    so a client pages through a workflow by passing the last task id it received.
+    Each line is an object with typed resources and the task's cluster, queue and
+    array concurrency already joined in.
+    """
+    if after_task_id == 0:
+        # Performance suffers heavily if we do a search with WHERE task.id > 0
+        min_task_id = db.execute(
+            select(func.min(Task.id)).where(Task.workflow_id == workflow_id)
+        ).scalar()
+        after_task_id = min_task_id - 1 if min_task_id else 0
+
+    query = (
+        select(
+            Task.id,
+            Task.array_id,
+            Task.status,
+            Task.max_attempts,
+            Task.resource_scales,
+            Task.fallback_queues,
+            TaskResources.requested_resources,
+            Cluster.name,
+            Queue.name,
+            Array.max_concurrently_running,
+        )
+        .join_from(Task, Array, Task.array_id == Array.id)
+        .join_from(Task, TaskResources, Task.task_resources_id == TaskResources.id)
+        .outerjoin(Queue, TaskResources.queue_id == Queue.id)
+        .outerjoin(Cluster, Queue.cluster_id == Cluster.id)
+        .where(
+            Task.workflow_id == workflow_id,
+            # only the unfinished part of the DAG is needed, see get_tasks_from_workflow
+            Task.status != TaskStatus.DONE,
+            Task.id > after_task_id,
+        )
+        .order_by(Task.id)
+        .limit(page_size)
+    )
+    rows = db.execute(query).all()
+
+    def generate_lines() -> Iterator[str]:
+        cache: Dict[str, Any] = {}
+        for start in range(0, len(rows), 1000):
+            lines = []
+            for row in rows[start : start + 1000]:
+                task = {
+                    "task_id": row[0],
+                    "array_id": row[1],
+                    "status": row[2],
+                    "max_attempts": row[3],
+                    "resource_scales": _parse_stored_literal(row[4], cache),
+                    "fallback_queues": _parse_stored_literal(row[5], cache),
+                    "requested_resources": _parse_stored_literal(row[6], cache),
+                    "cluster_name": row[7],
+                    "queue_name": row[8],
+                    "array_concurrency": row[9],
+                }
+                lines.append(json.dumps(task) + "\n")
+            yield "".join(lines)
+
+    return StreamingResponse(
+        generate_lines(),
+        status_code=StatusCodes.OK,
+        media_type="application/x-ndjson",
+    )
+
+
 @api_v3_router.get("/workflow_status/available_status")
-def get_available_workflow_statuses(db: Session = Depends(get_db)) -> Any:
+def get_available_workflow_statuses(request: Request, db: Session = DB) -> Any:
     """Return all available workflow statuses."""
-    # an easy testing route to verify db is loaded
-    select_stmt = select(WorkflowStatus.label).distinct()
-    res = db.execute(select_stmt).scalars().all()
-
-    resp = JSONResponse(content={"available_statuses": res}, status_code=StatusCodes.OK)
-    return resp
+    route_cache = get_route_cache()
+    cache_key = ("available_statuses",)
+    cached = route_cache.get(cache_key)
+    if cached is None:
+        # an easy testing route to verify db is loaded
+        select_stmt = select(WorkflowStatus.label).distinct()
+        res = db.execute(select_stmt).scalars().all()
+        cached = route_cache.put(cache_key, {"available_statuses": list(res)})
+    return route_cache.response(request, cached)
 
 
 @api_v3_router.post("/workflow/{workflow_id}/increase_resources")
-async def increase_resources_for_resource_error_tasks(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def increase_resources_for_resource_error_tasks(
+    workflow_id: int, request: Request, db: Session = DB
 ) -> Any:
     """Increase resources for tasks in E or F whose latest TaskInstance is Z.
 
@@ -812,11 +953,13 @@ async def increase_resources_for_resource_error_tasks(
 
 
 @api_v3_router.put("/workflow/{workflow_id}/update_array_max_concurrently_running")
-async def update_array_max_running(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def update_array_max_running(
+    workflow_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Update the number of tasks that can be running concurrently for a given Array."""
-    data = cast(Dict, await request.json())
     set_jobmon_context(workflow_id=workflow_id)
     logger.debug("Update array max concurrently running")
 
@@ -873,55 +1016,67 @@ async def update_array_max_running(
 
 
 @api_v3_router.get("/workflow/{workflow_id}/task_template_dag")
-async def task_template_dag(workflow_id: str, db: Session = Depends(get_db)) -> Any:
+def task_template_dag(workflow_id: str, db: Session = DB) -> Any:
     """Compute the shape of a Workflow's DAG by TaskTemplate."""
     dag_query = db.query(Workflow.dag_id).filter(Workflow.id == workflow_id)
 
     dag_id = dag_query.scalar()
 
-    query = (
-        db.query(
-            Edge.node_id,
-            Edge.downstream_node_ids,
-            TaskTemplate.name,
-        )
-        .join(Node, Edge.node_id == Node.id)
+    # every task template in the DAG, whether or not it has downstreams
+    names_query = (
+        select(TaskTemplate.name)
+        .distinct()
+        .join_from(Edge, Node, Edge.node_id == Node.id)
         .join(
             TaskTemplateVersion,
             Node.task_template_version_id == TaskTemplateVersion.id,
         )
+        .join(TaskTemplate, TaskTemplateVersion.task_template_id == TaskTemplate.id)
+        .where(Edge.dag_id == dag_id)
+    )
+    tt_dag_dict: dict[str, set[str]] = {
+        name: set() for name in db.execute(names_query).scalars()
+    }
+
+    # task template to task template edges
+    up_node, down_node = aliased(Node), aliased(Node)
+    up_ttv, down_ttv = aliased(TaskTemplateVersion), aliased(TaskTemplateVersion)
+    up_tt, down_tt = aliased(TaskTemplate), aliased(TaskTemplate)
+    edges_query = (
+        select(up_tt.name, down_tt.name)
+        .distinct()
+        .join_from(EdgeAdjacency, up_node, EdgeAdjacency.upstream_node_id == up_node.id)
+        .join(up_ttv, up_node.task_template_version_id == up_ttv.id)
+        .join(up_tt, up_ttv.task_template_id == up_tt.id)
+        .join(down_node, EdgeAdjacency.downstream_node_id == down_node.id)
+        .join(down_ttv, down_node.task_template_version_id == down_ttv.id)
+        .join(down_tt, down_ttv.task_template_id == down_tt.id)
+        .where(EdgeAdjacency.dag_id == dag_id)
+    )
+    for upstream_name, downstream_name in db.execute(edges_query):
+        tt_dag_dict.setdefault(upstream_name, set()).add(downstream_name)
+
+    # barriers connect every task template among their upstreams to every one among
+    # their downstreams
+    barrier_names: dict[tuple[int, bool], set[str]] = defaultdict(set)
+    barrier_query = (
+        select(BarrierNode.barrier_id, BarrierNode.is_upstream, TaskTemplate.name)
+        .distinct()
+        .join_from(BarrierNode, Node, BarrierNode.node_id == Node.id)
         .join(
-            TaskTemplate,
-            TaskTemplateVersion.task_template_id == TaskTemplate.id,
+            TaskTemplateVersion,
+            Node.task_template_version_id == TaskTemplateVersion.id,
         )
-        .filter(Edge.dag_id == dag_id)
+        .join(TaskTemplate, TaskTemplateVersion.task_template_id == TaskTemplate.id)
+        .where(BarrierNode.dag_id == dag_id)
     )
-
-    rows = db.execute(query).fetchall()
-
-    node_to_name = {row.node_id: row.name for row in rows}
-    tt_dag_dict: dict[str, set[str]] = {}
-
-    for row in rows:
-        task_name = row.name
-
-        if task_name not in tt_dag_dict:
-            tt_dag_dict[task_name] = set()
-
-        if row.downstream_node_ids:
-            try:
-                downstream_ids = normalize_node_ids(row.downstream_node_ids)
-                if downstream_ids:
-                    # Add downstream task names
-                    for downstream_id in downstream_ids:
-                        downstream_name = node_to_name.get(downstream_id)
-                        if downstream_name:
-                            tt_dag_dict[task_name].add(downstream_name)
-            except ValueError as e:
-                # Handle malformed downstream_node_ids
-                logger.warning(
-                    f"Malformed downstream_node_ids for node "
-                    f"{row.node_id}: {row.downstream_node_ids}, error: {e}"
+    for barrier_id, is_upstream, name in db.execute(barrier_query):
+        barrier_names[(barrier_id, bool(is_upstream))].add(name)
+    for (barrier_id, is_upstream), upstream_names in barrier_names.items():
+        if is_upstream:
+            for upstream_name in upstream_names:
+                tt_dag_dict.setdefault(upstream_name, set()).update(
+                    barrier_names.get((barrier_id, False), ())
                 )
 
     tt_dag: list[dict[str, str | None]] = []
@@ -935,9 +1090,7 @@ async def task_template_dag(workflow_id: str, db: Session = Depends(get_db)) ->
             tt_dag.append({"name": name, "downstream_task_template_id": None})
 
     # Clean up intermediate data structures
-    del node_to_name
     del tt_dag_dict
-    del rows
 
     resp_content = {"tt_dag": tt_dag}
     resp = JSONResponse(
@@ -2,7 +2,7 @@
 
 from collections import defaultdict
 from http import HTTPStatus as StatusCodes
-from typing import Any, Dict, List, cast
+from typing import Any, Dict, List
 
 import structlog
 from fastapi import Depends, Request
@@ -15,11 +15,12 @@ from jobmon.core.exceptions import InvalidStateTransition
 from jobmon.core.logging import set_jobmon_context
 from jobmon.server.web._compat import subtract_time
 from jobmon.server.web.config import get_jobmon_config
-from jobmon.server.web.db.deps import get_db, get_dialect
+from jobmon.server.web.db.deps import DB, get_dialect
 from jobmon.server.web.models.task_instance import TaskInstance
 from jobmon.server.web.models.task_instance_error_log import TaskInstanceErrorLog
 from jobmon.server.web.models.workflow import Workflow
 from jobmon.server.web.models.workflow_run import WorkflowRun
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.fsm import fsm_router as api_v3_router
 from jobmon.server.web.server_side_exception import InvalidUsage
 
@@ -27,10 +28,13 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.post("/workflow_run")
-async def add_workflow_run(request: Request, db: Session = Depends(get_db)) -> Any:
+def add_workflow_run(
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
     """Add a workflow run to the db."""
     try:
-        data = cast(Dict, await request.json())
         workflow_id = int(data["workflow_id"])
         user = data["user"]
         jobmon_version = data["jobmon_version"]
@@ -103,8 +107,8 @@ async def add_workflow_run(request: Request, db: Session = Depends(get_db)) -> A
 
 
 @api_v3_router.put("/workflow_run/{workflow_run_id}/terminate_task_instances")
-async def terminate_workflow_run(
-    workflow_run_id: int, request: Request, db: Session = Depends(get_db)
+def terminate_workflow_run(
+    workflow_run_id: int, request: Request, db: Session = DB
 ) -> Any:
     """Terminate task instances for a workflow run being resumed.
 
@@ -226,14 +230,16 @@ async def terminate_workflow_run(
 
 
 @api_v3_router.post("/workflow_run/{workflow_run_id}/log_heartbeat")
-async def log_workflow_run_heartbeat(
-    workflow_run_id: int, request: Request, db: Session = Depends(get_db)
+def log_workflow_run_heartbeat(
+    workflow_run_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Log a heartbeat for the workflow run to show that the client side is still alive."""
     set_jobmon_context(workflow_run_id=workflow_run_id)
     try:
         workflow_run_id = int(workflow_run_id)
-        data = cast(Dict, await request.json())
         next_report_increment = data["next_report_increment"]
         status = data["status"]
     except Exception as e:
@@ -260,14 +266,16 @@ async def log_workflow_run_heartbeat(
 
 
 @api_v3_router.put("/workflow_run/{workflow_run_id}/update_status")
-async def log_workflow_run_status_update(
-    workflow_run_id: int, request: Request, db: Session = Depends(get_db)
+def log_workflow_run_status_update(
+    workflow_run_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Update the status of the workflow run."""
     set_jobmon_context(workflow_run_id=workflow_run_id)
     try:
         workflow_run_id = int(workflow_run_id)
-        data = cast(Dict, await request.json())
         status = data["status"]
     except Exception as e:
         raise InvalidUsage(
@@ -292,14 +300,16 @@ async def log_workflow_run_status_update(
 
 
 @api_v3_router.post("/workflow_run/{workflow_run_id}/sync_status")
-async def task_instances_status_check(
-    workflow_run_id: int, request: Request, db: Session = Depends(get_db)
+def task_instances_status_check(
+    workflow_run_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Sync status of given task intance IDs."""
     set_jobmon_context(workflow_run_id=workflow_run_id)
     try:
         workflow_run_id = int(workflow_run_id)
-        data = cast(Dict, await request.json())
         task_instance_ids = data["task_instance_ids"]
         status = data["status"]
         logger.info(
@@ -350,9 +360,58 @@ async def task_instances_status_check(
     return resp
 
 
+@api_v3_router.post("/workflow_run/{workflow_run_id}/task_instance_status_updates")
+def task_instance_status_updates(
+    workflow_run_id: int,
+    request: Request,
+    data: Dict = Depends(get_request_json),
+    db: Session = DB,
+) -> Any:
+    """Return task instances whose status changed since the last sync.
+
+    Unlike ``sync_status`` the caller doesn't send the ids it already knows about.
+    Every task instance of the workflow run with a ``status_date`` at or after
+    ``last_sync`` is returned, grouped by status. The returned ``time`` is the
+    watermark to send on the next call. Without ``last_sync`` every task instance
+    of the workflow run is returned.
+    """
+    set_jobmon_context(workflow_run_id=workflow_run_id)
+    try:
+        workflow_run_id = int(workflow_run_id)
+        last_sync = data.get("last_sync")
+    except Exception as e:
+        raise InvalidUsage(
+            f"{str(e)} in request to {request.url.path}", status_code=400
+        ) from e
+
+    # get time from db before querying so that no change can fall between syncs
+    db_time = db.execute(select(func.now())).scalar()
+    str_time = db_time.strftime("%Y-%m-%d %H:%M:%S") if db_time else None
+
+    where_clause = [TaskInstance.workflow_run_id == workflow_run_id]
+    if last_sync is not None:
+        where_clause.append(TaskInstance.status_date >= last_sync)
+
+    return_dict: Dict[str, List[int]] = defaultdict(list)
+    select_stmt = select(TaskInstance.status, TaskInstance.id).where(*where_clause)
+    for row in db.execute(select_stmt):
+        return_dict[row[0]].append(int(row[1]))
+
+    logger.debug(
+        "Task instance status updates",
+        last_sync=last_sync,
+        num_updates=sum(len(ids) for ids in return_dict.values()),
+    )
+    resp = JSONResponse(
+        content={"status_updates": dict(return_dict), "time": str_time},
+        status_code=StatusCodes.OK,
+    )
+    return resp
+
+
 @api_v3_router.post("/workflow_run/{workflow_run_id}/set_status_for_triaging")
-async def set_status_for_triaging(
-    workflow_run_id: int, request: Request, db: Session = Depends(get_db)
+def set_status_for_triaging(
+    workflow_run_id: int, request: Request, db: Session = DB
 ) -> Any:
     """Two triaging related status sets with improved deadlock prevention.
 
@@ -4,7 +4,7 @@ from http import HTTPStatus as StatusCodes
 from typing import Any, Union
 
 import structlog
-from fastapi import Depends, Query, Request
+from fastapi import Depends, Query
 from sqlalchemy import case, func, insert, select, text, update
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse
@@ -12,7 +12,7 @@ from starlette.responses import JSONResponse
 from jobmon.core import constants
 from jobmon.core.exceptions import InvalidStateTransition
 from jobmon.core.logging import set_jobmon_context
-from jobmon.server.web.db.deps import get_db
+from jobmon.server.web.db.deps import DB
 from jobmon.server.web.models.task import Task
 from jobmon.server.web.models.task_instance import TaskInstance
 from jobmon.server.web.models.task_instance_error_log import TaskInstanceErrorLog
@@ -20,6 +20,7 @@ from jobmon.server.web.models.workflow import Workflow
 from jobmon.server.web.models.workflow_run import WorkflowRun
 from jobmon.server.web.models.workflow_run_status import WorkflowRunStatus
 from jobmon.server.web.models.workflow_status import WorkflowStatus
+from jobmon.server.web.routes.utils import get_request_json
 from jobmon.server.web.routes.v3.reaper import reaper_router as api_v3_router
 
 # new structlog logger per flask request context. internally stored as flask.g.logger
@@ -27,15 +28,16 @@ logger = structlog.get_logger(__name__)
 
 
 @api_v3_router.put("/workflow/{workflow_id}/fix_status_inconsistency")
-async def fix_wf_inconsistency(
-    workflow_id: int, request: Request, db: Session = Depends(get_db)
+def fix_wf_inconsistency(
+    workflow_id: int,
+    data: Any = Depends(get_request_json),
+    db: Session = DB,
 ) -> Any:
     """Find wf in F with all tasks in D and fix them.
 
     For flexibility, pass in the step size. It is easier to redeploy the reaper than the
     service.
     """
-    data = await request.json()
     increase_step = data["increase_step"]
     logger.debug(
         f"Fix inconsistencies starting at workflow {workflow_id} by {increase_step}"
@@ -97,7 +99,7 @@ async def fix_wf_inconsistency(
 
 
 @api_v3_router.get("/workflow/{workflow_id}/workflow_name_and_args")
-def get_wf_name_and_args(workflow_id: int, db: Session = Depends(get_db)) -> Any:
+def get_wf_name_and_args(workflow_id: int, db: Session = DB) -> Any:
     """Return workflow name and args associated with specified workflow ID."""
     query_filter = [Workflow.id == workflow_id]
     sql = select(Workflow.name, Workflow.workflow_args).where(*query_filter)
@@ -120,7 +122,7 @@ def get_wf_name_and_args(workflow_id: int, db: Session = Depends(get_db)) -> Any
 def get_lost_workflow_runs(
     status: Union[str, list[str]] = Query(...),
     version: str = Query(...),
-    db: Session = Depends(get_db),
+    db: Session = DB,
 ) -> Any:
     """Return all workflow runs that are currently in the specified state."""
     if isinstance(status, str):
@@ -140,7 +142,7 @@ def get_lost_workflow_runs(
 
 
 @api_v3_router.put("/workflow_run/{workflow_run_id}/reap")
-def reap_workflow_run(workflow_run_id: int, db: Session = Depends(get_db)) -> Any:
+def reap_workflow_run(workflow_run_id: int, db: Session = DB) -> Any:
     """If the last task was more than 2 minutes ago, transition wfr to A state.
 
     Also check WorkflowRun status_date to avoid possible race condition where reaper
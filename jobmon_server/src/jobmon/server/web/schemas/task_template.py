@@ -10,6 +10,8 @@ class TaskTemplateResourceUsageRequest(BaseModel):
     node_args: Optional[Dict[str, List[str]]] = None
     ci: Optional[str] = None
     viz: bool = False
+    # compute from every task instance instead of the stored summary
+    exact: bool = False
 
 
 class RequestedResourcesModel(BaseModel):  # Optional: For parsing the JSON string
@@ -0,0 +1,149 @@
+"""A mergeable quantile sketch for resource usage summaries."""
+
+import json
+import math
+from typing import Dict, List, Optional, Type
+
+import numpy as np
+
+
+class QuantileSketch:
+    """Quantiles of a stream of values in bounded space.
+
+    Values are kept exactly until there are more than ``exact_limit`` of them, so
+    small samples give the same quantiles as numpy. Past that the sketch keeps
+    counts of logarithmically sized buckets, as in DDSketch: any quantile it
+    returns is within ``relative_accuracy`` of a value of that rank, and the number
+    of buckets grows with the log of the value range rather than the sample size.
+    Two sketches with the same parameters merge into the sketch of both samples.
+    """
+
+    def __init__(
+        self, relative_accuracy: float = 0.01, exact_limit: int = 1000
+    ) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: relative error of quantiles once values are bucketed.
+            exact_limit: number of values kept exactly before bucketing.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        # raw values, until the sketch is bucketed
+        self.values: Optional[List[float]] = []
+        # bucket index -> count, for positive values and for absolute negative values
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero_count = 0
+
+    def add(self, value: float) -> None:
+        """Add one value to the sketch."""
+        self.count += 1
+        if self.values is not None:
+            self.values.append(value)
+            if len(self.values) > self.exact_limit:
+                self._to_buckets()
+        else:
+            self._add_to_bucket(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add every value of another sketch to this one."""
+        if self.values is not None and other.values is not None:
+            self.count += other.count
+            self.values.extend(other.values)
+            if len(self.values) > self.exact_limit:
+                self._to_buckets()
+            return
+        if self.values is not None:
+            self._to_buckets()
+        self.count += other.count
+        if other.values is not None:
+            for value in other.values:
+                self._add_to_bucket(value)
+        else:
+            for index, count in other.positive.items():
+                self.positive[index] = self.positive.get(index, 0) + count
+            for index, count in other.negative.items():
+                self.negative[index] = self.negative.get(index, 0) + count
+            self.zero_count += other.zero_count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the q-th quantile of the values, None if there are none."""
+        if self.count == 0:
+            return None
+        if self.values is not None:
+            return float(np.quantile(self.values, q))
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._bucket_value(index)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._bucket_value(index)
+        return self._bucket_value(max(self.positive))
+
+    def to_json(self) -> str:
+        """Serialize the sketch for storage."""
+        if self.values is not None:
+            return json.dumps({"values": self.values})
+        return json.dumps(
+            {
+                "positive": self.positive,
+                "negative": self.negative,
+                "zero_count": self.zero_count,
+            }
+        )
+
+    @classmethod
+    def from_json(
+        cls: Type["QuantileSketch"],
+        stored: Optional[str],
+        relative_accuracy: float = 0.01,
+        exact_limit: int = 1000,
+    ) -> "QuantileSketch":
+        """Load a sketch written by :meth:`to_json`; an empty sketch for None."""
+        sketch = cls(relative_accuracy, exact_limit)
+        if not stored:
+            return sketch
+        data = json.loads(stored)
+        if "values" in data:
+            sketch.values = data["values"]
+            sketch.count = len(data["values"])
+        else:
+            sketch.values = None
+            sketch.positive = {int(k): v for k, v in data["positive"].items()}
+            sketch.negative = {int(k): v for k, v in data["negative"].items()}
+            sketch.zero_count = data["zero_count"]
+            sketch.count = (
+                sum(sketch.positive.values())
+                + sum(sketch.negative.values())
+                + sketch.zero_count
+            )
+        return sketch
+
+    def _to_buckets(self) -> None:
+        values, self.values = self.values or [], None
+        for value in values:
+            self._add_to_bucket(value)
+
+    def _add_to_bucket(self, value: float) -> None:
+        if value == 0:
+            self.zero_count += 1
+            return
+        buckets = self.positive if value > 0 else self.negative
+        index = math.ceil(math.log(abs(value)) / self._log_gamma)
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def _bucket_value(self, index: int) -> float:
+        # the value within relative_accuracy of every value in the bucket
+        return 2 * self._gamma**index / (self._gamma + 1)
@@ -788,6 +788,62 @@ def test_node_dependencies(client_env):
     assert up_ids == set([t1.task_id])
 
 
+def test_task_template_dag(client_env):
+    tool = Tool(name="task_template_dag")
+    random_name = "".join(random.choice(string.ascii_letters) for _ in range(10))
+
+    wf = tool.create_workflow(name="task_template_dag_workflow")
+    tt1, tt2, tt3 = (
+        tool.get_task_template(
+            template_name=f"{random_name}_{i}",
+            command_template=f"echo {i} {{arg}}",
+            node_args=["arg"],
+        )
+        for i in range(1, 4)
+    )
+    compute_resources = {"queue": "null.q", "num_cores": 1}
+    t1 = tt1.create_task(
+        arg=1, cluster_name="sequential", compute_resources=compute_resources
+    )
+    t2 = tt2.create_task(
+        arg=2,
+        cluster_name="sequential",
+        compute_resources=compute_resources,
+        upstream_tasks=[t1],
+    )
+    t3 = tt3.create_task(
+        arg=3,
+        cluster_name="sequential",
+        compute_resources=compute_resources,
+        upstream_tasks=[t1, t2],
+    )
+    t4 = tt3.create_task(
+        arg=4,
+        cluster_name="sequential",
+        compute_resources=compute_resources,
+        upstream_tasks=[t2],
+    )
+    wf.add_tasks([t1, t2, t3, t4])
+    wf.bind()
+    wf._bind_tasks()
+
+    return_code, msg = wf.requester.send_request(
+        app_route=f"/workflow/{wf.workflow_id}/task_template_dag",
+        message={},
+        request_type="get",
+    )
+    assert return_code == 200
+    tt_dag = {
+        (edge["name"], edge["downstream_task_template_id"]) for edge in msg["tt_dag"]
+    }
+    assert tt_dag == {
+        (tt1.template_name, tt2.template_name),
+        (tt1.template_name, tt3.template_name),
+        (tt2.template_name, tt3.template_name),
+        (tt3.template_name, None),
+    }
+
+
 def test_get_workflow_status_viz(tool):
     t = tool
     wfids = []
@@ -517,6 +517,8 @@ def test_max_mem(db_engine, client_env):
             SET maxpss = null, maxrss=null
             WHERE task_id = {task_1.task_id}"""
         session.execute(text(query_1))
+        # usage is rewritten after the task instance was summarized
+        session.execute(text("DELETE FROM resource_usage_summary"))
         session.commit()
     resources = template.resource_usage()
     assert resources["max_mem"] is None
@@ -528,6 +530,8 @@ def test_max_mem(db_engine, client_env):
                 SET maxrss=null
                 WHERE task_id = {task_1.task_id}"""
         session.execute(text(query_1))
+        # usage is rewritten after the task instance was summarized
+        session.execute(text("DELETE FROM resource_usage_summary"))
         session.commit()
     resources = template.resource_usage()
     assert resources["max_mem"] is None
@@ -538,6 +542,8 @@ def test_max_mem(db_engine, client_env):
                 SET maxrss=1
                 WHERE task_id = {task_1.task_id}"""
         session.execute(text(query_1))
+        # usage is rewritten after the task instance was summarized
+        session.execute(text("DELETE FROM resource_usage_summary"))
         session.commit()
     resources = template.resource_usage()
     assert resources["max_mem"] == "1B"
@@ -548,6 +554,8 @@ def test_max_mem(db_engine, client_env):
                 SET maxrss= -1
                 WHERE task_id = {task_1.task_id}"""
         session.execute(text(query_1))
+        # usage is rewritten after the task instance was summarized
+        session.execute(text("DELETE FROM resource_usage_summary"))
         session.commit()
     resources = template.resource_usage()
     assert resources["max_mem"] == "0B"
@@ -115,7 +115,7 @@ def test_non_tenacious_request(client_env, mocker):
     "tenacious, exception_type", [(False, TimeoutError), (True, RuntimeError)]
 )
 def test_connection_timeout(client_env, mocker, tenacious, exception_type):
-    mocker.patch("requests.get", side_effect=TimeoutError)
+    mocker.patch("requests.Session.get", side_effect=TimeoutError)
 
     # Adjust the retries_timeout for the requester
     requester = Requester(client_env, request_timeout=1, retries_timeout=10)
@@ -249,3 +249,36 @@ def test_task_template_hash_unique(tool):
     for tt_version in task_template.task_template_versions:
         arg_mapping_set.add(tt_version.arg_mapping_hash)
     assert len(arg_mapping_set) == 3
+
+
+def test_load_version_created_elsewhere(tool):
+    """A version created by another process is loaded at once."""
+    tt = TaskTemplate("created_elsewhere")
+    tt.bind(tool.active_tool_version)
+    tt.get_task_template_version(command_template="{node1}", node_args=["node1"])
+    tt.load_task_template_versions()
+    first_id = tt.active_task_template_version.id
+
+    # create a version the way another process would, straight through the server
+    other = TaskTemplateVersion(
+        command_template="echo {node2}", node_args=["node2"], task_args=[], op_args=[]
+    )
+    _, response = tt.requester.send_request(
+        app_route=f"/task_template/{tt.id}/add_version",
+        message={
+            "command_template": other.command_template,
+            "arg_mapping_hash": other.arg_mapping_hash,
+            "node_args": list(other.node_args),
+            "task_args": [],
+            "op_args": [],
+        },
+        request_type="post",
+    )
+    new_id = response["task_template_version"][0]
+    assert new_id != first_id
+
+    reloaded = TaskTemplate("created_elsewhere")
+    reloaded.bind(tool.active_tool_version)
+    reloaded.load_task_template_versions()
+    assert reloaded.active_task_template_version.id == new_id
+    reloaded.set_active_task_template_version_id(new_id)
@@ -48,6 +48,20 @@ def test_create_tool_version(client_env):
     assert t1.active_tool_version.id == new_tool_version_id
 
 
+def test_activate_version_created_elsewhere(client_env):
+    """A version created by another process can be activated at once."""
+    t1 = Tool(name="baz")
+
+    # create a version the way another process would, straight through the server
+    _, response = t1.requester.send_request(
+        app_route="/tool_version", message={"tool_id": t1.id}, request_type="post"
+    )
+    new_version_id = response["tool_version"][0]
+
+    t2 = Tool(name="baz", active_tool_version_id=new_version_id)
+    assert t2.active_tool_version.id == new_version_id
+
+
 def test_yaml_compute_resources_and_scales(client_env):
     """Test that we can set Tool ComputeResources via YAML file."""
 
@@ -1,3 +1,6 @@
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
 from jobmon.client.workflow_run import WorkflowRunFactory
 from jobmon.core.constants import TaskInstanceStatus
 from jobmon.distributor.distributor_service import DistributorService
@@ -53,3 +56,63 @@ def test_queued(tool, task_template):
         )
         == 10
     )
+
+
+def test_delta_status_sync(tool, task_template, db_engine):
+    """tests that only changed task instances are synced between full syncs"""
+    from jobmon.server.web.models.task_instance import TaskInstance
+
+    tasks = [task_template.create_task(arg=f"sleep {i}") for i in range(6)]
+    workflow = tool.create_workflow(name="test_delta_status_sync")
+    workflow.add_tasks(tasks)
+    workflow.bind()
+    workflow._bind_tasks()
+    factory = WorkflowRunFactory(workflow.workflow_id)
+    wfr = factory.create_workflow_run()
+
+    state, gateway, orchestrator = create_test_context(
+        workflow, wfr.workflow_run_id, workflow.requester
+    )
+    prepare_and_queue_tasks(state, gateway, orchestrator)
+
+    distributor_service = DistributorService(
+        DummyDistributor("dummy"),
+        requester=workflow.requester,
+        full_sync_interval=3600,
+        raise_on_error=True,
+    )
+    distributor_service.set_workflow_run(wfr.workflow_run_id)
+
+    # the first sync is a full one and sets the watermark
+    distributor_service.sync_status_from_db()
+    queued = distributor_service._task_instance_status_map[TaskInstanceStatus.QUEUED]
+    assert len(queued) == 6
+    assert distributor_service._status_watermark is not None
+
+    # nothing changed, so the delta sync only re-reports what we already hold
+    distributor_service.sync_status_from_db()
+    assert len(queued) == 6
+
+    # move two task instances out of band and let the delta sync pick them up
+    ti_ids = sorted(ti.task_instance_id for ti in queued)
+    with Session(bind=db_engine) as session:
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.id == ti_ids[0])
+            .values(status=TaskInstanceStatus.KILL_SELF, status_date=func.now())
+        )
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.id == ti_ids[1])
+            .values(status=TaskInstanceStatus.ERROR_FATAL, status_date=func.now())
+        )
+        session.commit()
+    distributor_service.sync_status_from_db()
+
+    status_map = distributor_service._task_instance_status_map
+    assert len(status_map[TaskInstanceStatus.QUEUED]) == 4
+    assert {ti.task_instance_id for ti in status_map[TaskInstanceStatus.KILL_SELF]} == {
+        ti_ids[0]
+    }
+    # terminal task instances are expired from the distributor
+    assert ti_ids[1] not in distributor_service._task_instances
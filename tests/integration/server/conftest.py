@@ -216,4 +216,16 @@ def requester_in_memory(monkeypatch, web_server_in_memory, api_prefix):
     monkeypatch.setattr(requests, "get", get_in_mem)
     monkeypatch.setattr(requests, "post", post_in_mem)
     monkeypatch.setattr(requests, "put", put_in_mem)
+    # the Requester sends through a pooled requests.Session
+    monkeypatch.setattr(
+        requests.Session, "get", lambda self, url, **kwargs: get_in_mem(url, **kwargs)
+    )
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        lambda self, url, **kwargs: post_in_mem(url, **kwargs),
+    )
+    monkeypatch.setattr(
+        requests.Session, "put", lambda self, url, **kwargs: put_in_mem(url, **kwargs)
+    )
     monkeypatch.setattr(requester, "get_content", get_test_content)
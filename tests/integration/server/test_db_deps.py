@@ -215,6 +215,36 @@ class TestIntegrationWithFastAPI:
         data = response.json()
         assert data["detail"] == "Test exception"
 
+    def test_db_dependency_commits_before_response(self, web_server_in_memory):
+        """Test that the session is committed before the response is sent."""
+        from fastapi import APIRouter
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+        from starlette.responses import JSONResponse
+
+        client, engine = web_server_in_memory
+        events = []
+
+        class RecordingResponse(JSONResponse):
+            async def __call__(self, scope, receive, send):
+                events.append("response")
+                await super().__call__(scope, receive, send)
+
+        test_router = APIRouter()
+
+        @test_router.post("/test-commit-order")
+        def test_commit_order_endpoint(db: Session = DB):
+            """Test endpoint that records when its session commits."""
+            event.listen(db, "after_commit", lambda session: events.append("commit"))
+            return RecordingResponse({"status": "success"})
+
+        client.app.include_router(test_router)
+
+        response = client.post("/test-commit-order")
+
+        assert response.status_code == 200
+        assert events == ["commit", "response"]
+
     def test_dialect_dependency_in_route(self, web_server_in_memory):
         """Test that the dialect dependency works in actual routes."""
         from fastapi import APIRouter, Depends
@@ -0,0 +1,128 @@
+"""The normalized edge_adjacency table mirrors the JSON edge lists."""
+
+import importlib.util
+import uuid
+from importlib.resources import files
+from unittest import mock
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from jobmon.core.constants import Direction
+from jobmon.server.web.models.edge import Edge
+from jobmon.server.web.models.edge_adjacency import EdgeAdjacency
+from jobmon.server.web.repositories.task_repository import TaskRepository
+
+
+def _adjacency(db_engine, dag_id):
+    with Session(bind=db_engine) as session:
+        return set(
+            session.execute(
+                select(
+                    EdgeAdjacency.upstream_node_id, EdgeAdjacency.downstream_node_id
+                ).where(EdgeAdjacency.dag_id == dag_id)
+            ).all()
+        )
+
+
+def test_add_edges_fills_adjacency(web_server_in_memory, db_engine, api_prefix):
+    client, _ = web_server_in_memory
+    response = client.post(f"{api_prefix}/dag", json={"dag_hash": uuid.uuid4().hex})
+    dag_id = response.json()["dag_id"]
+
+    edges = [
+        {"node_id": 1, "upstream_node_ids": None, "downstream_node_ids": [2, 3]},
+        # clients up to 3.4.23 send the lists as JSON strings
+        {"node_id": 2, "upstream_node_ids": "[1]", "downstream_node_ids": "[4]"},
+        {"node_id": 3, "upstream_node_ids": [1], "downstream_node_ids": [4]},
+        {"node_id": 4, "upstream_node_ids": [2, 3], "downstream_node_ids": []},
+    ]
+    for mark_created in (False, True):  # a retried chunk adds nothing
+        response = client.post(
+            f"{api_prefix}/dag/{dag_id}/edges",
+            json={"edges_to_add": edges, "mark_created": mark_created},
+        )
+        assert response.status_code == 200, response.text
+
+    assert _adjacency(db_engine, dag_id) == {(1, 2), (1, 3), (2, 4), (3, 4)}
+
+
+def test_migration_backfills_adjacency():
+    path = files("jobmon.server").joinpath(
+        "web/migrations/versions/2026_10_17_0100-45778882731d_add_edge_adjacency.py"
+    )
+    spec = importlib.util.spec_from_file_location("add_edge_adjacency", str(path))
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    migration.BACKFILL_BATCH_SIZE = 2
+
+    engine = create_engine("sqlite://")
+    Edge.__table__.create(engine)
+    EdgeAdjacency.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Edge),
+            [
+                {"dag_id": 1, "node_id": 1, "downstream_node_ids": [2, 3]},
+                {"dag_id": 1, "node_id": 2, "downstream_node_ids": "[3]"},
+                {"dag_id": 1, "node_id": 3, "downstream_node_ids": None},
+                {"dag_id": 2, "node_id": 1, "downstream_node_ids": [2, 2]},
+                {"dag_id": 2, "node_id": 2, "downstream_node_ids": []},
+            ],
+        )
+        migration.backfill(connection)
+
+    assert _adjacency(engine, 1) == {(1, 2), (1, 3), (2, 3)}
+    assert _adjacency(engine, 2) == {(1, 2)}
+
+
+def test_barriers_are_followed_by_dependency_lookups(
+    web_server_in_memory, db_engine, api_prefix
+):
+    client, _ = web_server_in_memory
+    response = client.post(f"{api_prefix}/dag", json={"dag_hash": uuid.uuid4().hex})
+    dag_id = response.json()["dag_id"]
+
+    # 1, 2 -> barrier -> 3, 4 and an edge 3 -> 5
+    edges = [
+        {"node_id": 3, "upstream_node_ids": None, "downstream_node_ids": [5]},
+        {"node_id": 5, "upstream_node_ids": [3], "downstream_node_ids": None},
+    ]
+    client.post(
+        f"{api_prefix}/dag/{dag_id}/edges",
+        json={"edges_to_add": edges, "mark_created": True},
+    )
+    barriers = [
+        {"barrier_id": 0, "upstream_node_ids": [2, 1]},
+        {"barrier_id": 0, "downstream_node_ids": [3, 4]},
+    ]
+    for _ in range(2):  # a retried chunk adds nothing
+        response = client.post(
+            f"{api_prefix}/dag/{dag_id}/barriers", json={"barriers": barriers}
+        )
+        assert response.status_code == 200, response.text
+
+    response = client.get(f"{api_prefix}/dag/{dag_id}/barriers")
+    assert response.json() == {"barriers": {"0": [[1, 2], [3, 4]]}}
+
+    with Session(bind=db_engine) as session:
+        repository = TaskRepository(session)
+        assert repository._get_node_dependencies({1}, dag_id, Direction.DOWN) == {3, 4}
+        assert repository._get_node_dependencies({4}, dag_id, Direction.UP) == {1, 2}
+        for max_levels in (32, 0):  # level by level, then all in memory
+            with mock.patch(
+                "jobmon.server.web.repositories.task_repository._MAX_FRONTIER_LEVELS",
+                max_levels,
+            ):
+                assert repository._traverse_nodes({1}, dag_id, Direction.DOWN) == {
+                    1,
+                    3,
+                    4,
+                    5,
+                }
+                assert repository._traverse_nodes({5}, dag_id, Direction.UP) == {
+                    1,
+                    2,
+                    3,
+                    5,
+                }
@@ -0,0 +1,270 @@
+"""Task template resource usage is served from an incrementally updated summary."""
+
+import random
+import uuid
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session
+
+from jobmon.core.constants import TaskInstanceStatus, TaskStatus
+from jobmon.server.web.models.node import Node
+from jobmon.server.web.models.resource_usage_summary import ResourceUsageSummary
+from jobmon.server.web.models.task import Task
+from jobmon.server.web.models.task_instance import TaskInstance
+from jobmon.server.web.models.task_resources import TaskResources
+from jobmon.server.web.models.task_template_version import TaskTemplateVersion
+from jobmon.server.web.models.unsettled_task_instance import UnsettledTaskInstance
+from jobmon.server.web.repositories.task_template_repository import (
+    TaskTemplateRepository,
+)
+
+FINISHED = [
+    TaskInstanceStatus.DONE,
+    TaskInstanceStatus.ERROR,
+    TaskInstanceStatus.RESOURCE_ERROR,
+    TaskInstanceStatus.UNKNOWN_ERROR,
+    TaskInstanceStatus.ERROR_FATAL,
+]
+
+
+@pytest.fixture
+def task_template_version(db_engine):
+    with Session(bind=db_engine) as session:
+        ttv = TaskTemplateVersion(
+            task_template_id=1,
+            command_template=f"summary {uuid.uuid4().hex}",
+            arg_mapping_hash=uuid.uuid4().hex,
+        )
+        resources = TaskResources(task_resources_type_id="O", requested_resources="{}")
+        session.add_all([ttv, resources])
+        session.commit()
+        return ttv.id, resources.id
+
+
+def _add_task_instances(
+    db_engine, task_template_version, usages, age=timedelta(hours=1)
+):
+    """Add one task per (status, wallclock, maxrss) and return the instance ids.
+
+    The instances last changed ``age`` ago, past the summary's grace period by
+    default.
+    """
+    ttv_id, resources_id = task_template_version
+    with Session(bind=db_engine) as session:
+        status_date = session.execute(select(func.now())).scalar() - age
+        instances = []
+        for status, wallclock, maxrss in usages:
+            node = Node(
+                task_template_version_id=ttv_id, node_args_hash=uuid.uuid4().hex
+            )
+            session.add(node)
+            session.flush()
+            task = Task(
+                workflow_id=1,
+                node_id=node.id,
+                task_args_hash=uuid.uuid4().hex,
+                name="summary_task",
+                command="true",
+                status=TaskStatus.DONE,
+            )
+            session.add(task)
+            session.flush()
+            instances.append(
+                TaskInstance(
+                    workflow_run_id=1,
+                    array_id=1,
+                    array_batch_num=1,
+                    array_step_id=0,
+                    task_id=task.id,
+                    task_resources_id=resources_id,
+                    status=status,
+                    wallclock=wallclock,
+                    maxrss=maxrss,
+                    status_date=status_date,
+                )
+            )
+        session.add_all(instances)
+        session.commit()
+        return [instance.id for instance in instances]
+
+
+def _statistics(db_engine, ttv_id, exact):
+    with Session(bind=db_engine) as session:
+        repo = TaskTemplateRepository(session)
+        if exact:
+            details = repo.get_task_resource_details(ttv_id, None, None)
+            stats = repo.calculate_resource_statistics(details, "0.95", ttv_id)
+        else:
+            stats = repo.get_summarized_resource_statistics(ttv_id, "0.95")
+        session.commit()
+        return stats
+
+
+def _unsettled_ids(session, ttv_id):
+    return list(
+        session.execute(
+            select(UnsettledTaskInstance.task_instance_id)
+            .where(UnsettledTaskInstance.task_template_version_id == ttv_id)
+            .order_by(UnsettledTaskInstance.task_instance_id)
+        ).scalars()
+    )
+
+
+def _assert_matches_exact(summarized, exact):
+    assert summarized.num_tasks == exact.num_tasks
+    for name in ["min_mem", "max_mem", "min_runtime", "max_runtime"]:
+        assert getattr(summarized, name) == getattr(exact, name)
+    for name in ["mean_mem", "mean_runtime"]:
+        assert getattr(summarized, name) == pytest.approx(getattr(exact, name))
+    for name in ["median_mem", "median_runtime"]:
+        assert getattr(summarized, name) == pytest.approx(
+            getattr(exact, name), rel=0.01
+        )
+    for name in ["ci_mem", "ci_runtime"]:
+        assert getattr(summarized, name) == pytest.approx(
+            getattr(exact, name), abs=0.01
+        )
+
+
+def test_summary_matches_exact_statistics(db_engine, task_template_version):
+    rng = random.Random(0)
+    usages = [
+        (
+            rng.choice(FINISHED),
+            rng.choice([None, "0", str(rng.uniform(1, 3600))]),
+            rng.choice([None, "0", "-5", str(rng.randint(1, 10**10))]),
+        )
+        for _ in range(3000)
+    ]
+    _add_task_instances(db_engine, task_template_version, usages)
+    ttv_id, _ = task_template_version
+
+    _assert_matches_exact(
+        _statistics(db_engine, ttv_id, exact=False),
+        _statistics(db_engine, ttv_id, exact=True),
+    )
+    # served again from the stored summary alone
+    _assert_matches_exact(
+        _statistics(db_engine, ttv_id, exact=False),
+        _statistics(db_engine, ttv_id, exact=True),
+    )
+
+
+def test_summary_folds_settled_task_instances(db_engine, task_template_version):
+    ttv_id, _ = task_template_version
+    done = (TaskInstanceStatus.DONE, "10", "100")
+    _add_task_instances(db_engine, task_template_version, [done] * 3)
+    running_id, *_, last_id = _add_task_instances(
+        db_engine,
+        task_template_version,
+        [
+            (TaskInstanceStatus.RUNNING, None, None),
+            (TaskInstanceStatus.NO_DISTRIBUTOR_ID, None, None),
+            done,
+            done,
+        ],
+    )
+
+    stats = _statistics(db_engine, ttv_id, exact=False)
+    assert stats.num_tasks == 5
+    with Session(bind=db_engine) as session:
+        summary = session.get(ResourceUsageSummary, ttv_id)
+        # the watermark passes the running instance, which is read again next time
+        assert summary.last_task_instance_id == last_id
+        assert _unsettled_ids(session, ttv_id) == [running_id]
+        assert summary.num_task_instances == 5
+
+    # nothing settled since, so the summary is not written
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", record)
+    try:
+        assert _statistics(db_engine, ttv_id, exact=False).num_tasks == 5
+    finally:
+        event.remove(db_engine, "before_cursor_execute", record)
+    assert not [s for s in statements if "UPDATE resource_usage_summary" in s]
+
+    with Session(bind=db_engine) as session:
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.id == running_id)
+            .values(status=TaskInstanceStatus.DONE, wallclock="40", maxrss="400")
+        )
+        session.commit()
+
+    stats = _statistics(db_engine, ttv_id, exact=False)
+    _assert_matches_exact(stats, _statistics(db_engine, ttv_id, exact=True))
+    assert (stats.num_tasks, stats.max_runtime, stats.max_mem) == (6, 40, 400)
+    with Session(bind=db_engine) as session:
+        summary = session.get(ResourceUsageSummary, ttv_id)
+        assert summary.last_task_instance_id == last_id
+        assert _unsettled_ids(session, ttv_id) == []
+        assert summary.num_task_instances == 6
+
+
+def test_summary_of_unused_version(db_engine, task_template_version):
+    ttv_id, _ = task_template_version
+    stats = _statistics(db_engine, ttv_id, exact=False)
+    assert stats.num_tasks is None
+    assert stats.min_runtime is None
+
+
+def _set_task_instance(db_engine, task_instance_id, **values):
+    with Session(bind=db_engine) as session:
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.id == task_instance_id)
+            .values(**values)
+        )
+        session.commit()
+
+
+def test_summary_waits_for_late_commits(db_engine, task_template_version):
+    ttv_id, _ = task_template_version
+    (settled_id,) = _add_task_instances(
+        db_engine, task_template_version, [(TaskInstanceStatus.DONE, "10", "100")]
+    )
+    # leave a gap below the new instance for an id that is not committed yet
+    (low_id,) = _add_task_instances(
+        db_engine,
+        task_template_version,
+        [(TaskInstanceStatus.DONE, "20", "200")],
+        age=timedelta(0),
+    )
+    high_id = low_id + 10
+    _set_task_instance(db_engine, low_id, id=high_id)
+
+    # the new instance is counted, but the watermark stays below it
+    assert _statistics(db_engine, ttv_id, exact=False).num_tasks == 2
+    with Session(bind=db_engine) as session:
+        summary = session.get(ResourceUsageSummary, ttv_id)
+        assert summary.last_task_instance_id == settled_id
+        assert summary.num_task_instances == 1
+
+    # the lower id commits after the higher one was read
+    (late_id,) = _add_task_instances(
+        db_engine,
+        task_template_version,
+        [(TaskInstanceStatus.DONE, "40", "400")],
+        age=timedelta(0),
+    )
+    _set_task_instance(db_engine, late_id, id=low_id)
+    assert _statistics(db_engine, ttv_id, exact=False).num_tasks == 3
+
+    # once neither changed for the grace period, both are folded in
+    with Session(bind=db_engine) as session:
+        an_hour_ago = session.execute(select(func.now())).scalar() - timedelta(hours=1)
+    for task_instance_id in [low_id, high_id]:
+        _set_task_instance(db_engine, task_instance_id, status_date=an_hour_ago)
+    stats = _statistics(db_engine, ttv_id, exact=False)
+    _assert_matches_exact(stats, _statistics(db_engine, ttv_id, exact=True))
+    assert stats.num_tasks == 3
+    with Session(bind=db_engine) as session:
+        summary = session.get(ResourceUsageSummary, ttv_id)
+        assert summary.last_task_instance_id == high_id
+        assert summary.num_task_instances == 3
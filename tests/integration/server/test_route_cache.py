@@ -0,0 +1,72 @@
+"""Lookup routes are served from the per-worker route cache and revalidated by ETag."""
+
+import uuid
+
+import pytest
+from sqlalchemy.orm import Session
+
+from jobmon.server.web.models.tool_version import ToolVersion
+from jobmon.server.web.route_cache import get_route_cache
+
+
+@pytest.fixture
+def route_cache():
+    cache = get_route_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def test_lookup_served_from_cache_and_revalidated(web_server_in_memory, route_cache):
+    client, _ = web_server_in_memory
+    route = "/api/v3/workflow_status/available_status"
+
+    first = client.get(route)
+    assert first.status_code == 200
+    assert "max-age" in first.headers["cache-control"]
+    etag = first.headers["etag"]
+
+    second = client.get(route)
+    assert second.json() == first.json()
+    assert second.headers["etag"] == etag
+
+    not_modified = client.get(route, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    assert route_cache.stats()["routes"]["available_statuses"] == {
+        "hits": 2,
+        "misses": 1,
+    }
+    stats = client.get("/api/v3/route_cache/stats").json()
+    assert stats["routes"]["available_statuses"]["hits"] == 2
+
+
+def test_tool_versions_are_not_cached(web_server_in_memory, route_cache):
+    client, db_engine = web_server_in_memory
+    tool_id = client.post("/api/v3/tool", json={"name": uuid.uuid4().hex}).json()[
+        "tool"
+    ][0]
+    route = f"/api/v3/tool/{tool_id}/tool_versions"
+
+    client.post("/api/v3/tool_version", json={"tool_id": tool_id})
+    assert len(client.get(route).json()["tool_versions"]) == 1
+
+    # a version added through another worker is seen at once
+    with Session(bind=db_engine) as session:
+        session.add(ToolVersion(tool_id=tool_id))
+        session.commit()
+    assert len(client.get(route).json()["tool_versions"]) == 2
+    assert "tool_versions" not in route_cache.stats()["routes"]
+
+
+def test_cache_is_bounded(route_cache):
+    route_cache.max_entries, max_entries = 2, route_cache.max_entries
+    try:
+        for key in ["a", "b", "c"]:
+            route_cache.put(("test", key), key)
+        assert route_cache.get(("test", "a")) is None
+        assert route_cache.get(("test", "c")).body == b'"c"'
+        assert route_cache.stats()["entries"] == 2
+    finally:
+        route_cache.max_entries = max_entries
@@ -0,0 +1,86 @@
+"""Heartbeats stay responsive while slow binds hold the database."""
+
+import asyncio
+import re
+import statistics
+import time
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+# Statements that read the task table, i.e. the bulk of a bind.
+TASK_QUERY = re.compile(r"\bFROM task\b(?!_)")
+SLOW_QUERY_SECONDS = 0.1
+NUM_BINDS = 4
+# enough samples for statistics.quantiles to give a p99
+NUM_HEARTBEATS = 200
+
+
+@pytest.fixture
+def slow_task_queries(db_engine):
+    """Make every query on the task table take SLOW_QUERY_SECONDS."""
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if TASK_QUERY.search(statement):
+            time.sleep(SLOW_QUERY_SECONDS)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    yield
+    event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _bind_until(client, api_prefix, done):
+    binds = 0
+    while not done.is_set():
+        response = await client.put(
+            f"{api_prefix}/task/bind_tasks_no_args",
+            json={"tasks": {}, "workflow_id": 1, "mark_created": False},
+        )
+        assert response.status_code == 200, response.text
+        binds += 1
+    return binds
+
+
+async def _heartbeat(client, api_prefix):
+    start = time.perf_counter()
+    response = await client.post(
+        f"{api_prefix}/task_instance/log_report_by/batch",
+        json={"task_instance_ids": [1, 2, 3], "next_report_increment": 90},
+    )
+    assert response.status_code == 200, response.text
+    return time.perf_counter() - start
+
+
+def test_heartbeat_latency_during_binds(
+    web_server_in_memory, api_prefix, slow_task_queries
+):
+    test_client, _ = web_server_in_memory
+
+    async def run():
+        transport = httpx.ASGITransport(app=test_client.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            await _heartbeat(client, api_prefix)  # warm up the app
+
+            done = asyncio.Event()
+            binds = [
+                asyncio.create_task(_bind_until(client, api_prefix, done))
+                for _ in range(NUM_BINDS)
+            ]
+            await asyncio.sleep(SLOW_QUERY_SECONDS / 2)
+            latencies = []
+            for _ in range(NUM_HEARTBEATS):
+                latencies.append(await _heartbeat(client, api_prefix))
+            done.set()
+            return latencies, sum(await asyncio.gather(*binds))
+
+    latencies, num_binds = asyncio.run(run())
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    # Binds running on the event loop held every heartbeat behind their slow queries
+    # (p50 ~0.9s, max ~1.3s); offloaded to the threadpool they run side by side.
+    assert num_binds >= NUM_BINDS
+    assert p50 < SLOW_QUERY_SECONDS, latencies
+    assert p99 < 3 * SLOW_QUERY_SECONDS, latencies
@@ -0,0 +1,55 @@
+"""Attribute types bound by concurrent chunks of the same workflow."""
+
+import uuid
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from jobmon.server.web.models.task_attribute_type import TaskAttributeType
+from jobmon.server.web.routes.v3.fsm.task import _add_or_get_attribute_types
+from jobmon.server.web.server_side_exception import InvalidUsage
+
+
+def test_names_inserted_by_a_concurrent_chunk(db_engine):
+    x, y, z = (f"{name}_{uuid.uuid4().hex}" for name in "xyz")
+
+    inserted = []
+
+    def insert_y_first(conn, cursor, statement, *args):
+        # another chunk commits y between our lookup and our insert
+        if (
+            not inserted
+            and statement.startswith("INSERT")
+            and "task_attribute_type" in statement
+        ):
+            inserted.append(y)
+            with Session(bind=db_engine) as other:
+                other.execute(insert(TaskAttributeType).values(name=y))
+                other.commit()
+
+    event.listen(db_engine, "before_cursor_execute", insert_y_first)
+    try:
+        with Session(bind=db_engine) as session:
+            type_ids = _add_or_get_attribute_types({x, y, z}, session, "sqlite")
+            session.commit()
+    finally:
+        event.remove(db_engine, "before_cursor_execute", insert_y_first)
+
+    with Session(bind=db_engine) as session:
+        stored = dict(
+            session.execute(
+                select(TaskAttributeType.name, TaskAttributeType.id).where(
+                    TaskAttributeType.name.in_([x, y, z])
+                )
+            ).all()
+        )
+    assert inserted == [y]
+    assert type_ids == stored
+    assert set(stored) == {x, y, z}
+
+
+def test_names_longer_than_the_column(db_engine):
+    with Session(bind=db_engine) as session:
+        with pytest.raises(InvalidUsage, match="255 characters"):
+            _add_or_get_attribute_types({"a" * 256, "ok"}, session, "sqlite")
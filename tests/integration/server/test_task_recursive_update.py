@@ -0,0 +1,212 @@
+"""Recursive task status updates walk the DAG with a bounded number of queries."""
+
+import uuid
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from jobmon.core.constants import Direction, TaskStatus, WorkflowStatus
+from jobmon.server.web.models.dag import Dag
+from jobmon.server.web.models.edge import Edge
+from jobmon.server.web.models.edge_adjacency import EdgeAdjacency
+from jobmon.server.web.models.node import Node
+from jobmon.server.web.models.task import Task
+from jobmon.server.web.models.workflow import Workflow
+from jobmon.server.web.repositories.task_repository import (
+    _MAX_FRONTIER_LEVELS,
+    TaskRepository,
+)
+
+NUM_NODES = 5000
+
+
+def _chain(num_nodes):
+    return {node_id: [node_id + 1] for node_id in range(1, num_nodes)}
+
+
+def _fan(num_nodes):
+    # one root, a wide middle level and one sink
+    sink = num_nodes
+    downstreams = {1: list(range(2, sink))}
+    downstreams.update({node_id: [sink] for node_id in range(2, sink)})
+    return downstreams
+
+
+def _layers(num_nodes):
+    # 20 layers; each node feeds the node below it and its neighbour in the next layer
+    width = num_nodes // 20
+    downstreams = {}
+    for node_id in range(1, num_nodes - width + 1):
+        neighbour = node_id + width + 1 if node_id % width else node_id + 1
+        downstreams[node_id] = [node_id + width, min(neighbour, num_nodes)]
+    return downstreams
+
+
+def _create_workflow(db_engine, num_nodes, downstreams):
+    """Insert a workflow whose task on node i is upstream of its downstreams' tasks.
+
+    Node i of the shape is stored as a node row of its own, so the edges don't
+    collide with those of other tests. Task ids are returned by shape node.
+    """
+    with Session(bind=db_engine) as session:
+        prefix = uuid.uuid4().hex
+        session.execute(
+            insert(Node),
+            [
+                {"task_template_version_id": 0, "node_args_hash": f"{prefix}_{i}"}
+                for i in range(1, num_nodes + 1)
+            ],
+        )
+        session.commit()
+        node_ids = {
+            int(node_args_hash.rsplit("_", 1)[1]): node_id
+            for node_id, node_args_hash in session.execute(
+                select(Node.id, Node.node_args_hash).where(
+                    Node.node_args_hash.like(f"{prefix}_%")
+                )
+            )
+        }
+    downstreams = {
+        node_ids[i]: [node_ids[child] for child in children]
+        for i, children in downstreams.items()
+    }
+    upstreams = {node_id: [] for node_id in node_ids.values()}
+    for node_id, children in downstreams.items():
+        for child in children:
+            upstreams[child].append(node_id)
+
+    with Session(bind=db_engine) as session:
+        dag = Dag(hash=uuid.uuid4().hex)
+        session.add(dag)
+        session.flush()
+        workflow = Workflow(
+            dag_id=dag.id,
+            workflow_args_hash=uuid.uuid4().hex,
+            task_hash=uuid.uuid4().hex,
+            max_concurrently_running=1,
+            status=WorkflowStatus.FAILED,
+        )
+        session.add(workflow)
+        session.flush()
+        session.execute(
+            insert(Edge),
+            [
+                {
+                    "dag_id": dag.id,
+                    "node_id": node_id,
+                    "upstream_node_ids": upstreams[node_id] or None,
+                    "downstream_node_ids": downstreams.get(node_id) or None,
+                }
+                for node_id in node_ids.values()
+            ],
+        )
+        session.execute(
+            insert(EdgeAdjacency),
+            [
+                {
+                    "dag_id": dag.id,
+                    "upstream_node_id": node_id,
+                    "downstream_node_id": child,
+                }
+                for node_id, children in downstreams.items()
+                for child in children
+            ],
+        )
+        session.execute(
+            insert(Task),
+            [
+                {
+                    "workflow_id": workflow.id,
+                    "node_id": node_id,
+                    "task_args_hash": str(node_id),
+                    "name": f"task_{node_id}",
+                    "command": "true",
+                    "status": TaskStatus.ERROR_FATAL,
+                }
+                for node_id in node_ids.values()
+            ],
+        )
+        session.commit()
+        task_ids = dict(
+            session.execute(
+                select(Task.node_id, Task.id).where(Task.workflow_id == workflow.id)
+            ).all()
+        )
+    return workflow.id, {i: task_ids[node_id] for i, node_id in node_ids.items()}
+
+
+@pytest.fixture
+def edge_queries(db_engine):
+    """Count the statements that read the edge table."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "FROM edge_adjacency" in statement:
+            statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.parametrize(
+    "shape, max_edge_queries",
+    [
+        # one query per level until the rest of the DAG is loaded at once
+        (_chain, _MAX_FRONTIER_LEVELS + 1),
+        # root, middle (in IN clause batches) and sink levels
+        (_fan, 7),
+        (_layers, 21),
+    ],
+)
+def test_recursive_update_query_count(db_engine, edge_queries, shape, max_edge_queries):
+    downstreams = shape(NUM_NODES)
+    workflow_id, task_ids = _create_workflow(db_engine, NUM_NODES, downstreams)
+    sink_task_ids = [
+        task_id for node_id, task_id in task_ids.items() if node_id not in downstreams
+    ]
+
+    with Session(bind=db_engine) as session:
+        TaskRepository(session).update_task_statuses(
+            workflow_id=str(workflow_id),
+            recursive=True,
+            workflow_status=None,
+            task_ids=sink_task_ids,
+            new_status=TaskStatus.DONE,
+        )
+        session.commit()
+    assert len(edge_queries) <= max_edge_queries
+
+    with Session(bind=db_engine) as session:
+        statuses = session.execute(
+            select(Task.status).where(Task.workflow_id == workflow_id)
+        ).scalars()
+        assert set(statuses) == {TaskStatus.DONE}
+        workflow_status = session.execute(
+            select(Workflow.status).where(Workflow.id == workflow_id)
+        ).scalar_one()
+        assert workflow_status == WorkflowStatus.DONE
+
+
+@pytest.mark.parametrize("shape", [_chain, _fan, _layers])
+def test_recursive_tasks_match_reachable_nodes(db_engine, shape):
+    num_nodes = 3 * _MAX_FRONTIER_LEVELS
+    downstreams = shape(num_nodes)
+    workflow_id, task_ids = _create_workflow(db_engine, num_nodes, downstreams)
+
+    start_node = 2
+    expected = {start_node}
+    stack = [start_node]
+    while stack:
+        for node_id in downstreams.get(stack.pop(), []):
+            if node_id not in expected:
+                expected.add(node_id)
+                stack.append(node_id)
+
+    with Session(bind=db_engine) as session:
+        repository = TaskRepository(session)
+        found = repository._get_tasks_recursive({task_ids[start_node]}, Direction.DOWN)
+        subdag = repository.get_task_subdag([task_ids[start_node]], [])
+    assert found == {task_ids[node_id] for node_id in expected}
+    assert set(subdag.sub_task) == found
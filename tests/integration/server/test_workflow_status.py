@@ -0,0 +1,150 @@
+"""The cli workflow status is aggregated in the database with one grouped query."""
+
+import json
+import time
+import uuid
+from datetime import datetime
+from io import StringIO
+
+import pandas as pd
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from jobmon.core.constants import TaskStatus, WorkflowStatus
+from jobmon.server.web.models.dag import Dag
+from jobmon.server.web.models.task import Task
+from jobmon.server.web.models.workflow import Workflow
+from jobmon.server.web.repositories.workflow_repository import WorkflowRepository
+
+NUM_WORKFLOWS = 3
+NUM_TASKS = 20_000
+LATENCY_BUDGET_SECONDS = 1.0
+
+# status and number of attempts of task i are picked by i modulo these lengths
+STATUSES = [
+    TaskStatus.REGISTERING,
+    TaskStatus.QUEUED,
+    TaskStatus.LAUNCHED,
+    TaskStatus.RUNNING,
+    TaskStatus.DONE,
+    TaskStatus.DONE,
+    TaskStatus.ERROR_FATAL,
+]
+NUM_ATTEMPTS = [0, 1, 2, 4]
+
+
+def _expected_counts(num_tasks):
+    cli_statuses = {
+        TaskStatus.REGISTERING: "PENDING",
+        TaskStatus.QUEUED: "PENDING",
+        TaskStatus.LAUNCHED: "SCHEDULED",
+        TaskStatus.RUNNING: "RUNNING",
+        TaskStatus.DONE: "DONE",
+        TaskStatus.ERROR_FATAL: "FATAL",
+    }
+    counts = dict.fromkeys(["PENDING", "SCHEDULED", "RUNNING", "DONE", "FATAL"], 0)
+    retries = 0
+    for i in range(num_tasks):
+        counts[cli_statuses[STATUSES[i % len(STATUSES)]]] += 1
+        retries += max(NUM_ATTEMPTS[i % len(NUM_ATTEMPTS)] - 1, 0)
+    return counts, retries
+
+
+@pytest.fixture
+def large_workflows(db_engine):
+    """Insert workflows of NUM_TASKS tasks each, bypassing the client."""
+    workflow_ids = []
+    with Session(bind=db_engine) as session:
+        for _ in range(NUM_WORKFLOWS):
+            dag = Dag(hash=uuid.uuid4().hex)
+            session.add(dag)
+            session.flush()
+            workflow = Workflow(
+                dag_id=dag.id,
+                name="large_workflow",
+                workflow_args_hash=uuid.uuid4().hex,
+                task_hash=uuid.uuid4().hex,
+                max_concurrently_running=1,
+                status=WorkflowStatus.RUNNING,
+                created_date=datetime(2026, 1, 2, 3, 4, 5),
+            )
+            session.add(workflow)
+            session.flush()
+            session.execute(
+                insert(Task),
+                [
+                    {
+                        "workflow_id": workflow.id,
+                        "node_id": i,
+                        "task_args_hash": str(i),
+                        "name": f"task_{i}",
+                        "command": "true",
+                        "status": STATUSES[i % len(STATUSES)],
+                        "num_attempts": NUM_ATTEMPTS[i % len(NUM_ATTEMPTS)],
+                    }
+                    for i in range(NUM_TASKS)
+                ],
+            )
+            workflow_ids.append(workflow.id)
+        session.commit()
+    return workflow_ids
+
+
+def test_workflow_status_single_grouped_query(db_engine, large_workflows):
+    task_queries = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "FROM task" in statement or "JOIN task" in statement:
+            task_queries.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with Session(bind=db_engine) as session:
+            start = time.perf_counter()
+            response = WorkflowRepository(session).get_workflow_status(
+                workflow_id=large_workflows
+            )
+            elapsed = time.perf_counter() - start
+    finally:
+        event.remove(db_engine, "before_cursor_execute", before_cursor_execute)
+
+    assert len(task_queries) == 1
+    assert elapsed < LATENCY_BUDGET_SECONDS
+
+    counts, retries = _expected_counts(NUM_TASKS)
+    workflows = json.loads(response.workflows)
+    assert list(workflows) == [
+        "WF_ID",
+        "WF_NAME",
+        "WF_STATUS",
+        "CREATED_DATE",
+        "TASKS",
+        "PENDING",
+        "SCHEDULED",
+        "RUNNING",
+        "DONE",
+        "FATAL",
+        "RETRIES",
+    ]
+    for i, workflow_id in enumerate(sorted(large_workflows)):
+        index = str(i)
+        assert workflows["WF_ID"][index] == workflow_id
+        assert workflows["WF_NAME"][index] == "large_workflow"
+        assert workflows["WF_STATUS"][index] == "RUNNING"
+        assert workflows["CREATED_DATE"][index] == 1767323045000
+        assert workflows["TASKS"][index] == NUM_TASKS
+        for col, count in counts.items():
+            pct = round(count / NUM_TASKS * 100, 1)
+            assert workflows[col][index] == f"{count} ({pct}%)"
+        assert workflows["RETRIES"][index] == retries
+
+    # the cli reads the payload with pandas
+    df = pd.read_json(StringIO(response.workflows))
+    assert list(df.WF_ID) == sorted(large_workflows)
+
+
+def test_workflow_status_no_tasks(db_engine):
+    with Session(bind=db_engine) as session:
+        response = WorkflowRepository(session).get_workflow_status(workflow_id=[-1])
+    assert pd.read_json(StringIO(response.workflows)).empty
@@ -707,3 +707,121 @@ def test_build_swarm_from_workflow_id(tool, task_template):
         resume_orchestrator,
         full_sync=True,
     )
+
+
+def test_barrier_between_arrays(db_engine, tool, task_template, array_template):
+    """A downstream array waits on a barrier instead of an edge per task pair."""
+    workflow = tool.create_workflow()
+    upstream = task_template.create_tasks(arg=["echo 1", "exit 1"], max_attempts=1)
+    downstream = array_template.create_tasks(
+        arg=["a", "b", "c"], upstream_tasks=upstream, barrier=True
+    )
+    workflow.add_tasks(upstream + downstream)
+    workflow.run()
+
+    # the failed upstream holds back every downstream task
+    with Session(bind=db_engine) as session:
+        statuses = dict(
+            session.execute(
+                text("SELECT id, status FROM task WHERE workflow_id = :wf_id"),
+                {"wf_id": workflow.workflow_id},
+            ).all()
+        )
+        num_edges = session.execute(
+            text("SELECT COUNT(*) FROM edge_adjacency WHERE dag_id = :dag_id"),
+            {"dag_id": workflow.dag_id},
+        ).scalar_one()
+        num_members = session.execute(
+            text("SELECT COUNT(*) FROM barrier_node WHERE dag_id = :dag_id"),
+            {"dag_id": workflow.dag_id},
+        ).scalar_one()
+    assert [statuses[t.task_id] for t in upstream] == [
+        TaskStatus.DONE,
+        TaskStatus.ERROR_FATAL,
+    ]
+    assert {statuses[t.task_id] for t in downstream} == {TaskStatus.REGISTERING}
+    assert (num_edges, num_members) == (0, 5)
+
+    # a resumed swarm only waits on the upstream that is run again
+    resume_factory = WorkflowRunFactory(workflow.workflow_id)
+    resume_factory.set_workflow_resume()
+    resume_factory.reset_task_statuses()
+    resume_wfr = resume_factory.create_workflow_run()
+    builder = SwarmBuilder(
+        requester=Requester.from_defaults(),
+        workflow_run_id=resume_wfr.workflow_run_id,
+        initial_status=resume_wfr.status,
+    )
+    builder.build_from_workflow_id(workflow.workflow_id)
+
+    (barrier,) = builder.state.barriers
+    assert [t.task_id for t in barrier.upstreams] == [upstream[1].task_id]
+    assert {t.task_id for t in barrier.downstreams} == {t.task_id for t in downstream}
+    assert {t.num_upstreams for t in barrier.downstreams} == {1}
+    newly_ready = builder.state.propagate_completions({barrier.upstreams[0]})
+    assert {t.task_id for t in newly_ready} == {t.task_id for t in downstream}
+
+
+def test_resume_tasks_stream_pages(tool, task_template):
+    workflow = tool.create_workflow()
+    t1 = task_template.create_task(
+        arg="sleep 1",
+        compute_resources={"runtime": 10},
+        resource_scales={"runtime": 0.5},
+        fallback_queues=["null.q"],
+    )
+    t2 = task_template.create_task(arg="sleep 2", upstream_tasks=[t1])
+    t3 = task_template.create_task(arg="sleep 3", upstream_tasks=[t2])
+    workflow.add_tasks([t1, t2, t3])
+    workflow.bind()
+    workflow._bind_tasks()
+
+    requester = Requester.from_defaults()
+    app_route = f"/workflow/{workflow.workflow_id}/resume_tasks"
+    pages = []
+    after_task_id = 0
+    while True:
+        page = list(
+            requester.stream_request(
+                app_route, {"after_task_id": after_task_id, "page_size": 2}
+            )
+        )
+        pages.append([task["task_id"] for task in page])
+        if len(page) < 2:
+            break
+        after_task_id = page[-1]["task_id"]
+    assert pages == [[t1.task_id, t2.task_id], [t3.task_id]]
+
+    first = next(iter(requester.stream_request(app_route, {"page_size": 1})))
+    assert first == {
+        "task_id": t1.task_id,
+        "array_id": t1.array.array_id,
+        "status": TaskStatus.REGISTERING,
+        "max_attempts": t1.max_attempts,
+        "resource_scales": {"runtime": 0.5},
+        "fallback_queues": ["null.q"],
+        "requested_resources": {"runtime": 10},
+        "cluster_name": "sequential",
+        "queue_name": "null.q",
+        "array_concurrency": t1.array.max_concurrently_running,
+    }
+
+
+def test_concurrency_limits_in_one_request(tool, task_template, array_template):
+    workflow = tool.create_workflow(max_concurrently_running=23)
+    (t1,) = task_template.create_tasks(arg=["sleep 1"], max_concurrently_running=5)
+    (t2,) = array_template.create_tasks(arg=["a"], max_concurrently_running=7)
+    workflow.add_tasks([t1, t2])
+    workflow.bind()
+    workflow._bind_tasks()
+
+    requester = Requester.from_defaults()
+    _, response = requester.send_request(
+        app_route=f"/workflow/{workflow.workflow_id}/concurrency_limits",
+        message={},
+        request_type="get",
+    )
+    assert response == {
+        "max_concurrently_running": 23,
+        "array_limits": {str(t1.array.array_id): 5, str(t2.array.array_id): 7},
+    }
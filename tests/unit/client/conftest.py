@@ -0,0 +1,71 @@
+"""Shared fixtures for client unit tests.
+
+Task template versions built here look bound to a server, so arrays and tasks can
+be created from them without one.
+"""
+
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from jobmon.client.array import Array
+from jobmon.client.task_template_version import TaskTemplateVersion
+
+
+@pytest.fixture
+def make_task_template_version() -> Callable[..., TaskTemplateVersion]:
+    """Return a factory for bound-looking task template versions."""
+
+    def make(
+        command_template: str,
+        node_args: List[str],
+        task_args: Optional[List[str]] = None,
+        op_args: Optional[List[str]] = None,
+        template_name: str = "template",
+        task_template_version_id: int = 1,
+        arg_ids: Optional[Dict[str, int]] = None,
+    ) -> TaskTemplateVersion:
+        task_args = task_args or []
+        op_args = op_args or []
+        ttv = TaskTemplateVersion(
+            command_template=command_template,
+            node_args=node_args,
+            task_args=task_args,
+            op_args=op_args,
+            requester=MagicMock(),
+        )
+        ttv._task_template = SimpleNamespace(template_name=template_name)
+        ttv._task_template_version_id = task_template_version_id
+        ttv._id_name_map = arg_ids or {
+            name: arg_id
+            for arg_id, name in enumerate(node_args + task_args + op_args, start=1)
+        }
+        return ttv
+
+    return make
+
+
+@pytest.fixture
+def make_echo_array(
+    make_task_template_version: Callable[..., TaskTemplateVersion],
+) -> Callable[[str, int], Array]:
+    """Return a factory for arrays of ``echo {arg}`` tasks with one node arg."""
+
+    def make(template_name: str, task_template_version_id: int) -> Array:
+        ttv = make_task_template_version(
+            "echo {arg}",
+            node_args=["arg"],
+            template_name=template_name,
+            task_template_version_id=task_template_version_id,
+        )
+        return Array(
+            task_template_version=ttv,
+            task_args={},
+            op_args={},
+            cluster_name="dummy",
+            requester=ttv.requester,
+        )
+
+    return make
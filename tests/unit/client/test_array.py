@@ -0,0 +1,113 @@
+from itertools import product
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jobmon.client.array import Array
+
+
+class FakeTask:
+    """The parts of a Task that Array.add_task and node arg lookups use."""
+
+    cluster_name = ""
+
+    def __init__(self, **node_args):
+        self.node = SimpleNamespace(node_args=node_args)
+
+    def __repr__(self) -> str:
+        return f"FakeTask({self.node.node_args})"
+
+
+def make_array(node_args_list):
+    array = Array(
+        task_template_version=MagicMock(),
+        task_args={},
+        op_args={},
+        cluster_name="dummy",
+        name="array",
+        requester=MagicMock(),
+    )
+    for node_args in node_args_list:
+        array.add_task(FakeTask(**node_args))
+    return array
+
+
+def node_args_of(tasks):
+    return [task.node.node_args for task in tasks]
+
+
+def test_get_tasks_by_node_args():
+    array = make_array(
+        dict(location=loc, year=year, sex=sex)
+        for loc, year, sex in product([1, 2, 3], [2000, 2010], ["m", "f"])
+    )
+
+    assert node_args_of(array.get_tasks_by_node_args(location=2, year=2010)) == [
+        {"location": 2, "year": 2010, "sex": "m"},
+        {"location": 2, "year": 2010, "sex": "f"},
+    ]
+    # iterable values match any of their items, results keep insertion order
+    tasks = array.get_tasks_by_node_args(location=[3, 1], year=iter([2000]), sex="f")
+    assert node_args_of(tasks) == [
+        {"location": 1, "year": 2000, "sex": "f"},
+        {"location": 3, "year": 2000, "sex": "f"},
+    ]
+    assert len(array.get_tasks_by_node_args()) == 12
+    assert array.get_tasks_by_node_args(location=4) == []
+    assert array.get_tasks_by_node_args(location=4, missing=1) == []
+    with pytest.raises(KeyError):
+        array.get_tasks_by_node_args(missing=1)
+
+
+def test_string_values_are_matched_whole():
+    array = make_array([{"loc": "1"}, {"loc": "12"}, {"loc": "2"}, {"loc": ("1", "2")}])
+    assert node_args_of(array.get_tasks_by_node_args(loc="12")) == [{"loc": "12"}]
+    # a tuple matches its items and an equal node arg value
+    assert node_args_of(array.get_tasks_by_node_args(loc=("1", "2"))) == [
+        {"loc": "1"},
+        {"loc": "2"},
+        {"loc": ("1", "2")},
+    ]
+
+
+def test_unhashable_node_args_fall_back_to_scanning():
+    array = make_array([{"loc": 1, "draws": [1, 2]}, {"loc": 2, "draws": [3]}])
+    assert array._node_arg_index is None
+    assert node_args_of(array.get_tasks_by_node_args(draws=[[3]], loc=2)) == [
+        {"loc": 2, "draws": [3]}
+    ]
+
+
+class CountingNode:
+    """A node that counts how often its node args are read."""
+
+    reads = 0
+
+    def __init__(self, node_args):
+        self._node_args = node_args
+
+    @property
+    def node_args(self):
+        CountingNode.reads += 1
+        return self._node_args
+
+
+@pytest.mark.parametrize("num_tasks", [1_000, 100_000])
+def test_get_tasks_by_node_args_examines_only_matches(num_tasks):
+    """A lookup reads the node args of its candidate matches, not the whole array."""
+    array = make_array([])
+    for i in range(num_tasks):
+        task = FakeTask()
+        task.node = CountingNode({"location": i, "draw": i % 10})
+        array.add_task(task)
+
+    CountingNode.reads = 0
+    with patch.object(
+        Array, "_scan_tasks_by_node_args", autospec=True
+    ) as scan_tasks_by_node_args:
+        for i in range(0, num_tasks, num_tasks // 100):
+            assert len(array.get_tasks_by_node_args(location=i, draw=[i % 10])) == 1
+    scan_tasks_by_node_args.assert_not_called()
+    # the one task matching on location is checked against draw
+    assert CountingNode.reads == 100
@@ -0,0 +1,74 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from jobmon.client.dag import Dag
+from jobmon.core.exceptions import CyclicGraphError, NodeDependencyNotExistError
+
+
+def make_dag(*task_groups):
+    dag = Dag(requester=MagicMock())
+    for tasks in task_groups:
+        for task in tasks:
+            dag.add_node(task.node)
+    return dag
+
+
+def test_array_tasks_share_one_barrier(make_echo_array):
+    upstream = make_echo_array("up", 1).create_tasks(arg=range(3))
+    array = make_echo_array("down", 2)
+    first = array.create_tasks(upstream_tasks=upstream, barrier=True, arg=[0, 1])
+    second = array.create_tasks(upstream_tasks=upstream, barrier=True, arg=[2])
+
+    (barrier,) = {
+        id(b): b for t in first + second for b in t.upstream_barriers
+    }.values()
+    assert barrier.upstream_tasks == tuple(upstream)
+    assert barrier.downstream_tasks == first + second
+    assert all(not task.upstream_tasks for task in first + second)
+    assert all(not task.downstream_tasks for task in upstream)
+
+    dag = make_dag(upstream, first, second)
+    assert dag.barriers == [barrier]
+    dag.validate()
+
+
+def test_dag_hash_covers_barriers(make_echo_array):
+    def build(barrier):
+        upstream = make_echo_array("up", 1).create_tasks(arg=range(3))
+        downstream = make_echo_array("down", 2).create_tasks(
+            upstream_tasks=upstream if barrier is not None else None,
+            barrier=bool(barrier),
+            arg=range(2),
+        )
+        return hash(make_dag(upstream, downstream))
+
+    # a barrier changes the hash, and hashes differently from the edges it replaces
+    without_dependencies = build(None)
+    assert build(True) != without_dependencies
+    assert build(True) != build(False)
+    assert build(True) == build(True)
+
+
+def test_validate_follows_barriers(make_echo_array):
+    upstream = make_echo_array("up", 1).create_tasks(arg=range(2))
+    downstream = make_echo_array("down", 2).create_tasks(
+        upstream_tasks=upstream, barrier=True, arg=range(2)
+    )
+    with pytest.raises(NodeDependencyNotExistError):
+        make_dag(downstream).validate()
+
+    upstream[0].add_upstream(downstream[1])
+    with pytest.raises(CyclicGraphError):
+        make_dag(upstream, downstream).validate()
+
+
+def test_validate_rejects_barrier_downstream_missing_from_dag(make_echo_array):
+    upstream = make_echo_array("up", 1).create_tasks(arg=range(2))
+    downstream = make_echo_array("down", 2).create_tasks(
+        upstream_tasks=upstream, barrier=True, arg=range(2)
+    )
+    # the second downstream task was created but never added to the workflow
+    dag = make_dag(upstream, downstream[:1])
+    with pytest.raises(NodeDependencyNotExistError):
+        dag.validate()
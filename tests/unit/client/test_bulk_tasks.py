@@ -0,0 +1,140 @@
+import copy
+import itertools
+
+import pytest
+
+from jobmon.client.array import Array
+from jobmon.client.node import Node
+from jobmon.client.task import Task
+
+COMMAND = "python script.py --location {location} --year {year} --data {data} {log}"
+
+
+@pytest.fixture
+def task_template_version(make_task_template_version):
+    return make_task_template_version(
+        COMMAND,
+        node_args=["location", "year"],
+        task_args=["data"],
+        op_args=["log"],
+        template_name="bulk template",
+        task_template_version_id=5,
+        arg_ids={"location": 11, "year": 7, "data": 3, "log": 4},
+    )
+
+
+def make_array(ttv):
+    return Array(
+        task_template_version=ttv,
+        task_args={"data": "/path/to data"},
+        op_args={"log": "--verbose"},
+        cluster_name="dummy",
+        requester=ttv.requester,
+    )
+
+
+def one_at_a_time(array, node_kwargs, **task_kwargs):
+    """Create tasks the way Array.create_tasks did before the bulk path."""
+    tasks = []
+    resource_scales = task_kwargs.pop("resource_scales", None)
+    task_kwargs.setdefault("task_attributes", {})
+    for node_args in Array.expand_dict(**node_kwargs):
+        node = Node(array.task_template_version, node_args, array.requester)
+        task = Task(
+            node=node,
+            task_args=array.task_args,
+            op_args=array.op_args,
+            resource_scales=copy.deepcopy(resource_scales),
+            requester=array.requester,
+            **task_kwargs,
+        )
+        array.add_task(task)
+        tasks.append(task)
+    return tasks
+
+
+def test_bulk_tasks_match_tasks_created_one_at_a_time(task_template_version):
+    upstream = one_at_a_time(
+        make_array(task_template_version), {"location": [0], "year": [0]}
+    )
+    node_kwargs = {"location": [1, "two/2", 3.5], "year": range(2000, 2003)}
+    task_kwargs = dict(
+        max_attempts=4,
+        upstream_tasks=upstream,
+        task_attributes={"release": 9},
+        resource_scales={"memory": 0.5, "runtime": iter([10, 20])},
+    )
+
+    bulk = make_array(task_template_version).create_tasks(
+        **copy.deepcopy(task_kwargs), **node_kwargs
+    )
+    single = one_at_a_time(
+        make_array(task_template_version), node_kwargs, **task_kwargs
+    )
+
+    assert len(bulk) == len(single) == 9
+    for bulk_task, single_task in zip(bulk, single):
+        assert hash(bulk_task) == hash(single_task)
+        assert hash(bulk_task.node) == hash(single_task.node)
+        assert vars(bulk_task.node).keys() == vars(single_task.node).keys()
+        assert bulk_task.node.mapped_node_args == single_task.node.mapped_node_args
+        assert bulk_task.node.node_args_hash == single_task.node.node_args_hash
+
+        bulk_vars, single_vars = vars(bulk_task), vars(single_task)
+        assert bulk_vars.keys() == single_vars.keys()
+        for name in single_vars.keys() - {
+            "node",
+            "_array",
+            "_instance_resource_scales",
+        }:
+            assert bulk_vars[name] == single_vars[name], name
+        assert bulk_task.upstream_tasks == set(upstream)
+        assert bulk_task.node.upstream_nodes == {upstream[0].node}
+
+        # iterator scales are not shared between tasks
+        bulk_scales = bulk_task.resource_scales
+        assert bulk_scales["memory"] == 0.5
+        assert list(bulk_scales["runtime"]) == [10, 20]
+    assert bulk[0].name == "bulk_template_location-1_year-2000"
+    assert bulk[3].name == "bulk_template_location-two_2_year-2000"
+    assert bulk[0].command == (
+        "python script.py --location 1 --year 2000 --data /path/to data --verbose"
+    )
+
+
+def test_bulk_tasks_share_immutable_scales(task_template_version):
+    tasks = make_array(task_template_version).create_tasks(
+        resource_scales={"memory": 0.5}, location=range(3), year=[2000]
+    )
+    assert len({id(task._instance_resource_scales) for task in tasks}) == 1
+    assert tasks[0].resource_scales == {"memory": 0.5}
+
+    with pytest.raises(ValueError, match="already exists"):
+        make_array(task_template_version).create_tasks(location=[1, 1], year=[2000])
+
+
+def test_bulk_creation_work(task_template_version, monkeypatch):
+    """Bulk creation maps the shared args once instead of once per node and task."""
+    node_kwargs = {"location": range(200), "year": range(100)}
+    convert = task_template_version.convert_arg_names_to_ids
+    calls = []
+
+    def counted_convert(**kwargs):
+        calls.append(kwargs)
+        return convert(**kwargs)
+
+    monkeypatch.setattr(
+        task_template_version, "convert_arg_names_to_ids", counted_convert
+    )
+    single = one_at_a_time(make_array(task_template_version), node_kwargs)
+    single_calls = len(calls)
+    calls.clear()
+    bulk = make_array(task_template_version).create_tasks(**node_kwargs)
+
+    assert [hash(task) for task in bulk] == [hash(task) for task in single]
+    # one call per node and one per task, against one for the task args of all
+    assert single_calls == 2 * len(single)
+    assert len(calls) == 1
+    assert list(itertools.islice((task.command for task in bulk), 1)) == [
+        "python script.py --location 0 --year 0 --data /path/to data --verbose"
+    ]
@@ -0,0 +1,122 @@
+import hashlib
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jobmon.client import dag as dag_module
+from jobmon.client.dag import Dag
+from jobmon.client.workflow import Workflow
+from jobmon.core.exceptions import CyclicGraphError
+
+
+def make_dag(tasks):
+    dag = Dag(requester=MagicMock())
+    for task in tasks:
+        dag.add_node(task.node)
+    return dag
+
+
+def chain(make_echo_array, num_tasks):
+    """Two arrays where each downstream task depends on one upstream task."""
+    upstream = make_echo_array("up", 1).create_tasks(arg=range(num_tasks // 2))
+    downstream = make_echo_array("down", 2).create_tasks(arg=range(num_tasks // 2))
+    for up, down in zip(upstream, downstream):
+        down.add_upstream(up)
+    return upstream + downstream
+
+
+def reference_dag_hash(dag):
+    """Dag.__hash__ as it was before it was cached."""
+    hash_value = hashlib.sha256()
+    for node in sorted(dag.nodes):
+        hash_value.update(str(hash(node)).encode("utf-8"))
+        for downstream_node in sorted(node.downstream_nodes):
+            hash_value.update(str(hash(downstream_node)).encode("utf-8"))
+    for barrier in dag.barriers:
+        hash_value.update(f"barrier{barrier.digest()}".encode("utf-8"))
+    return int(hash_value.hexdigest(), 16)
+
+
+def test_hashes_are_unchanged(make_echo_array):
+    tasks = chain(make_echo_array, 20)
+    tasks += make_echo_array("barrier", 3).create_tasks(
+        upstream_tasks=tasks[:3], barrier=True, arg=range(4)
+    )
+    dag = make_dag(tasks)
+    assert dag.__hash__() == reference_dag_hash(dag)
+
+    workflow = Workflow(tool_version=MagicMock(), requester=MagicMock())
+    assert workflow.task_hash == int(hashlib.sha256().hexdigest(), 16)
+    workflow.tasks = {hash(task): task for task in tasks}
+    task_hash = hashlib.sha256()
+    for task in sorted(tasks):
+        task_hash.update(str(hash(task)).encode("utf-8"))
+    assert workflow.task_hash == int(task_hash.hexdigest(), 16)
+
+
+def test_graph_changes_invalidate_the_cache(make_echo_array):
+    tasks = make_echo_array("a", 1).create_tasks(arg=range(3))
+    barrier_tasks = make_echo_array("b", 2).create_tasks(
+        upstream_tasks=tasks[:1], barrier=True, arg=[0]
+    )
+    dag = make_dag(tasks[:2] + barrier_tasks)
+    dag.validate()
+    hashes = [hash(dag)]
+
+    dag.add_node(tasks[2].node)
+    hashes.append(hash(dag))
+    tasks[2].add_upstream(tasks[0])
+    hashes.append(hash(dag))
+    barrier_tasks[0].upstream_barriers[0].add_downstream(tasks[1])
+    assert len({*hashes, hash(dag)}) == 4
+    assert dag.__hash__() == reference_dag_hash(dag)
+    dag.validate()
+
+    # a cycle added after a successful validation is still caught
+    tasks[0].add_upstream(tasks[2])
+    with pytest.raises(CyclicGraphError):
+        dag.validate()
+
+
+@pytest.mark.parametrize(
+    "num_tasks",
+    [
+        100_000,
+        # building a million tasks takes about a minute, so it is opt in
+        pytest.param(
+            1_000_000,
+            marks=pytest.mark.skipif(
+                not os.environ.get("JOBMON_RUN_BENCHMARKS"),
+                reason="set JOBMON_RUN_BENCHMARKS=1 to run the 1M node case",
+            ),
+        ),
+    ],
+)
+def test_hash_and_validate_are_computed_once_per_change(make_echo_array, num_tasks):
+    """A large dag is hashed and validated once, then again after an edge is added."""
+    tasks = chain(make_echo_array, num_tasks)
+    dag = make_dag(tasks)
+    reference = reference_dag_hash(dag)
+
+    is_cyclic = Dag._is_cyclic
+    with patch.object(
+        dag_module.hashlib, "sha256", wraps=hashlib.sha256
+    ) as sha256, patch.object(
+        Dag, "_is_cyclic", autospec=True, side_effect=is_cyclic
+    ) as dfs:
+        assert dag.__hash__() == reference
+        dag.validate()
+        assert (sha256.call_count, dfs.call_count) == (1, 1)
+
+        for _ in range(10):
+            hash(dag)
+            dag.validate()
+        assert (sha256.call_count, dfs.call_count) == (1, 1)
+
+        tasks[-1].add_upstream(tasks[0])
+        for _ in range(10):
+            hash(dag)
+            dag.validate()
+        assert (sha256.call_count, dfs.call_count) == (2, 2)
+    assert dag.__hash__() == reference_dag_hash(dag)
@@ -0,0 +1,81 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from jobmon.client.pipelined_binder import PipelinedBinder
+from jobmon.core.requester import Requester
+
+
+class _RecordingRequester:
+    """Answers each chunk after a short delay and records the chunks in flight."""
+
+    def __init__(self, fail_chunk=None):
+        self.fail_chunk = fail_chunk
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sent = []
+        self.finished = []
+
+    async def send_request_async(self, session, app_route, message, request_type):
+        self.sent.append(message["chunk"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01 if message["chunk"] % 2 else 0.02)
+        self.in_flight -= 1
+        if message["chunk"] == self.fail_chunk:
+            raise RuntimeError("chunk failed")
+        self.finished.append(message["chunk"])
+        return 200, {"chunk": message["chunk"]}
+
+
+def _binder(requester, max_in_flight):
+    binder = PipelinedBinder(MagicMock(spec=Requester), max_in_flight=max_in_flight)
+    binder.requester = requester
+    return binder
+
+
+def test_chunks_sent_within_window():
+    requester = _RecordingRequester()
+    responses = []
+    _binder(requester, 3).run_phase(
+        "tasks",
+        "/route",
+        "put",
+        ({"chunk": i} for i in range(10)),
+        num_items=10,
+        on_response=lambda response: responses.append(response["chunk"]),
+    )
+    assert requester.max_in_flight == 3
+    assert sorted(requester.finished) == list(range(10))
+    assert sorted(responses) == list(range(10))
+
+
+def test_last_chunk_sent_after_others():
+    requester = _RecordingRequester()
+    _binder(requester, 4).run_phase(
+        "edges",
+        "/route",
+        "post",
+        ({"chunk": i} for i in range(6)),
+        num_items=6,
+        send_last_after_others=True,
+    )
+    assert sorted(requester.finished[:-1]) == list(range(5))
+    assert requester.finished[-1] == 5
+
+
+def test_failed_chunk_stops_phase():
+    requester = _RecordingRequester(fail_chunk=1)
+    with pytest.raises(RuntimeError, match="chunk failed"):
+        _binder(requester, 2).run_phase(
+            "tasks",
+            "/route",
+            "put",
+            ({"chunk": i} for i in range(100)),
+            num_items=100,
+            send_last_after_others=True,
+        )
+    # no more chunks are built once the failure is seen, and the last is never sent
+    assert len(requester.sent) < 10
+    assert 99 not in requester.sent
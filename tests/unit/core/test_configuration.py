@@ -499,3 +499,34 @@ def test_conflicting_environment_variables_primitive_vs_nested(monkeypatch, tmp_
     assert isinstance(db_section["sqlalchemy_connect_args"], dict)
     assert db_section["sqlalchemy_connect_args"]["ssl_mode"] == "REQUIRED"
     assert db_section["sqlalchemy_connect_args"]["ssl_cert"] == "/path/to/cert"
+
+
+def test_cached_config_snapshot(monkeypatch, temp_yaml_file):
+    """The cached config is parsed once and invalidated on file or path changes."""
+    import os
+
+    monkeypatch.setenv("JOBMON__CONFIG_FILE", str(temp_yaml_file))
+    monkeypatch.delenv("JOBMON__HTTP__REQUEST_TIMEOUT", raising=False)
+    config = JobmonConfig.reload_cached()
+    loads = JobmonConfig.load_count()
+
+    for _ in range(10):
+        assert JobmonConfig.cached() is config
+    assert JobmonConfig.load_count() == loads
+
+    # environment overrides are still read at lookup time
+    monkeypatch.setenv("JOBMON__HTTP__REQUEST_TIMEOUT", "45")
+    assert JobmonConfig.cached().get_int("http", "request_timeout") == 45
+    monkeypatch.delenv("JOBMON__HTTP__REQUEST_TIMEOUT")
+
+    # editing the file invalidates the snapshot
+    temp_yaml_file.write_text("http:\n  request_timeout: 99\n")
+    stat = os.stat(temp_yaml_file)
+    os.utime(temp_yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert JobmonConfig.cached().get_int("http", "request_timeout") == 99
+    assert JobmonConfig.load_count() == loads + 1
+
+    # an explicit reload always re-parses
+    reloaded = JobmonConfig.reload_cached()
+    assert reloaded is not config
+    assert JobmonConfig.load_count() == loads + 2
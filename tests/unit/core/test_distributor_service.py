@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from jobmon.core.constants import TaskInstanceStatus
+from jobmon.distributor.distributor_service import DistributorService
+from jobmon.distributor.distributor_task_instance import DistributorTaskInstance
+from jobmon.distributor.task_instance_batch import TaskInstanceBatch
+
+LATENCY = 0.02
+
+
+class SlowRequester:
+    """Answers the launch routes after a fixed round trip time."""
+
+    def __init__(self) -> None:
+        self.routes: List[str] = []
+        self.active_requests = 0
+        self.max_active_requests = 0
+        self._lock = threading.Lock()
+
+    def send_request(self, app_route: str, message: Dict, request_type: str) -> Any:
+        with self._lock:
+            self.active_requests += 1
+            self.max_active_requests = max(
+                self.max_active_requests, self.active_requests
+            )
+        time.sleep(LATENCY)
+        with self._lock:
+            self.active_requests -= 1
+            self.routes.append(app_route)
+        if app_route.startswith("/task_resources/"):
+            return 200, {"requested_resources": "{}", "queue_name": "null.q"}
+        return 200, {}
+
+
+class FakeCluster:
+    def __init__(self, concurrent_submission: bool = False) -> None:
+        self._concurrent_submission = concurrent_submission
+        self.active_calls = 0
+        self.max_active_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def concurrent_submission(self) -> bool:
+        return self._concurrent_submission
+
+    def build_worker_node_command(self, **kwargs: Any) -> str:
+        return "worker_node_entry_point"
+
+    def submit_array_to_batch_distributor(
+        self, command: str, name: str, requested_resources: Dict, array_length: int
+    ) -> Dict[int, str]:
+        with self._lock:
+            self.active_calls += 1
+            self.max_active_calls = max(self.max_active_calls, self.active_calls)
+        time.sleep(LATENCY / 4)
+        with self._lock:
+            self.active_calls -= 1
+        return {step: f"{name}.{step}" for step in range(array_length)}
+
+
+def _service_with_batches(
+    cluster: FakeCluster, num_batches: int, batch_size: int = 2
+) -> DistributorService:
+    requester = SlowRequester()
+    service = DistributorService(
+        cluster,  # type: ignore
+        requester=requester,  # type: ignore
+        workflow_run_heartbeat_interval=30,
+        task_instance_heartbeat_interval=90,
+        heartbeat_report_by_buffer=3.1,
+        distributor_poll_interval=10,
+        full_sync_interval=600,
+        max_concurrent_commands=8,
+        raise_on_error=True,
+    )
+    service.workflow_run = MagicMock(workflow_run_id=1)
+
+    task_instance_id = 0
+    for batch_number in range(num_batches):
+        batch = TaskInstanceBatch(
+            array_id=1,
+            array_name="array",
+            array_batch_num=batch_number,
+            task_resources_id=1,
+            requester=requester,  # type: ignore
+        )
+        service._task_instance_batches[(1, batch_number)] = batch
+        for _ in range(batch_size):
+            task_instance_id += 1
+            task_instance = DistributorTaskInstance(
+                task_instance_id, 1, TaskInstanceStatus.INSTANTIATED, requester  # type: ignore
+            )
+            batch.add_task_instance(task_instance)
+            service._task_instances[task_instance_id] = task_instance
+            service._task_instance_status_map[TaskInstanceStatus.INSTANTIATED].add(
+                task_instance
+            )
+    return service
+
+
+def _assert_all_launched(service: DistributorService, num_task_instances: int) -> None:
+    status_map = service._task_instance_status_map
+    assert len(status_map[TaskInstanceStatus.INSTANTIATED]) == 0
+    assert len(status_map[TaskInstanceStatus.LAUNCHED]) == num_task_instances
+    assert all(ti.distributor_id for ti in status_map[TaskInstanceStatus.LAUNCHED])
+    assert not service._task_instance_batches
+
+
+def test_launch_records_batch_in_one_request():
+    """Each batch is recorded as launched after its resources load and submission."""
+    service = _service_with_batches(FakeCluster(), num_batches=3)
+    asyncio.run(service.process_status_async(TaskInstanceStatus.INSTANTIATED))
+
+    _assert_all_launched(service, 6)
+    routes = service.requester.routes  # type: ignore
+    # one round trip to load resources and one to record the launch per batch
+    assert routes.count("/task_resources/1") == 3
+    assert routes.count("/array/1/launch_batch") == 3
+    assert len(routes) == 6
+    assert routes.index("/task_resources/1") < routes.index("/array/1/launch_batch")
+
+
+def test_cluster_calls_serialized_unless_concurrent():
+    serial_cluster = FakeCluster(concurrent_submission=False)
+    service = _service_with_batches(serial_cluster, num_batches=16)
+    asyncio.run(service.process_status_async(TaskInstanceStatus.INSTANTIATED))
+    assert serial_cluster.max_active_calls == 1
+
+    concurrent_cluster = FakeCluster(concurrent_submission=True)
+    service = _service_with_batches(concurrent_cluster, num_batches=16)
+    asyncio.run(service.process_status_async(TaskInstanceStatus.INSTANTIATED))
+    assert concurrent_cluster.max_active_calls > 1
+
+
+def test_concurrent_launch_overlaps_round_trips():
+    """Launching many batches overlaps their HTTP round trips."""
+    num_batches = 24
+
+    service = _service_with_batches(FakeCluster(), num_batches)
+    service.process_status(TaskInstanceStatus.INSTANTIATED)
+    _assert_all_launched(service, num_batches * 2)
+    assert service.requester.max_active_requests == 1  # type: ignore
+
+    service = _service_with_batches(FakeCluster(), num_batches)
+    asyncio.run(service.process_status_async(TaskInstanceStatus.INSTANTIATED))
+    _assert_all_launched(service, num_batches * 2)
+    # round trips overlap, up to max_concurrent_commands at once
+    assert 1 < service.requester.max_active_requests <= 8  # type: ignore
+
+
+def test_command_errors_propagate():
+    service = _service_with_batches(FakeCluster(), num_batches=4)
+
+    def broken(task_instance_batch: TaskInstanceBatch) -> None:
+        raise RuntimeError("boom")
+
+    service.launch_task_instance_batch = broken  # type: ignore
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(service.process_status_async(TaskInstanceStatus.INSTANTIATED))
+    # the status map is still consistent
+    assert len(service._task_instance_status_map[TaskInstanceStatus.INSTANTIATED]) == 8
@@ -0,0 +1,124 @@
+import http.server
+import threading
+
+import pytest
+
+from jobmon.core import http_session
+from jobmon.core.configuration import JobmonConfig
+from jobmon.core.http_session import (
+    PoolSettings,
+    close_pooled_sessions,
+    get_connection_stats,
+    get_pooled_session,
+)
+from jobmon.core.requester import Requester
+
+
+class _KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def keep_alive_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    close_pooled_sessions()
+    yield
+    close_pooled_sessions()
+
+
+def test_pool_settings_from_config(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "http:\n  pool_maxsize: 32\n  keep_alive: false\n  service_url: ''\n"
+    )
+    settings = PoolSettings.from_config(JobmonConfig(filepath=str(config_file)))
+
+    # explicit values are honoured, missing keys fall back to the defaults
+    assert settings.pool_maxsize == 32
+    assert settings.keep_alive is False
+    assert settings.pool_connections == PoolSettings().pool_connections
+    assert settings.pool_block is False
+
+
+def test_sessions_shared_per_settings():
+    a = get_pooled_session(PoolSettings())
+    b = get_pooled_session(PoolSettings())
+    c = get_pooled_session(PoolSettings(pool_maxsize=2))
+    assert a is b
+    assert a is not c
+    assert a.session.headers["Connection"] == "keep-alive"
+    assert (
+        get_pooled_session(PoolSettings(keep_alive=False)).session.headers["Connection"]
+        == "close"
+    )
+
+
+def test_session_recreated_after_fork(monkeypatch):
+    pooled = get_pooled_session()
+    original = pooled.session
+    monkeypatch.setattr(http_session.os, "getpid", lambda: -1)
+    assert pooled.session is not original
+
+
+def test_requester_reuses_connections(keep_alive_server):
+    requester = Requester(keep_alive_server, retries_attempts=1)
+    for _ in range(5):
+        rc, content = requester.send_request("/time", {}, "get", tenacious=False)
+        assert rc == 200
+        assert content == {"ok": True}
+
+    stats = requester.connection_stats()
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 4
+    assert get_connection_stats() == stats
+
+
+def test_requester_without_keep_alive(keep_alive_server):
+    requester = Requester(
+        keep_alive_server, pool_settings=PoolSettings(keep_alive=False)
+    )
+    for _ in range(3):
+        requester.send_request("/time", {}, "get", tenacious=False)
+
+    stats = requester.connection_stats()
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 3
+    assert stats["reused_connections"] == 0
+
+
+def test_from_defaults_shares_requesters(monkeypatch):
+    monkeypatch.setenv("JOBMON__HTTP__SERVICE_URL", "http://one.example")
+    loads = JobmonConfig.load_count()
+    first = Requester.from_defaults()
+    assert Requester.from_defaults() is first
+    assert JobmonConfig.load_count() <= loads + 1
+
+    # a different service url resolves to a different shared requester
+    monkeypatch.setenv("JOBMON__HTTP__SERVICE_URL", "http://two.example")
+    second = Requester.from_defaults()
+    assert second is not first
+    assert second.url.startswith("http://two.example")
+
+    # reload discards the cached instances
+    assert Requester.reload() is not second
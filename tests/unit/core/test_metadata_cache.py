@@ -0,0 +1,91 @@
+from unittest import mock
+
+from jobmon.core.cluster import Cluster
+from jobmon.core.metadata_cache import MetadataCache
+from jobmon.core.requester import Requester
+
+
+def _requester(url, responses):
+    requester = Requester(url)
+    requester.send_request = mock.Mock(side_effect=lambda **kwargs: responses.pop(0))
+    return requester
+
+
+def test_lookups_are_shared_per_server_url():
+    cache = MetadataCache(ttl=60)
+    first = _requester("http://a", [(200, {"tool": [1, "t"]})])
+    second = _requester("http://a", [])
+    other_server = _requester("http://b", [(200, {"tool": [7, "t"]})])
+
+    for requester in [first, second, first]:
+        _, response = cache.send_request(requester, "/tool", {"name": "t"}, "post")
+        assert response == {"tool": [1, "t"]}
+        # callers get their own copy
+        response["tool"][0] = 99
+    _, response = cache.send_request(other_server, "/tool", {"name": "t"}, "post")
+    assert response == {"tool": [7, "t"]}
+    assert first.send_request.call_count == 1
+    assert cache.requests_avoided == 2
+
+
+def test_refresh_and_keep():
+    cache = MetadataCache(ttl=60)
+    requester = _requester(
+        "http://a",
+        [
+            (200, {"cluster": None}),
+            (200, {"cluster": [1, "c"]}),
+            (200, {"cluster": [1, "c", "updated"]}),
+        ],
+    )
+
+    def load():
+        return cache.send_request(
+            requester,
+            "/cluster/c",
+            {},
+            "get",
+            keep=lambda response: response["cluster"] is not None,
+        )[1]["cluster"]
+
+    # empty lookups are not kept
+    assert load() is None
+    assert load() == [1, "c"]
+    assert load() == [1, "c"]
+    cache.refresh("http://other")
+    assert load() == [1, "c"]
+    cache.refresh("http://a")
+    assert load() == [1, "c", "updated"]
+    assert requester.send_request.call_count == 3
+
+
+def test_expired_and_disabled():
+    requester = _requester("http://a", [(200, {"queue": [1]})] * 4)
+    with mock.patch("jobmon.core.metadata_cache.time.monotonic", return_value=0):
+        cache = MetadataCache(ttl=10)
+        cache.send_request(requester, "/q", {}, "get")
+        cache.send_request(requester, "/q", {}, "get")
+    with mock.patch("jobmon.core.metadata_cache.time.monotonic", return_value=11):
+        cache.send_request(requester, "/q", {}, "get")
+    assert requester.send_request.call_count == 2
+
+    disabled = MetadataCache(ttl=0)
+    disabled.send_request(requester, "/q", {}, "get")
+    disabled.send_request(requester, "/q", {}, "get")
+    assert requester.send_request.call_count == 4
+
+
+def test_clusters_share_queue_lookups():
+    cache = MetadataCache(ttl=60)
+    requester = _requester(
+        "http://a",
+        [
+            (200, {"cluster": [1, "dummy", "dummy", "{}"]}),
+            (200, {"queue": [1, "null.q", "{}"]}),
+        ],
+    )
+    with mock.patch("jobmon.core.cluster.get_metadata_cache", return_value=cache):
+        for _ in range(3):
+            cluster = Cluster.get_cluster("dummy", requester)
+            assert cluster.get_queue("null.q").queue_name == "null.q"
+    assert requester.send_request.call_count == 2
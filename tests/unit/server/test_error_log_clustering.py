@@ -1,11 +1,13 @@
 import random
+import time
+import uuid
 
-import nltk
 import pandas as pd
 
-from jobmon.server.web.error_log_clustering import cluster_error_logs
-
-nltk.download("punkt_tab")
+from jobmon.server.web.error_log_clustering import (
+    cluster_error_logs,
+    normalize_error_logs,
+)
 
 
 def test_cluster_error_logs():
@@ -125,3 +127,103 @@ RuntimeError: Unexpected error occurred while processing task.""",
     input_df = pd.DataFrame(input_data)
     output_df = cluster_error_logs(input_df)
     assert output_df.shape[0] == 5
+
+
+def _error_logs(logs):
+    return pd.DataFrame(
+        [
+            {
+                "error": None,
+                "error_time": "Mon, 15 Jul 2024 18:05:45 GMT",
+                "task_id": i + 1,
+                "task_instance_err_id": i + 100,
+                "task_instance_id": i + 1000,
+                "task_instance_stderr_log": log,
+                "workflow_id": 1,
+                "workflow_run_id": 1,
+            }
+            for i, log in enumerate(logs)
+        ]
+    )
+
+
+def test_normalize_error_logs():
+    templates = normalize_error_logs(
+        pd.Series(
+            [
+                "FileNotFoundError: [Errno 2] No such file: '/mnt/share/loc_12/d.h5'",
+                "job 1b4e28ba-2fa1-11d2-883f-0016d3cca427 killed after 12.5 seconds",
+                "segfault at 0x7ffd5e8c in   worker\n  pid 4242",
+                "JOB 81 CANCELLED AT 2024-07-15T18:05:45 DUE TO TIME LIMIT",
+                None,
+            ]
+        )
+    )
+    assert list(templates) == [
+        "FileNotFoundError: [Errno <NUM>] No such file: '<PATH>'",
+        "job <UUID> killed after <NUM> seconds",
+        "segfault at <HEX> in worker pid <NUM>",
+        "JOB <NUM> CANCELLED AT <TIME> DUE TO TIME LIMIT",
+        "",
+    ]
+
+
+def test_cluster_error_logs_by_template():
+    logs = [f"MemoryError: unable to allocate {i} MiB" for i in range(10)] + [
+        f"No such file: /ihme/loc_{i}/draws.csv" for i in range(5)
+    ]
+    input_df = _error_logs(logs)
+    input_df.loc[0, "task_instance_stderr_log"] = ""
+    input_df.loc[0, "error"] = "MemoryError: unable to allocate 99 MiB"
+
+    output_df = cluster_error_logs(input_df, batch_size=4)
+    assert list(output_df["group_instance_count"]) == [10, 5]
+    assert sorted(output_df.loc[0, "task_ids"]) == list(range(1, 11))
+    assert output_df.loc[0, "sample_error"] == "MemoryError: unable to allocate 99 MiB"
+    assert output_df.loc[1, "sample_error"] == "No such file: /ihme/loc_0/draws.csv"
+    assert output_df["error_score"].between(0, 1).all()
+
+
+def test_cluster_error_logs_caps():
+    input_df = _error_logs(
+        [f"error {i % 3} of kind {chr(97 + i % 3)}" for i in range(30)]
+    )
+    # the first ten logs are clustered, in batches of four
+    output_df = cluster_error_logs(input_df, batch_size=4, max_rows=10)
+    assert output_df["group_instance_count"].sum() == 10
+
+    # the first batch is always clustered, even when no time is allowed
+    output_df = cluster_error_logs(input_df, batch_size=4, max_seconds=0)
+    assert output_df["group_instance_count"].sum() == 4
+
+    assert cluster_error_logs(input_df.iloc[:0]).empty
+
+
+def test_cluster_error_logs_synthetic_corpus():
+    """A large corpus is clustered by template without a dense matrix."""
+    error_types = [
+        'File "/ihme/code/model_{i}/run.py", line {n}, in main\n'
+        "MemoryError: unable to allocate {n} MiB for an array at 0x{h:x}",
+        "FileNotFoundError: [Errno 2] No such file: '/mnt/share/loc_{i}/d_{n}.h5'",
+        "job {u} killed by signal 9 after {n}.{i} seconds",
+        "ValueError: location_id {i} has {n} missing values",
+        "JOB {n} ON node-{i} CANCELLED AT 2024-07-15T18:05:45 DUE TO TIME LIMIT",
+    ]
+    num_logs = 200_000
+    rng = random.Random(0)
+    input_df = _error_logs(
+        error_types[i % len(error_types)].format(
+            i=i,
+            n=rng.randint(1, 10**6),
+            h=rng.getrandbits(48),
+            u=uuid.UUID(int=rng.getrandbits(128)),
+        )
+        for i in range(num_logs)
+    )
+
+    start = time.perf_counter()
+    output_df = cluster_error_logs(input_df)
+    elapsed = time.perf_counter() - start
+
+    assert list(output_df["group_instance_count"]) == [num_logs // 5] * 5
+    assert elapsed < 30
@@ -0,0 +1,52 @@
+import random
+
+import numpy as np
+import pytest
+
+from jobmon.server.web.utils.quantile_sketch import QuantileSketch
+
+
+def _sketch(values, **kwargs):
+    sketch = QuantileSketch(**kwargs)
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+def test_small_samples_are_exact():
+    values = [300.0, 900.0, 600.0, 450.0]
+    sketch = QuantileSketch.from_json(_sketch(values).to_json())
+    assert sketch.quantile(0.5) == np.median(values)
+    assert sketch.quantile(0.9) == np.quantile(values, 0.9)
+    assert QuantileSketch().quantile(0.5) is None
+
+
+@pytest.mark.parametrize("q", [0.01, 0.25, 0.5, 0.75, 0.99])
+def test_bucketed_quantiles_within_relative_accuracy(q):
+    rng = random.Random(0)
+    values = [rng.lognormvariate(20, 2) for _ in range(20_000)]
+    values += [-rng.uniform(1, 100) for _ in range(2_000)] + [0.0] * 500
+    sketch = _sketch(values, exact_limit=100)
+    assert sketch.values is None
+    assert len(sketch.positive) + len(sketch.negative) < 2_000
+
+    expected = sorted(values)[int(q * (len(values) - 1))]
+    assert sketch.quantile(q) == pytest.approx(expected, rel=0.01, abs=1e-9)
+
+
+def test_merge_equals_sketch_of_both_samples():
+    rng = random.Random(1)
+    left = [rng.uniform(1, 1000) for _ in range(700)]
+    right = [rng.uniform(1, 1000) for _ in range(700)]
+
+    merged = _sketch(left)
+    merged.merge(QuantileSketch.from_json(_sketch(right).to_json()))
+    combined = _sketch(left + right)
+    assert merged.count == combined.count == 1400
+    assert merged.positive == combined.positive
+    assert merged.quantile(0.5) == combined.quantile(0.5)
+
+    # merging into a bucketed sketch keeps every value
+    merged.merge(_sketch([5.0, 6.0]))
+    assert merged.count == 1402
+    assert sum(merged.positive.values()) == 1402
@@ -7,10 +7,13 @@ responses, without requiring a running server.
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Iterator
 from unittest.mock import MagicMock
 
 import pytest
+import requests
 
+import jobmon.client.swarm.builder as builder_module
 from jobmon.client.swarm.array import SwarmArray
 from jobmon.client.swarm.builder import SwarmBuilder
 from jobmon.client.swarm.state import SwarmState
@@ -88,6 +91,21 @@ def mock_workflow() -> MagicMock:
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+def _streamed_task(task_id: int) -> dict:
+    return {
+        "task_id": task_id,
+        "array_id": 1,
+        "status": TaskStatus.REGISTERING,
+        "max_attempts": 3,
+        "resource_scales": {"memory": 0.5, "runtime": [10, 20]},
+        "fallback_queues": ["null.q"],
+        "requested_resources": {"memory": 1},
+        "cluster_name": "dummy",
+        "queue_name": "null.q",
+        "array_concurrency": 10,
+    }
+
+
 class TestBuilderInitialization:
     """Test SwarmBuilder initialization."""
 
@@ -376,9 +394,9 @@ class TestBuildFromWorkflowId:
             (200, {"status": WorkflowRunStatus.LINKING}),  # heartbeat
             (200, {"workflow": [100, 50, 500]}),  # metadata
             (200, {"time": now}),  # server time
-            (200, {"tasks": {}}),  # empty tasks (done)
             (200, {"status": WorkflowRunStatus.BOUND}),  # status update
         ]
+        mock_requester.stream_request.return_value = iter([])  # no tasks
 
         builder.build_from_workflow_id(100)
 
@@ -417,15 +435,113 @@ class TestBuildFromWorkflowId:
             (200, {"workflow": [100, 50, 500]}),  # metadata
             (200, {"time": now}),  # server time
             (200, {"status": WorkflowRunStatus.LINKING}),  # heartbeat during tasks
-            (200, {"tasks": {}}),  # empty tasks
             (200, {"status": WorkflowRunStatus.BOUND}),  # status update
         ]
+        mock_requester.stream_request.return_value = iter([])  # no tasks
 
         builder.build_from_workflow_id(100)
 
         # Should have called send_request multiple times for heartbeats
         assert mock_requester.send_request.call_count >= 4
 
+    def test_set_tasks_from_db_streams_pages(
+        self,
+        builder: SwarmBuilder,
+        mock_requester: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that streamed tasks are paged by the last task id received."""
+        monkeypatch.setattr(builder_module, "Cluster", MagicMock())
+        mock_requester.send_request.return_value = (
+            200,
+            {"time": datetime.now(), "status": WorkflowRunStatus.LINKING},
+        )
+        builder._workflow_id = 100
+        builder._dag_id = 50
+        builder._max_concurrently_running = 500
+
+        mock_requester.stream_request.side_effect = [
+            iter([_streamed_task(1), _streamed_task(2)]),
+            iter([_streamed_task(3)]),
+        ]
+
+        builder._set_tasks_from_db(page_size=2)
+
+        messages = [
+            call.kwargs["message"] for call in mock_requester.stream_request.mock_calls
+        ]
+        assert messages == [
+            {"after_task_id": 0, "page_size": 2},
+            {"after_task_id": 2, "page_size": 2},
+        ]
+        assert set(builder.state.tasks) == {1, 2, 3}
+        assert builder.state.arrays[1].max_concurrently_running == 10
+        task = builder.state.tasks[1]
+        assert task.resource_scales["memory"] == 0.5
+        assert list(task.resource_scales["runtime"]) == [10, 20]
+
+    def test_set_tasks_from_db_reopens_broken_stream(
+        self,
+        builder: SwarmBuilder,
+        mock_requester: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a broken stream is reopened after the last task received."""
+        monkeypatch.setattr(builder_module, "Cluster", MagicMock())
+        mock_requester.send_request.return_value = (
+            200,
+            {"time": datetime.now(), "status": WorkflowRunStatus.LINKING},
+        )
+        builder._workflow_id = 100
+        builder._dag_id = 50
+        builder._max_concurrently_running = 500
+
+        def broken_stream() -> Iterator[dict]:
+            yield _streamed_task(1)
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        mock_requester.stream_request.side_effect = [
+            broken_stream(),
+            iter([_streamed_task(2), _streamed_task(3)]),
+            iter([]),
+        ]
+
+        builder._set_tasks_from_db(page_size=2)
+
+        messages = [
+            call.kwargs["message"] for call in mock_requester.stream_request.mock_calls
+        ]
+        assert messages == [
+            {"after_task_id": 0, "page_size": 2},
+            {"after_task_id": 1, "page_size": 2},
+            {"after_task_id": 3, "page_size": 2},
+        ]
+        assert set(builder.state.tasks) == {1, 2, 3}
+
+    def test_set_tasks_from_db_gives_up_on_repeated_breaks(
+        self,
+        builder: SwarmBuilder,
+        mock_requester: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a stream which keeps breaking is retried a bounded number of times."""
+        monkeypatch.setattr(builder_module, "Cluster", MagicMock())
+        mock_requester.send_request.return_value = (
+            200,
+            {"time": datetime.now(), "status": WorkflowRunStatus.LINKING},
+        )
+        builder._workflow_id = 100
+        builder._dag_id = 50
+        builder._max_concurrently_running = 500
+        mock_requester.stream_request.side_effect = requests.exceptions.ConnectionError(
+            "refused"
+        )
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            builder._set_tasks_from_db(page_size=2, max_stream_retries=2)
+
+        assert mock_requester.stream_request.call_count == 3
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Edge Cases
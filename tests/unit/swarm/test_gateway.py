@@ -255,6 +255,23 @@ class TestStateSynchronization:
         call_kwargs = mock_requester.send_request_async.call_args.kwargs
         assert call_kwargs["app_route"] == "/workflow/100/get_max_concurrently_running"
 
+    @pytest.mark.asyncio
+    async def test_get_concurrency_limits(
+        self, gateway: ServerGateway, mock_requester: MagicMock
+    ) -> None:
+        """Test workflow and array concurrency fetch in one request."""
+        mock_requester.send_request_async.return_value = (
+            200,
+            {"max_concurrently_running": 500, "array_limits": {"42": 100, "43": 7}},
+        )
+
+        result = await gateway.get_concurrency_limits()
+
+        assert result.max_concurrently_running == 500
+        assert result.array_limits == {42: 100, 43: 7}
+        call_kwargs = mock_requester.send_request_async.call_args.kwargs
+        assert call_kwargs["app_route"] == "/workflow/100/concurrency_limits"
+
     @pytest.mark.asyncio
     async def test_get_array_concurrency(
         self, gateway: ServerGateway, mock_requester: MagicMock
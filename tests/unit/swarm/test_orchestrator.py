@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from jobmon.client.swarm.gateway import (
+    ConcurrencyLimitsResponse,
     HeartbeatResponse,
     QueueResponse,
     StatusUpdateResponse,
@@ -92,8 +93,11 @@ def mock_gateway():
     )
 
     # Default concurrency queries
-    gateway.get_workflow_concurrency = AsyncMock(return_value=100)
-    gateway.get_array_concurrency = AsyncMock(return_value=50)
+    gateway.get_concurrency_limits = AsyncMock(
+        return_value=ConcurrencyLimitsResponse(
+            max_concurrently_running=100, array_limits={}
+        )
+    )
 
     # Default queue behavior
     gateway.queue_task_batch = AsyncMock(
@@ -123,6 +127,8 @@ def mock_task():
         task.all_upstreams_done = all_upstreams_done
         task.num_upstreams_done = 0
         task.downstream_swarm_tasks = set()
+        task.iter_downstreams = lambda: iter(task.downstream_swarm_tasks)
+        task._barriers = ()
         task.compute_resources_callable = None
         task.resource_scales = {}
         task.fallback_queues = []
@@ -1378,7 +1384,11 @@ class TestSyncOperations:
         self, pending_state, mock_gateway, default_config
     ):
         """Test that _do_sync updates max_concurrently_running."""
-        mock_gateway.get_workflow_concurrency = AsyncMock(return_value=200)
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            return_value=ConcurrencyLimitsResponse(
+                max_concurrently_running=200, array_limits={}
+            )
+        )
 
         orchestrator = WorkflowRunOrchestrator(
             pending_state, mock_gateway, default_config
@@ -1392,7 +1402,11 @@ class TestSyncOperations:
         self, pending_state, mock_gateway, default_config
     ):
         """Test that _do_sync updates array concurrency limits."""
-        mock_gateway.get_array_concurrency = AsyncMock(return_value=75)
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            return_value=ConcurrencyLimitsResponse(
+                max_concurrently_running=100, array_limits={1: 75}
+            )
+        )
 
         orchestrator = WorkflowRunOrchestrator(
             pending_state, mock_gateway, default_config
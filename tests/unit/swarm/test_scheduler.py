@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+import jobmon.client.swarm.services.scheduler as scheduler_module
 from jobmon.client.swarm.gateway import QueueResponse
 from jobmon.client.swarm.services.scheduler import (
     BatchResult,
@@ -453,6 +455,111 @@ class TestSchedulerBatchGeneration:
         # First batch should be capped at MAX_BATCH_SIZE
         assert len(batches[0]) <= Scheduler.MAX_BATCH_SIZE
 
+    def test_generate_batches_fifo_across_groups(self, scheduler):
+        """Batches start from the group holding the oldest remaining task."""
+        scheduler._state.arrays[20] = create_mock_array(20)
+        res_a = MagicMock(is_bound=True, id=1)
+        res_b = MagicMock(is_bound=True, id=2)
+        layout = [(10, res_a), (20, res_b), (10, res_a), (10, res_b), (20, res_b)]
+        for i, (array_id, resources) in enumerate(layout):
+            task = create_mock_task(i, array_id, task_resources=resources)
+            scheduler._state.ready_to_run.append(task)
+            scheduler._state.tasks[i] = task
+
+        batches = list(scheduler._generate_batches())
+
+        assert [[t.task_id for t in b] for b in batches] == [[0, 2], [1, 4], [3]]
+
+    def test_generate_batches_restores_order_when_stopped_early(self, scheduler):
+        """Closing the generator early returns unscheduled tasks in FIFO order."""
+        scheduler._state.arrays[20] = create_mock_array(20)
+        res_a = MagicMock(is_bound=True, id=1)
+        res_b = MagicMock(is_bound=True, id=2)
+        for i in range(6):
+            array_id, resources = (10, res_a) if i % 2 == 0 else (20, res_b)
+            task = create_mock_task(i, array_id, task_resources=resources)
+            scheduler._state.ready_to_run.append(task)
+            scheduler._state.tasks[i] = task
+
+        gen = scheduler._generate_batches()
+        first = next(gen)
+        gen.close()
+
+        assert [t.task_id for t in first] == [0, 2, 4]
+        assert [t.task_id for t in scheduler._state.ready_to_run] == [1, 3, 5]
+
+    def test_generate_batches_scales_linearly(
+        self, mock_gateway, task_status_map, monkeypatch
+    ):
+        """Batching work grows linearly with ready tasks.
+
+        The number of arrays grows with the number of tasks, which made the old
+        full-queue rescan per batch quadratic. Work is counted as queue reads plus
+        heap operations rather than timed, so the test does not depend on load.
+        """
+        from types import SimpleNamespace
+
+        work = {"dequeue": 0, "heap": 0}
+
+        def counted(name):
+            def wrapper(heap, *args):
+                work["heap"] += len(heap) if name == "heapify" else 1
+                return getattr(heapq, name)(heap, *args)
+
+            return wrapper
+
+        monkeypatch.setattr(
+            scheduler_module,
+            "heapq",
+            SimpleNamespace(
+                heapify=counted("heapify"),
+                heappop=counted("heappop"),
+                heappush=counted("heappush"),
+            ),
+        )
+
+        def count_batch_work(num_tasks: int) -> int:
+            num_arrays = num_tasks // Scheduler.MAX_BATCH_SIZE
+            arrays = {
+                aid: create_mock_array(aid, num_tasks) for aid in range(num_arrays)
+            }
+            resources = {aid: ("resources", aid) for aid in arrays}
+            state = create_swarm_state(
+                arrays=arrays,
+                task_status_map=task_status_map,
+                max_concurrently_running=num_tasks,
+            )
+            for i in range(num_tasks):
+                aid = i % num_arrays
+                state.ready_to_run.append(
+                    SimpleNamespace(
+                        task_id=i, array_id=aid, current_task_resources=resources[aid]
+                    )
+                )
+            dequeue_task = state.dequeue_task
+
+            def counted_dequeue():
+                work["dequeue"] += 1
+                return dequeue_task()
+
+            state.dequeue_task = counted_dequeue
+            scheduler = Scheduler(gateway=mock_gateway, state=state)
+
+            work.update(dequeue=0, heap=0)
+            batches = list(scheduler._generate_batches())
+
+            assert sum(len(b) for b in batches) == num_tasks
+            assert len(batches) == num_arrays
+            # every task is read from the queue once, however many batches there are
+            assert work["dequeue"] == num_tasks
+            return work["dequeue"] + work["heap"]
+
+        small = count_batch_work(10_000)
+        large = count_batch_work(50_000)
+
+        # 5x the tasks (and 5x the arrays) costs ~25x if batching is quadratic
+        assert large <= 5 * small
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Test Queue Batch
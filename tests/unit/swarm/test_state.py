@@ -6,7 +6,10 @@ a running server or full workflow setup.
 
 from __future__ import annotations
 
+import os
+import tracemalloc
 from datetime import datetime
+from typing import Iterator
 from unittest.mock import MagicMock
 
 import pytest
@@ -15,6 +18,7 @@ from jobmon.client.swarm.state import (
     StateUpdate,
     SwarmState,
 )
+from jobmon.client.swarm.task import SwarmBarrier, SwarmTask
 from jobmon.core.constants import TaskStatus
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -37,6 +41,10 @@ class MockSwarmTask:
         self.downstream_swarm_tasks: set[MockSwarmTask] = set()
         self.num_upstreams: int = 0
         self.num_upstreams_done: int = 0
+        self._barriers: tuple = ()
+
+    def iter_downstreams(self) -> Iterator[MockSwarmTask]:
+        return iter(self.downstream_swarm_tasks)
 
     @property
     def all_upstreams_done(self) -> bool:
@@ -339,6 +347,42 @@ class TestSwarmStateQueries:
         # Non-existent array
         assert state_with_tasks.get_array_capacity(999) == 0
 
+    def test_get_array_capacities(self, state_with_tasks: SwarmState) -> None:
+        """Test the bulk capacity lookup used by the scheduler."""
+        assert state_with_tasks.get_array_capacities() == {1: 48, 2: 30}
+        assert state_with_tasks.get_array_active_count(1) == 2
+        assert state_with_tasks.get_array_active_count(2) == 0
+        assert state_with_tasks.get_status_count(TaskStatus.QUEUED) == 1
+        assert state_with_tasks.get_status_count(TaskStatus.ERROR_RECOVERABLE) == 0
+
+    def test_array_counters_follow_status_changes(
+        self, state_with_tasks: SwarmState
+    ) -> None:
+        """Per-array counters are updated incrementally as statuses change."""
+        state = state_with_tasks
+        state.update_task_status(1, TaskStatus.QUEUED)  # array 1 -> 3 active
+        state.apply_update(
+            StateUpdate(
+                task_statuses={
+                    3: TaskStatus.RUNNING,  # active -> active, no change
+                    4: TaskStatus.DONE,  # array 1 -> 2 active
+                    5: TaskStatus.LAUNCHED,  # array 2 -> 1 active
+                }
+            )
+        )
+
+        assert state._active_by_array == {1: 2, 2: 1}
+        assert state.get_array_capacities() == {1: 48, 2: 29}
+
+    def test_array_counters_rebuilt_after_direct_mutation(
+        self, state_with_tasks: SwarmState
+    ) -> None:
+        """Buckets changed behind the state's back trigger a rebuild."""
+        extra = MockSwarmTask(7, array_id=2, status=TaskStatus.RUNNING)
+        state_with_tasks._task_status_map[TaskStatus.RUNNING].add(extra)  # type: ignore
+
+        assert state_with_tasks.get_array_capacity(2) == 29
+
     def test_get_percent_done(self, state_with_tasks: SwarmState) -> None:
         """Test calculating percent done."""
         # 1 done out of 6 tasks = 16.67%
@@ -583,3 +627,204 @@ class TestSwarmStateInitializationHelpers:
 
         assert task2.num_upstreams_done == 1
         assert task3.num_upstreams_done == 1
+
+
+class TestSwarmStateCompactDependencies:
+    """Tests for the compacted downstream graph."""
+
+    @staticmethod
+    def _swarm_task(task_id: int, status: str = TaskStatus.REGISTERING) -> SwarmTask:
+        return SwarmTask(
+            task_id=task_id,
+            array_id=1,
+            status=status,
+            max_attempts=3,
+            task_resources=None,  # type: ignore
+            cluster=None,  # type: ignore
+        )
+
+    def test_compacted_graph_preserves_edges(self, state: SwarmState) -> None:
+        """Test downstream views and completion propagation after compaction."""
+        tasks = [self._swarm_task(i) for i in range(1, 5)]
+        # 1 -> 2, 3; 2 -> 4; 3 -> 4
+        tasks[0].downstream_swarm_tasks = [tasks[1], tasks[2], tasks[1]]
+        tasks[1].set_downstreams([tasks[3]])
+        tasks[2].set_downstreams([tasks[3]])
+        tasks[1].num_upstreams = tasks[2].num_upstreams = 1
+        tasks[3].num_upstreams = 2
+        for task in tasks:
+            state.add_task(task)
+
+        state.compact_dependencies()
+
+        assert tasks[0].downstream_swarm_tasks == {tasks[1], tasks[2]}
+        assert tasks[3].downstream_tasks == []
+        assert not hasattr(tasks[0], "__dict__")
+
+        state.apply_update(StateUpdate(task_statuses={1: TaskStatus.DONE}))
+        newly_ready = state.propagate_completions({tasks[0]})
+        assert {t.task_id for t in newly_ready} == {2, 3}
+
+        # replacing the edges of a compacted task leaves the other tasks intact
+        tasks[3].set_downstreams([tasks[0]])
+        assert tasks[3].downstream_swarm_tasks == {tasks[0]}
+        assert tasks[1].downstream_swarm_tasks == {tasks[3]}
+
+    @pytest.mark.parametrize(
+        "n",
+        [
+            100_000,
+            # building a million tasks twice takes a while, so it is opt in
+            pytest.param(
+                1_000_000,
+                marks=pytest.mark.skipif(
+                    not os.environ.get("JOBMON_RUN_BENCHMARKS"),
+                    reason="set JOBMON_RUN_BENCHMARKS=1 to run the 1M task case",
+                ),
+            ),
+        ],
+    )
+    def test_compacted_graph_memory(self, n: int) -> None:
+        """Test per-task memory of a task chain against a dict-and-set task."""
+
+        class LegacyTask:
+            def __init__(self, task_id: int) -> None:
+                self.task_id = task_id
+                self.array_id = 1
+                self.status = TaskStatus.REGISTERING
+                self.downstream_swarm_tasks: set = set()
+                self.current_task_resources = None
+                self.compute_resources_callable = None
+                self.fallback_queues = None
+                self.resource_scales: dict = {}
+                self.cluster = None
+                self.max_attempts = 3
+                self.num_upstreams = 0
+                self.num_upstreams_done = 0
+
+            def __hash__(self) -> int:
+                return self.task_id
+
+        def measure(build) -> float:
+            tracemalloc.start()
+            try:
+                before = tracemalloc.get_traced_memory()[0]
+                built = build()
+                after = tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+            del built
+            return (after - before) / n
+
+        def build(task_factory, compact: bool) -> SwarmState:
+            state = SwarmState(
+                workflow_id=1,
+                workflow_run_id=1,
+                dag_id=1,
+                max_concurrently_running=n,
+                status="B",
+            )
+            tasks = [task_factory(i) for i in range(n)]
+            for upstream, downstream in zip(tasks, tasks[1:]):
+                if compact:
+                    upstream.set_downstreams((downstream,))
+                else:
+                    upstream.downstream_swarm_tasks.add(downstream)
+            for task in tasks:
+                state.add_task(task)
+            if compact:
+                state.compact_dependencies()
+            return state
+
+        legacy_per_task = measure(lambda: build(LegacyTask, compact=False))
+        compact_per_task = measure(lambda: build(self._swarm_task, compact=True))
+        assert compact_per_task < 0.75 * legacy_per_task, (
+            compact_per_task,
+            legacy_per_task,
+        )
+
+
+class TestSwarmStateBarriers:
+    """Tests for all-to-all barrier dependencies."""
+
+    _swarm_task = staticmethod(TestSwarmStateCompactDependencies._swarm_task)
+
+    def test_barrier_releases_downstreams_after_all_upstreams(
+        self, state: SwarmState
+    ) -> None:
+        """Test that downstreams wait for every upstream and their own edges."""
+        upstreams = [self._swarm_task(i) for i in range(1, 4)]
+        downstreams = [self._swarm_task(i) for i in range(4, 6)]
+        other = self._swarm_task(6)
+        # task 5 also has an ordinary edge from task 6
+        other.set_downstreams([downstreams[1]])
+        downstreams[1].num_upstreams = 1
+        for task in upstreams + downstreams + [other]:
+            state.add_task(task)
+        barrier = state.add_barrier(upstreams, downstreams)
+        state.compact_dependencies()
+
+        assert [t.num_upstreams for t in downstreams] == [1, 2]
+        assert state.propagate_completions({upstreams[0], upstreams[1]}) == []
+        assert barrier.num_upstreams_done == 2
+        assert state.propagate_completions({upstreams[2]}) == [downstreams[0]]
+        assert state.propagate_completions({other}) == [downstreams[1]]
+
+        # barriers constraining nothing are not added
+        assert state.add_barrier([], downstreams) is None
+        assert state.barriers == [barrier]
+
+    def test_initial_done_counts(self, state: SwarmState) -> None:
+        """Test that upstreams finished in a previous run count towards a barrier."""
+        upstreams = [
+            self._swarm_task(1, status=TaskStatus.DONE),
+            self._swarm_task(2),
+        ]
+        downstream = self._swarm_task(3)
+        for task in upstreams + [downstream]:
+            state.add_task(task)
+        state.add_barrier(upstreams, [downstream])
+
+        state.compute_initial_upstream_done_counts()
+
+        assert downstream.num_upstreams_done == 0
+        assert state.propagate_completions({upstreams[1]}) == [downstream]
+
+    def test_barrier_costs_members_not_edges(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that each upstream completion costs one barrier increment.
+
+        The downstream tasks are counted once when the barrier releases, so an
+        N-to-N barrier does N increments on its downstreams instead of N x N.
+        """
+        n = 500
+        calls: list[SwarmBarrier] = []
+        upstream_done = SwarmBarrier.upstream_done
+
+        def counting_upstream_done(barrier: SwarmBarrier) -> tuple:
+            calls.append(barrier)
+            return upstream_done(barrier)
+
+        monkeypatch.setattr(SwarmBarrier, "upstream_done", counting_upstream_done)
+
+        state = SwarmState(workflow_id=1, workflow_run_id=1, dag_id=1)
+        upstreams = [self._swarm_task(i) for i in range(n)]
+        downstreams = [self._swarm_task(i) for i in range(n, 2 * n)]
+        for task in upstreams + downstreams:
+            state.add_task(task)
+        barrier = state.add_barrier(upstreams, downstreams)
+        assert barrier is not None
+        state.compact_dependencies()
+        assert all(not task.downstream_tasks for task in upstreams)
+
+        for done, task in enumerate(upstreams[:-1], start=1):
+            assert state.propagate_completions({task}) == []
+            assert len(calls) == done
+            assert barrier.num_upstreams_done == done
+        assert sum(task.num_upstreams_done for task in downstreams) == 0
+
+        newly_ready = state.propagate_completions({upstreams[-1]})
+        assert len(calls) == n
+        assert newly_ready == downstreams
+        assert sum(task.num_upstreams_done for task in downstreams) == n
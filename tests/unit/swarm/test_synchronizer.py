@@ -8,7 +8,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from jobmon.client.swarm.gateway import TaskStatusUpdatesResponse
+from jobmon.client.swarm.gateway import (
+    ConcurrencyLimitsResponse,
+    TaskStatusUpdatesResponse,
+)
 from jobmon.client.swarm.services.synchronizer import Synchronizer
 from jobmon.client.swarm.state import StateUpdate
 from jobmon.core.constants import TaskStatus
@@ -29,8 +32,12 @@ def mock_gateway():
             tasks_by_status={},
         )
     )
-    gateway.get_workflow_concurrency = AsyncMock(return_value=100)
-    gateway.get_array_concurrency = AsyncMock(return_value=50)
+    gateway.get_concurrency_limits = AsyncMock(
+        return_value=ConcurrencyLimitsResponse(
+            max_concurrently_running=100,
+            array_limits={10: 50, 20: 50},
+        )
+    )
     return gateway
 
 
@@ -228,32 +235,39 @@ class TestSynchronizerConcurrency:
     """Tests for concurrency limit synchronization."""
 
     @pytest.mark.asyncio
-    async def test_get_workflow_concurrency(self, synchronizer, mock_gateway):
-        """Test fetching workflow concurrency limit."""
-        mock_gateway.get_workflow_concurrency = AsyncMock(return_value=200)
+    async def test_get_concurrency_limits(self, synchronizer, mock_gateway):
+        """Test fetching workflow and array limits in one request."""
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            return_value=ConcurrencyLimitsResponse(
+                max_concurrently_running=200,
+                array_limits={10: 50, 20: 75},
+            )
+        )
 
-        update = await synchronizer._get_workflow_concurrency()
+        update = await synchronizer._get_concurrency_limits()
 
-        mock_gateway.get_workflow_concurrency.assert_called_once()
+        mock_gateway.get_concurrency_limits.assert_called_once()
         assert update.max_concurrently_running == 200
+        assert update.array_limits == {10: 50, 20: 75}
 
     @pytest.mark.asyncio
-    async def test_get_array_concurrency_limits(self, synchronizer, mock_gateway):
-        """Test fetching array concurrency limits."""
-
-        # Mock to return different values for different arrays
-        async def get_array_limit(aid):
-            return {10: 50, 20: 75}[aid]
+    async def test_get_concurrency_limits_filters_unknown_arrays(
+        self, synchronizer, mock_gateway
+    ):
+        """Test that limits of arrays this synchronizer doesn't track are dropped."""
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            return_value=ConcurrencyLimitsResponse(
+                max_concurrently_running=200,
+                array_limits={10: 50, 30: 75},
+            )
+        )
 
-        mock_gateway.get_array_concurrency = AsyncMock(side_effect=get_array_limit)
+        update = await synchronizer._get_concurrency_limits()
 
-        update = await synchronizer._get_array_concurrency_limits()
-
-        assert update.array_limits == {10: 50, 20: 75}
-        assert mock_gateway.get_array_concurrency.call_count == 2
+        assert update.array_limits == {10: 50}
 
     @pytest.mark.asyncio
-    async def test_get_array_concurrency_limits_empty(self, mock_gateway, task_ids):
+    async def test_get_concurrency_limits_without_arrays(self, mock_gateway, task_ids):
         """Test with no arrays."""
         sync = Synchronizer(
             gateway=mock_gateway,
@@ -261,49 +275,39 @@ class TestSynchronizerConcurrency:
             array_ids=set(),
         )
 
-        update = await sync._get_array_concurrency_limits()
+        update = await sync._get_concurrency_limits()
 
+        assert update.max_concurrently_running == 100
         assert update.array_limits == {}
-        mock_gateway.get_array_concurrency.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_get_array_concurrency_handles_failure(
-        self, synchronizer, mock_gateway
-    ):
-        """Test that single array failure doesn't stop others."""
-        call_count = [0]
-
-        async def get_array_limit(aid):
-            call_count[0] += 1
-            if aid == 10:
-                raise Exception("Network error")
-            return 75
-
-        mock_gateway.get_array_concurrency = AsyncMock(side_effect=get_array_limit)
-
-        update = await synchronizer._get_array_concurrency_limits()
-
-        # Should still have array 20's limit
-        assert 20 in update.array_limits
-        assert update.array_limits[20] == 75
-        # Array 10 should not be in limits (failed)
-        assert 10 not in update.array_limits
 
     @pytest.mark.asyncio
     async def test_get_concurrency_limits_only(self, synchronizer, mock_gateway):
         """Test get_concurrency_limits_only convenience method."""
-        mock_gateway.get_workflow_concurrency = AsyncMock(return_value=150)
-
-        async def get_array_limit(aid):
-            return {10: 30, 20: 40}[aid]
-
-        mock_gateway.get_array_concurrency = AsyncMock(side_effect=get_array_limit)
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            return_value=ConcurrencyLimitsResponse(
+                max_concurrently_running=150,
+                array_limits={10: 30, 20: 40},
+            )
+        )
 
         update = await synchronizer.get_concurrency_limits_only()
 
         assert update.max_concurrently_running == 150
         assert update.array_limits == {10: 30, 20: 40}
 
+    @pytest.mark.asyncio
+    async def test_get_concurrency_limits_only_handles_failure(
+        self, synchronizer, mock_gateway
+    ):
+        """Test that a failed request returns an empty update."""
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            side_effect=Exception("Network error")
+        )
+
+        update = await synchronizer.get_concurrency_limits_only()
+
+        assert update.is_empty()
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Test Full Tick
@@ -323,16 +327,13 @@ class TestSynchronizerTick:
                 tasks_by_status={TaskStatus.DONE: [1]},
             )
         )
-        mock_gateway.get_workflow_concurrency = AsyncMock(return_value=100)
-        mock_gateway.get_array_concurrency = AsyncMock(return_value=50)
 
         await synchronizer.tick(full_sync=False, last_sync=sync_time)
 
         mock_gateway.request_triage.assert_called_once()
         mock_gateway.get_task_status_updates.assert_called_once()
-        mock_gateway.get_workflow_concurrency.assert_called_once()
-        # Array concurrency called for each array
-        assert mock_gateway.get_array_concurrency.call_count == 2
+        # One request covers the workflow and every array
+        mock_gateway.get_concurrency_limits.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_tick_merges_all_updates(self, synchronizer, mock_gateway):
@@ -344,12 +345,12 @@ class TestSynchronizerTick:
                 tasks_by_status={TaskStatus.DONE: [1, 2]},
             )
         )
-        mock_gateway.get_workflow_concurrency = AsyncMock(return_value=150)
-
-        async def get_array_limit(aid):
-            return {10: 30, 20: 40}[aid]
-
-        mock_gateway.get_array_concurrency = AsyncMock(side_effect=get_array_limit)
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            return_value=ConcurrencyLimitsResponse(
+                max_concurrently_running=150,
+                array_limits={10: 30, 20: 40},
+            )
+        )
 
         update = await synchronizer.tick(full_sync=True, last_sync=None)
 
@@ -373,19 +374,17 @@ class TestSynchronizerTick:
                 tasks_by_status={TaskStatus.DONE: [1]},
             )
         )
-        # Workflow concurrency succeeds
-        mock_gateway.get_workflow_concurrency = AsyncMock(return_value=100)
-        # Array concurrency fails
-        mock_gateway.get_array_concurrency = AsyncMock(
-            side_effect=Exception("Array error")
+        # Concurrency limits fail
+        mock_gateway.get_concurrency_limits = AsyncMock(
+            side_effect=Exception("Concurrency error")
         )
 
         update = await synchronizer.tick(full_sync=True, last_sync=None)
 
-        # Should still have task updates and workflow concurrency
+        # Should still have task updates
         assert update.task_statuses == {1: TaskStatus.DONE}
-        assert update.max_concurrently_running == 100
-        # Array limits should be empty due to failure
+        # Limits should be unset due to failure
+        assert update.max_concurrently_running is None
         assert update.array_limits == {}
 
     @pytest.mark.asyncio
@@ -405,10 +404,12 @@ class TestSynchronizerTick:
             )
         )
 
-        await sync.tick(full_sync=True, last_sync=None)
+        update = await sync.tick(full_sync=True, last_sync=None)
 
-        # Should not call array concurrency
-        mock_gateway.get_array_concurrency.assert_not_called()
+        # Workflow limit still synced, no array limits
+        mock_gateway.get_concurrency_limits.assert_called_once()
+        assert update.max_concurrently_running == 100
+        assert update.array_limits == {}
 
     @pytest.mark.asyncio
     async def test_tick_full_sync_ignores_last_sync(self, synchronizer, mock_gateway):
@@ -454,16 +455,17 @@ class TestSynchronizerParallelism:
                 tasks_by_status={},
             )
 
-        async def slow_workflow_concurrency():
-            call_order.append("workflow_start")
+        async def slow_concurrency_limits():
+            call_order.append("concurrency_start")
             await asyncio.sleep(0.05)
-            call_order.append("workflow_end")
-            return 100
+            call_order.append("concurrency_end")
+            return ConcurrencyLimitsResponse(
+                max_concurrently_running=100, array_limits={}
+            )
 
         mock_gateway.request_triage = slow_triage
         mock_gateway.get_task_status_updates = slow_task_updates
-        mock_gateway.get_workflow_concurrency = slow_workflow_concurrency
-        mock_gateway.get_array_concurrency = AsyncMock(return_value=50)
+        mock_gateway.get_concurrency_limits = slow_concurrency_limits
 
         await synchronizer.tick(full_sync=True, last_sync=None)
 
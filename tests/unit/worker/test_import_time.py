@@ -0,0 +1,87 @@
+import subprocess
+import sys
+
+import pytest
+
+WORKER_NODE_MODULES = [
+    "jobmon.worker_node.cli",
+    "jobmon.worker_node.worker_node_factory",
+    "jobmon.worker_node.worker_node_task_instance",
+]
+
+# Heavy packages a worker node has no use for.
+FORBIDDEN_PREFIXES = (
+    "aiohttp",
+    "docstring_parser",
+    "docutils",
+    "jobmon.client",
+    "pandas",
+    "sphinx.",
+)
+
+# Dependencies every worker node needs anyway. The worker node path is timed relative
+# to them so the budget holds on slow or busy machines.
+BASELINE_MODULES = ["asyncio", "requests", "structlog", "yaml"]
+
+# The worker node path used to take about 5x as long to import as the baseline and now
+# takes about 1.4x.
+IMPORT_BUDGET_RATIO = 2.5
+
+
+def _import_times(modules):
+    """Return ``(name, cumulative microseconds, top level)`` for every import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        # nested imports are indented below the module that triggered them
+        times.append((name.strip(), int(cumulative), not name[1:].startswith(" ")))
+    return times
+
+
+@pytest.fixture(scope="module")
+def worker_node_import_times():
+    return _import_times(WORKER_NODE_MODULES)
+
+
+def test_worker_node_skips_heavy_imports(worker_node_import_times):
+    heavy = sorted(
+        name
+        for name, _, _ in worker_node_import_times
+        if name.startswith(FORBIDDEN_PREFIXES)
+    )
+    assert heavy == []
+
+
+def _total(import_times):
+    return sum(cumulative for _, cumulative, top_level in import_times if top_level)
+
+
+def test_worker_node_import_budget(worker_node_import_times):
+    worker_node = _total(worker_node_import_times)
+    baseline = _total(_import_times(BASELINE_MODULES))
+    assert worker_node < IMPORT_BUDGET_RATIO * baseline, (worker_node, baseline)
+
+
+def test_task_generator_defers_docs_and_client():
+    times = _import_times(["jobmon.core.task_generator"])
+    assert [name for name, _, _ in times if name.startswith(FORBIDDEN_PREFIXES)] == []
+
+
+def test_task_generator_docs_still_importable():
+    pytest.importorskip("sphinx")
+    from jobmon.core import task_generator, task_generator_docs
+
+    assert task_generator.TaskGeneratorDocumenter is (
+        task_generator_docs.TaskGeneratorDocumenter
+    )
+    assert task_generator.setup is task_generator_docs.setup
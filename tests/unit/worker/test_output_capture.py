@@ -0,0 +1,122 @@
+import asyncio
+import io
+
+from jobmon.worker_node.worker_node_task_instance import WorkerNodeTaskInstance
+
+
+async def _reader(chunks):
+    reader = asyncio.StreamReader()
+    for chunk in chunks:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    return reader
+
+
+async def _capture(chunks, **kwargs):
+    reader = await _reader(chunks)
+    output = io.BytesIO()
+    tail = await WorkerNodeTaskInstance._communicate(reader, output, **kwargs)
+    return tail, output.getvalue()
+
+
+async def _legacy_communicate(async_stream, output_stream, chunk_size=64):
+    # the previous implementation, kept here as the reference for the tail
+    mem_buffer = ""
+    while True:
+        data_chunk = await async_stream.read(chunk_size)
+        if not data_chunk:
+            break
+        try:
+            data_chunk_str = data_chunk.decode()
+            output_stream.write(data_chunk_str)
+            output_stream.flush()
+            mem_buffer += data_chunk_str
+            mem_buffer = mem_buffer[-10000:]
+        except UnicodeDecodeError:
+            pass
+    return mem_buffer
+
+
+def test_split_multibyte_characters_survive():
+    text = "── Attaching packages ──" * 50
+    data = text.encode()
+    # split every character's bytes across reads
+    chunks = [data[i : i + 1] for i in range(len(data))]
+    tail, written = asyncio.run(_capture(chunks, chunk_size=1))
+    assert tail == text
+    assert written == data
+
+
+def test_tail_is_bounded():
+    data = ("a" * 2**10 + "\n") * 2**8
+    tail, written = asyncio.run(_capture([data.encode()], chunk_size=100))
+    assert tail == data[-10000:]
+    assert written == data.encode()
+
+    # a single read much larger than the tail
+    tail, _ = asyncio.run(_capture([("é" * 50000 + "end").encode()]))
+    assert tail == ("é" * 50000 + "end")[-10000:]
+
+
+def test_invalid_bytes_are_replaced():
+    tail, written = asyncio.run(_capture([b"ok \xff\xfe done", b"\xe2\x94"]))
+    assert tail == "ok �� done�"
+    assert written == b"ok \xff\xfe done\xe2\x94"
+
+
+class _CountingReader:
+    """Wrap a StreamReader and count the reads made on it."""
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.reads = 0
+
+    async def read(self, n=-1):
+        self.reads += 1
+        return await self.reader.read(n)
+
+
+def test_capture_matches_legacy_tail():
+    line = ("x" * 79 + "\n").encode()
+    data = line * 500
+
+    async def run_new():
+        reader = await _reader([data])
+        return await WorkerNodeTaskInstance._communicate(reader, io.BytesIO())
+
+    async def run_legacy():
+        reader = await _reader([data])
+        return await _legacy_communicate(reader, io.StringIO())
+
+    assert asyncio.run(run_new()) == asyncio.run(run_legacy())
+
+
+def test_capture_reads_in_large_chunks():
+    """The stream is drained in chunk_size reads rather than 64 byte ones."""
+    data = b"x" * 2**20 + b"end"
+    chunk_size = 2**16
+
+    async def run():
+        reader = _CountingReader(await _reader([data]))
+        output = io.BytesIO()
+        await WorkerNodeTaskInstance._communicate(reader, output, chunk_size=chunk_size)
+        return reader.reads, output.getvalue()
+
+    reads, written = asyncio.run(run())
+    assert written == data
+    # one read per full chunk, one for the remainder and one for EOF
+    assert reads == len(data) // chunk_size + 2
+
+
+def test_cancelled_capture_returns_tail():
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"partial output")
+        output = io.BytesIO()
+        task = asyncio.create_task(WorkerNodeTaskInstance._communicate(reader, output))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return task.result(), output.getvalue()
+
+    assert asyncio.run(run()) == ("partial output", b"partial output")